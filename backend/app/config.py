@@ -11,9 +11,17 @@ class Settings(BaseSettings):
 
     # Scheduler
     scheduler_enabled: bool = True
+    scheduler_lock_backend: str = "database"  # database | file | none
+    scheduler_lease_ttl: int = 90  # seconds
+    scheduler_lock_file: str = ".cache/scheduler.lock"
 
     # OpenRouter
     openrouter_api_key: str = ""
+    llm_max_concurrency: int = 8
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = ".cache/llm_cache.sqlite3"
+    llm_cache_max_mb: int = 64
+    sentiment_triage_threshold: float = 0.3
 
     # Telegram
     telegram_bot_token: str = ""
@@ -28,7 +28,7 @@ from app.routers import (
     watchlist,
 )
 from app.scheduler.jobs import start_scheduler, stop_scheduler
-from app.services import telegram_service
+from app.services import llm_client, telegram_sender, telegram_service
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -59,6 +59,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     await telegram_service.stop_bot()
     stop_scheduler()
+    telegram_sender.shutdown()
+    llm_client.shutdown()
     logger.info("API shutdown complete")
 
 
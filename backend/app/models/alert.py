@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationInfo, field_validator
 
 
 class PriceAlertCreateRequest(BaseModel):
@@ -10,8 +10,8 @@ class PriceAlertCreateRequest(BaseModel):
 
     ticker: str
     company_name: str | None = None
-    alert_type: str  # TARGET_PRICE | STOP_LOSS
-    trigger_price: float
+    alert_type: str  # TARGET_PRICE | STOP_LOSS | DAILY_CHANGE
+    trigger_price: float  # DAILY_CHANGE는 전일 종가 대비 변동률 임계값(%)
     memo: str | None = None
 
     @field_validator("ticker")
@@ -22,16 +22,18 @@ class PriceAlertCreateRequest(BaseModel):
     @field_validator("alert_type")
     @classmethod
     def validate_alert_type(cls, v: str) -> str:
-        allowed = {"TARGET_PRICE", "STOP_LOSS"}
+        allowed = {"TARGET_PRICE", "STOP_LOSS", "DAILY_CHANGE"}
         if v not in allowed:
             raise ValueError(f"alert_type은 {allowed} 중 하나여야 합니다.")
         return v
 
     @field_validator("trigger_price")
     @classmethod
-    def validate_trigger_price(cls, v: float) -> float:
+    def validate_trigger_price(cls, v: float, info: ValidationInfo) -> float:
         if v <= 0:
             raise ValueError("trigger_price는 0보다 커야 합니다.")
+        if info.data.get("alert_type") == "DAILY_CHANGE" and v > 100:
+            raise ValueError("DAILY_CHANGE의 trigger_price는 변동률(%)로 100 이하여야 합니다.")
         return v
 
 
@@ -69,6 +71,7 @@ class AlertCheckResult(BaseModel):
     """가격 알림 체크 결과 요약."""
 
     checked_count: int
+    skipped_count: int = 0  # 장 마감/조회 주기 미도래로 이번에 건너뛴 알림 수
     triggered_count: int
     notified_count: int
     failed_tickers: list[str]
@@ -84,5 +87,6 @@ class RiskAlertResult(BaseModel):
     high_urgency_count: int = 0
     currency_alert: bool = False
     usd_krw_change_pct: float | None = None
+    exposed_user_count: int = 0  # 보유 종목이 리스크 조건에 노출된 사용자 수
     notifications_sent: int = 0
     checked_at: datetime
@@ -33,6 +33,8 @@ class MacroSignal(BaseModel):
 class SentimentSignal(BaseModel):
     avg_weighted_score: float = 0.0
     article_count: int = 0
+    ticker_score: float | None = None  # 종목 언급 헤드라인만의 감쇠 가중 평균
+    ticker_article_count: int = 0
     composite: float = 0.0
 
 
@@ -56,6 +58,22 @@ class SignalBreakdown(BaseModel):
     geopolitical: GeopoliticalSignal = GeopoliticalSignal()
 
 
+# ─── 가중치/임계값 설정 (signal_weight_configs) ───
+
+
+class SignalWeightConfig(BaseModel):
+    """통합 점수 가중치 + 방향 판정 임계값."""
+
+    technical: float
+    macro: float
+    sentiment: float
+    currency: float
+    geopolitical: float
+    buy_threshold: float
+    strong_threshold: float
+    calibrated_at: datetime | None = None
+
+
 # ─── DB row 1:1 대응 응답 ───
 
 
@@ -31,6 +31,9 @@ class SentimentResult(BaseModel):
     affected_countries: list[str] | None = None
     short_term_impact: str | None = None
     medium_term_impact: str | None = None
+    cluster_size: int = 1  # 같은 사건을 보도한 근접 중복 기사 수 (실행 내)
+    analysis_source: str = "LLM"  # LLM | LOCAL (사전 분류로 LLM 생략)
+    tickers: list[str] = []  # 헤드라인에 언급된 종목 (별칭 인덱스 태깅)
     analyzed_at: datetime | None = None
     created_at: datetime | None = None
 
@@ -53,6 +56,9 @@ class SentimentCollectResponse(BaseModel):
     success: bool
     articles_collected: int
     articles_analyzed: int
+    articles_new: int = 0
+    articles_duplicate: int = 0
+    articles_local: int = 0  # 로컬 사전 분류로 LLM 생략한 기사 수
     collected_at: datetime
 
 
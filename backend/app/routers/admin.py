@@ -8,6 +8,8 @@ from supabase import Client
 
 from app.dependencies import get_supabase
 from app.middleware.auth import CurrentUser, require_admin, require_super_admin
+from app.scheduler.jobs import TRIGGERABLE_JOBS
+from app.services import job_ledger, job_queue, llm_cache, llm_client, telegram_sender
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -100,6 +102,8 @@ class ModelConfigResponse(BaseModel):
     display_name: str = ""
     primary_model: str = ""
     fallback_model: str | None = None
+    fallback_models: list[str] = []
+    hedge_after_ms: int | None = None
     max_tokens: int = 4096
     temperature: float = 0.7
     is_active: bool = True
@@ -113,6 +117,105 @@ class ModelsListResponse(BaseModel):
     total: int
 
 
+class LLMFeatureMetrics(BaseModel):
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    hedges: int = 0
+    fallback_wins: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+    avg_latency_ms: float = 0.0
+    p50_latency_ms: float = 0.0
+    p95_latency_ms: float = 0.0
+    last_model: str | None = None
+
+
+class LLMModelMetrics(BaseModel):
+    calls: int = 0
+    errors: int = 0
+    p50_latency_ms: float = 0.0
+    p95_latency_ms: float = 0.0
+
+
+class LLMCacheStats(BaseModel):
+    entries: int = 0
+    size_bytes: int = 0
+    by_feature: dict[str, int] = {}
+
+
+class LLMMetricsResponse(BaseModel):
+    features: dict[str, LLMFeatureMetrics]
+    models: dict[str, LLMModelMetrics]
+    cache: LLMCacheStats
+
+
+class TelegramSenderMetricsResponse(BaseModel):
+    queue_depth: int = 0
+    enqueued: int = 0
+    sent: int = 0
+    failed: int = 0
+    retries: int = 0
+    flood_waits: int = 0
+    p50_queue_wait_ms: float = 0.0
+    p95_queue_wait_ms: float = 0.0
+    p50_latency_ms: float = 0.0
+    p95_latency_ms: float = 0.0
+
+
+class JobRunResponse(BaseModel):
+    id: int
+    job_id: str
+    started_at: str
+    finished_at: str | None = None
+    duration_ms: int | None = None
+    status: str
+    items_processed: int | None = None
+    items_failed: int | None = None
+    peak_rss_mb: float | None = None  # 기록 시점까지의 프로세스 최대 RSS (실행별 값 아님)
+    error: str | None = None
+    details: dict | None = None
+
+
+class JobRunsListResponse(BaseModel):
+    runs: list[JobRunResponse]
+    total: int
+
+
+class JobStats(BaseModel):
+    runs: int = 0
+    failures: int = 0
+    p50_duration_ms: float = 0.0
+    p95_duration_ms: float = 0.0
+    items_processed: int = 0
+    last_started_at: str | None = None
+    last_status: str | None = None
+
+
+class JobStatsResponse(BaseModel):
+    days: int
+    jobs: dict[str, JobStats]
+
+
+class JobRequestResponse(BaseModel):
+    id: int
+    job_id: str
+    requested_by: str | None = None
+    requested_at: str
+    status: str
+    claimed_at: str | None = None
+    handled_at: str | None = None
+    note: str | None = None
+
+
+class JobRequestsListResponse(BaseModel):
+    requests: list[JobRequestResponse]
+    total: int
+
+
 # ──────────────────────────────────────────────
 # 엔드포인트
 # ──────────────────────────────────────────────
@@ -258,6 +361,69 @@ def get_models(
     return ModelsListResponse(models=models, total=len(models))
 
 
+@router.get("/llm/metrics", response_model=LLMMetricsResponse)
+def get_llm_metrics(
+    _admin: CurrentUser = Depends(require_admin),
+):
+    """기능별·모델별 LLM 호출 지연시간/토큰/비용 집계 (프로세스 기동 이후 누적)."""
+    return LLMMetricsResponse(
+        features={
+            feature: LLMFeatureMetrics(**metrics)
+            for feature, metrics in llm_client.get_metrics().items()
+        },
+        models={
+            model: LLMModelMetrics(**metrics)
+            for model, metrics in llm_client.get_model_metrics().items()
+        },
+        cache=LLMCacheStats(**llm_cache.stats()),
+    )
+
+
+@router.get("/telegram/metrics", response_model=TelegramSenderMetricsResponse)
+def get_telegram_metrics(
+    _admin: CurrentUser = Depends(require_admin),
+):
+    """텔레그램 발송 큐 깊이/발송 통계/지연시간 (이 프로세스 기동 이후 누적)."""
+    return TelegramSenderMetricsResponse(**telegram_sender.get_metrics())
+
+
+@router.get("/jobs/runs", response_model=JobRunsListResponse)
+def list_job_runs(
+    job_id: str | None = Query(None, max_length=100),
+    limit: int = Query(50, ge=1, le=500),
+    _admin: CurrentUser = Depends(require_admin),
+    client: Client = Depends(get_supabase),
+):
+    """스케줄 작업 최근 실행 기록 (최신순, job_id로 필터 가능)."""
+    runs = [JobRunResponse(**row) for row in job_ledger.get_recent_runs(client, job_id, limit)]
+    return JobRunsListResponse(runs=runs, total=len(runs))
+
+
+@router.get("/jobs/stats", response_model=JobStatsResponse)
+def get_job_stats(
+    days: int = Query(job_ledger.STATS_WINDOW_DAYS, ge=1, le=30),
+    _admin: CurrentUser = Depends(require_admin),
+    client: Client = Depends(get_supabase),
+):
+    """작업별 최근 N일 실행 수/실패 수/소요 시간 p50·p95."""
+    stats = job_ledger.get_job_stats(client, days)
+    return JobStatsResponse(
+        days=days,
+        jobs={job_id: JobStats(**s) for job_id, s in stats.items()},
+    )
+
+
+@router.get("/jobs/requests", response_model=JobRequestsListResponse)
+def list_job_requests(
+    limit: int = Query(50, ge=1, le=200),
+    _admin: CurrentUser = Depends(require_admin),
+    client: Client = Depends(get_supabase),
+):
+    """즉시 실행 요청 이력 (최신순)."""
+    requests = [JobRequestResponse(**row) for row in job_queue.get_recent(client, limit)]
+    return JobRequestsListResponse(requests=requests, total=len(requests))
+
+
 # ──────────────────────────────────────────────
 # 쓰기 엔드포인트 — 요청 모델
 # ──────────────────────────────────────────────
@@ -278,6 +444,8 @@ class SendNotificationRequest(BaseModel):
 class ModelConfigUpdateRequest(BaseModel):
     primary_model: str | None = None
     fallback_model: str | None = None
+    fallback_models: list[str] | None = None
+    hedge_after_ms: int | None = None
     max_tokens: int | None = None
     temperature: float | None = None
     is_active: bool | None = None
@@ -414,6 +582,12 @@ def update_model_config(
         update_data["primary_model"] = body.primary_model
     if body.fallback_model is not None:
         update_data["fallback_model"] = body.fallback_model
+    if body.fallback_models is not None:
+        update_data["fallback_models"] = body.fallback_models
+    if body.hedge_after_ms is not None:
+        if body.hedge_after_ms <= 0:
+            raise HTTPException(status_code=400, detail="hedge_after_ms는 0보다 커야 합니다.")
+        update_data["hedge_after_ms"] = body.hedge_after_ms
     if body.max_tokens is not None:
         update_data["max_tokens"] = body.max_tokens
     if body.temperature is not None:
@@ -422,6 +596,7 @@ def update_model_config(
         update_data["is_active"] = body.is_active
 
     client.table("model_configs").update(update_data).eq("id", config_id).execute()
+    llm_client.invalidate_model_chains()
 
     # model_change_logs에 기록
     client.table("model_change_logs").insert({
@@ -439,6 +614,35 @@ def update_model_config(
     return {"message": "모델 설정이 업데이트되었습니다."}
 
 
+@router.delete("/llm/cache")
+def clear_llm_cache(
+    admin: CurrentUser = Depends(require_admin),
+    client: Client = Depends(get_supabase),
+):
+    """LLM 응답 캐시 비우기 (프롬프트/모델 변경 직후 재생성 강제)."""
+    logger.info("LLM 캐시 초기화: admin=%s", admin.user_id)
+    deleted = llm_cache.clear()
+    _log_audit(client, admin.user_id, "LLM_CACHE_CLEAR", detail={"deleted": deleted})
+    return {"message": f"LLM 캐시 {deleted}건을 삭제했습니다.", "deleted": deleted}
+
+
+@router.post("/jobs/{job_id}/run", status_code=202, response_model=JobRequestResponse)
+def run_job(
+    job_id: str,
+    admin: CurrentUser = Depends(require_admin),
+    client: Client = Depends(get_supabase),
+):
+    """스케줄 작업 즉시 실행 요청 — 큐에 넣고 워커의 스케줄러가 실행한다."""
+    if job_id not in TRIGGERABLE_JOBS:
+        raise HTTPException(status_code=404, detail=f"알 수 없는 작업: {job_id}")
+    row = job_queue.enqueue(client, job_id, admin.user_id)
+    if not row:
+        raise HTTPException(status_code=500, detail="실행 요청 등록에 실패했습니다.")
+    _log_audit(client, admin.user_id, "JOB_RUN_REQUEST", detail={"job_id": job_id, "request_id": row.get("id")})
+    logger.info("작업 즉시 실행 요청: job=%s admin=%s", job_id, admin.user_id)
+    return JobRequestResponse(**row)
+
+
 @router.get("/settings", response_model=SystemSettingsResponse)
 def get_system_settings(
     _admin: CurrentUser = Depends(require_admin),
@@ -52,9 +52,9 @@ async def get_my_alerts(
 async def manual_price_alert_check(
     _admin: CurrentUser = Depends(require_admin),
 ):
-    """가격 알림을 수동으로 체크한다. (ADMIN 전용)"""
+    """가격 알림을 수동으로 체크한다 — 장 시간과 무관하게 전체 티커 조회. (ADMIN 전용)"""
     client = get_supabase()
-    return alert_service.check_price_alerts(client)
+    return alert_service.check_price_alerts(client, force=True)
 
 
 @router.post("/risk-check", response_model=RiskAlertResult)
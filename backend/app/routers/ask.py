@@ -1,4 +1,7 @@
+import json
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from supabase import Client
 
 from app.dependencies import get_supabase
@@ -30,3 +33,27 @@ def ask_question(
         deeplinks=[DeepLinkItem(**d) for d in result.get("deeplinks", [])],
         context_data=result.get("context_data", {}),
     )
+
+
+@router.post("/stream")
+async def ask_question_stream(
+    req: AskRequest,
+    user: CurrentUser = Depends(get_current_user),
+    client: Client = Depends(get_supabase),
+):
+    """AI Q&A (SSE 스트리밍) — token 이벤트로 답변 조각, done 이벤트로 최종 답변/딥링크."""
+
+    async def event_stream():
+        async for item in ask_service.ask_question_stream(
+            client=client,
+            user_id=user.user_id,
+            question=req.question,
+        ):
+            data = json.dumps(item["data"], ensure_ascii=False, default=str)
+            yield f"event: {item['event']}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -75,8 +75,9 @@ def categories(
 
 @router.get("/categories/summary")
 def category_summary(
+    window: str = Query(default="24h", pattern="^(24h|7d|30d)$", description="집계 기간"),
     _user: CurrentUser = Depends(get_current_user),
     client: Client = Depends(get_supabase),
 ):
-    """카테고리별 최근 분석 요약 통계를 반환한다."""
-    return {"summaries": get_category_summary(client)}
+    """카테고리별 감성 요약 통계를 반환한다 (시간 단위 롤업 기반)."""
+    return {"window": window, "summaries": get_category_summary(client, window)}
@@ -1,16 +1,28 @@
-"""APScheduler 기반 크론잡 — ETF 동기화 + 거시 수집 + 감성 분석 + 통합 스코어링 + 지정학 + 공포탐욕 + 가이드."""
+"""APScheduler 기반 크론잡 — ETF 동기화 + 시장 데이터 갱신 파이프라인(거시/지정학/감성/공포탐욕/스코어링/리스크/가이드) + 가격 알림 + 주간 작업."""
+
+import functools
+import threading
+from datetime import datetime
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
+from app.config import settings
 from app.dependencies import get_supabase
+from app.scheduler.leader import DatabaseLease, FileLease, Lease, LeaderElection, make_holder_id
+from app.scheduler.pipeline import Step, run_pipeline
 from app.services import (
+    alert_engine,
     alert_service,
     etf_service,
     fear_greed_service,
     geo_service,
     guide_service,
+    job_ledger,
+    job_queue,
     prediction_service,
+    signal_calibration_service,
     weekly_report_service,
 )
 from app.services.macro_collector import collect_macro_data
@@ -21,309 +33,497 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 scheduler = BackgroundScheduler(timezone="Asia/Seoul")
+_election: LeaderElection | None = None
+_running_jobs: set[str] = set()  # 이 프로세스에서 실행 중인 작업 id (즉시 실행 요청 판정용)
+_running_lock = threading.Lock()
+
+# 작업별 실행 정책: 겹침 방지(max_instances), 밀린 실행 1회로 합치기(coalesce),
+# 지연 허용 시간(misfire_grace_time, 초 — 넘으면 해당 회차는 건너뜀)
+JOB_POLICIES: dict[str, dict] = {
+    "etf_sync": {"max_instances": 1, "coalesce": True, "misfire_grace_time": 3600},
+    "market_refresh": {"max_instances": 1, "coalesce": True, "misfire_grace_time": 1800},
+    "price_alert_check": {"max_instances": 1, "coalesce": True, "misfire_grace_time": 30},
+    "weekly_report": {"max_instances": 1, "coalesce": True, "misfire_grace_time": 3600},
+    "signal_calibration": {"max_instances": 1, "coalesce": True, "misfire_grace_time": 3600},
+}
+
+# API에서 즉시 실행을 요청할 수 있는 작업 (job_requests 큐 경유)
+TRIGGERABLE_JOBS: tuple[str, ...] = tuple(JOB_POLICIES)
+JOB_QUEUE_POLL_SECONDS = 10
+
+
+def _tracked(job_id: str, record_idle: bool = True):
+    """작업 실행을 job_runs 원장에 기록하고, 예외는 로그로 남긴다 (스케줄러 스레드 보호)."""
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper():
+            with _running_lock:
+                _running_jobs.add(job_id)
+            try:
+                return job_ledger.run_tracked(get_supabase, job_id, func, record_idle=record_idle)
+            except Exception as e:
+                logger.error("Scheduled job %s failed: %s", job_id, e)
+                return None
+            finally:
+                with _running_lock:
+                    _running_jobs.discard(job_id)
+
+        return wrapper
 
+    return decorate
 
+
+@_tracked("etf_sync")
 def _scheduled_etf_sync():
     """스케줄러에 의해 호출되는 ETF/펀드 동기화 작업."""
     logger.info("Scheduled ETF sync started")
-    try:
-        client = get_supabase()
-        result = etf_service.sync_all(client)
-        logger.info(
-            "Scheduled ETF sync done — foreign=%d, domestic=%d, fund=%d, failed=%d",
-            result.foreign_count,
-            result.domestic_count,
-            result.fund_count,
-            len(result.failed_tickers),
-        )
-    except Exception as e:
-        logger.error("Scheduled ETF sync failed: %s", e)
+    client = get_supabase()
+    result = etf_service.sync_all(client)
+    logger.info(
+        "Scheduled ETF sync done — foreign=%d, domestic=%d, fund=%d, failed=%d",
+        result.foreign_count,
+        result.domestic_count,
+        result.fund_count,
+        len(result.failed_tickers),
+    )
+    return {
+        "items": result.foreign_count + result.domestic_count + result.fund_count,
+        "failed": len(result.failed_tickers),
+    }
 
 
-def _scheduled_macro_collect():
-    """스케줄러에 의해 호출되는 거시 데이터 수집 작업."""
+def _step_macro():
+    """파이프라인 단계 — 거시 데이터 수집 작업."""
     logger.info("Scheduled macro collection started")
-    try:
-        snapshot, failed, collected_at = collect_macro_data()
-        client = get_supabase()
-        insert_snapshot(client, snapshot, collected_at)
-        logger.info(
-            "Scheduled macro collection done — %d failed tickers",
-            len(failed),
-        )
-    except Exception as e:
-        logger.error("Scheduled macro collection failed: %s", e)
+    snapshot, failed, collected_at = collect_macro_data()
+    client = get_supabase()
+    insert_snapshot(client, snapshot, collected_at)
+    logger.info(
+        "Scheduled macro collection done — %d failed tickers",
+        len(failed),
+    )
+    return {"failed": len(failed)}
 
 
-def _scheduled_geo_collect():
-    """스케줄러에 의해 호출되는 지정학 뉴스 수집 + AI 분류 작업."""
+def _step_geo():
+    """파이프라인 단계 — 지정학 뉴스 수집 + AI 분류 작업."""
     logger.info("Scheduled geo collection started")
-    try:
-        client = get_supabase()
-        result = geo_service.collect_and_analyze(client)
-        logger.info(
-            "Scheduled geo done — collected=%d, events=%d",
-            result.get("articles_collected", 0),
-            result.get("events_created", 0),
-        )
-    except Exception as e:
-        logger.error("Scheduled geo collection failed: %s", e)
+    client = get_supabase()
+    result = geo_service.collect_and_analyze(client)
+    logger.info(
+        "Scheduled geo done — collected=%d, events=%d",
+        result.get("articles_collected", 0),
+        result.get("events_created", 0),
+    )
+    return {
+        "items": result.get("articles_collected", 0),
+        "events": result.get("events_created", 0),
+    }
 
 
-def _scheduled_sentiment_collect():
-    """스케줄러에 의해 호출되는 뉴스 감성 분석 작업."""
+def _step_sentiment():
+    """파이프라인 단계 — 뉴스 감성 분석 작업."""
     logger.info("Scheduled sentiment collection started")
-    try:
-        client = get_supabase()
-        result = collect_and_analyze(client)
-        logger.info(
-            "Scheduled sentiment done — collected=%d, analyzed=%d",
-            result.articles_collected,
-            result.articles_analyzed,
-        )
-    except Exception as e:
-        logger.error("Scheduled sentiment collection failed: %s", e)
+    client = get_supabase()
+    result = collect_and_analyze(client)
+    logger.info(
+        "Scheduled sentiment done — collected=%d, new=%d, duplicate=%d, local=%d, analyzed=%d",
+        result.articles_collected,
+        result.articles_new,
+        result.articles_duplicate,
+        result.articles_local,
+        result.articles_analyzed,
+    )
+    return {
+        "items": result.articles_analyzed,
+        "collected": result.articles_collected,
+        "new": result.articles_new,
+        "duplicate": result.articles_duplicate,
+        "local": result.articles_local,
+    }
 
 
-def _scheduled_fear_greed_collect():
-    """스케줄러에 의해 호출되는 공포/탐욕 지수 계산 작업."""
+def _step_fear_greed():
+    """파이프라인 단계 — 공포/탐욕 지수 계산 작업."""
     logger.info("Scheduled fear/greed collection started")
-    try:
-        client = get_supabase()
-        result = fear_greed_service.collect_fear_greed(client)
-        logger.info(
-            "Scheduled fear/greed done — index=%d (%s)",
-            result.get("index_value", 0),
-            result.get("label", "N/A"),
-        )
-    except Exception as e:
-        logger.error("Scheduled fear/greed collection failed: %s", e)
+    client = get_supabase()
+    result = fear_greed_service.collect_fear_greed(client)
+    logger.info(
+        "Scheduled fear/greed done — index=%d (%s)",
+        result.get("index_value", 0),
+        result.get("label", "N/A"),
+    )
+    return {"index": result.get("index_value")}
 
 
-def _scheduled_prediction_scoring():
-    """스케줄러에 의해 호출되는 통합 스코어링 작업.
+def _step_prediction():
+    """파이프라인 단계 — 통합 스코어링 작업.
 
     portfolio 테이블에서 is_deleted=False 종목을 조회하고,
     user_id+ticker 중복 제거 후 순차 분석한다.
     """
     logger.info("Scheduled prediction scoring started")
-    try:
-        client = get_supabase()
-
-        # 활성 포트폴리오에서 고유 (user_id, ticker) 쌍 추출
-        result = (
-            client.table("portfolio")
-            .select("user_id, ticker, company_name")
-            .eq("is_deleted", False)
-            .execute()
-        )
-        rows = result.data or []
+    client = get_supabase()
+
+    # 활성 포트폴리오에서 고유 (user_id, ticker) 쌍 추출
+    result = (
+        client.table("portfolio")
+        .select("user_id, ticker, company_name")
+        .eq("is_deleted", False)
+        .execute()
+    )
+    rows = result.data or []
 
-        # 중복 제거: (user_id, ticker) 기준
-        seen: set[tuple[str, str]] = set()
-        unique_targets: list[dict] = []
-        for row in rows:
-            key = (row["user_id"], row["ticker"])
-            if key not in seen:
-                seen.add(key)
-                unique_targets.append(row)
+    # 중복 제거: (user_id, ticker) 기준
+    seen: set[tuple[str, str]] = set()
+    unique_targets: list[dict] = []
+    for row in rows:
+        key = (row["user_id"], row["ticker"])
+        if key not in seen:
+            seen.add(key)
+            unique_targets.append(row)
 
-        logger.info(
-            "Prediction scoring targets: %d unique (user, ticker) pairs",
-            len(unique_targets),
-        )
+    logger.info(
+        "Prediction scoring targets: %d unique (user, ticker) pairs",
+        len(unique_targets),
+    )
 
-        success_count = 0
-        for target in unique_targets:
-            try:
-                prediction_service.analyze_ticker(
-                    client=client,
-                    ticker=target["ticker"],
-                    user_id=target["user_id"],
-                    company_name=target.get("company_name"),
-                )
-                success_count += 1
-            except Exception as e:
-                logger.error(
-                    "Prediction failed for %s/%s: %s",
-                    target["user_id"],
-                    target["ticker"],
-                    e,
-                )
+    success_count = 0
+    for target in unique_targets:
+        try:
+            prediction_service.analyze_ticker(
+                client=client,
+                ticker=target["ticker"],
+                user_id=target["user_id"],
+                company_name=target.get("company_name"),
+            )
+            success_count += 1
+        except Exception as e:
+            logger.error(
+                "Prediction failed for %s/%s: %s",
+                target["user_id"],
+                target["ticker"],
+                e,
+            )
 
-        logger.info(
-            "Scheduled prediction scoring done — %d/%d succeeded",
-            success_count,
-            len(unique_targets),
-        )
-    except Exception as e:
-        logger.error("Scheduled prediction scoring failed: %s", e)
+    logger.info(
+        "Scheduled prediction scoring done — %d/%d succeeded",
+        success_count,
+        len(unique_targets),
+    )
+    if unique_targets and not success_count:
+        raise RuntimeError(f"all {len(unique_targets)} predictions failed")
+    return {"items": success_count, "failed": len(unique_targets) - success_count}
 
 
-def _scheduled_guide_generation():
-    """스케줄러에 의해 호출되는 일간 투자 가이드 생성 작업."""
+def _step_guide():
+    """파이프라인 단계 — 일간 투자 가이드 생성 작업."""
     logger.info("Scheduled guide generation started")
-    try:
-        client = get_supabase()
-        result = guide_service.generate_daily_guide(client)
-        logger.info(
-            "Scheduled guide done — date=%s, success=%s",
-            result.get("briefing_date", "N/A"),
-            result.get("success", False),
-        )
-    except Exception as e:
-        logger.error("Scheduled guide generation failed: %s", e)
+    client = get_supabase()
+    result = guide_service.generate_daily_guide(client)
+    logger.info(
+        "Scheduled guide done — date=%s, success=%s",
+        result.get("briefing_date", "N/A"),
+        result.get("success", False),
+    )
+    return {"success": bool(result.get("success", False))}
+
+
+def _step_risk_alert():
+    """파이프라인 단계 — 리스크 조건 체크 작업."""
+    logger.info("Scheduled risk alert check started")
+    client = get_supabase()
+    result = alert_service.check_risk_conditions(client)
+    logger.info(
+        "Scheduled risk check done — vix=%s, geo=%s, currency=%s, sent=%d",
+        result.vix_alert,
+        result.geopolitical_alert,
+        result.currency_alert,
+        result.notifications_sent,
+    )
+    return {"items": result.notifications_sent}
+
+
+# 시장 데이터 갱신 DAG: 거시·지정학 병렬 → 감성 → 공포/탐욕 → 스코어링 → 리스크·가이드 병렬
+# (감성은 지정학이 채운 RSS 캐시를 재사용하도록 지정학 뒤에 둔다)
+MARKET_REFRESH_STEPS: list[Step] = [
+    Step("macro", _step_macro),
+    Step("geo", _step_geo),
+    Step("sentiment", _step_sentiment, depends_on=("geo",)),
+    Step("fear_greed", _step_fear_greed, depends_on=("macro", "sentiment")),
+    Step("prediction", _step_prediction, depends_on=("fear_greed", "geo")),
+    Step("risk_alert", _step_risk_alert, depends_on=("prediction",)),
+    Step("guide", _step_guide, depends_on=("prediction",)),
+]
 
 
+@_tracked("market_refresh")
+def _scheduled_market_refresh():
+    """스케줄러에 의해 호출되는 시장 데이터 갱신 파이프라인 (단계별 실행도 원장에 기록).
+
+    단계를 시작할 때마다 리더인지 확인해, 실행 중 리더를 잃으면 남은 단계는 건너뛴다.
+    """
+    logger.info("Scheduled market refresh started")
+    result = run_pipeline(
+        "market_refresh", MARKET_REFRESH_STEPS, should_continue=is_scheduler_leader
+    )
+
+    client = get_supabase()
+    for name, step in result.steps.items():
+        if step.status == "skipped":
+            continue
+        job_ledger.record(
+            client,
+            f"market_refresh.{name}",
+            step.started_at or result.started_at,
+            step.duration_s,
+            step.status,
+            output=step.output,
+            error=step.error,
+            details={"upstream_failed": True} if step.upstream_failed else None,
+        )
+    job_ledger.prune(client)
+
+    if result.failed_steps:
+        logger.warning("Market refresh finished with failed steps: %s", result.failed_steps)
+    output = {
+        "items": len(result.steps) - len(result.failed_steps) - len(result.skipped_steps),
+        "failed": len(result.failed_steps),
+        "steps": {name: step.duration_s for name, step in result.steps.items()},
+    }
+    if result.skipped_steps:
+        logger.warning("Market refresh stopped after losing leadership: %s", result.skipped_steps)
+        output["skipped"] = result.skipped_steps
+    return output
+
+
+@_tracked("weekly_report")
 def _scheduled_weekly_report():
     """스케줄러에 의해 호출되는 주간 리포트 생성 작업 (매주 일요일 21:00 KST)."""
     logger.info("Scheduled weekly report generation started")
-    try:
-        client = get_supabase()
-        result = weekly_report_service.generate_weekly_report(client)
-        logger.info(
-            "Scheduled weekly report done — week=%s, success=%s",
-            result.get("week_start_date", "N/A"),
-            result.get("success", False),
-        )
-    except Exception as e:
-        logger.error("Scheduled weekly report generation failed: %s", e)
+    client = get_supabase()
+    result = weekly_report_service.generate_weekly_report(client)
+    logger.info(
+        "Scheduled weekly report done — week=%s, success=%s",
+        result.get("week_start_date", "N/A"),
+        result.get("success", False),
+    )
+    return {"success": bool(result.get("success", False))}
+
+
+@_tracked("signal_calibration")
+def _scheduled_signal_calibration():
+    """스케줄러에 의해 호출되는 통합 스코어링 가중치 보정 작업 (매주 일요일 22:00 KST)."""
+    logger.info("Scheduled signal calibration started")
+    client = get_supabase()
+    result = signal_calibration_service.calibrate_signal_weights(client)
+    logger.info(
+        "Scheduled signal calibration done — samples=%d, updated=%s",
+        result.get("sample_count", 0),
+        result.get("updated", False),
+    )
+    return {"items": result.get("sample_count", 0), "updated": result.get("updated", False)}
 
 
+@_tracked("price_alert_check", record_idle=False)
 def _scheduled_price_alert_check():
-    """스케줄러에 의해 호출되는 가격 알림 체크 작업."""
-    logger.info("Scheduled price alert check started")
-    try:
-        client = get_supabase()
-        result = alert_service.check_price_alerts(client)
+    """스케줄러에 의해 호출되는 가격 알림 폴링 틱 (조회할 티커가 없으면 바로 끝난다)."""
+    client = get_supabase()
+    result = alert_service.check_price_alerts(client)
+    if result.checked_count:
         logger.info(
-            "Scheduled price alert check done — checked=%d, triggered=%d",
+            "Scheduled price alert check done — checked=%d, skipped=%d, triggered=%d",
             result.checked_count,
+            result.skipped_count,
             result.triggered_count,
         )
-    except Exception as e:
-        logger.error("Scheduled price alert check failed: %s", e)
+    return {
+        "items": result.checked_count,
+        "failed": len(result.failed_tickers),
+        "skipped": result.skipped_count,
+        "triggered": result.triggered_count,
+    }
 
 
-def _scheduled_risk_alert_check():
-    """스케줄러에 의해 호출되는 리스크 조건 체크 작업."""
-    logger.info("Scheduled risk alert check started")
+def is_job_running(job_id: str) -> bool:
+    """이 프로세스에서 해당 작업이 실행 중인지."""
+    with _running_lock:
+        return job_id in _running_jobs
+
+
+def _dispatch_job_requests():
+    """job_requests 큐의 즉시 실행 요청을 해당 스케줄 작업의 다음 실행 시각(지금)으로 반영한다.
+
+    스케줄러를 통해 실행하므로 max_instances 정책이 그대로 적용된다. 이미 실행 중인 작업은
+    스케줄러가 조용히 건너뛰므로 dispatched로 남기지 않고 rejected("already running")로 기록한다.
+    """
     try:
         client = get_supabase()
-        result = alert_service.check_risk_conditions(client)
-        logger.info(
-            "Scheduled risk check done — vix=%s, geo=%s, currency=%s, sent=%d",
-            result.vix_alert,
-            result.geopolitical_alert,
-            result.currency_alert,
-            result.notifications_sent,
-        )
+        requests = job_queue.claim(client)
     except Exception as e:
-        logger.error("Scheduled risk alert check failed: %s", e)
+        logger.warning("Job request poll failed: %s", e)
+        return
+
+    now = datetime.now(scheduler.timezone)
+    for req in requests:
+        job_id = req.get("job_id")
+        if job_id not in TRIGGERABLE_JOBS or scheduler.get_job(job_id) is None:
+            job_queue.mark(client, req["id"], "rejected", f"unknown job: {job_id}")
+            continue
+        if is_job_running(job_id):
+            job_queue.mark(client, req["id"], "rejected", "already running")
+            logger.info("Job %s already running — request %s rejected", job_id, req["id"])
+            continue
+        scheduler.modify_job(job_id, next_run_time=now)
+        job_queue.mark(client, req["id"], "dispatched")
+        logger.info("Job %s triggered on demand (request %s)", job_id, req["id"])
+
+
+# ─── 리더 선출 ───
+
+
+def _build_lease() -> Lease | None:
+    """SCHEDULER_LOCK_BACKEND 설정에 맞는 임대 (none이면 락 없이 단독 실행)."""
+    backend = settings.scheduler_lock_backend
+    if backend == "database":
+        return DatabaseLease(get_supabase, make_holder_id(), settings.scheduler_lease_ttl)
+    if backend == "file":
+        return FileLease(settings.scheduler_lock_file)
+    if backend != "none":
+        logger.warning("Unknown SCHEDULER_LOCK_BACKEND=%s — running without lock", backend)
+    return None
+
+
+def _on_elected() -> None:
+    """리더가 되면 팔로워 동안 밀린 회차는 건너뛰고(이전 리더가 이미 실행) 다음 회차부터 실행한다."""
+    now = datetime.now(scheduler.timezone)
+    for job in scheduler.get_jobs():
+        scheduler.modify_job(job.id, next_run_time=job.trigger.get_next_fire_time(None, now))
+    scheduler.resume()
+    alert_engine.start(get_supabase)
+    logger.info("Scheduler resumed as leader")
+
+
+def _on_demoted() -> None:
+    """리더를 잃으면 새 회차를 멈춘다.
+
+    pause()는 이미 실행 중인 작업을 멈추지 않는다. market_refresh는 단계 사이마다 리더 여부를
+    확인해 남은 단계를 건너뛰지만, 실행 중이던 단계 1개(와 다른 작업의 현재 실행)는 끝까지 돈다.
+    그동안 새 리더가 같은 작업을 시작하면 해당 단계가 두 프로세스에서 겹칠 수 있다
+    (수집/스코어링은 같은 데이터를 다시 쓰는 정도, risk_alert는 알림이 중복될 수 있음).
+    """
+    scheduler.pause()
+    alert_engine.stop()
+    with _running_lock:
+        in_flight = sorted(_running_jobs)
+    if in_flight:
+        logger.warning("Scheduler paused (not leader) — in-flight jobs finish current step: %s", in_flight)
+    else:
+        logger.info("Scheduler paused (not leader)")
+
+
+def is_scheduler_leader() -> bool:
+    """이 프로세스가 크론잡을 실행 중인지 여부."""
+    if _election is not None:
+        return _election.is_leader
+    return scheduler.running
 
 
 def start_scheduler():
     """스케줄러를 시작한다.
 
     - ETF 동기화:       06:30 KST (1일 1회)
-    - 거시 수집:        07:00 / 13:00 / 18:00 KST
-    - 지정학 수집:      07:30 / 13:30 / 18:30 KST (거시 +30m)
-    - 감성 분석:        08:00 / 14:00 / 19:00 KST (지정학 +30m)
-    - 공포/탐욕 계산:   08:30 / 14:30 / 19:30 KST (감성 +30m)
-    - 통합 스코어링:    09:00 / 15:00 / 20:00 KST (공포탐욕 +30m)
-    - 리스크 알림:      09:30 / 15:30 / 20:30 KST (스코어링 +30m)
-    - 가이드 생성:      09:30 / 15:30 / 20:30 KST (리스크와 동시)
-    - 가격 알림:        07:00~23:50, 10분 간격
+    - 시장 데이터 갱신: 07:00 / 13:00 / 18:00 KST — MARKET_REFRESH_STEPS 파이프라인
+      (거시·지정학 → 감성 → 공포/탐욕 → 통합 스코어링 → 리스크 알림·가이드,
+       각 단계는 상위 단계 완료 즉시 시작)
+    - 가격 알림:        30초 간격 틱 — 거래소 개장 중인 티커만, 트리거 근접도에 따라 30초~15분 주기로 조회
+                        (조회 시세와 시세 피드 모두 알림 엔진이 즉시 평가)
+    - 주간 리포트:      매주 일요일 21:00 KST
+    - 가중치 보정:      매주 일요일 22:00 KST (주간 리포트 이후)
+    - 즉시 실행 요청:   JOB_QUEUE_POLL_SECONDS 간격으로 job_requests 큐 확인
+
+    여러 프로세스/레플리카가 동시에 호출해도 임대를 잡은 리더 1개만 작업을 실행한다.
+    나머지는 일시정지 상태로 대기하다 리더가 죽어 임대가 만료되면 인계받는다.
     """
+    global _election
     scheduler.add_job(
         _scheduled_etf_sync,
         trigger=CronTrigger(hour=6, minute=30, timezone="Asia/Seoul"),
         id="etf_sync",
+        **JOB_POLICIES["etf_sync"],
         name="ETF/Fund Sync",
         replace_existing=True,
     )
     scheduler.add_job(
-        _scheduled_macro_collect,
+        _scheduled_market_refresh,
         trigger=CronTrigger(hour="7,13,18", timezone="Asia/Seoul"),
-        id="macro_collection",
-        name="Macro Data Collection",
-        replace_existing=True,
-    )
-    scheduler.add_job(
-        _scheduled_geo_collect,
-        trigger=CronTrigger(hour="7,13,18", minute="30", timezone="Asia/Seoul"),
-        id="geo_collection",
-        name="Geopolitical News Collection",
-        replace_existing=True,
-    )
-    scheduler.add_job(
-        _scheduled_sentiment_collect,
-        trigger=CronTrigger(hour="8,14,19", timezone="Asia/Seoul"),
-        id="sentiment_collection",
-        name="News Sentiment Analysis",
-        replace_existing=True,
-    )
-    scheduler.add_job(
-        _scheduled_fear_greed_collect,
-        trigger=CronTrigger(hour="8,14,19", minute="30", timezone="Asia/Seoul"),
-        id="fear_greed_collection",
-        name="Fear & Greed Index Calculation",
-        replace_existing=True,
-    )
-    scheduler.add_job(
-        _scheduled_prediction_scoring,
-        trigger=CronTrigger(hour="9,15,20", timezone="Asia/Seoul"),
-        id="prediction_scoring",
-        name="Prediction Scoring",
+        id="market_refresh",
+        **JOB_POLICIES["market_refresh"],
+        name="Market Data Refresh Pipeline",
         replace_existing=True,
     )
     scheduler.add_job(
         _scheduled_price_alert_check,
-        trigger=CronTrigger(
-            hour="7-23", minute="*/10", timezone="Asia/Seoul",
-        ),
+        trigger=IntervalTrigger(seconds=alert_service.ALERT_TICK_SECONDS),
         id="price_alert_check",
+        **JOB_POLICIES["price_alert_check"],
         name="Price Alert Check",
         replace_existing=True,
     )
     scheduler.add_job(
-        _scheduled_risk_alert_check,
+        _scheduled_weekly_report,
         trigger=CronTrigger(
-            hour="9,15,20", minute="30", timezone="Asia/Seoul",
+            day_of_week="sun", hour=21, minute=0, timezone="Asia/Seoul",
         ),
-        id="risk_alert_check",
-        name="Risk Alert Check",
+        id="weekly_report",
+        **JOB_POLICIES["weekly_report"],
+        name="Weekly Report Generation",
         replace_existing=True,
     )
     scheduler.add_job(
-        _scheduled_guide_generation,
+        _scheduled_signal_calibration,
         trigger=CronTrigger(
-            hour="9,15,20", minute="30", timezone="Asia/Seoul",
+            day_of_week="sun", hour=22, minute=0, timezone="Asia/Seoul",
         ),
-        id="guide_generation",
-        name="Daily Guide Generation",
+        id="signal_calibration",
+        **JOB_POLICIES["signal_calibration"],
+        name="Signal Weight Calibration",
         replace_existing=True,
     )
     scheduler.add_job(
-        _scheduled_weekly_report,
-        trigger=CronTrigger(
-            day_of_week="sun", hour=21, minute=0, timezone="Asia/Seoul",
-        ),
-        id="weekly_report",
-        name="Weekly Report Generation",
+        _dispatch_job_requests,
+        trigger=IntervalTrigger(seconds=JOB_QUEUE_POLL_SECONDS),
+        id="job_queue",
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=JOB_QUEUE_POLL_SECONDS,
+        name="On-demand Job Requests",
         replace_existing=True,
     )
-    scheduler.start()
+    lease = _build_lease()
+    scheduler.start(paused=lease is not None)
     logger.info(
-        "Scheduler started — etf 06:30, macro 07/13/18, geo 07:30/13:30/18:30, "
-        "sentiment 08/14/19, fear-greed 08:30/14:30/19:30, "
-        "prediction 09/15/20, risk+guide 09:30/15:30/20:30, "
-        "price-alert every 10min (07~23), weekly-report Sun 21:00 KST"
+        "Scheduler started (lock=%s) — etf 06:30, market-refresh pipeline 07/13/18, "
+        "price-alert tick every %ds (market-hours adaptive), weekly-report Sun 21:00, "
+        "signal-calibration Sun 22:00 KST",
+        settings.scheduler_lock_backend if lease else "none",
+        alert_service.ALERT_TICK_SECONDS,
     )
+    if lease is not None:
+        _election = LeaderElection(lease, _on_elected, _on_demoted, settings.scheduler_lease_ttl)
+        _election.start()
+    else:
+        alert_engine.start(get_supabase)
 
 
 def stop_scheduler():
-    """스케줄러를 안전하게 종료한다."""
+    """스케줄러를 안전하게 종료한다 (리더였다면 임대를 반납해 즉시 인계)."""
+    global _election
+    if _election is not None:
+        _election.stop()
+        _election = None
+    alert_engine.stop()
     if scheduler.running:
         scheduler.shutdown(wait=False)
         logger.info("Scheduler stopped")
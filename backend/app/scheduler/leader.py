@@ -0,0 +1,188 @@
+"""스케줄러 리더 선출 — 여러 프로세스/레플리카 중 하나만 크론잡을 실행하도록 임대(lease)를 잡는다.
+
+- DatabaseLease: scheduler_leases 테이블의 임대 행 (acquire_scheduler_lease RPC로 원자적 획득/갱신).
+  리더가 죽으면 임대가 만료(ttl)되고 다른 인스턴스가 다음 갱신 주기에 인계받는다.
+- FileLease: 같은 호스트의 프로세스끼리만 유효한 fcntl 파일 락 (로컬 개발/테스트용).
+
+LeaderElection은 백그라운드 스레드에서 ttl/3 간격으로 임대를 갱신하고,
+리더가 되면 on_elected, 리더를 잃으면 on_demoted 콜백을 호출한다.
+DB 갱신이 일시적으로 실패하면 마지막 갱신 기준 임대 만료 직전까지는 리더를 유지한다.
+"""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from typing import Protocol
+
+from supabase import Client
+
+from app.utils.logger import get_logger
+
+try:  # POSIX 전용
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = get_logger(__name__)
+
+LEASE_NAME = "scheduler"
+DEFAULT_LEASE_TTL = 90  # seconds
+EXPIRY_MARGIN = 5  # seconds — 만료 직전에 스스로 물러나 두 리더가 겹치지 않게 한다
+
+
+def make_holder_id() -> str:
+    """인스턴스 식별자 (호스트:pid:난수)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class Lease(Protocol):
+    def acquire(self) -> bool: ...
+
+    def release(self) -> None: ...
+
+
+class DatabaseLease:
+    """scheduler_leases 행 기반 임대."""
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Client],
+        holder: str,
+        ttl: int = DEFAULT_LEASE_TTL,
+        name: str = LEASE_NAME,
+    ):
+        self.client_factory = client_factory
+        self.holder = holder
+        self.ttl = ttl
+        self.name = name
+
+    def acquire(self) -> bool:
+        """임대를 획득하거나 갱신한다. 다른 인스턴스가 유효한 임대를 가졌으면 False."""
+        result = (
+            self.client_factory()
+            .rpc(
+                "acquire_scheduler_lease",
+                {"p_name": self.name, "p_holder": self.holder, "p_ttl_seconds": self.ttl},
+            )
+            .execute()
+        )
+        return bool(result.data)
+
+    def release(self) -> None:
+        self.client_factory().rpc(
+            "release_scheduler_lease", {"p_name": self.name, "p_holder": self.holder}
+        ).execute()
+
+
+class FileLease:
+    """fcntl.flock 기반 임대 — 락을 쥔 프로세스가 죽으면 OS가 자동 해제한다."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: int | None = None
+
+    def acquire(self) -> bool:
+        if fcntl is None:
+            raise RuntimeError("file lease requires fcntl (POSIX)")
+        if self._fd is not None:
+            return True
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+class LeaderElection:
+    """임대를 주기적으로 갱신하며 리더 상태 전환 시 콜백을 호출한다."""
+
+    def __init__(
+        self,
+        lease: Lease,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None],
+        ttl: int = DEFAULT_LEASE_TTL,
+    ):
+        self.lease = lease
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.ttl = ttl
+        self.renew_interval = max(1.0, ttl / 3)
+        self._is_leader = False
+        self._renewed_at = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    def tick(self) -> bool:
+        """임대 획득/갱신을 1회 시도하고 리더 상태를 갱신한다."""
+        now = time.monotonic()
+        try:
+            held = self.lease.acquire()
+        except Exception as e:
+            logger.warning("Scheduler lease renewal failed: %s", e)
+            # 마지막으로 갱신한 임대가 아직 유효하면 리더를 유지
+            held = self._is_leader and now - self._renewed_at < self.ttl - EXPIRY_MARGIN
+        else:
+            if held:
+                self._renewed_at = now
+
+        if held and not self._is_leader:
+            self._is_leader = True
+            logger.info("Scheduler leadership acquired")
+            self.on_elected()
+        elif not held and self._is_leader:
+            self._is_leader = False
+            logger.warning("Scheduler leadership lost")
+            self.on_demoted()
+        return self._is_leader
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error("Scheduler leader election tick failed: %s", e)
+            self._stop.wait(self.renew_interval)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="scheduler-leader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """갱신을 멈추고 리더였다면 임대를 반납해 다른 인스턴스가 즉시 인계받게 한다."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._is_leader:
+            self._is_leader = False
+            self.on_demoted()
+            try:
+                self.lease.release()
+            except Exception as e:
+                logger.warning("Scheduler lease release failed: %s", e)
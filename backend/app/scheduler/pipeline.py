@@ -0,0 +1,161 @@
+"""의존성 기반 파이프라인 실행기 — 단계 간 선후관계(DAG)를 선언하고 준비된 단계부터 병렬 실행한다.
+
+- 각 단계는 상위 단계가 모두 끝나는 즉시 시작한다 (고정 크론 오프셋 대기 없음).
+- 서로 독립인 단계(거시/지정학, 리스크/가이드)는 스레드 풀에서 동시에 실행한다.
+- 상위 단계가 실패해도 하위 단계는 실행한다 (기존 크론 방식처럼 직전 데이터로 진행).
+  결과에는 upstream_failed로 표시해 신선도 문제를 추적할 수 있게 한다.
+- 단계별 시작 시각/소요 시간/상태를 기록한다.
+- should_continue가 False를 반환하면 아직 시작하지 않은 단계는 skipped로 남기고 중단한다
+  (실행 중인 단계는 끝까지 돈다 — 스레드는 중간에 멈출 수 없다).
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class Step:
+    name: str
+    func: Callable[[], object]  # 반환값은 StepResult.output에 보관
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str = "pending"  # success | failed | skipped
+    started_at: datetime | None = None
+    duration_s: float = 0.0
+    error: str | None = None
+    upstream_failed: bool = False
+    output: object = None  # 단계 함수 반환값 (처리 건수 등)
+
+
+@dataclass
+class PipelineResult:
+    name: str
+    started_at: datetime
+    duration_s: float = 0.0
+    steps: dict[str, StepResult] = field(default_factory=dict)
+
+    @property
+    def success(self) -> bool:
+        return all(s.status == "success" for s in self.steps.values())
+
+    @property
+    def failed_steps(self) -> list[str]:
+        return [n for n, s in self.steps.items() if s.status == "failed"]
+
+    @property
+    def skipped_steps(self) -> list[str]:
+        return [n for n, s in self.steps.items() if s.status == "skipped"]
+
+
+def validate(steps: list[Step]) -> None:
+    """이름 중복, 알 수 없는 의존성, 순환을 검사한다. 문제가 있으면 ValueError."""
+    names = [s.name for s in steps]
+    if len(set(names)) != len(names):
+        raise ValueError(f"duplicate step names: {names}")
+
+    known = set(names)
+    for step in steps:
+        unknown = set(step.depends_on) - known
+        if unknown:
+            raise ValueError(f"step {step.name!r} depends on unknown steps: {sorted(unknown)}")
+
+    # Kahn 위상 정렬로 순환 검사
+    indegree = {s.name: len(s.depends_on) for s in steps}
+    dependents: dict[str, list[str]] = {s.name: [] for s in steps}
+    for step in steps:
+        for dep in step.depends_on:
+            dependents[dep].append(step.name)
+    ready = [n for n, d in indegree.items() if d == 0]
+    visited = 0
+    while ready:
+        name = ready.pop()
+        visited += 1
+        for child in dependents[name]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+    if visited != len(steps):
+        raise ValueError("pipeline has a dependency cycle")
+
+
+def _run_step(step: Step, result: StepResult) -> StepResult:
+    result.started_at = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    try:
+        result.output = step.func()
+        result.status = "success"
+    except Exception as e:
+        result.status = "failed"
+        result.error = str(e)
+        logger.error("Pipeline step %s failed: %s", step.name, e)
+    result.duration_s = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_pipeline(
+    name: str,
+    steps: list[Step],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    should_continue: Callable[[], bool] | None = None,
+) -> PipelineResult:
+    """DAG를 실행하고 단계별 결과를 반환한다 (should_continue는 새 단계를 시작하기 전마다 확인)."""
+    validate(steps)
+    results = {s.name: StepResult(name=s.name) for s in steps}
+    pipeline = PipelineResult(name=name, started_at=datetime.now(timezone.utc), steps=results)
+    started = time.perf_counter()
+
+    done: set[str] = set()
+    running: dict[Future, str] = {}
+
+    def launch_ready(pool: ThreadPoolExecutor) -> None:
+        scheduled = done | set(running.values())
+        if should_continue is not None and not should_continue():
+            stopped = [n for n, r in results.items() if n not in scheduled and r.status == "pending"]
+            for step_name in stopped:
+                results[step_name].status = "skipped"
+            if stopped:
+                logger.warning("Pipeline %s stopped before %s", name, stopped)
+            return
+        for step in steps:
+            if step.name in scheduled or not all(d in done for d in step.depends_on):
+                continue
+            failed_deps = [d for d in step.depends_on if results[d].status == "failed"]
+            if failed_deps:
+                results[step.name].upstream_failed = True
+                logger.warning(
+                    "Pipeline step %s starting with failed upstream %s", step.name, failed_deps
+                )
+            running[pool.submit(_run_step, step, results[step.name])] = step.name
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"pipeline-{name}") as pool:
+        launch_ready(pool)
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                step_name = running.pop(future)
+                done.add(step_name)
+                r = results[step_name]
+                logger.info("Pipeline step %s %s in %.1fs", step_name, r.status, r.duration_s)
+            launch_ready(pool)
+
+    pipeline.duration_s = round(time.perf_counter() - started, 3)
+    logger.info(
+        "Pipeline %s finished in %.1fs — %s",
+        name,
+        pipeline.duration_s,
+        ", ".join(f"{n}={r.status}:{r.duration_s:.1f}s" for n, r in results.items()),
+    )
+    return pipeline
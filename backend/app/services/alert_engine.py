@@ -0,0 +1,332 @@
+"""가격 알림 엔진 — 시세가 들어올 때마다 미발동 알림을 증분 평가하고 발동/발송한다.
+
+시세 입력 경로:
+- 알림 폴러(alert_service.check_price_alerts): 조회한 시세로 process()를 직접 호출 (결과 집계 필요)
+- 시세 피드(quote_feed): 시세 API 조회 등 그 밖의 소스. start() 후 구독 스레드가 큐에서 꺼내 처리
+
+평가 규칙 (AlertIndex 이분 탐색):
+- TARGET_PRICE / STOP_LOSS: 1회성 — 발동 시 is_triggered = TRUE
+- DAILY_CHANGE: |전일 종가 대비 변동률| >= trigger_price(%) — 반복형, 거래소 세션(현지 거래일)당 최대 1회.
+  상장 거래소가 개장 중이거나 폐장 직후(DAILY_CHANGE_GRACE)일 때만 평가한다 —
+  휴장 중 들어온 직전 세션 시세로 다음 날 다시 발동하지 않도록.
+
+중복 방지:
+- 같은 티커의 가격/전일 종가가 직전과 같으면 평가를 건너뛴다 (재적재로 알림 구성이 바뀐 티커는 다시 평가)
+- 발동 처리한 알림은 다음 재적재까지 인덱스에서 제외한다
+- DB 갱신 RPC는 아직 발동 가능한 행만 갱신·반환하므로 여러 프로세스가 동시에 평가해도 1회만 발송된다
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+
+from supabase import Client
+
+from app.services import market_calendar, quote_feed, telegram_service
+from app.services.alert_index import DAILY_CHANGE, AlertIndex
+from app.services.quote_feed import Quote
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ENGINE_RELOAD_SECONDS = 60  # 알림 생성/삭제 반영 주기
+DAILY_CHANGE_GRACE = timedelta(minutes=20)  # 폐장 후 종가 반영 대기 (alert_service.POST_CLOSE_GRACE와 같게)
+QUEUE_MAX = 10_000
+ALERT_PAGE_SIZE = 1000  # PostgREST 기본 max-rows
+ALERT_COLUMNS = "id, user_id, ticker, company_name, alert_type, trigger_price, triggered_at"
+
+
+@dataclass
+class EngineResult:
+    triggered: int = 0
+    notified: int = 0
+
+
+def _parse_time(value) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def _session_day(ticker: str, at: datetime) -> date:
+    """at이 속한 상장 거래소의 현지 거래일 — DAILY_CHANGE 중복 방지 키."""
+    return at.astimezone(market_calendar.exchange_for(ticker).tz).date()
+
+
+def _session_start(ticker: str, at: datetime) -> datetime:
+    """at이 속한 현지 거래일의 시작 시각 (이 시각 이후 발동 기록이 있으면 같은 세션)."""
+    exchange = market_calendar.exchange_for(ticker)
+    return datetime.combine(_session_day(ticker, at), dt_time(0), tzinfo=exchange.tz)
+
+
+def load_untriggered(client: Client) -> list[dict]:
+    """미발동 알림 전체를 페이지 단위로 읽는다 (max-rows 제한에 잘리지 않도록)."""
+    rows: list[dict] = []
+    offset = 0
+    while True:
+        page = (
+            client.table("price_alerts")
+            .select(ALERT_COLUMNS)
+            .eq("is_triggered", False)
+            .order("id")
+            .range(offset, offset + ALERT_PAGE_SIZE - 1)
+            .execute()
+        ).data or []
+        rows.extend(page)
+        if len(page) < ALERT_PAGE_SIZE:
+            return rows
+        offset += ALERT_PAGE_SIZE
+
+
+def _rpc_ids(client: Client, name: str, params: dict) -> set[str] | None:
+    """갱신된 알림 id 집합 (RPC 실패 시 None)."""
+    try:
+        result = client.rpc(name, params).execute()
+    except Exception as e:
+        logger.error("Alert RPC %s failed: %s", name, e)
+        return None
+    return {row["id"] if isinstance(row, dict) else row for row in result.data or []}
+
+
+class AlertEngine:
+    def __init__(self):
+        self._index = AlertIndex([])
+        self._alert_count = 0
+        self._loaded_at: float | None = None
+        self._fired: set[str] = set()
+        self._fired_session: dict[str, date] = {}  # DAILY_CHANGE 알림 id → 마지막 발동 거래일
+        self._last_quote: dict[str, tuple[float, float | None]] = {}
+        self._ids_by_ticker: dict[str, frozenset[str]] = {}
+        self._lock = threading.Lock()
+        self._process_lock = threading.Lock()
+        self._queue: queue.Queue[Quote] = queue.Queue(maxsize=QUEUE_MAX)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._unsubscribe: Callable[[], None] | None = None
+
+    @property
+    def index(self) -> AlertIndex:
+        with self._lock:
+            return self._index
+
+    @property
+    def alert_count(self) -> int:
+        with self._lock:
+            return self._alert_count
+
+    # ─── 알림 적재 ───
+
+    def refresh(self, client: Client, force: bool = False) -> None:
+        """재적재 주기가 지났거나 force면 미발동 알림으로 인덱스를 다시 만든다."""
+        now = time.monotonic()
+        with self._lock:
+            if (
+                not force
+                and self._loaded_at is not None
+                and now - self._loaded_at < ENGINE_RELOAD_SECONDS
+            ):
+                return
+        rows = load_untriggered(client)
+        index = AlertIndex(rows)
+        sessions = {}
+        grouped: dict[str, set[str]] = {}
+        for row in rows:
+            grouped.setdefault(row["ticker"], set()).add(row["id"])
+            triggered_at = _parse_time(row.get("triggered_at"))
+            if row.get("alert_type") == DAILY_CHANGE and triggered_at:
+                sessions[row["id"]] = _session_day(row["ticker"], triggered_at)
+        with self._lock:
+            self._index = index
+            self._alert_count = len(rows)
+            self._loaded_at = now
+            self._fired.clear()
+            self._fired_session = sessions
+            ids_by_ticker = {t: frozenset(ids) for t, ids in grouped.items()}
+            # 알림 구성이 바뀐 티커는 직전 시세를 잊는다 — 이미 조건을 충족한 새 알림이
+            # 가격이 움직일 때까지 기다리지 않고 같은 시세로 바로 평가되도록
+            for ticker in self._ids_by_ticker.keys() | ids_by_ticker.keys():
+                if self._ids_by_ticker.get(ticker) != ids_by_ticker.get(ticker):
+                    self._last_quote.pop(ticker, None)
+            self._ids_by_ticker = ids_by_ticker
+
+    # ─── 평가 ───
+
+    def evaluate(self, quote: Quote, now: datetime) -> list[dict]:
+        """시세 1건으로 새로 조건을 충족한 알림 (중복/같은 세션 재발동/휴장 중 DAILY_CHANGE 제외)."""
+        key = (quote.price, quote.previous_close)
+        exchange = market_calendar.exchange_for(quote.ticker)
+        session_active = market_calendar.is_active(exchange, now, DAILY_CHANGE_GRACE)
+        session = _session_day(quote.ticker, now)
+        with self._lock:
+            if self._last_quote.get(quote.ticker) == key:
+                return []
+            self._last_quote[quote.ticker] = key
+            crossed = self._index.crossed(quote.ticker, quote.price, quote.change_pct)
+            return [
+                alert
+                for alert in crossed
+                if alert["id"] not in self._fired
+                and (
+                    alert["alert_type"] != DAILY_CHANGE
+                    or (session_active and self._fired_session.get(alert["id"]) != session)
+                )
+            ]
+
+    def _commit(self, client: Client, events: list[tuple[dict, Quote]], now: datetime) -> set[str]:
+        """발동을 DB에 일괄 반영하고 실제로 발동된 알림 id를 반환한다."""
+        one_shot = [(a, q) for a, q in events if a["alert_type"] != DAILY_CHANGE]
+        daily = [(a, q) for a, q in events if a["alert_type"] == DAILY_CHANGE]
+        fired: set[str] = set()
+        failed: list[tuple[dict, Quote]] = []
+        for batch, name, extra in (
+            (one_shot, "trigger_price_alerts", {}),
+            (
+                daily,
+                "trigger_daily_change_alerts",
+                {"p_session_starts": [_session_start(a["ticker"], now).isoformat() for a, _ in daily]},
+            ),
+        ):
+            if not batch:
+                continue
+            ids = _rpc_ids(
+                client,
+                name,
+                {
+                    "p_ids": [a["id"] for a, _ in batch],
+                    "p_prices": [q.price for _, q in batch],
+                    "p_triggered_at": now.isoformat(),
+                    **extra,
+                },
+            )
+            if ids is None:
+                failed.extend(batch)
+            else:
+                fired |= ids
+
+        failed_ids = {a["id"] for a, _ in failed}
+        with self._lock:
+            # 반영 실패한 티커는 같은 시세가 다시 와도 재평가되도록 직전 시세를 잊는다
+            for _, quote in failed:
+                self._last_quote.pop(quote.ticker, None)
+            for alert, _ in one_shot:
+                if alert["id"] in fired:
+                    self._fired.add(alert["id"])
+            for alert, _ in daily:
+                if alert["id"] in failed_ids:
+                    continue
+                # DB가 거절한 알림도 이번 세션에 다른 프로세스가 이미 발동한 것
+                self._fired_session[alert["id"]] = _session_day(alert["ticker"], now)
+        return fired
+
+    def process(
+        self, client: Client, quotes: list[Quote], now: datetime | None = None
+    ) -> EngineResult:
+        """시세 묶음을 평가하고 발동된 알림을 DB 반영 후 발송한다 (now는 테스트용)."""
+        with self._process_lock:
+            try:
+                self.refresh(client)
+            except Exception as e:
+                logger.warning("Alert engine reload failed, using cached index: %s", e)
+            now = now or datetime.now(timezone.utc)
+            events = [(alert, q) for q in quotes for alert in self.evaluate(q, now)]
+            if not events:
+                return EngineResult()
+            fired = self._commit(client, events, now)
+
+        notified = _notify_all(client, [(a, q) for a, q in events if a["id"] in fired])
+        if fired:
+            logger.info("Alert engine fired %d alerts (%d notified)", len(fired), notified)
+        return EngineResult(triggered=len(fired), notified=notified)
+
+    # ─── 피드 구독 ───
+
+    def _enqueue(self, quote: Quote) -> None:
+        try:
+            self._queue.put_nowait(quote)
+        except queue.Full:
+            logger.warning("Alert engine queue full, dropping quote for %s", quote.ticker)
+
+    def _run(self, client_factory: Callable[[], Client]) -> None:
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            # 밀린 시세는 티커별 최신 1건으로 합친다
+            latest = {first.ticker: first}
+            while True:
+                try:
+                    q = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                latest[q.ticker] = q
+            try:
+                self.process(client_factory(), list(latest.values()))
+            except Exception as e:
+                logger.error("Alert engine processing failed: %s", e)
+
+    def start(self, client_factory: Callable[[], Client]) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._unsubscribe = quote_feed.subscribe(self._enqueue)
+        self._thread = threading.Thread(
+            target=self._run, args=(client_factory,), name="alert-engine", daemon=True
+        )
+        self._thread.start()
+        logger.info("Alert engine subscribed to quote feed")
+
+    def stop(self) -> None:
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+def _notify_all(client: Client, events: list[tuple[dict, Quote]]) -> int:
+    """발동된 알림을 수신 대상 1회 조회로 묶어 동시 발송하고 성공 건수를 반환한다."""
+    if not events:
+        return 0
+    messages = [
+        (
+            alert["user_id"],
+            telegram_service.format_price_alert(
+                ticker=alert["ticker"],
+                company_name=alert.get("company_name"),
+                alert_type=alert["alert_type"],
+                trigger_price=float(alert["trigger_price"]),
+                current_price=quote.price,
+                change_pct=quote.change_pct,
+            ),
+        )
+        for alert, quote in events
+    ]
+    return sum(telegram_service.send_to_users(client, messages))
+
+
+_engine = AlertEngine()
+
+
+def get_engine() -> AlertEngine:
+    return _engine
+
+
+def start(client_factory: Callable[[], Client]) -> None:
+    _engine.start(client_factory)
+
+
+def stop() -> None:
+    _engine.stop()
+
+
+def reset() -> None:
+    """엔진 상태 초기화 (테스트용)."""
+    global _engine
+    _engine.stop()
+    _engine = AlertEngine()
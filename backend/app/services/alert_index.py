@@ -0,0 +1,105 @@
+"""가격 알림 인덱스 — 티커별 트리거 가격 정렬 배열로 도달한 알림을 이분 탐색으로 찾는다.
+
+- TARGET_PRICE: 오름차순 — price >= trigger 인 알림은 배열 앞쪽 구간 [0, bisect_right(price))
+- STOP_LOSS:    내림차순(부호 반전 키로 오름차순 저장) — price <= trigger 인 알림도 앞쪽 구간
+- DAILY_CHANGE: 변동률 임계값(%, trigger_price) 오름차순 — |전일 대비 변동률| >= 임계값 인 앞쪽 구간
+
+새 가격 1개당 O(log n + 도달 건수)로 평가하므로 알림 수가 10만 건 이상이어도 빠르다.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+
+TARGET_PRICE = "TARGET_PRICE"
+STOP_LOSS = "STOP_LOSS"
+DAILY_CHANGE = "DAILY_CHANGE"
+ALERT_TYPES = (TARGET_PRICE, STOP_LOSS, DAILY_CHANGE)
+
+
+@dataclass
+class _Thresholds:
+    """정렬된 키 배열과 같은 순서의 알림 배열."""
+
+    keys: list[float] = field(default_factory=list)
+    alerts: list[dict] = field(default_factory=list)
+
+    def crossed(self, key: float) -> list[dict]:
+        return self.alerts[: bisect_right(self.keys, key)]
+
+
+@dataclass
+class _TickerAlerts:
+    targets: _Thresholds = field(default_factory=_Thresholds)  # key = trigger
+    stops: _Thresholds = field(default_factory=_Thresholds)  # key = -trigger
+    daily: _Thresholds = field(default_factory=_Thresholds)  # key = 변동률 임계값(%)
+
+    @property
+    def count(self) -> int:
+        return len(self.targets.alerts) + len(self.stops.alerts) + len(self.daily.alerts)
+
+
+class AlertIndex:
+    """미발동 알림 목록으로 만든 티커별 임계값 인덱스 (불변)."""
+
+    def __init__(self, alerts: list[dict]):
+        grouped: dict[str, dict[str, list[tuple[float, dict]]]] = {}
+        for alert in alerts:
+            trigger = alert.get("trigger_price")
+            alert_type = alert.get("alert_type")
+            if trigger is None or alert_type not in ALERT_TYPES:
+                continue
+            trigger = float(trigger)
+            key = -trigger if alert_type == STOP_LOSS else trigger
+            by_type = grouped.setdefault(alert["ticker"], {t: [] for t in ALERT_TYPES})
+            by_type[alert_type].append((key, alert))
+
+        self._by_ticker: dict[str, _TickerAlerts] = {}
+        for ticker, by_type in grouped.items():
+            entry = _TickerAlerts()
+            for alert_type, thresholds in (
+                (TARGET_PRICE, entry.targets),
+                (STOP_LOSS, entry.stops),
+                (DAILY_CHANGE, entry.daily),
+            ):
+                pairs = sorted(by_type[alert_type], key=lambda p: p[0])
+                thresholds.keys = [k for k, _ in pairs]
+                thresholds.alerts = [a for _, a in pairs]
+            self._by_ticker[ticker] = entry
+
+    @property
+    def tickers(self) -> set[str]:
+        return set(self._by_ticker)
+
+    def count(self, ticker: str) -> int:
+        entry = self._by_ticker.get(ticker)
+        return entry.count if entry else 0
+
+    def crossed(self, ticker: str, price: float, change_pct: float | None = None) -> list[dict]:
+        """price에서 조건을 충족한 알림 (목표가 도달 + 손절가 이탈 + 일일 변동률 초과)."""
+        entry = self._by_ticker.get(ticker)
+        if entry is None:
+            return []
+        crossed = entry.targets.crossed(price) + entry.stops.crossed(-price)
+        if change_pct is not None:
+            crossed += entry.daily.crossed(abs(change_pct))
+        return crossed
+
+    def distance_pct(self, ticker: str, price: float, change_pct: float | None = None) -> float:
+        """price에서 아직 도달하지 않은 가장 가까운 트리거까지의 거리 (%, 일일 변동은 %p)."""
+        entry = self._by_ticker.get(ticker)
+        if entry is None or price <= 0:
+            return float("inf")
+        candidates: list[float] = []
+        i = bisect_right(entry.targets.keys, price)
+        if i < len(entry.targets.keys):
+            candidates.append(entry.targets.keys[i] - price)
+        # 손절 키는 -trigger — bisect_right 이후 구간이 trigger < price 인 미이탈 알림
+        j = bisect_right(entry.stops.keys, -price)
+        if j < len(entry.stops.keys):
+            candidates.append(price + entry.stops.keys[j])
+        distance = min(candidates) / price * 100 if candidates else float("inf")
+        if change_pct is not None:
+            k = bisect_right(entry.daily.keys, abs(change_pct))
+            if k < len(entry.daily.keys):
+                distance = min(distance, entry.daily.keys[k] - abs(change_pct))
+        return distance
@@ -1,10 +1,16 @@
-"""알림 서비스 — 가격 알림 체크 + 리스크 조건 감지."""
+"""알림 서비스 — 가격 알림 체크 + 리스크 조건 감지.
+
+가격 알림 폴러는 짧은 주기로 호출되며 티커별로 조회 여부를 결정한다 (적응형 폴링):
+- 상장 거래소가 개장 중이거나 폐장 직후(POST_CLOSE_GRACE)인 티커만 시세를 조회한다.
+- 조회 후 트리거까지 남은 거리에 따라 다음 조회 시각을 정한다 (가까울수록 자주).
+조회한 시세의 평가/발동/발송은 알림 엔진(alert_engine)이 담당한다.
+"""
 
 from __future__ import annotations
 
-import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from supabase import Client
 
@@ -16,7 +22,17 @@ from app.models.alert import (
     PriceAlertsListResponse,
     RiskAlertResult,
 )
-from app.services import stock_service, telegram_service
+from app.services import (
+    alert_engine,
+    market_calendar,
+    notification_targets,
+    quote_feed,
+    risk_exposure,
+    stock_service,
+    telegram_service,
+)
+from app.services.alert_index import AlertIndex
+from app.services.quote_feed import Quote
 from app.services.supabase_client import get_latest
 from app.utils.logger import get_logger
 
@@ -24,115 +40,125 @@ logger = get_logger(__name__)
 
 MAX_QUOTE_WORKERS = 8
 
+# 폐장 후에도 종가 반영을 위해 잠시 더 조회한다
+POST_CLOSE_GRACE = timedelta(minutes=20)
+# 트리거까지 거리(%) 상한 → 다음 조회까지 간격 (폴러 틱은 ALERT_TICK_SECONDS)
+ALERT_TICK_SECONDS = 30
+POLL_INTERVALS: tuple[tuple[float, timedelta], ...] = (
+    (0.5, timedelta(seconds=30)),
+    (2.0, timedelta(minutes=2)),
+    (5.0, timedelta(minutes=5)),
+    (float("inf"), timedelta(minutes=15)),
+)
+
+# 지정학 경보 대상 이벤트의 분석 시각 범위 — 시장 갱신 주기(최소 5시간)보다 짧게 두어
+# 이전 회차에 이미 경보한 이벤트로 다시 경보하지 않는다
+GEO_EVENT_WINDOW = timedelta(hours=4)
+
+_next_poll: dict[str, datetime] = {}  # ticker → 다음 조회 가능 시각
+_poll_lock = threading.Lock()
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # (A) 가격 알림 체크 — FR-E01
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
-def check_price_alerts(client: Client) -> AlertCheckResult:
-    """미발동 가격 알림을 체크하고 조건 충족 시 트리거한다."""
+def _poll_interval(distance_pct: float) -> timedelta:
+    for limit, interval in POLL_INTERVALS:
+        if distance_pct <= limit:
+            return interval
+    return POLL_INTERVALS[-1][1]
+
+
+def _due_tickers(tickers: set[str], now: datetime, force: bool) -> list[str]:
+    """이번 주기에 시세를 조회할 티커 — 거래소 활성 + 다음 조회 시각 도래."""
+    with _poll_lock:
+        for stale in set(_next_poll) - tickers:
+            del _next_poll[stale]
+        if force:
+            return sorted(tickers)
+        return sorted(
+            t
+            for t in tickers
+            if market_calendar.is_active(market_calendar.exchange_for(t), now, POST_CLOSE_GRACE)
+            and now >= _next_poll.get(t, now)
+        )
+
+
+def _schedule_next_polls(index: AlertIndex, quotes: list[Quote], now: datetime) -> None:
+    """조회 성공한 티커의 다음 조회 시각 (실패한 티커는 다음 틱에 재시도)."""
+    with _poll_lock:
+        for quote in quotes:
+            distance = index.distance_pct(quote.ticker, quote.price, quote.change_pct)
+            _next_poll[quote.ticker] = now + _poll_interval(distance)
+
+
+def reset_poll_state() -> None:
+    with _poll_lock:
+        _next_poll.clear()
+
+
+def check_price_alerts(client: Client, force: bool = False) -> AlertCheckResult:
+    """미발동 가격 알림을 체크하고 조건 충족 시 트리거한다.
+
+    force=False(스케줄러)면 거래소 활성 + 조회 주기가 도래한 티커만 조회하고,
+    force=True(관리자 수동 체크)면 알림을 다시 읽고 모든 티커를 즉시 조회한다.
+    """
     now = datetime.now(timezone.utc)
 
-    # 1. 미발동 알림 조회
-    result = (
-        client.table("price_alerts")
-        .select("*")
-        .eq("is_triggered", False)
-        .execute()
-    )
-    alerts = result.data or []
-    checked_count = len(alerts)
+    # 1. 알림 엔진의 미발동 알림 인덱스 (ENGINE_RELOAD_SECONDS마다 재적재)
+    engine = alert_engine.get_engine()
+    engine.refresh(client, force=force)
+    index = engine.index
 
-    if not alerts:
+    # 2. 조회 대상 티커 선정 → 현재가 병렬 조회
+    unique_tickers = _due_tickers(index.tickers, now, force)
+    checked_count = sum(index.count(t) for t in unique_tickers)
+    skipped_count = engine.alert_count - checked_count
+
+    if not checked_count:
         return AlertCheckResult(
             checked_count=0,
+            skipped_count=skipped_count,
             triggered_count=0,
             notified_count=0,
             failed_tickers=[],
             checked_at=now,
         )
 
-    # 2. 고유 티커 추출 → 현재가 병렬 조회
-    unique_tickers = list({a["ticker"] for a in alerts})
-    prices: dict[str, float | None] = {}
+    quotes: list[Quote] = []
     failed_tickers: list[str] = []
 
+    # 엔진에 직접 넘기므로 시세 피드에는 발행하지 않는다 (중복 평가 방지)
     with ThreadPoolExecutor(max_workers=MAX_QUOTE_WORKERS) as executor:
         future_map = {
-            executor.submit(stock_service.fetch_quote, t): t
+            executor.submit(stock_service.fetch_quote, t, publish=False): t
             for t in unique_tickers
         }
         for future in future_map:
             ticker = future_map[future]
             try:
-                quote = future.result(timeout=30)
-                prices[ticker] = quote.price
+                quote = quote_feed.from_stock_quote(future.result(timeout=30), source="poll")
             except Exception as e:
                 logger.error("Quote fetch failed for %s: %s", ticker, e)
-                prices[ticker] = None
+                quote = None
+            if quote is None:
                 failed_tickers.append(ticker)
+            else:
+                quotes.append(quote)
 
-    # 3. 조건 판정 + 트리거
-    triggered_count = 0
-    notified_count = 0
-
-    for alert in alerts:
-        ticker = alert["ticker"]
-        current_price = prices.get(ticker)
-        if current_price is None:
-            continue
-
-        alert_type = alert["alert_type"]
-        trigger_price = float(alert["trigger_price"])
-        triggered = False
-
-        if alert_type == "TARGET_PRICE" and current_price >= trigger_price:
-            triggered = True
-        elif alert_type == "STOP_LOSS" and current_price <= trigger_price:
-            triggered = True
-        # DAILY_CHANGE: Phase 1 미구현
-
-        if not triggered:
-            continue
-
-        triggered_count += 1
-
-        # 4. DB 업데이트
-        try:
-            client.table("price_alerts").update(
-                {
-                    "is_triggered": True,
-                    "triggered_at": now.isoformat(),
-                    "current_price": current_price,
-                }
-            ).eq("id", alert["id"]).execute()
-        except Exception as e:
-            logger.error("Failed to update alert %s: %s", alert["id"], e)
-            continue
-
-        # 5. 텔레그램 알림 발송
-        msg = telegram_service.format_price_alert(
-            ticker=ticker,
-            company_name=alert.get("company_name"),
-            alert_type=alert_type,
-            trigger_price=trigger_price,
-            current_price=current_price,
-        )
-        try:
-            sent = asyncio.run(
-                telegram_service.send_to_user_async(alert["user_id"], msg)
-            )
-        except RuntimeError:
-            # 이미 이벤트 루프가 실행 중인 경우
-            sent = telegram_service.send_to_default(msg)
-
-        if sent:
-            notified_count += 1
+    # 3. 알림 엔진 평가 → 일괄 발동 → 발송
+    _schedule_next_polls(index, quotes, now)
+    outcome = engine.process(client, quotes)
+    triggered_count = outcome.triggered
+    notified_count = outcome.notified
 
     logger.info(
-        "Price alert check: checked=%d, triggered=%d, notified=%d, failed=%s",
+        "Price alert check: tickers=%d, checked=%d, skipped=%d, triggered=%d, notified=%d, failed=%s",
+        len(unique_tickers),
         checked_count,
+        skipped_count,
         triggered_count,
         notified_count,
         failed_tickers,
@@ -140,6 +166,7 @@ def check_price_alerts(client: Client) -> AlertCheckResult:
 
     return AlertCheckResult(
         checked_count=checked_count,
+        skipped_count=skipped_count,
         triggered_count=triggered_count,
         notified_count=notified_count,
         failed_tickers=failed_tickers,
@@ -153,7 +180,11 @@ def check_price_alerts(client: Client) -> AlertCheckResult:
 
 
 def check_risk_conditions(client: Client) -> RiskAlertResult:
-    """리스크 조건(VIX/환율/지정학)을 체크하고 알림을 발송한다."""
+    """리스크 조건(VIX/환율/지정학)을 체크하고, 보유 종목이 노출된 사용자에게만 알림을 발송한다.
+
+    노출 판정은 risk_exposure가 전체 보유 종목을 한 번에 읽어 배열 연산으로 수행한다.
+    보유 종목을 읽지 못하면 이전처럼 모든 활성 대상에게 같은 메시지를 브로드캐스트한다.
+    """
     now = datetime.now(timezone.utc)
 
     vix_alert = False
@@ -162,6 +193,7 @@ def check_risk_conditions(client: Client) -> RiskAlertResult:
     usd_krw_change_pct: float | None = None
     geopolitical_alert = False
     high_urgency_count = 0
+    geo_events: list[dict] = []
 
     # 1. VIX 체크 — 최신 스냅샷에서
     latest = get_latest(client)
@@ -193,62 +225,86 @@ def check_risk_conditions(client: Client) -> RiskAlertResult:
         except Exception as e:
             logger.error("Currency change check failed: %s", e)
 
-    # 3. 지정학 리스크 — sentiment_results에서 HIGH urgency GEOPOLITICAL 조회
+    # 3. 지정학 리스크 — 최근 GEO_EVENT_WINDOW 내 HIGH urgency GEOPOLITICAL 조회
     try:
+        since = (datetime.now(timezone.utc) - GEO_EVENT_WINDOW).isoformat()
         geo_result = (
             client.table("sentiment_results")
-            .select("id")
+            .select("id, tickers, affected_sectors, affected_countries")
             .eq("event_type", "GEOPOLITICAL")
             .eq("urgency", "HIGH")
+            .gte("analyzed_at", since)
             .order("analyzed_at", desc=True)
             .limit(10)
             .execute()
         )
-        high_urgency_count = len(geo_result.data or [])
+        geo_events = geo_result.data or []
+        high_urgency_count = len(geo_events)
         if high_urgency_count > 0:
             geopolitical_alert = True
     except Exception as e:
         logger.error("Geopolitical risk check failed: %s", e)
 
-    # 4. 조건 충족 시 알림 브로드캐스트
+    # 4. 조건 충족 시 노출된 사용자에게 발송
     notifications_sent = 0
+    exposed_user_count = 0
     if vix_alert or currency_alert or geopolitical_alert:
         msg = telegram_service.format_risk_alert(
             vix=vix_value,
             high_urgency_count=high_urgency_count,
             usd_krw_change_pct=usd_krw_change_pct,
         )
+        signals = risk_exposure.RiskSignals(
+            vix_alert=vix_alert,
+            currency_alert=currency_alert,
+            geo_events=geo_events,
+        )
 
-        # 모든 활성 notification_targets에 발송
+        exposures: list[risk_exposure.UserExposure] | None
         try:
-            targets = (
-                client.table("notification_targets")
-                .select("telegram_chat_id")
-                .eq("is_active", True)
-                .execute()
-            )
-            for target in targets.data or []:
-                chat_id = target.get("telegram_chat_id")
-                if chat_id:
-                    ok = telegram_service.send_message(chat_id, msg)
-                    if ok:
-                        notifications_sent += 1
+            exposures = risk_exposure.evaluate(risk_exposure.load_holdings(client), signals)
         except Exception as e:
-            logger.error("Risk alert broadcast failed: %s", e)
+            logger.error("Per-user risk evaluation failed, broadcasting to all targets: %s", e)
+            exposures = None
+
+        if exposures is None:
+            try:
+                chat_ids = notification_targets.active_chat_ids(client)
+                notifications_sent = telegram_service.broadcast(chat_ids, msg)
+            except Exception as e:
+                logger.error("Risk alert broadcast failed: %s", e)
+        else:
+            exposed_user_count = len(exposures)
+            messages = [
+                (
+                    e.user_id,
+                    telegram_service.format_risk_alert(
+                        vix=vix_value if e.vix else None,
+                        high_urgency_count=e.geo_events,
+                        usd_krw_change_pct=usd_krw_change_pct if e.currency else None,
+                        exposed_tickers=e.tickers,
+                    ),
+                )
+                for e in exposures
+            ]
+            notifications_sent = sum(
+                telegram_service.send_to_users(client, messages, fallback_default=False)
+            )
 
-        # fallback: 기본 chat_id로도 발송
+        # fallback: 노출 사용자에게 보내지 못했으면 기본 chat_id로 전체 요약 발송
         if notifications_sent == 0:
             if telegram_service.send_to_default(msg):
                 notifications_sent = 1
 
     logger.info(
-        "Risk check: vix=%s(%.1f), geo=%s(%d), currency=%s(%.2f%%), sent=%d",
+        "Risk check: vix=%s(%.1f), geo=%s(%d), currency=%s(%.2f%%), exposed_users=%d, sent=%d",
         vix_alert,
         vix_value or 0,
         geopolitical_alert,
         high_urgency_count,
         currency_alert,
         usd_krw_change_pct or 0,
+        exposed_user_count,
         notifications_sent,
     )
 
@@ -259,6 +315,7 @@ def check_risk_conditions(client: Client) -> RiskAlertResult:
         high_urgency_count=high_urgency_count,
         currency_alert=currency_alert,
         usd_krw_change_pct=usd_krw_change_pct,
+        exposed_user_count=exposed_user_count,
         notifications_sent=notifications_sent,
         checked_at=now,
     )
@@ -0,0 +1,193 @@
+"""수집 기사 중복 제거 — 정규화 URL 해시 + 제목 지문 인덱스.
+
+매 수집 주기(07/13/18시 시장 데이터 갱신)마다 피드 상위 기사를 다시 가져오므로 대부분이 직전 주기와 겹친다.
+이미 감성 분석한 기사는 LLM 호출과 DB 재저장을 건너뛴다.
+
+- seen_articles 테이블에 영속 저장하고, 프로세스 메모리 set에 미러링한다
+  (최근 SEEN_RETENTION_DAYS일치 수천 건 규모라 Bloom 필터 없이 set으로 충분).
+- 같은 기사가 다른 피드/추적 파라미터로 들어와도 URL 정규화 또는 제목 지문으로 걸러진다.
+"""
+
+import hashlib
+import re
+import threading
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from supabase import Client
+
+from app.models.sentiment import NewsArticle
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SEEN_TABLE = "seen_articles"
+SEEN_RETENTION_DAYS = 14
+PAGE_SIZE = 1000
+MIN_TITLE_CHARS = 12  # 정규화 제목이 이보다 짧으면 제목 지문 비교 생략 (오탐 방지)
+
+# 기사 식별과 무관한 추적용 쿼리 파라미터
+TRACKING_PARAMS = frozenset(
+    {"fbclid", "gclid", "ref", "cmpid", "ocid", "rss", "feed", "from", "cid"}
+)
+TRACKING_PREFIXES = ("utm_",)
+
+# 제목 끝 매체명 접미사 (" - Reuters", " | BBC News")
+_SOURCE_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{2,30}$")
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+_seen_urls: set[str] = set()
+_seen_titles: set[str] = set()
+_loaded = False
+_lock = threading.Lock()
+
+
+# ─── 정규화/해시 ───
+
+
+def normalize_url(url: str) -> str:
+    """스킴/호스트 소문자화, www·fragment·추적 파라미터·끝 슬래시 제거, 쿼리 정렬."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    )
+    scheme = "https" if parts.scheme in ("http", "https") else parts.scheme
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def normalize_title(title: str) -> str:
+    """NFKC 정규화, 매체명 접미사 제거, 소문자화, 기호/공백 제거."""
+    text = unicodedata.normalize("NFKC", title).strip()
+    text = _SOURCE_SUFFIX.sub("", text)
+    return _NON_WORD.sub("", text.lower())
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def url_hash(url: str) -> str:
+    return _digest(normalize_url(url))
+
+
+def title_hash(title: str) -> str:
+    return _digest(normalize_title(title))
+
+
+# ─── 인덱스 로드/조회 ───
+
+
+def _ensure_loaded(client: Client) -> None:
+    """최근 보존 기간의 seen_articles를 메모리 set으로 1회 로드한다."""
+    global _loaded
+    with _lock:
+        if _loaded:
+            return
+        since = (datetime.now(timezone.utc) - timedelta(days=SEEN_RETENTION_DAYS)).isoformat()
+        offset = 0
+        try:
+            while True:
+                result = (
+                    client.table(SEEN_TABLE)
+                    .select("url_hash, title_hash")
+                    .gte("first_seen_at", since)
+                    .range(offset, offset + PAGE_SIZE - 1)
+                    .execute()
+                )
+                page = result.data or []
+                for row in page:
+                    _seen_urls.add(row["url_hash"])
+                    _seen_titles.add(row["title_hash"])
+                if len(page) < PAGE_SIZE:
+                    break
+                offset += PAGE_SIZE
+            _loaded = True
+            logger.info("Seen-article index loaded: %d urls", len(_seen_urls))
+        except Exception as e:
+            # 로드 실패 시 이번 주기는 메모리 set만으로 판정하고 다음 주기에 재시도
+            logger.warning("Seen-article index load failed: %s", e)
+
+
+def filter_new(client: Client, articles: list[NewsArticle]) -> tuple[list[NewsArticle], int]:
+    """이미 분석했거나 같은 수집 주기 내에서 겹치는 기사를 제외한다.
+
+    Returns
+    -------
+    (신규 기사 목록, 중복으로 제외된 건수)
+    """
+    _ensure_loaded(client)
+
+    fresh: list[NewsArticle] = []
+    batch_urls: set[str] = set()
+    batch_titles: set[str] = set()
+    with _lock:
+        for article in articles:
+            if not article.title:
+                continue
+            u = url_hash(article.link)
+            if u in _seen_urls or u in batch_urls:
+                continue
+            if len(normalize_title(article.title)) >= MIN_TITLE_CHARS:
+                t = title_hash(article.title)
+                if t in _seen_titles or t in batch_titles:
+                    continue
+                batch_titles.add(t)
+            batch_urls.add(u)
+            fresh.append(article)
+
+    duplicates = len(articles) - len(fresh)
+    logger.info("Article dedup: %d new, %d duplicate", len(fresh), duplicates)
+    return fresh, duplicates
+
+
+def mark_seen(client: Client, articles: list[NewsArticle]) -> None:
+    """분석 완료 기사를 인덱스(DB + 메모리)에 등록한다."""
+    if not articles:
+        return
+    now = datetime.now(timezone.utc).isoformat()
+    rows = {}
+    for article in articles:
+        u = url_hash(article.link)
+        rows[u] = {
+            "url_hash": u,
+            "title_hash": title_hash(article.title),
+            "source": article.source,
+            "first_seen_at": now,
+        }
+
+    with _lock:
+        for row in rows.values():
+            _seen_urls.add(row["url_hash"])
+            _seen_titles.add(row["title_hash"])
+
+    try:
+        client.table(SEEN_TABLE).upsert(
+            list(rows.values()), on_conflict="url_hash", ignore_duplicates=True
+        ).execute()
+    except Exception as e:
+        logger.warning("Failed to persist seen articles: %s", e)
+
+
+def prune(client: Client) -> None:
+    """보존 기간이 지난 인덱스 항목을 삭제한다."""
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=SEEN_RETENTION_DAYS)).isoformat()
+    try:
+        client.table(SEEN_TABLE).delete().lt("first_seen_at", cutoff).execute()
+    except Exception as e:
+        logger.warning("Seen-article prune failed: %s", e)
+
+
+def reset_cache() -> None:
+    """메모리 미러를 비운다 (다음 조회 시 DB에서 다시 로드)."""
+    global _loaded
+    with _lock:
+        _seen_urls.clear()
+        _seen_titles.clear()
+        _loaded = False
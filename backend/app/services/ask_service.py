@@ -1,19 +1,19 @@
 """AI Q&A 서비스 — 질문에 따라 컨텍스트를 수집하고 AI 답변 생성."""
 
-import json
+import asyncio
 import re
-from datetime import datetime, timezone
+from typing import AsyncIterator
 
-import httpx
 from supabase import Client
 
 from app.config import settings
+from app.services import llm_client, prompt_context
+from app.services.keyword_matcher import KeywordMatcher
 from app.services.supabase_client import get_latest
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
 # 딥링크 매핑: 키워드 → 페이지
@@ -35,6 +35,23 @@ DEEPLINK_KEYWORDS: dict[str, dict] = {
     "용어": {"label": "용어사전", "url": "/glossary"},
 }
 
+# 질문 키워드 → 추가 컨텍스트 종류
+CONTEXT_KEYWORDS: dict[str, list[str]] = {
+    "geo": ["지정학", "전쟁", "분쟁", "제재", "관세", "중동", "대만", "러시아", "북한", "무역"],
+    "sentiment": ["감성", "뉴스", "시장 분위기", "센티먼트", "심리"],
+    "fear_greed": ["공포", "탐욕", "fear", "greed", "심리지수"],
+}
+
+_context_matcher = KeywordMatcher(CONTEXT_KEYWORDS)
+
+# 딥링크는 URL 단위로 매칭 (라벨 정의 순서 = DEEPLINK_KEYWORDS 순서)
+_DEEPLINK_BY_URL: dict[str, str] = {}
+_deeplink_keywords: dict[str, list[str]] = {}
+for _keyword, _link in DEEPLINK_KEYWORDS.items():
+    _DEEPLINK_BY_URL.setdefault(_link["url"], _link["label"])
+    _deeplink_keywords.setdefault(_link["url"], []).append(_keyword)
+_deeplink_matcher = KeywordMatcher(_deeplink_keywords)
+
 
 def _get_model_from_db(client: Client) -> str:
     """model_configs에서 Q&A용 모델을 조회한다."""
@@ -57,7 +74,7 @@ def _get_model_from_db(client: Client) -> str:
 def _build_context(client: Client, question: str) -> dict:
     """질문 내용에 따라 관련 데이터를 동적으로 수집한다."""
     context: dict = {}
-    q_lower = question.lower()
+    matched = _context_matcher.match(question)
 
     # 거시경제 컨텍스트 (항상 포함 — 기본)
     snapshot = get_latest(client)
@@ -71,8 +88,7 @@ def _build_context(client: Client, question: str) -> dict:
         }
 
     # 지정학 키워드 감지
-    geo_keywords = ["지정학", "전쟁", "분쟁", "제재", "관세", "중동", "대만", "러시아", "북한", "무역"]
-    if any(kw in q_lower for kw in geo_keywords):
+    if "geo" in matched:
         try:
             geo_result = (
                 client.table("geopolitical_risks")
@@ -91,8 +107,7 @@ def _build_context(client: Client, question: str) -> dict:
         context["mentioned_tickers"] = ticker_pattern[:5]
 
     # 감성 분석 컨텍스트
-    sentiment_keywords = ["감성", "뉴스", "시장 분위기", "센티먼트", "심리"]
-    if any(kw in q_lower for kw in sentiment_keywords):
+    if "sentiment" in matched:
         try:
             sent_result = (
                 client.table("sentiment_results")
@@ -106,8 +121,7 @@ def _build_context(client: Client, question: str) -> dict:
             logger.warning("Sentiment context fetch failed: %s", e)
 
     # 공포/탐욕 컨텍스트
-    fg_keywords = ["공포", "탐욕", "fear", "greed", "심리지수"]
-    if any(kw in q_lower for kw in fg_keywords):
+    if "fear_greed" in matched:
         try:
             fg_result = (
                 client.table("fear_greed_snapshots")
@@ -126,40 +140,40 @@ def _build_context(client: Client, question: str) -> dict:
 
 def _extract_deeplinks(question: str, answer: str) -> list[dict]:
     """질문+답변에서 관련 페이지 딥링크를 추출한다."""
-    combined = (question + " " + answer).lower()
-    seen_urls: set[str] = set()
-    links: list[dict] = []
-
-    for keyword, link_info in DEEPLINK_KEYWORDS.items():
-        if keyword in combined and link_info["url"] not in seen_urls:
-            links.append({"label": link_info["label"], "url": link_info["url"]})
-            seen_urls.add(link_info["url"])
-
+    hits = _deeplink_matcher.match(question + " " + answer)
+    # 적중 횟수 순이 아닌 DEEPLINK_KEYWORDS 정의 순서를 유지한다
+    links = [
+        {"label": label, "url": url}
+        for url, label in _DEEPLINK_BY_URL.items()
+        if url in hits
+    ]
     return links[:5]
 
 
-def ask_question(
-    client: Client,
-    user_id: str,
-    question: str,
-) -> dict:
-    """AI Q&A: 컨텍스트 수집 → AI 답변 → 딥링크 생성 → DB 저장."""
-    context = _build_context(client, question)
-    model = _get_model_from_db(client)
-
-    if not settings.openrouter_api_key:
-        logger.warning("OPENROUTER_API_KEY not set — returning fallback answer")
-        answer = (
-            "AI 답변 기능이 아직 활성화되지 않았습니다. "
-            "관리자에게 OpenRouter API 키 설정을 요청해 주세요."
-        )
-        deeplinks = _extract_deeplinks(question, answer)
-        _save_conversation(client, user_id, question, answer, context, deeplinks)
-        return {"answer": answer, "deeplinks": deeplinks, "context_data": context}
-
-    context_json = json.dumps(context, ensure_ascii=False, default=str)
-
-    prompt = f"""당신은 주식 투자 AI 어시스턴트 "Stock Guide"입니다.
+NO_API_KEY_ANSWER = (
+    "AI 답변 기능이 아직 활성화되지 않았습니다. "
+    "관리자에게 OpenRouter API 키 설정을 요청해 주세요."
+)
+ERROR_ANSWER = (
+    "죄송합니다. 일시적으로 AI 답변을 생성할 수 없습니다. "
+    "잠시 후 다시 시도해 주세요."
+)
+
+
+def _build_prompt(context: dict, question: str) -> str:
+    """컨텍스트 + 질문으로 Q&A 프롬프트를 만든다."""
+    context_json = prompt_context.build_context(
+        "ask",
+        [
+            ("macro", context.get("macro")),
+            ("mentioned_tickers", context.get("mentioned_tickers")),
+            ("fear_greed", context.get("fear_greed")),
+            ("geo_risks", context.get("geo_risks")),
+            ("recent_sentiment", context.get("recent_sentiment")),
+        ],
+    )
+
+    return f"""당신은 주식 투자 AI 어시스턴트 "Stock Guide"입니다.
 초보 투자자도 이해할 수 있도록 쉽고 친절하게 답변하세요.
 
 ## 현재 시장 데이터
@@ -177,29 +191,35 @@ def ask_question(
 
 답변만 작성하세요."""
 
+
+def ask_question(
+    client: Client,
+    user_id: str,
+    question: str,
+) -> dict:
+    """AI Q&A: 컨텍스트 수집 → AI 답변 → 딥링크 생성 → DB 저장."""
+    context = _build_context(client, question)
+    model = _get_model_from_db(client)
+
+    if not settings.openrouter_api_key:
+        logger.warning("OPENROUTER_API_KEY not set — returning fallback answer")
+        answer = NO_API_KEY_ANSWER
+        deeplinks = _extract_deeplinks(question, answer)
+        _save_conversation(client, user_id, question, answer, context, deeplinks)
+        return {"answer": answer, "deeplinks": deeplinks, "context_data": context}
+
     try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.5,
-            },
+        answer = llm_client.chat_completion(
+            model,
+            llm_client.user_prompt(_build_prompt(context, question)),
+            feature="ask",
+            temperature=0.5,
             timeout=60.0,
-        )
-        response.raise_for_status()
-        answer = response.json()["choices"][0]["message"]["content"].strip()
+        ).content.strip()
 
     except Exception as e:
         logger.error("AI Q&A failed: %s", e)
-        answer = (
-            "죄송합니다. 일시적으로 AI 답변을 생성할 수 없습니다. "
-            "잠시 후 다시 시도해 주세요."
-        )
+        answer = ERROR_ANSWER
 
     deeplinks = _extract_deeplinks(question, answer)
     _save_conversation(client, user_id, question, answer, context, deeplinks)
@@ -207,6 +227,58 @@ def ask_question(
     return {"answer": answer, "deeplinks": deeplinks, "context_data": context}
 
 
+async def ask_question_stream(
+    client: Client,
+    user_id: str,
+    question: str,
+) -> AsyncIterator[dict]:
+    """스트리밍 AI Q&A — 이벤트 dict를 순서대로 yield한다.
+
+    - {"event": "token", "data": {"text": ...}}: 토큰 델타 (도착 즉시)
+    - {"event": "done", "data": {"answer", "deeplinks", "context_data"}}: 완료
+
+    딥링크는 전체 답변이 완성된 뒤 계산하고, 대화는 스트림 완료 후 저장한다.
+    스트림 도중 오류가 나면 이미 보낸 부분 답변 뒤에 안내 문구를 이어 보낸다.
+    """
+    context, model = await asyncio.gather(
+        asyncio.to_thread(_build_context, client, question),
+        asyncio.to_thread(_get_model_from_db, client),
+    )
+
+    parts: list[str] = []
+    if not settings.openrouter_api_key:
+        logger.warning("OPENROUTER_API_KEY not set — returning fallback answer")
+        parts.append(NO_API_KEY_ANSWER)
+        yield {"event": "token", "data": {"text": NO_API_KEY_ANSWER}}
+    else:
+        try:
+            async for delta in llm_client.astream_completion(
+                model,
+                llm_client.user_prompt(_build_prompt(context, question)),
+                feature="ask",
+                temperature=0.5,
+                timeout=60.0,
+            ):
+                parts.append(delta)
+                yield {"event": "token", "data": {"text": delta}}
+        except Exception as e:
+            logger.error("AI Q&A stream failed: %s", e)
+            fallback = ("\n\n" if parts else "") + ERROR_ANSWER
+            parts.append(fallback)
+            yield {"event": "token", "data": {"text": fallback}}
+
+    answer = "".join(parts).strip()
+    deeplinks = _extract_deeplinks(question, answer)
+    await asyncio.to_thread(
+        _save_conversation, client, user_id, question, answer, context, deeplinks
+    )
+
+    yield {
+        "event": "done",
+        "data": {"answer": answer, "deeplinks": deeplinks, "context_data": context},
+    }
+
+
 def _save_conversation(
     client: Client,
     user_id: str,
@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 
 from supabase import Client
 
+from app.services import sentiment_index
 from app.services.supabase_client import get_latest
 from app.utils.logger import get_logger
 
@@ -92,30 +93,14 @@ def _calc_momentum_component(client: Client) -> dict:
 
 
 def _calc_sentiment_component(client: Client) -> dict:
-    """뉴스 감성 기반 컴포넌트. BULLISH 비율 → 탐욕."""
-    try:
-        result = (
-            client.table("sentiment_results")
-            .select("direction")
-            .order("analyzed_at", desc=True)
-            .limit(50)
-            .execute()
-        )
-        rows = result.data or []
-    except Exception as e:
-        logger.warning("Sentiment data fetch failed: %s", e)
-        return {"value": 50, "label": "NEUTRAL", "raw": None}
-
-    if not rows:
+    """뉴스 감성 기반 컴포넌트. BULLISH 비율 → 탐욕 (시간 감쇠 감성 지수 기준)."""
+    state = sentiment_index.get_state(client)
+    if state is None or state.count_sum <= 0:
         return {"value": 50, "label": "NEUTRAL", "raw": None}
 
-    bullish = sum(1 for r in rows if r.get("direction") == "BULLISH")
-    bearish = sum(1 for r in rows if r.get("direction") == "BEARISH")
-    total = len(rows)
-
     # BULLISH 비율: 100% → 100, 0% → 0
-    bull_ratio = bullish / total * 100
-    bear_ratio = bearish / total * 100
+    bull_ratio = state.bullish_pct
+    bear_ratio = state.bearish_pct
     value = max(0.0, min(100.0, bull_ratio + (50 - bear_ratio) * 0.5))
 
     return {
@@ -0,0 +1,136 @@
+"""RSS 공용 수집 레이어 — 비동기 동시 수집 + 조건부 GET + 파싱 결과 단기 캐시.
+
+감성 분석(sentiment_service)과 지정학(geo_service)이 같은 피드(Reuters World, BBC World 등)를
+같은 갱신 주기에 수집하므로, 파싱된 엔트리를 FEED_CACHE_TTL 동안 공유한다.
+
+- 한 번의 수집 호출 안에서 풀링된 httpx.AsyncClient로 피드를 동시에 가져온다
+  (MAX_CONCURRENT_FEEDS 제한). 피드별 타임아웃이 있어 느린 피드 하나가 전체를 막지 않는다.
+- 캐시가 만료된 피드는 ETag/Last-Modified로 조건부 요청하고, 304면 이전 파싱 결과를 재사용한다.
+- 실패한 피드는 빈 목록으로 처리하고 나머지 피드 결과는 그대로 반환한다.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+
+import feedparser
+import httpx
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FEED_TIMEOUT = 10.0  # seconds, 피드별
+FEED_CACHE_TTL = 35 * 60  # seconds — 같은 갱신 주기의 geo → sentiment 수집 간 공유
+FEED_STALE_MAX = 24 * 3600  # 304 재사용을 위해 엔트리를 보관하는 최대 기간
+MAX_CONCURRENT_FEEDS = 8
+USER_AGENT = "StockAnalysisBot/1.0"
+
+
+@dataclass
+class _FeedState:
+    entries: list = field(default_factory=list)
+    fetched_at: float = 0.0
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+_states: dict[str, _FeedState] = {}
+_states_lock = threading.Lock()
+
+
+def _get_state(url: str) -> _FeedState | None:
+    with _states_lock:
+        return _states.get(url)
+
+
+def _set_state(url: str, state: _FeedState) -> None:
+    with _states_lock:
+        _states[url] = state
+
+
+async def _fetch_one(
+    http: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    url: str,
+) -> list:
+    """피드 1개를 조건부 GET으로 가져와 엔트리 목록을 반환한다."""
+    state = _get_state(url)
+    now = time.time()
+    if state is not None and now - state.fetched_at < FEED_CACHE_TTL:
+        return state.entries
+
+    headers: dict[str, str] = {}
+    if state is not None and now - state.fetched_at < FEED_STALE_MAX:
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+
+    try:
+        async with semaphore:
+            # httpx timeout은 읽기 단위라 조금씩 흘러오는 응답은 막지 못하므로 전체 시간을 제한한다
+            response = await asyncio.wait_for(http.get(url, headers=headers), FEED_TIMEOUT)
+
+        if response.status_code == 304 and state is not None:
+            state.fetched_at = now
+            logger.info("Feed not modified: %s", url)
+            return state.entries
+
+        response.raise_for_status()
+        parsed = await asyncio.to_thread(feedparser.parse, response.content)
+        if parsed.bozo and not parsed.entries:
+            raise ValueError(f"unparseable feed: {parsed.get('bozo_exception')}")
+
+        _set_state(
+            url,
+            _FeedState(
+                entries=list(parsed.entries),
+                fetched_at=now,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            ),
+        )
+        return list(parsed.entries)
+
+    except Exception as e:
+        logger.warning("Feed fetch failed (%s): %r", url, e)
+        return []
+
+
+async def _fetch_all(urls: list[str]) -> list[list]:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FEEDS)
+    async with httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=MAX_CONCURRENT_FEEDS),
+    ) as http:
+        return await asyncio.gather(*(_fetch_one(http, semaphore, url) for url in urls))
+
+
+def fetch_feeds(feeds: dict[str, str]) -> dict[str, list]:
+    """{피드명: URL}을 동시 수집해 {피드명: 엔트리 목록}을 반환한다 (동기 호출용).
+
+    엔트리는 feedparser 엔트리(dict 호환)이며, 실패한 피드는 빈 목록이다.
+    """
+    if not feeds:
+        return {}
+    names = list(feeds)
+    urls = [feeds[n] for n in names]
+
+    started = time.perf_counter()
+    results = asyncio.run(_fetch_all(urls))
+    logger.info(
+        "Fetched %d feeds in %.1fs (%d empty)",
+        len(urls),
+        time.perf_counter() - started,
+        sum(1 for r in results if not r),
+    )
+    return dict(zip(names, results))
+
+
+def clear_cache() -> None:
+    """파싱 캐시와 조건부 요청 검증자를 모두 비운다."""
+    with _states_lock:
+        _states.clear()
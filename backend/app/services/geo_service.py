@@ -3,16 +3,14 @@
 import json
 from datetime import datetime, timezone
 
-import feedparser
-import httpx
 from supabase import Client
 
 from app.config import settings
+from app.services import feed_fetcher, headline_cluster, llm_client
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 DEFAULT_MODEL = "google/gemini-2.0-flash-001"
 
 # 지정학 뉴스 RSS 피드
@@ -41,28 +39,22 @@ RISK_KEYWORDS: dict[str, list[str]] = {
 
 
 def _collect_geo_news() -> list[dict]:
-    """RSS 피드에서 지정학 관련 뉴스를 수집한다."""
+    """RSS 피드에서 지정학 관련 뉴스를 수집한다 (feed_fetcher 공용 레이어 경유)."""
     articles: list[dict] = []
 
-    for source, url in GEO_RSS_FEEDS.items():
-        try:
-            feed = feedparser.parse(url)
-            entries = feed.entries[:MAX_ARTICLES_PER_SOURCE]
-
-            for entry in entries:
-                articles.append(
-                    {
-                        "title": entry.get("title", "").strip(),
-                        "link": entry.get("link", ""),
-                        "source": source,
-                        "summary": entry.get("summary", "")[:300],
-                        "published": entry.get("published", entry.get("updated", "")),
-                    }
-                )
-
-            logger.info("Collected %d geo articles from %s", len(entries), source)
-        except Exception as e:
-            logger.warning("Failed to collect from %s: %s", source, e)
+    for source, entries in feed_fetcher.fetch_feeds(GEO_RSS_FEEDS).items():
+        entries = entries[:MAX_ARTICLES_PER_SOURCE]
+        for entry in entries:
+            articles.append(
+                {
+                    "title": entry.get("title", "").strip(),
+                    "link": entry.get("link", ""),
+                    "source": source,
+                    "summary": entry.get("summary", "")[:300],
+                    "published": entry.get("published", entry.get("updated", "")),
+                }
+            )
+        logger.info("Collected %d geo articles from %s", len(entries), source)
 
     logger.info("Total geo articles collected: %d", len(articles))
     return articles
@@ -121,31 +113,13 @@ def _classify_geo_events(
 JSON 배열만 응답하세요."""
 
     try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.1,
-            },
+        events_raw = llm_client.chat_json(
+            model,
+            llm_client.user_prompt(prompt),
+            feature="geo",
+            temperature=0.1,
             timeout=60.0,
         )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-
-        # JSON 파싱 — 코드 블록 제거
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1] if "\n" in content else content
-            if content.endswith("```"):
-                content = content[: -len("```")]
-            content = content.strip()
-
-        events_raw = json.loads(content)
 
         # 이벤트 레코드 생성
         events: list[dict] = []
@@ -169,6 +143,7 @@ JSON 배열만 응답하세요."""
                     "source_url": article["link"],
                     "impact_assessment": ev.get("impact_assessment"),
                     "severity_change": ev.get("severity_change", "STABLE"),
+                    "cluster_size": article.get("cluster_size", 1),
                     "analyzed_at": analyzed_at,
                 }
             )
@@ -178,6 +153,10 @@ JSON 배열만 응답하세요."""
             client.table("geopolitical_events").insert(events).execute()
             logger.info("Saved %d geopolitical events", len(events))
 
+        # 분류 완료 기사는 다음 실행에서 근접 중복으로 건너뛴다
+        for article in articles:
+            headline_cluster.remember("geo", article["title"], True)
+
         return events
 
     except Exception as e:
@@ -190,15 +169,16 @@ JSON 배열만 응답하세요."""
 
 def _update_risk_levels(client: Client, events: list[dict]) -> None:
     """최근 이벤트 빈도와 심각도에 따라 risk_level을 업데이트한다."""
-    # risk_id별 이벤트 집계
+    # risk_id별 이벤트 집계 (클러스터 대표 이벤트는 보도 기사 수만큼 가중)
     risk_counts: dict[str, dict] = {}
     for ev in events:
         rid = ev["risk_id"]
+        weight = ev.get("cluster_size", 1)
         if rid not in risk_counts:
             risk_counts[rid] = {"total": 0, "up": 0}
-        risk_counts[rid]["total"] += 1
+        risk_counts[rid]["total"] += weight
         if ev.get("severity_change") == "UP":
-            risk_counts[rid]["up"] += 1
+            risk_counts[rid]["up"] += weight
 
     for risk_id, counts in risk_counts.items():
         # 이벤트 5건 이상 또는 UP이 3건 이상이면 레벨 상향
@@ -252,19 +232,41 @@ def collect_and_analyze(client: Client) -> dict:
             "events_created": 0,
         }
 
-    # 2. 모델 선택
+    # 2. 근접 중복 클러스터 대표만 분류 (최근 실행에서 분류한 사건은 제외)
+    clusters = headline_cluster.cluster([a["title"] for a in articles])
+    representatives = [
+        {**articles[c[0]], "cluster_size": len(c)}
+        for c in clusters
+        if headline_cluster.recall("geo", articles[c[0]]["title"]) is None
+    ]
+    logger.info(
+        "Geo clustering: %d articles → %d clusters, %d new",
+        len(articles),
+        len(clusters),
+        len(representatives),
+    )
+    if not representatives:
+        return {
+            "success": True,
+            "articles_collected": len(articles),
+            "clusters_analyzed": 0,
+            "events_created": 0,
+        }
+
+    # 3. 모델 선택
     model = _get_model_from_db(client)
     logger.info("Using model for geo: %s", model)
 
-    # 3. AI 분류 + 이벤트 저장
-    events = _classify_geo_events(client, articles, model)
+    # 4. AI 분류 + 이벤트 저장
+    events = _classify_geo_events(client, representatives, model)
 
-    # 4. 리스크 레벨 업데이트
+    # 5. 리스크 레벨 업데이트
     if events:
         _update_risk_levels(client, events)
 
     return {
         "success": True,
         "articles_collected": len(articles),
+        "clusters_analyzed": len(representatives),
         "events_created": len(events),
     }
@@ -4,50 +4,23 @@
 daily_briefings(오늘의 가이드)와 investment_guides(종목별 가이드)를 생성한다.
 """
 
-import json
 from datetime import date, datetime, timezone
 
-import httpx
 from supabase import Client
 
 from app.config import settings
-from app.services import stock_service
+from app.services import llm_client, prompt_context, sentiment_index, stock_service
 from app.services.supabase_client import get_latest
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
 
-def _get_model_from_db(client: Client) -> str:
-    """model_configs에서 가이드 생성용 모델을 조회한다."""
-    try:
-        result = (
-            client.table("model_configs")
-            .select("model_id")
-            .eq("feature", "guide")
-            .eq("is_active", True)
-            .limit(1)
-            .execute()
-        )
-        if result.data:
-            return result.data[0]["model_id"]
-    except Exception as e:
-        logger.warning("model_configs query failed: %s — using default", e)
-    return DEFAULT_MODEL
-
-
-def _parse_ai_json(content: str) -> dict:
-    """AI 응답에서 JSON을 추출한다."""
-    content = content.strip()
-    if content.startswith("```"):
-        content = content.split("\n", 1)[1] if "\n" in content else content
-        if content.endswith("```"):
-            content = content[: -len("```")]
-        content = content.strip()
-    return json.loads(content)
+def _get_model_chain(client: Client) -> llm_client.ModelChain:
+    """model_configs에서 가이드 생성용 모델 체인(DAILY_GUIDE)을 조회한다."""
+    return llm_client.get_model_chain(client, "DAILY_GUIDE", DEFAULT_MODEL)
 
 
 # ─── 컨텍스트 수집 ───
@@ -83,27 +56,29 @@ def _gather_context(client: Client) -> dict:
         logger.warning("Geo risks fetch failed: %s", e)
         context["geo_risks"] = []
 
-    # 3. 최근 감성 분석 요약
+    # 3. 감성 요약 (시간 감쇠 감성 지수 상태 + HIGH 긴급 항목만 조회)
     try:
-        sent_result = (
+        states = sentiment_index.get_states(client)
+        overall = states.get(sentiment_index.SCOPE_ALL)
+        high_result = (
             client.table("sentiment_results")
-            .select("direction, urgency, reasoning")
+            .select("reasoning")
+            .eq("urgency", "HIGH")
             .order("analyzed_at", desc=True)
-            .limit(20)
+            .limit(3)
             .execute()
         )
-        rows = sent_result.data or []
-        bullish = sum(1 for r in rows if r.get("direction") == "BULLISH")
-        bearish = sum(1 for r in rows if r.get("direction") == "BEARISH")
-        high_urgency = [
-            r.get("reasoning", "") for r in rows if r.get("urgency") == "HIGH"
-        ][:3]
         context["sentiment"] = {
-            "total": len(rows),
-            "bullish": bullish,
-            "bearish": bearish,
-            "neutral": len(rows) - bullish - bearish,
-            "high_urgency_items": high_urgency,
+            "index": round(overall.value, 1) if overall else None,
+            "bullish_pct": round(overall.bullish_pct, 1) if overall else None,
+            "bearish_pct": round(overall.bearish_pct, 1) if overall else None,
+            "effective_count": round(overall.count_sum, 1) if overall else None,
+            "by_category": {
+                scope: round(s.value, 1)
+                for scope, s in sorted(states.items(), key=lambda kv: -kv[1].count_sum)
+                if scope != sentiment_index.SCOPE_ALL and s.count_sum >= 1
+            },
+            "high_urgency_items": [r.get("reasoning", "") for r in high_result.data or []],
         }
     except Exception as e:
         logger.warning("Sentiment fetch failed: %s", e)
@@ -154,13 +129,22 @@ def generate_daily_guide(client: Client) -> dict:
     """오늘의 투자 가이드를 생성하여 daily_briefings에 UPSERT한다."""
     today_str = date.today().isoformat()
     context = _gather_context(client)
-    model = _get_model_from_db(client)
+    chain = _get_model_chain(client)
 
     if not settings.openrouter_api_key:
         logger.warning("OPENROUTER_API_KEY not set — generating fallback guide")
         return _save_fallback_briefing(client, today_str, context)
 
-    context_json = json.dumps(context, ensure_ascii=False, default=str)
+    context_json = prompt_context.build_context(
+        "guide",
+        [
+            ("macro", context.get("macro")),
+            ("sentiment", context.get("sentiment")),
+            ("today_events", context.get("today_events")),
+            ("geo_risks", context.get("geo_risks")),
+            ("popular_tickers", context.get("popular_tickers")),
+        ],
+    )
 
     prompt = f"""당신은 전문 투자 분석가입니다. 아래 시장 데이터를 기반으로 오늘의 투자 가이드를 작성하세요.
 
@@ -210,22 +194,13 @@ market_causal_chain의 각 단계는 이전 단계의 결과가 다음 단계의
 JSON만 응답하세요. 다른 텍스트 포함 금지."""
 
     try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3,
-            },
+        guide = llm_client.chat_json_hedged(
+            chain,
+            llm_client.user_prompt(prompt),
+            feature="guide",
+            temperature=0.3,
             timeout=90.0,
         )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-        guide = _parse_ai_json(content)
 
     except Exception as e:
         logger.error("Daily guide generation failed: %s", e)
@@ -307,7 +282,7 @@ def generate_ticker_guide(client: Client, ticker: str) -> dict:
     """개별 종목 가이드를 생성하여 investment_guides에 UPSERT한다."""
     today_str = date.today().isoformat()
     context = _gather_context(client)
-    model = _get_model_from_db(client)
+    chain = _get_model_chain(client)
 
     # 기술적 지표 수집
     tech_data: dict = {}
@@ -336,10 +311,13 @@ def generate_ticker_guide(client: Client, ticker: str) -> dict:
         logger.warning("OPENROUTER_API_KEY not set — generating fallback ticker guide")
         return _save_fallback_ticker_guide(client, ticker, company_name, today_str)
 
-    context_json = json.dumps(
-        {"macro": context.get("macro"), "geo_risks": context.get("geo_risks"), "technical": tech_data},
-        ensure_ascii=False,
-        default=str,
+    context_json = prompt_context.build_context(
+        "guide_ticker",
+        [
+            ("technical", tech_data),
+            ("macro", context.get("macro")),
+            ("geo_risks", context.get("geo_risks")),
+        ],
     )
 
     prompt = f"""당신은 독립적 투자 분석가입니다. 뉴스·증권사 리포트를 단순 요약하지 마세요.
@@ -383,22 +361,13 @@ causal_chain은 3~5단계, 거시경제 → 산업 → 이 종목으로 좁혀
 JSON만 응답하세요. 다른 텍스트 포함 금지."""
 
     try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3,
-            },
+        guide = llm_client.chat_json_hedged(
+            chain,
+            llm_client.user_prompt(prompt),
+            feature="guide",
+            temperature=0.3,
             timeout=90.0,
         )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-        guide = _parse_ai_json(content)
 
     except Exception as e:
         logger.error("Ticker guide generation failed for %s: %s", ticker, e)
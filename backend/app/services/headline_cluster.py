@@ -0,0 +1,209 @@
+"""헤드라인 근접 중복 클러스터링 — MinHash + LSH.
+
+같은 사건이 Reuters/BBC/Al Jazeera 등에서 조금씩 다른 제목으로 들어오면
+클러스터로 묶어 대표 1건만 LLM에 보내고 결과를 나머지에 전파한다.
+
+- 시그니처: 정규화 제목의 단어 집합에 대한 MinHash (NUM_PERM개)
+- 후보 탐색: LSH 밴딩(BANDS × ROWS) 후 추정 Jaccard ≥ SIMILARITY_THRESHOLD만 연결
+- 방향어(상승/하락, 인상/인하 …)나 숫자 토큰이 다르면 유사도와 무관하게 묶지 않는다.
+  "주가 3% 상승"과 "주가 3% 하락"처럼 한 단어만 다른 반대 의미 제목에 결과가 전파되지 않도록.
+- 같은 실행 내 클러스터링(cluster) + 최근 실행 이력 대조(recall/remember, 프로세스 메모리)
+"""
+
+import re
+import threading
+import time
+import unicodedata
+import zlib
+from collections import deque
+from typing import Any
+
+import numpy as np
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+NUM_PERM = 64
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.8
+HISTORY_TTL_SECONDS = 24 * 3600
+HISTORY_MAX = 5000  # 네임스페이스별 보관 상한
+
+_EMPTY = np.uint64(1 << 32)  # 빈 제목 시그니처 (해시 값은 항상 2^32 미만)
+_rng = np.random.default_rng(20240611)
+# multiply-shift 해시: ((a·h + b) mod 2^64) >> 32, a는 홀수. uint64 오버플로(랩어라운드)를 그대로 이용한다.
+_PERM_A = _rng.integers(0, 1 << 63, size=NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_PERM_B = _rng.integers(0, 1 << 63, size=NUM_PERM, dtype=np.uint64)
+
+_SOURCE_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{2,30}$")
+_NON_WORD = re.compile(r"[^\w%.]+|_+", re.UNICODE)
+_DIGIT = re.compile(r"\d")
+
+# 방향어 → 부호. 영문은 단어 일치, 한글은 조사가 붙으므로 어간 포함 여부로 판정한다.
+_POLARITY_WORDS = {
+    **dict.fromkeys(
+        (
+            "rise rises rising rose jump jumps jumped surge surges surged gain gains gained "
+            "up higher climb climbs climbed soar soars soared rally rallies rallied "
+            "raise raises raised hike hikes hiked increase increases increased boost boosts"
+        ).split(),
+        "+",
+    ),
+    **dict.fromkeys(
+        (
+            "fall falls falling fell drop drops dropped plunge plunges plunged slump slumps "
+            "down lower decline declines declined sink sinks sank tumble tumbles tumbled "
+            "cut cuts cutting slash slashes slashed decrease decreases decreased lose loses lost"
+        ).split(),
+        "-",
+    ),
+}
+_POLARITY_STEMS = {
+    "상승": "+", "급등": "+", "인상": "+", "증가": "+", "반등": "+", "강세": "+", "확대": "+",
+    "하락": "-", "급락": "-", "인하": "-", "감소": "-", "약세": "-", "축소": "-", "폭락": "-",
+}
+
+_history: dict[str, deque] = {}
+_history_lock = threading.Lock()
+
+
+# ─── 시그니처 ───
+
+
+def _normalize(title: str) -> str:
+    text = unicodedata.normalize("NFKC", title).strip()
+    text = _SOURCE_SUFFIX.sub("", text)
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def _shingles(title: str) -> set[str]:
+    return {w.strip(".") for w in _normalize(title).split() if w.strip(".")}
+
+
+def _polarity(word: str) -> str | None:
+    sign = _POLARITY_WORDS.get(word)
+    if sign is None:
+        sign = next((v for k, v in _POLARITY_STEMS.items() if k in word), None)
+    return sign
+
+
+def guard_key(title: str) -> tuple[frozenset[str], frozenset[str]]:
+    """병합 허용 조건 — 방향어 부호 집합과 숫자 토큰 집합이 같아야 같은 사건으로 본다."""
+    words = _shingles(title)
+    signs = frozenset(p for p in map(_polarity, words) if p)
+    numbers = frozenset(w for w in words if _DIGIT.search(w))
+    return signs, numbers
+
+
+def signature(title: str) -> np.ndarray:
+    """제목 단어 집합의 MinHash 시그니처 (uint64[NUM_PERM])."""
+    shingles = _shingles(title)
+    if not shingles:
+        return np.full(NUM_PERM, _EMPTY, dtype=np.uint64)
+    hashes = np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+    )
+    permuted = (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1)
+
+
+def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """두 시그니처의 추정 Jaccard 유사도."""
+    return float(np.mean(sig_a == sig_b))
+
+
+def _band_keys(sig: np.ndarray) -> list[tuple[int, bytes]]:
+    return [(b, sig[b * ROWS : (b + 1) * ROWS].tobytes()) for b in range(BANDS)]
+
+
+# ─── 실행 내 클러스터링 ───
+
+
+def cluster(titles: list[str]) -> list[list[int]]:
+    """근접 중복 제목을 묶어 인덱스 클러스터 목록을 반환한다.
+
+    각 클러스터의 첫 인덱스가 대표(입력 순서상 가장 앞)이며, 클러스터는 대표 순으로 정렬된다.
+    """
+    n = len(titles)
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    sigs = [signature(t) for t in titles]
+    guards = [guard_key(t) for t in titles]
+    buckets: dict[tuple[int, bytes], list[int]] = {}
+    for i, sig in enumerate(sigs):
+        for key in _band_keys(sig):
+            buckets.setdefault(key, []).append(i)
+
+    checked: set[tuple[int, int]] = set()
+    for members in buckets.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                i, j = members[x], members[y]
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                if guards[i] == guards[j] and similarity(sigs[i], sigs[j]) >= SIMILARITY_THRESHOLD:
+                    ri, rj = find(i), find(j)
+                    if ri != rj:
+                        parent[max(ri, rj)] = min(ri, rj)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(n):
+        groups.setdefault(find(i), []).append(i)
+    clusters = sorted(groups.values(), key=lambda g: g[0])
+
+    merged = n - len(clusters)
+    if merged:
+        logger.info("Headline clustering: %d titles → %d clusters", n, len(clusters))
+    return clusters
+
+
+# ─── 최근 실행 이력 ───
+
+
+def _prune(entries: deque, now: float) -> None:
+    while entries and now - entries[0][0] > HISTORY_TTL_SECONDS:
+        entries.popleft()
+
+
+def remember(namespace: str, title: str, payload: Any) -> None:
+    """분석 완료된 대표 제목과 결과를 이력에 기록한다."""
+    now = time.time()
+    with _history_lock:
+        entries = _history.setdefault(namespace, deque(maxlen=HISTORY_MAX))
+        _prune(entries, now)
+        entries.append((now, signature(title), guard_key(title), payload))
+
+
+def recall(namespace: str, title: str) -> Any | None:
+    """최근 이력 중 근접 중복 제목의 결과를 반환한다 (가장 유사한 1건, 없으면 None)."""
+    sig = signature(title)
+    guard = guard_key(title)
+    now = time.time()
+    with _history_lock:
+        entries = _history.get(namespace)
+        if not entries:
+            return None
+        _prune(entries, now)
+        if not entries:
+            return None
+        stacked = np.stack([e[1] for e in entries])
+        scores = (stacked == sig).mean(axis=1)
+        scores[[e[2] != guard for e in entries]] = -1.0
+        best = int(scores.argmax())
+        if scores[best] >= SIMILARITY_THRESHOLD:
+            return entries[best][3]
+    return None
+
+
+def reset_history() -> None:
+    with _history_lock:
+        _history.clear()
@@ -0,0 +1,92 @@
+"""헤드라인 로컬 사전 분류 — LLM 호출 전 CPU만으로 시장 관련성/잠정 방향을 추정한다.
+
+렉시콘 기반 선형 점수:
+- 관련성 = 1 - exp(-(카테고리 키워드·시장 용어·방향 용어 적중의 가중합))
+- 잠정 방향 = (강세 용어 - 약세 용어) / 전체 방향 용어 적중
+
+관련성이 임계값(settings.sentiment_triage_threshold) 미만인 헤드라인은
+LLM에 보내지 않고 로컬 결과로 저장한다. 임계값 0이면 사전 분류를 끈다.
+"""
+
+import math
+from dataclasses import dataclass
+
+from app.services.keyword_matcher import KeywordMatcher
+
+# 시장/투자 맥락 용어 (카테고리 키워드와 별도로 관련성 가산)
+MARKET_TERMS: list[str] = [
+    "stock", "shares", "market", "investor", "earnings", "profit", "revenue",
+    "bond", "yield", "dollar", "currency", "bank", "economy", "economic",
+    "price", "export", "import", "trade", "rate", "merger", "acquisition",
+    "ipo", "dividend", "forecast", "outlook", "quarter",
+    "증시", "주가", "코스닥", "실적", "매출", "영업이익", "순이익", "투자",
+    "수출", "수입", "경기", "금융", "은행", "채권", "달러", "원화", "상장",
+    "인수", "합병", "전망", "분기", "시장",
+]
+
+BULLISH_TERMS: list[str] = [
+    "surge", "soar", "rally", "jump", "gain", "rise", "record high", "beat",
+    "upgrade", "boost", "rebound", "recover", "growth", "expand", "cut rates",
+    "급등", "상승", "반등", "호조", "호실적", "최고치", "돌파", "개선", "확대",
+    "흑자", "상향", "회복", "수혜",
+]
+
+BEARISH_TERMS: list[str] = [
+    "plunge", "slump", "tumble", "fall", "drop", "slide", "crash", "miss",
+    "downgrade", "loss", "recession", "default", "layoff", "cut jobs", "warn",
+    "급락", "하락", "폭락", "부진", "적자", "감소", "하향", "우려", "위기",
+    "침체", "손실", "둔화", "악화",
+]
+
+CATEGORY_WEIGHT = 0.6
+MARKET_WEIGHT = 0.4
+POLARITY_WEIGHT = 0.25
+LOCAL_SCORE_SCALE = 0.3  # 로컬 결과는 약한 신호로만 기록 (|score| ≤ 0.3)
+LOCAL_CONFIDENCE = 0.3
+
+_market_matcher = KeywordMatcher({"market": MARKET_TERMS}, short_word_chars=3)  # "ipo" ≠ "ipod"
+_polarity_matcher = KeywordMatcher({"bullish": BULLISH_TERMS, "bearish": BEARISH_TERMS})
+
+
+@dataclass
+class TriageResult:
+    relevance: float  # 0 ~ 1
+    direction: str  # BULLISH | BEARISH | NEUTRAL (잠정)
+    score: float  # -LOCAL_SCORE_SCALE ~ LOCAL_SCORE_SCALE
+
+
+def triage(title: str, category_hits: dict[str, int]) -> TriageResult:
+    """헤드라인 1건의 관련성과 잠정 방향을 계산한다.
+
+    category_hits는 카테고리 매처 결과(카테고리 → 적중 횟수)를 그대로 넘긴다.
+    """
+    market_hits = _market_matcher.match(title).get("market", 0)
+    polarity = _polarity_matcher.match(title)
+    bullish = polarity.get("bullish", 0)
+    bearish = polarity.get("bearish", 0)
+
+    weighted = (
+        CATEGORY_WEIGHT * sum(category_hits.values())
+        + MARKET_WEIGHT * market_hits
+        + POLARITY_WEIGHT * (bullish + bearish)
+    )
+    relevance = 1.0 - math.exp(-weighted)
+
+    net = (bullish - bearish) / (bullish + bearish) if bullish + bearish else 0.0
+    if net > 0:
+        direction = "BULLISH"
+    elif net < 0:
+        direction = "BEARISH"
+    else:
+        direction = "NEUTRAL"
+
+    return TriageResult(
+        relevance=round(relevance, 3),
+        direction=direction,
+        score=round(net * LOCAL_SCORE_SCALE, 3),
+    )
+
+
+def should_escalate(result: TriageResult, threshold: float) -> bool:
+    """LLM 분석 대상 여부. 임계값 0 이하이면 항상 LLM으로 보낸다."""
+    return threshold <= 0 or result.relevance >= threshold
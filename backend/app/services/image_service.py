@@ -1,12 +1,10 @@
 """이미지 분석 서비스 — Vision OCR + 종목 검증 + AI 투자 가이드 (모듈 G)."""
 
 import base64
-import json
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 
-import httpx
 import yfinance as yf
 from supabase import Client
 
@@ -19,6 +17,7 @@ from app.models.image import (
     RecognizedHolding,
     SectorAnalysis,
 )
+from app.services import llm_client
 from app.services.alert_service import create_alerts_from_holdings
 from app.services.supabase_client import get_latest
 from app.services.telegram_service import (
@@ -29,7 +28,6 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 DEFAULT_VISION_MODEL = "anthropic/claude-sonnet-4-20250514"
 MAX_IMAGE_BYTES = 10 * 1024 * 1024  # 10MB
 MAX_WORKERS = 8
@@ -94,44 +92,25 @@ JSON 배열만 반환하세요. 다른 텍스트는 포함하지 마세요.
   ...
 ]"""
 
-    response = httpx.post(
-        OPENROUTER_URL,
-        headers={
-            "Authorization": f"Bearer {settings.openrouter_api_key}",
-            "Content-Type": "application/json",
-        },
-        json={
-            "model": model,
-            "messages": [
+    messages = [
+        {
+            "role": "user",
+            "content": [
                 {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:{media_type};base64,{image_base64}"
-                            },
-                        },
-                        {"type": "text", "text": prompt},
-                    ],
-                }
+                    "type": "image_url",
+                    "image_url": {"url": f"data:{media_type};base64,{image_base64}"},
+                },
+                {"type": "text", "text": prompt},
             ],
-            "temperature": 0.1,
-        },
+        }
+    ]
+    return llm_client.chat_json(
+        model,
+        messages,
+        feature="image",
+        temperature=0.1,
         timeout=120.0,
     )
-    response.raise_for_status()
-    content = response.json()["choices"][0]["message"]["content"]
-
-    # JSON 파싱 — 코드 블록 제거
-    content = content.strip()
-    if content.startswith("```"):
-        content = content.split("\n", 1)[1] if "\n" in content else content
-        if content.endswith("```"):
-            content = content[: -len("```")]
-        content = content.strip()
-
-    return json.loads(content)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -283,31 +262,13 @@ JSON만 반환하세요. 다른 텍스트는 포함하지 마세요.
 면책: 이 분석은 투자 참고용이며 실제 투자 판단의 책임은 본인에게 있습니다."""
 
     try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3,
-            },
+        data = llm_client.chat_json(
+            model,
+            llm_client.user_prompt(prompt),
+            feature="image",
+            temperature=0.3,
             timeout=120.0,
         )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-
-        # JSON 파싱 — 코드 블록 제거
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1] if "\n" in content else content
-            if content.endswith("```"):
-                content = content[: -len("```")]
-            content = content.strip()
-
-        data = json.loads(content)
 
         return InvestmentGuide(
             diagnosis=data.get("diagnosis", ""),
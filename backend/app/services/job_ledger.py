@@ -0,0 +1,168 @@
+"""스케줄 작업 실행 원장 — job_runs 테이블에 실행 1회당 1행을 기록한다.
+
+기록 항목: 시작/종료 시각, 소요 시간, 상태, 처리/실패 건수, 프로세스 최대 RSS, 오류, 부가 정보(details).
+peak_rss_mb는 기록 시점까지의 프로세스 수명 전체 최대값(ru_maxrss)이다 — 해당 실행이 쓴 메모리가 아니라
+단조 증가하는 상한이므로, 값이 뛰어오른 실행이 메모리를 키운 실행으로 읽으면 된다.
+작업 함수는 {"items": n, "failed": m, ...} 형태의 dict를 반환하면 건수가 기록되고,
+그 외 키는 details에 그대로 저장된다. 원장 기록 실패는 작업 결과에 영향을 주지 않는다.
+"""
+
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from supabase import Client
+
+from app.utils.logger import get_logger
+
+try:  # POSIX 전용
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+logger = get_logger(__name__)
+
+JOB_RUNS_TABLE = "job_runs"
+STATS_WINDOW_DAYS = 7
+RETENTION_DAYS = 30
+STATS_MAX_ROWS = 10000
+
+
+def peak_rss_mb() -> float | None:
+    """프로세스 시작 이후 최대 RSS (MB, 실행별 값 아님). 지원하지 않는 플랫폼이면 None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss 단위: macOS는 byte, Linux는 KB
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _counts(output: Any) -> tuple[int | None, int | None, dict]:
+    if not isinstance(output, dict):
+        return None, None, {}
+    details = {k: v for k, v in output.items() if k not in ("items", "failed")}
+    return output.get("items"), output.get("failed"), details
+
+
+def record(
+    client: Client,
+    job_id: str,
+    started_at: datetime,
+    duration_s: float,
+    status: str,
+    output: Any = None,
+    error: str | None = None,
+    details: dict | None = None,
+) -> None:
+    """실행 1회를 job_runs에 기록한다."""
+    items, failed, extra = _counts(output)
+    row = {
+        "job_id": job_id,
+        "started_at": started_at.isoformat(),
+        "finished_at": (started_at + timedelta(seconds=duration_s)).isoformat(),
+        "duration_ms": int(duration_s * 1000),
+        "status": status,
+        "items_processed": items,
+        "items_failed": failed,
+        "peak_rss_mb": peak_rss_mb(),
+        "error": error[:1000] if error else None,
+        "details": {**extra, **(details or {})} or None,
+    }
+    try:
+        client.table(JOB_RUNS_TABLE).insert(row).execute()
+    except Exception as e:
+        logger.warning("Failed to record job run %s: %s", job_id, e)
+
+
+def run_tracked(
+    client_factory: Callable[[], Client],
+    job_id: str,
+    func: Callable[[], Any],
+    record_idle: bool = True,
+) -> Any:
+    """func를 실행하고 결과를 원장에 기록한다. 예외는 기록 후 다시 던진다.
+
+    record_idle=False면 처리 건수(items)가 0인 성공 실행은 기록하지 않는다 (짧은 주기 폴러용).
+    """
+    started_at = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    try:
+        output = func()
+    except Exception as e:
+        _safe_record(client_factory, job_id, started_at, time.perf_counter() - started, "failed", error=str(e))
+        raise
+    items, _, _ = _counts(output)
+    if not record_idle and not items:
+        return output
+    _safe_record(client_factory, job_id, started_at, time.perf_counter() - started, "success", output=output)
+    return output
+
+
+def _safe_record(client_factory: Callable[[], Client], job_id: str, *args, **kwargs) -> None:
+    try:
+        record(client_factory(), job_id, *args, **kwargs)
+    except Exception as e:
+        logger.warning("Failed to record job run %s: %s", job_id, e)
+
+
+def prune(client: Client) -> None:
+    """보존 기간이 지난 실행 기록을 삭제한다."""
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=RETENTION_DAYS)).isoformat()
+    try:
+        client.table(JOB_RUNS_TABLE).delete().lt("started_at", cutoff).execute()
+    except Exception as e:
+        logger.warning("Job run prune failed: %s", e)
+
+
+# ─── 조회 ───
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def get_recent_runs(client: Client, job_id: str | None = None, limit: int = 50) -> list[dict]:
+    """최근 실행 기록 (최신순)."""
+    query = client.table(JOB_RUNS_TABLE).select("*")
+    if job_id:
+        query = query.eq("job_id", job_id)
+    result = query.order("started_at", desc=True).limit(limit).execute()
+    return result.data or []
+
+
+def get_job_stats(client: Client, days: int = STATS_WINDOW_DAYS) -> dict[str, dict]:
+    """작업별 최근 N일 실행 수/실패 수/소요 시간 p50·p95/최근 실행 시각."""
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    result = (
+        client.table(JOB_RUNS_TABLE)
+        .select("job_id, status, duration_ms, started_at, items_processed")
+        .gte("started_at", since)
+        .order("started_at", desc=True)
+        .limit(STATS_MAX_ROWS)
+        .execute()
+    )
+
+    grouped: dict[str, list[dict]] = {}
+    for row in result.data or []:
+        grouped.setdefault(row["job_id"], []).append(row)
+
+    stats: dict[str, dict] = {}
+    for job_id, rows in grouped.items():
+        durations = [float(r["duration_ms"]) for r in rows if r.get("duration_ms") is not None]
+        stats[job_id] = {
+            "runs": len(rows),
+            "failures": sum(1 for r in rows if r.get("status") == "failed"),
+            "p50_duration_ms": round(_percentile(durations, 50), 1),
+            "p95_duration_ms": round(_percentile(durations, 95), 1),
+            "items_processed": sum(r.get("items_processed") or 0 for r in rows),
+            "last_started_at": rows[0].get("started_at"),
+            "last_status": rows[0].get("status"),
+        }
+    return stats
@@ -0,0 +1,60 @@
+"""작업 실행 요청 큐 — API 프로세스가 job_requests에 요청을 넣고, 스케줄러 리더(워커)가 꺼내 실행한다.
+
+API 파드는 SCHEDULER_ENABLED=false로 작업을 직접 돌리지 않으므로, 관리자의 즉시 실행 요청은
+이 큐를 거쳐 워커의 스케줄러로 전달된다. 상태: pending → dispatched | rejected
+(모르는 작업이거나 이미 실행 중이면 rejected, 사유는 note).
+꺼내기는 claim_job_requests RPC(FOR UPDATE SKIP LOCKED)로 원자적으로 수행한다.
+"""
+
+from datetime import datetime, timezone
+
+from supabase import Client
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+JOB_REQUESTS_TABLE = "job_requests"
+CLAIM_BATCH = 10
+
+
+def enqueue(client: Client, job_id: str, requested_by: str | None = None) -> dict:
+    """실행 요청을 큐에 넣고 생성된 행을 반환한다."""
+    result = (
+        client.table(JOB_REQUESTS_TABLE)
+        .insert({"job_id": job_id, "requested_by": requested_by, "status": "pending"})
+        .execute()
+    )
+    return result.data[0] if result.data else {}
+
+
+def claim(client: Client, limit: int = CLAIM_BATCH) -> list[dict]:
+    """대기 중인 요청을 오래된 순으로 꺼낸다 (다른 인스턴스와 중복 없이)."""
+    result = client.rpc("claim_job_requests", {"p_limit": limit}).execute()
+    return result.data or []
+
+
+def mark(client: Client, request_id: int, status: str, note: str | None = None) -> None:
+    """요청 처리 결과를 기록한다."""
+    try:
+        client.table(JOB_REQUESTS_TABLE).update(
+            {
+                "status": status,
+                "note": note,
+                "handled_at": datetime.now(timezone.utc).isoformat(),
+            }
+        ).eq("id", request_id).execute()
+    except Exception as e:
+        logger.warning("Failed to mark job request %s as %s: %s", request_id, status, e)
+
+
+def get_recent(client: Client, limit: int = 50) -> list[dict]:
+    """최근 실행 요청 (최신순)."""
+    result = (
+        client.table(JOB_REQUESTS_TABLE)
+        .select("*")
+        .order("requested_at", desc=True)
+        .limit(limit)
+        .execute()
+    )
+    return result.data or []
@@ -0,0 +1,109 @@
+"""다중 키워드 매처 — Aho–Corasick 오토마톤.
+
+{라벨: [키워드, ...]}를 한 번 컴파일해 두고, 텍스트를 한 번만 훑어
+매칭된 모든 라벨과 라벨별 적중 횟수를 반환한다.
+
+- 대소문자 무시 (키워드/텍스트 모두 소문자화)
+- 영문/숫자로 시작하는 키워드는 단어 시작에서만 매칭한다 ("AI"가 "said"에 걸리지 않도록).
+  접미는 허용하므로 "tariff"는 "tariffs"에도 매칭된다. 한글 키워드는 조사가 붙으므로 부분 매칭.
+- whole_word=True면 영문/숫자로 끝나는 키워드는 단어 끝에서도 끊겨야 매칭한다
+  (고유명사 별칭 "Intel"이 "intelligence"에 걸리지 않도록).
+- short_word_chars=n이면 n자 이하 영문 키워드(약어)도 단어 끝에서 끊겨야 매칭한다 — 복수형 "s"만 허용
+  ("AI"가 "aid"/"airline"에 걸리지 않고, "ETF"는 "ETFs"에 매칭).
+"""
+
+from collections import deque
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _ends_word(text: str, end: int, plural_ok: bool) -> bool:
+    """text[end - 1]에서 단어가 끝나는지 (plural_ok면 복수형 "s" 1자 허용)."""
+    if plural_ok and end < len(text) and text[end] == "s":
+        end += 1
+    return end >= len(text) or not _is_word_char(text[end])
+
+
+class KeywordMatcher:
+    """라벨별 키워드 집합을 컴파일한 Aho–Corasick 매처."""
+
+    def __init__(
+        self,
+        keywords_by_label: dict[str, list[str]],
+        whole_word: bool = False,
+        short_word_chars: int = 0,
+    ):
+        self.labels: list[str] = list(keywords_by_label)
+        self._whole_word = whole_word
+        self._short_word_chars = short_word_chars
+        self._order = {label: i for i, label in enumerate(self.labels)}
+        # 노드별 전이/실패 링크/출력(라벨, 키워드 길이, 단어 시작/끝 필요 여부, 복수형 허용)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[str, int, bool, bool, bool]]] = [[]]
+
+        for label, keywords in keywords_by_label.items():
+            for kw in keywords:
+                kw = kw.strip().lower()
+                if kw:
+                    self._add(label, kw)
+        self._build_links()
+
+    def _add(self, label: str, keyword: str) -> None:
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        ascii_end = _is_word_char(keyword[-1])
+        short = ascii_end and keyword.isascii() and len(keyword) <= self._short_word_chars
+        entry = (
+            label,
+            len(keyword),
+            _is_word_char(keyword[0]),
+            ascii_end and (self._whole_word or short),
+            short and not self._whole_word,
+        )
+        if entry not in self._out[node]:
+            self._out[node].append(entry)
+
+    def _build_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt].extend(self._out[self._fail[nxt]])
+
+    def match(self, text: str) -> dict[str, int]:
+        """매칭된 라벨 → 적중 횟수. 적중 많은 순, 동률이면 라벨 정의 순."""
+        text = text.lower()
+        counts: dict[str, int] = {}
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for label, length, word_start, word_end, plural_ok in self._out[node]:
+                start = i - length + 1
+                if word_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if word_end and not _ends_word(text, i + 1, plural_ok):
+                    continue
+                counts[label] = counts.get(label, 0) + 1
+        return dict(sorted(counts.items(), key=lambda kv: (-kv[1], self._order[kv[0]])))
+
+    def best(self, text: str) -> str | None:
+        """가장 많이 적중한 라벨 (없으면 None)."""
+        return next(iter(self.match(text)), None)
@@ -0,0 +1,229 @@
+"""LLM 응답 영속 캐시 — (model, messages, temperature) 해시 기반 SQLite 저장소.
+
+동일 프롬프트가 반복되는 호출(같은 헤드라인의 감성 배치, 재시도로 재생성되는 가이드,
+같은 스크리닝 결과의 추천 사유 등)은 OpenRouter를 다시 호출하지 않고 캐시에서 응답한다.
+
+- 키: model/messages/temperature/max_tokens를 정렬 JSON으로 직렬화한 SHA-256
+- 기능별 TTL (FEATURE_TTL_SECONDS). TTL 0인 기능은 캐시하지 않는다.
+- 총 용량이 LLM_CACHE_MAX_MB를 넘으면 만료 항목 → 오래 사용되지 않은 항목 순으로 삭제
+- LLM_CACHE_ENABLED=false 또는 호출 시 cache=False로 우회
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 기능별 캐시 TTL (초). 목록에 없는 기능은 DEFAULT_TTL_SECONDS.
+FEATURE_TTL_SECONDS: dict[str, int] = {
+    "prediction": 6 * 3600,
+    "sentiment": 24 * 3600,
+    "geo": 6 * 3600,
+    "guide": 12 * 3600,
+    "weekly_report": 24 * 3600,
+    "recommendation": 12 * 3600,
+    "simulator": 24 * 3600,
+    "image": 7 * 24 * 3600,
+    "ask": 0,  # 대화형 Q&A는 사용자 맥락이 달라 캐시하지 않음
+}
+DEFAULT_TTL_SECONDS = 3600
+
+EVICT_EVERY_WRITES = 32  # N회 저장마다 용량 점검
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key          TEXT PRIMARY KEY,
+    feature      TEXT NOT NULL,
+    model        TEXT NOT NULL,
+    content      TEXT NOT NULL,
+    size         INTEGER NOT NULL,
+    created_at   REAL NOT NULL,
+    expires_at   REAL NOT NULL,
+    last_access  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_cache(expires_at);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache(last_access);
+"""
+
+_conn: sqlite3.Connection | None = None
+_lock = threading.Lock()
+_writes_since_evict = 0
+
+
+# ─── 키/정책 ───
+
+
+def make_key(
+    model: str,
+    messages: list[dict],
+    temperature: float,
+    max_tokens: int | None = None,
+) -> str:
+    """요청 내용을 정규화해 SHA-256 키를 만든다."""
+    raw = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "temperature": round(float(temperature), 4),
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def ttl_for(feature: str) -> int:
+    return FEATURE_TTL_SECONDS.get(feature, DEFAULT_TTL_SECONDS)
+
+
+def is_enabled(feature: str) -> bool:
+    """전역 설정과 기능별 TTL을 보고 캐시 사용 여부를 판단한다."""
+    return settings.llm_cache_enabled and ttl_for(feature) > 0
+
+
+# ─── 연결 ───
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        path = settings.llm_cache_path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _conn = conn
+        logger.info("LLM cache opened: %s", path)
+    return _conn
+
+
+def close() -> None:
+    """SQLite 연결을 닫는다 (API 종료 시 / 테스트 격리)."""
+    global _conn, _writes_since_evict
+    with _lock:
+        if _conn is not None:
+            try:
+                _conn.close()
+            except Exception as e:
+                logger.warning("LLM cache close failed: %s", e)
+        _conn = None
+        _writes_since_evict = 0
+
+
+# ─── 조회/저장 ───
+
+
+def get(key: str) -> str | None:
+    """만료되지 않은 캐시 응답을 반환한다. 실패 시 None (캐시 미스로 취급)."""
+    now = time.time()
+    try:
+        with _lock:
+            conn = _get_conn()
+            row = conn.execute(
+                "SELECT content FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+            return row[0]
+    except Exception as e:
+        logger.warning("LLM cache read failed: %s", e)
+        return None
+
+
+def put(key: str, feature: str, model: str, content: str) -> None:
+    """응답을 기능별 TTL로 저장하고, 주기적으로 용량 초과분을 정리한다."""
+    global _writes_since_evict
+    ttl = ttl_for(feature)
+    if ttl <= 0:
+        return
+    now = time.time()
+    try:
+        with _lock:
+            conn = _get_conn()
+            conn.execute(
+                """INSERT OR REPLACE INTO llm_cache
+                   (key, feature, model, content, size, created_at, expires_at, last_access)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (key, feature, model, content, len(content.encode("utf-8")), now, now + ttl, now),
+            )
+            conn.commit()
+            _writes_since_evict += 1
+            if _writes_since_evict >= EVICT_EVERY_WRITES:
+                _writes_since_evict = 0
+                _evict(conn, now)
+    except Exception as e:
+        logger.warning("LLM cache write failed: %s", e)
+
+
+def _evict(conn: sqlite3.Connection, now: float) -> int:
+    """만료 항목을 지우고, 남은 용량이 상한을 넘으면 LRU 순으로 삭제한다."""
+    removed = conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+
+    max_bytes = settings.llm_cache_max_mb * 1024 * 1024
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+    if total > max_bytes:
+        excess = total - max_bytes
+        freed = 0
+        victims: list[str] = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM llm_cache ORDER BY last_access ASC"
+        ):
+            victims.append(key)
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM llm_cache WHERE key = ?", [(k,) for k in victims])
+        removed += len(victims)
+
+    conn.commit()
+    if removed:
+        logger.info("LLM cache evicted %d entries", removed)
+    return removed
+
+
+def evict() -> int:
+    """만료/용량 초과 항목을 즉시 정리한다."""
+    with _lock:
+        return _evict(_get_conn(), time.time())
+
+
+def clear() -> int:
+    """캐시 전체를 비운다. 삭제된 항목 수를 반환한다."""
+    with _lock:
+        conn = _get_conn()
+        removed = conn.execute("DELETE FROM llm_cache").rowcount
+        conn.commit()
+    logger.info("LLM cache cleared (%d entries)", removed)
+    return removed
+
+
+def stats() -> dict:
+    """항목 수/용량(바이트)/기능별 항목 수를 반환한다."""
+    try:
+        with _lock:
+            conn = _get_conn()
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+            by_feature = dict(
+                conn.execute("SELECT feature, COUNT(*) FROM llm_cache GROUP BY feature").fetchall()
+            )
+        return {"entries": entries, "size_bytes": size, "by_feature": by_feature}
+    except Exception as e:
+        logger.warning("LLM cache stats failed: %s", e)
+        return {"entries": 0, "size_bytes": 0, "by_feature": {}}
@@ -0,0 +1,859 @@
+"""OpenRouter 공용 LLM 클라이언트 — 풀링된 HTTP/2 연결 + 전역 동시성 제한 + 재시도 + 메트릭.
+
+모든 AI 기능(예측, 감성, 지정학, 가이드, 주간 리포트, Q&A, 시뮬레이터, 이미지, 추천)은
+이 모듈을 통해 OpenRouter를 호출한다.
+
+- 전용 백그라운드 이벤트 루프 1개가 keep-alive httpx.AsyncClient(HTTP/2)와
+  전역 asyncio.Semaphore를 소유한다. 호출마다 TLS 핸드셰이크를 반복하지 않는다.
+- 동기 호출자(스케줄러 스레드, sync 라우터)는 chat_completion()으로,
+  비동기 호출자는 achat_completion()으로 같은 루프/풀/세마포어를 공유한다.
+- 429/5xx 및 연결 오류는 지수 백오프 + full jitter로 재시도한다 (Retry-After 우선).
+- 호출마다 지연시간/토큰/비용을 기록하고 get_metrics()로 기능별 집계를 노출한다.
+- 동일 요청은 llm_cache(SQLite 영속 캐시)에서 먼저 조회한다. cache=False로 우회.
+- astream_completion()은 SSE 스트림으로 토큰 델타를 도착 즉시 전달한다 (캐시 미사용).
+- chat_json_hedged()는 model_configs의 기능별 모델 체인으로 헤지 요청을 보낸다.
+  1순위 모델이 지연 예산(hedge_after_ms) 안에 응답하지 않으면 다음 모델을 병렬로 호출하고
+  먼저 도착한 유효 JSON을 채택한다. 모델별 p50/p95는 get_model_metrics()로 노출한다.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable
+
+import httpx
+
+from app.config import settings
+from app.services import llm_cache, prompt_context
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+DEFAULT_TIMEOUT = 60.0
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_MAX = 20.0  # seconds
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+LATENCY_WINDOW = 200  # 기능별 최근 지연시간 보관 개수
+DEFAULT_HEDGE_AFTER_MS = 20_000  # model_configs.hedge_after_ms 미설정 시 지연 예산
+MODEL_CHAIN_CACHE_TTL = 300  # seconds
+
+
+class LLMError(Exception):
+    """OpenRouter 응답이 비정상(본문 누락 등)일 때 발생한다."""
+
+
+@dataclass
+class LLMResponse:
+    content: str
+    model: str
+    latency_ms: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float | None = None
+    attempts: int = 1
+    cached: bool = False
+
+
+@dataclass
+class ModelChain:
+    """기능별 모델 체인 — models[0]이 1순위, 이후는 헤지/폴백 순서."""
+
+    models: list[str]
+    hedge_after_ms: int = DEFAULT_HEDGE_AFTER_MS
+
+
+# ─── 응답 파서 ───
+
+
+def strip_code_fence(content: str) -> str:
+    """```json ... ``` 코드 블록 래핑을 제거한다."""
+    content = content.strip()
+    if content.startswith("```"):
+        content = content.split("\n", 1)[1] if "\n" in content else content
+        if content.endswith("```"):
+            content = content[: -len("```")]
+        content = content.strip()
+    return content
+
+
+def parse_json_content(content: str) -> Any:
+    """AI 응답 텍스트에서 JSON(객체 또는 배열)을 파싱한다."""
+    return json.loads(strip_code_fence(content))
+
+
+# ─── 메트릭 ───
+
+_metrics: dict[str, dict] = {}
+_model_metrics: dict[str, dict] = {}
+_metrics_lock = threading.Lock()
+
+
+def _metrics_entry(feature: str, model: str) -> dict:
+    """기능별 집계 dict를 반환한다 (없으면 생성). _metrics_lock 하에서 호출."""
+    m = _metrics.get(feature)
+    if m is None:
+        m = {
+            "calls": 0,
+            "errors": 0,
+            "retries": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "hedges": 0,
+            "fallback_wins": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "cost": 0.0,
+            "latency_ms_total": 0.0,
+            "latencies": deque(maxlen=LATENCY_WINDOW),
+            "last_model": model,
+        }
+        _metrics[feature] = m
+    return m
+
+
+def _record(
+    feature: str,
+    model: str,
+    latency_ms: float,
+    ok: bool,
+    retries: int,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    cost: float | None = None,
+) -> None:
+    with _metrics_lock:
+        m = _metrics_entry(feature, model)
+        m["calls"] += 1
+        m["retries"] += retries
+        m["last_model"] = model
+        m["latency_ms_total"] += latency_ms
+        m["latencies"].append(latency_ms)
+
+        mm = _model_metrics.get(model)
+        if mm is None:
+            mm = {"calls": 0, "errors": 0, "latencies": deque(maxlen=LATENCY_WINDOW)}
+            _model_metrics[model] = mm
+        mm["calls"] += 1
+
+        if not ok:
+            m["errors"] += 1
+            mm["errors"] += 1
+            return
+        mm["latencies"].append(latency_ms)
+        m["prompt_tokens"] += prompt_tokens
+        m["completion_tokens"] += completion_tokens
+        if cost is not None:
+            m["cost"] += cost
+
+
+def _record_cache(feature: str, model: str, hit: bool) -> None:
+    with _metrics_lock:
+        m = _metrics_entry(feature, model)
+        m["cache_hits" if hit else "cache_misses"] += 1
+
+
+def _record_hedge(feature: str, model: str, won: bool = False) -> None:
+    """헤지 요청 발송(won=False) 또는 폴백 모델 채택(won=True)을 기록한다."""
+    with _metrics_lock:
+        m = _metrics_entry(feature, model)
+        m["fallback_wins" if won else "hedges"] += 1
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def get_metrics() -> dict[str, dict]:
+    """기능별 누적 호출 수/오류/재시도/캐시 적중/토큰/비용과 최근 지연시간 p50·p95를 반환한다."""
+    with _metrics_lock:
+        snapshot = {k: {**v, "latencies": list(v["latencies"])} for k, v in _metrics.items()}
+
+    result: dict[str, dict] = {}
+    for feature, m in snapshot.items():
+        latencies = m.pop("latencies")
+        total_ms = m.pop("latency_ms_total")
+        result[feature] = {
+            **m,
+            "cost": round(m["cost"], 6),
+            "avg_latency_ms": round(total_ms / m["calls"], 1) if m["calls"] else 0.0,
+            "p50_latency_ms": round(_percentile(latencies, 50), 1),
+            "p95_latency_ms": round(_percentile(latencies, 95), 1),
+        }
+    return result
+
+
+def get_model_metrics() -> dict[str, dict]:
+    """모델별 호출 수/오류와 성공 응답 지연시간 p50·p95 — 헤지 예산 튜닝용."""
+    with _metrics_lock:
+        snapshot = {k: {**v, "latencies": list(v["latencies"])} for k, v in _model_metrics.items()}
+
+    return {
+        model: {
+            "calls": m["calls"],
+            "errors": m["errors"],
+            "p50_latency_ms": round(_percentile(m["latencies"], 50), 1),
+            "p95_latency_ms": round(_percentile(m["latencies"], 95), 1),
+        }
+        for model, m in snapshot.items()
+    }
+
+
+# ─── 백그라운드 루프 + 풀링 클라이언트 ───
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_http: httpx.AsyncClient | None = None
+_semaphore: asyncio.Semaphore | None = None
+_init_lock = threading.Lock()
+
+
+async def _setup() -> None:
+    global _http, _semaphore
+    concurrency = settings.llm_max_concurrency
+    _http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=concurrency * 2,
+            max_keepalive_connections=concurrency,
+            keepalive_expiry=120.0,
+        ),
+        timeout=DEFAULT_TIMEOUT,
+    )
+    _semaphore = asyncio.Semaphore(concurrency)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """LLM 전용 이벤트 루프를 (최초 1회) 기동하고 반환한다."""
+    global _loop, _loop_thread
+    with _init_lock:
+        if _loop is not None and _loop.is_running():
+            return _loop
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever, name="llm-client-loop", daemon=True
+        )
+        thread.start()
+        asyncio.run_coroutine_threadsafe(_setup(), loop).result()
+        _loop, _loop_thread = loop, thread
+        logger.info(
+            "LLM client started (http2, max_concurrency=%d)",
+            settings.llm_max_concurrency,
+        )
+        return loop
+
+
+def _backoff_delay(attempt: int, response: httpx.Response | None) -> float:
+    """Retry-After 헤더가 있으면 따르고, 없으면 full jitter 지수 백오프."""
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(BACKOFF_MAX, float(retry_after))
+            except ValueError:
+                pass
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2**attempt)))
+
+
+async def _request(
+    payload: dict,
+    feature: str,
+    timeout: float,
+) -> LLMResponse:
+    """세마포어 하에서 OpenRouter를 호출하고 재시도/메트릭을 처리한다."""
+    assert _http is not None and _semaphore is not None
+    headers = {
+        "Authorization": f"Bearer {settings.openrouter_api_key}",
+        "Content-Type": "application/json",
+    }
+    model = payload["model"]
+    est_tokens = prompt_context.estimate_messages_tokens(payload["messages"])
+    logger.debug("LLM call feature=%s model=%s est_prompt_tokens=%d", feature, model, est_tokens)
+    started = time.perf_counter()
+
+    for attempt in range(MAX_RETRIES + 1):
+        response: httpx.Response | None = None
+        try:
+            async with _semaphore:
+                response = await _http.post(
+                    OPENROUTER_URL, headers=headers, json=payload, timeout=timeout
+                )
+            if response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                raise httpx.HTTPStatusError(
+                    f"retryable status {response.status_code}",
+                    request=response.request,
+                    response=response,
+                )
+            response.raise_for_status()
+
+            body = response.json()
+            try:
+                content = body["choices"][0]["message"]["content"] or ""
+            except (KeyError, IndexError, TypeError) as e:
+                raise LLMError(f"Malformed OpenRouter response: {body!r:.200}") from e
+
+            usage = body.get("usage") or {}
+            result = LLMResponse(
+                content=content,
+                model=body.get("model", model),
+                latency_ms=(time.perf_counter() - started) * 1000,
+                prompt_tokens=int(usage.get("prompt_tokens") or 0),
+                completion_tokens=int(usage.get("completion_tokens") or 0),
+                cost=usage.get("cost"),
+                attempts=attempt + 1,
+            )
+            _record(
+                feature,
+                model,
+                result.latency_ms,
+                True,
+                attempt,
+                result.prompt_tokens,
+                result.completion_tokens,
+                result.cost,
+            )
+            logger.info(
+                "LLM call feature=%s model=%s latency=%.0fms tokens=%d(est %d)/%d cost=%s attempts=%d",
+                feature,
+                model,
+                result.latency_ms,
+                result.prompt_tokens,
+                est_tokens,
+                result.completion_tokens,
+                result.cost,
+                result.attempts,
+            )
+            return result
+
+        except (httpx.HTTPStatusError, httpx.ConnectError, httpx.RemoteProtocolError) as e:
+            retryable = isinstance(e, (httpx.ConnectError, httpx.RemoteProtocolError)) or (
+                response is not None and response.status_code in RETRY_STATUS_CODES
+            )
+            if not retryable or attempt >= MAX_RETRIES:
+                _record(feature, model, (time.perf_counter() - started) * 1000, False, attempt)
+                raise
+            delay = _backoff_delay(attempt, response)
+            logger.warning(
+                "LLM call feature=%s model=%s failed (%s) — retry %d/%d in %.1fs",
+                feature,
+                model,
+                e,
+                attempt + 1,
+                MAX_RETRIES,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+        except Exception:
+            _record(feature, model, (time.perf_counter() - started) * 1000, False, attempt)
+            raise
+
+    raise LLMError("unreachable")  # pragma: no cover
+
+
+async def _stream(
+    payload: dict,
+    feature: str,
+    timeout: float,
+    emit: Callable[[str, Any], None],
+) -> None:
+    """스트리밍 호출. 델타는 emit("delta", text)로, 종료는 emit("done"/"error", ...)로 알린다.
+
+    첫 토큰 전의 429/5xx·연결 오류만 재시도한다 (부분 응답은 재시도하지 않음).
+    """
+    assert _http is not None and _semaphore is not None
+    headers = {
+        "Authorization": f"Bearer {settings.openrouter_api_key}",
+        "Content-Type": "application/json",
+    }
+    model = payload["model"]
+    started = time.perf_counter()
+    first_token_ms: float | None = None
+    usage: dict = {}
+    attempt = 0
+
+    try:
+        for attempt in range(MAX_RETRIES + 1):
+            retry_response: httpx.Response | None = None
+            try:
+                async with _semaphore:
+                    async with _http.stream(
+                        "POST", OPENROUTER_URL, headers=headers, json=payload, timeout=timeout
+                    ) as response:
+                        if response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                            retry_response = response
+                        else:
+                            if response.status_code >= 400:
+                                await response.aread()
+                            response.raise_for_status()
+                            async for line in response.aiter_lines():
+                                # OpenRouter는 ": OPENROUTER PROCESSING" 주석 라인을 보낸다
+                                if not line.startswith("data:"):
+                                    continue
+                                data = line[len("data:") :].strip()
+                                if data == "[DONE]":
+                                    break
+                                chunk = json.loads(data)
+                                if chunk.get("usage"):
+                                    usage = chunk["usage"]
+                                choices = chunk.get("choices") or []
+                                delta = (
+                                    (choices[0].get("delta") or {}).get("content")
+                                    if choices
+                                    else None
+                                )
+                                if delta:
+                                    if first_token_ms is None:
+                                        first_token_ms = (time.perf_counter() - started) * 1000
+                                    emit("delta", delta)
+            except (httpx.ConnectError, httpx.RemoteProtocolError) as e:
+                if first_token_ms is not None or attempt >= MAX_RETRIES:
+                    raise
+                delay = _backoff_delay(attempt, None)
+                logger.warning(
+                    "LLM stream feature=%s model=%s failed (%s) — retry %d/%d in %.1fs",
+                    feature,
+                    model,
+                    e,
+                    attempt + 1,
+                    MAX_RETRIES,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if retry_response is None:
+                break
+            delay = _backoff_delay(attempt, retry_response)
+            logger.warning(
+                "LLM stream feature=%s model=%s status %d — retry %d/%d in %.1fs",
+                feature,
+                model,
+                retry_response.status_code,
+                attempt + 1,
+                MAX_RETRIES,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    except Exception as e:
+        _record(feature, model, (time.perf_counter() - started) * 1000, False, attempt)
+        emit("error", e)
+        return
+
+    latency_ms = (time.perf_counter() - started) * 1000
+    _record(
+        feature,
+        model,
+        latency_ms,
+        True,
+        attempt,
+        int(usage.get("prompt_tokens") or 0),
+        int(usage.get("completion_tokens") or 0),
+        usage.get("cost"),
+    )
+    logger.info(
+        "LLM stream feature=%s model=%s ttft=%.0fms latency=%.0fms attempts=%d",
+        feature,
+        model,
+        first_token_ms or 0.0,
+        latency_ms,
+        attempt + 1,
+    )
+    emit("done", None)
+
+
+def _build_payload(
+    model: str,
+    messages: list[dict],
+    temperature: float,
+    max_tokens: int | None,
+) -> dict:
+    payload: dict = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "usage": {"include": True},
+    }
+    if max_tokens is not None:
+        payload["max_tokens"] = max_tokens
+    return payload
+
+
+# ─── 응답 캐시 ───
+
+
+def _cache_key(payload: dict, feature: str, cache: bool) -> str | None:
+    if not cache or not llm_cache.is_enabled(feature):
+        return None
+    return llm_cache.make_key(
+        payload["model"],
+        payload["messages"],
+        payload["temperature"],
+        payload.get("max_tokens"),
+    )
+
+
+def _cache_lookup(key: str | None, feature: str, model: str) -> LLMResponse | None:
+    if key is None:
+        return None
+    content = llm_cache.get(key)
+    _record_cache(feature, model, content is not None)
+    if content is None:
+        return None
+    logger.info("LLM cache hit feature=%s model=%s", feature, model)
+    return LLMResponse(content=content, model=model, latency_ms=0.0, attempts=0, cached=True)
+
+
+def _cache_store(
+    key: str | None,
+    feature: str,
+    model: str,
+    content: str,
+    validate: Callable[[str], Any] | None,
+) -> None:
+    """응답을 캐시에 저장한다. validate가 실패하는 응답(깨진 JSON 등)은 저장하지 않는다."""
+    if key is None or not content:
+        return
+    if validate is not None:
+        try:
+            validate(content)
+        except Exception:
+            return
+    llm_cache.put(key, feature, model, content)
+
+
+def _complete_sync(
+    payload: dict,
+    feature: str,
+    timeout: float,
+    cache: bool,
+    validate: Callable[[str], Any] | None = None,
+) -> LLMResponse:
+    key = _cache_key(payload, feature, cache)
+    hit = _cache_lookup(key, feature, payload["model"])
+    if hit is not None:
+        return hit
+    loop = _get_loop()
+    response = asyncio.run_coroutine_threadsafe(
+        _request(payload, feature, timeout), loop
+    ).result()
+    _cache_store(key, feature, payload["model"], response.content, validate)
+    return response
+
+
+async def _complete_async(
+    payload: dict,
+    feature: str,
+    timeout: float,
+    cache: bool,
+    validate: Callable[[str], Any] | None = None,
+) -> LLMResponse:
+    key = _cache_key(payload, feature, cache)
+    hit = await asyncio.to_thread(_cache_lookup, key, feature, payload["model"])
+    if hit is not None:
+        return hit
+    loop = _get_loop()
+    coro = _request(payload, feature, timeout)
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        response = await coro
+    else:
+        response = await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+    await asyncio.to_thread(
+        _cache_store, key, feature, payload["model"], response.content, validate
+    )
+    return response
+
+
+# ─── 모델 체인 + 헤지 요청 ───
+
+_chain_cache: dict[str, tuple[float, ModelChain]] = {}
+_chain_lock = threading.Lock()
+
+
+def _load_model_chain(client: Any, config_key: str, default_model: str) -> ModelChain:
+    try:
+        result = (
+            client.table("model_configs")
+            .select("*")
+            .eq("config_key", config_key)
+            .eq("is_active", True)
+            .limit(1)
+            .execute()
+        )
+        if result.data:
+            row = result.data[0]
+            models: list[str] = []
+            for model in [
+                row.get("primary_model"),
+                row.get("fallback_model"),
+                *(row.get("fallback_models") or []),
+            ]:
+                if model and model not in models:
+                    models.append(model)
+            if models:
+                return ModelChain(
+                    models=models,
+                    hedge_after_ms=int(row.get("hedge_after_ms") or DEFAULT_HEDGE_AFTER_MS),
+                )
+    except Exception as e:
+        logger.warning("model_configs query failed for %s: %s — using default", config_key, e)
+    return ModelChain(models=[default_model])
+
+
+def get_model_chain(client: Any, config_key: str, default_model: str) -> ModelChain:
+    """model_configs에서 기능별 모델 체인을 조회한다 (TTL 캐시, 조회 실패 시 기본 모델 1개)."""
+    now = time.monotonic()
+    with _chain_lock:
+        cached = _chain_cache.get(config_key)
+        if cached is not None and now - cached[0] < MODEL_CHAIN_CACHE_TTL:
+            return cached[1]
+
+    chain = _load_model_chain(client, config_key, default_model)
+    with _chain_lock:
+        _chain_cache[config_key] = (now, chain)
+    return chain
+
+
+def invalidate_model_chains() -> None:
+    """모델 체인 캐시를 비운다 (관리자 모델 설정 변경 시)."""
+    with _chain_lock:
+        _chain_cache.clear()
+
+
+async def _hedged_json(
+    payloads: list[dict],
+    feature: str,
+    timeout: float,
+    hedge_after_s: float,
+    cache: bool,
+) -> Any:
+    """체인 순서대로 요청하되, 지연 예산 초과 또는 실패 시 다음 모델을 병렬 발송한다.
+
+    먼저 도착한 유효 JSON 응답을 채택하고 나머지 요청은 취소한다.
+    """
+    keys = [_cache_key(p, feature, cache) for p in payloads]
+    for payload, key in zip(payloads, keys):
+        hit = await asyncio.to_thread(_cache_lookup, key, feature, payload["model"])
+        if hit is not None:
+            return parse_json_content(hit.content)
+
+    pending: dict[asyncio.Task, int] = {}
+    next_idx = 0
+    last_error: Exception | None = None
+
+    def launch() -> None:
+        nonlocal next_idx
+        idx = next_idx
+        next_idx += 1
+        if idx > 0:
+            _record_hedge(feature, payloads[idx]["model"])
+        pending[asyncio.create_task(_request(payloads[idx], feature, timeout))] = idx
+
+    launch()
+    try:
+        while pending:
+            can_hedge = next_idx < len(payloads)
+            done, _ = await asyncio.wait(
+                pending,
+                timeout=hedge_after_s if can_hedge else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                logger.warning(
+                    "LLM hedge feature=%s: no response within %.0fms — also trying %s",
+                    feature,
+                    hedge_after_s * 1000,
+                    payloads[next_idx]["model"],
+                )
+                launch()
+                continue
+
+            for task in done:
+                idx = pending.pop(task)
+                model = payloads[idx]["model"]
+                try:
+                    response = task.result()
+                    parsed = parse_json_content(response.content)
+                except Exception as e:
+                    last_error = e
+                    logger.warning("LLM hedge feature=%s model=%s failed: %s", feature, model, e)
+                    continue
+
+                if idx > 0:
+                    _record_hedge(feature, model, won=True)
+                    logger.info("LLM hedge feature=%s won by fallback model %s", feature, model)
+                await asyncio.to_thread(
+                    _cache_store, keys[idx], feature, model, response.content, None
+                )
+                return parsed
+
+            # 진행 중인 요청이 모두 실패했으면 예산을 기다리지 않고 다음 모델로
+            if not pending and next_idx < len(payloads):
+                launch()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    raise last_error or LLMError(f"All models failed for feature={feature}")
+
+
+# ─── 공개 API ───
+
+
+async def achat_completion(
+    model: str,
+    messages: list[dict],
+    *,
+    feature: str,
+    temperature: float = 0.3,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_tokens: int | None = None,
+    cache: bool = True,
+) -> LLMResponse:
+    """비동기 chat completion. 어느 이벤트 루프에서 호출해도 공용 풀을 사용한다."""
+    payload = _build_payload(model, messages, temperature, max_tokens)
+    return await _complete_async(payload, feature, timeout, cache)
+
+
+def chat_completion(
+    model: str,
+    messages: list[dict],
+    *,
+    feature: str,
+    temperature: float = 0.3,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_tokens: int | None = None,
+    cache: bool = True,
+) -> LLMResponse:
+    """동기 chat completion — 스케줄러 스레드/sync 라우터에서 호출한다."""
+    payload = _build_payload(model, messages, temperature, max_tokens)
+    return _complete_sync(payload, feature, timeout, cache)
+
+
+async def achat_json(
+    model: str,
+    messages: list[dict],
+    *,
+    feature: str,
+    temperature: float = 0.3,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_tokens: int | None = None,
+    cache: bool = True,
+) -> Any:
+    """achat_completion + JSON 파싱. 파싱 가능한 응답만 캐시한다."""
+    payload = _build_payload(model, messages, temperature, max_tokens)
+    response = await _complete_async(payload, feature, timeout, cache, parse_json_content)
+    return parse_json_content(response.content)
+
+
+def chat_json(
+    model: str,
+    messages: list[dict],
+    *,
+    feature: str,
+    temperature: float = 0.3,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_tokens: int | None = None,
+    cache: bool = True,
+) -> Any:
+    """chat_completion + JSON 파싱. 파싱 가능한 응답만 캐시한다."""
+    payload = _build_payload(model, messages, temperature, max_tokens)
+    response = _complete_sync(payload, feature, timeout, cache, parse_json_content)
+    return parse_json_content(response.content)
+
+
+def chat_json_hedged(
+    chain: ModelChain,
+    messages: list[dict],
+    *,
+    feature: str,
+    temperature: float = 0.3,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_tokens: int | None = None,
+    cache: bool = True,
+) -> Any:
+    """모델 체인에 헤지 요청을 보내고 먼저 도착한 유효 JSON을 반환한다."""
+    payloads = [_build_payload(m, messages, temperature, max_tokens) for m in chain.models]
+    loop = _get_loop()
+    coro = _hedged_json(payloads, feature, timeout, chain.hedge_after_ms / 1000, cache)
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def astream_completion(
+    model: str,
+    messages: list[dict],
+    *,
+    feature: str,
+    temperature: float = 0.3,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_tokens: int | None = None,
+) -> AsyncIterator[str]:
+    """스트리밍 chat completion — 토큰 델타 문자열을 도착 즉시 yield한다.
+
+    HTTP 스트림은 공용 루프에서 읽고, 호출자 루프의 asyncio.Queue로 전달한다.
+    호출자가 중간에 반복을 멈추면(클라이언트 연결 종료 등) 상류 스트림도 취소한다.
+    """
+    payload = _build_payload(model, messages, temperature, max_tokens)
+    payload["stream"] = True
+    loop = _get_loop()
+    caller = asyncio.get_running_loop()
+    queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+
+    def emit(kind: str, value: Any) -> None:
+        caller.call_soon_threadsafe(queue.put_nowait, (kind, value))
+
+    future = asyncio.run_coroutine_threadsafe(_stream(payload, feature, timeout, emit), loop)
+    try:
+        while True:
+            kind, value = await queue.get()
+            if kind == "delta":
+                yield value
+            elif kind == "error":
+                raise value
+            else:
+                return
+    finally:
+        if not future.done():
+            future.cancel()
+
+
+def user_prompt(prompt: str) -> list[dict]:
+    """단일 user 메시지 목록을 만든다."""
+    return [{"role": "user", "content": prompt}]
+
+
+def shutdown() -> None:
+    """풀링 클라이언트를 닫고 백그라운드 루프를 정지한다 (API 종료 시)."""
+    global _loop, _loop_thread, _http, _semaphore
+    llm_cache.close()
+    with _init_lock:
+        if _loop is None:
+            return
+        loop = _loop
+        if _http is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(_http.aclose(), loop).result(timeout=5)
+            except Exception as e:
+                logger.warning("LLM client close failed: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        if _loop_thread is not None:
+            _loop_thread.join(timeout=5)
+        loop.close()
+        _loop, _loop_thread, _http, _semaphore = None, None, None, None
+        logger.info("LLM client stopped")
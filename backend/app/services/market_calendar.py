@@ -0,0 +1,140 @@
+"""거래소 거래 캘린더 — 티커 접미사로 거래소를 판별하고 정규장 개장 여부를 계산한다.
+
+- KRX (.KS/.KQ): 09:00~15:30 KST
+- US (접미사 없음): 09:30~16:00 ET, 조기 폐장일 13:00
+- TSE (.T) / HKEX (.HK): 점심 휴장 포함
+- LSE (.L): 08:00~16:30 London
+- 암호화폐 (-USD/-KRW 등): 24시간
+- 그 외 접미사: 캘린더 미지원 → 항상 개장으로 간주 (기존 동작 유지)
+
+휴장일은 연도별 고정 목록이다 (대체공휴일/선거일 포함). 매년 말 다음 해 목록을 추가한다.
+목록에 없는 연도는 주말만 휴장으로 본다.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+# ─── 휴장일 ───
+
+KRX_HOLIDAYS: frozenset[date] = frozenset(
+    date.fromisoformat(d)
+    for d in (
+        # 2026
+        "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02",
+        "2026-05-01", "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17",
+        "2026-09-24", "2026-09-25", "2026-10-05", "2026-10-09", "2026-12-25",
+        "2026-12-31",
+        # 2027
+        "2027-01-01", "2027-02-08", "2027-02-09", "2027-03-01", "2027-05-05",
+        "2027-05-13", "2027-08-16", "2027-09-14", "2027-09-15", "2027-09-16",
+        "2027-10-04", "2027-10-11", "2027-12-27", "2027-12-31",
+    )
+)
+
+US_HOLIDAYS: frozenset[date] = frozenset(
+    date.fromisoformat(d)
+    for d in (
+        # 2026
+        "2026-01-01", "2026-01-19", "2026-02-16", "2026-04-03", "2026-05-25",
+        "2026-06-19", "2026-07-03", "2026-09-07", "2026-11-26", "2026-12-25",
+        # 2027
+        "2027-01-01", "2027-01-18", "2027-02-15", "2027-03-26", "2027-05-31",
+        "2027-06-18", "2027-07-05", "2027-09-06", "2027-11-25", "2027-12-24",
+    )
+)
+
+US_EARLY_CLOSES: dict[date, time] = {
+    date(2026, 11, 27): time(13, 0),
+    date(2026, 12, 24): time(13, 0),
+    date(2027, 11, 26): time(13, 0),
+}
+
+
+# ─── 거래소 ───
+
+
+@dataclass(frozen=True)
+class Exchange:
+    code: str
+    tz: ZoneInfo
+    open: time
+    close: time
+    lunch: tuple[time, time] | None = None
+    holidays: frozenset[date] = frozenset()
+    early_closes: dict[date, time] = field(default_factory=dict)
+    always_open: bool = False
+
+
+KRX = Exchange("KRX", ZoneInfo("Asia/Seoul"), time(9, 0), time(15, 30), holidays=KRX_HOLIDAYS)
+US = Exchange(
+    "US",
+    ZoneInfo("America/New_York"),
+    time(9, 30),
+    time(16, 0),
+    holidays=US_HOLIDAYS,
+    early_closes=US_EARLY_CLOSES,
+)
+TSE = Exchange("TSE", ZoneInfo("Asia/Tokyo"), time(9, 0), time(15, 30), lunch=(time(11, 30), time(12, 30)))
+HKEX = Exchange("HKEX", ZoneInfo("Asia/Hong_Kong"), time(9, 30), time(16, 0), lunch=(time(12, 0), time(13, 0)))
+LSE = Exchange("LSE", ZoneInfo("Europe/London"), time(8, 0), time(16, 30))
+CRYPTO = Exchange("CRYPTO", ZoneInfo("UTC"), time(0, 0), time(0, 0), always_open=True)
+UNKNOWN = Exchange("UNKNOWN", ZoneInfo("UTC"), time(0, 0), time(0, 0), always_open=True)
+
+SUFFIX_EXCHANGES: dict[str, Exchange] = {
+    ".KS": KRX,
+    ".KQ": KRX,
+    ".T": TSE,
+    ".HK": HKEX,
+    ".L": LSE,
+}
+CRYPTO_QUOTES = ("-USD", "-KRW", "-USDT")
+
+
+def exchange_for(ticker: str) -> Exchange:
+    """티커가 상장된 거래소."""
+    upper = ticker.upper()
+    if upper.endswith(CRYPTO_QUOTES):
+        return CRYPTO
+    if "." not in upper:
+        return US
+    return SUFFIX_EXCHANGES.get(upper[upper.rindex("."):], UNKNOWN)
+
+
+def is_trading_day(exchange: Exchange, day: date) -> bool:
+    return exchange.always_open or (day.weekday() < 5 and day not in exchange.holidays)
+
+
+def session_close(exchange: Exchange, at: datetime) -> datetime | None:
+    """at이 속한 현지 거래일의 폐장 시각 (거래일이 아니면 None)."""
+    local = at.astimezone(exchange.tz)
+    if not is_trading_day(exchange, local.date()):
+        return None
+    close = exchange.early_closes.get(local.date(), exchange.close)
+    return datetime.combine(local.date(), close, tzinfo=exchange.tz)
+
+
+def is_open(exchange: Exchange, at: datetime) -> bool:
+    """at 시점에 정규장이 열려 있는지 (점심 휴장 제외)."""
+    if exchange.always_open:
+        return True
+    close = session_close(exchange, at)
+    if close is None:
+        return False
+    local = at.astimezone(exchange.tz)
+    opens = datetime.combine(local.date(), exchange.open, tzinfo=exchange.tz)
+    if not opens <= local < close:
+        return False
+    if exchange.lunch:
+        lunch_start, lunch_end = exchange.lunch
+        if lunch_start <= local.time() < lunch_end:
+            return False
+    return True
+
+
+def is_active(exchange: Exchange, at: datetime, grace: timedelta) -> bool:
+    """개장 중이거나 폐장 후 grace 이내(종가 반영 대기)인지."""
+    if is_open(exchange, at):
+        return True
+    close = session_close(exchange, at)
+    return close is not None and close <= at.astimezone(exchange.tz) < close + grace
@@ -0,0 +1,142 @@
+"""알림 수신 대상 캐시 — notification_targets 전체를 한 번에 읽어 user_id ↔ telegram_chat_id 맵으로 유지한다.
+
+user_id에는 유니크 제약이 없으므로 한 사용자가 여러 활성 채팅(개인 대화, 그룹 등)을 가질 수 있고,
+발송은 사용자의 활성 채팅 전부로 나간다.
+
+가격 알림 발송·리스크 브로드캐스트·봇 명령어는 알림마다 테이블을 조회하지 않고 이 맵을 쓴다.
+
+무효화:
+- VERSION_CHECK_SECONDS마다 notification_targets_version() RPC(행 수 + 최신 updated_at)를
+  조회해 다른 프로세스/대시보드에서 대상이 바뀌었으면 다시 적재한다.
+- RPC를 쓸 수 없으면 TARGETS_CACHE_TTL마다 다시 적재한다.
+- 같은 프로세스에서 대상을 바꾼 코드는 invalidate()를 호출한다.
+"""
+
+import threading
+import time
+
+from supabase import Client
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TARGETS_TABLE = "notification_targets"
+TARGETS_CACHE_TTL = 600  # seconds
+VERSION_CHECK_SECONDS = 30
+TARGETS_PAGE_SIZE = 1000  # PostgREST 기본 max-rows
+
+
+class _TargetMap:
+    """활성 대상의 user_id → chat_id 목록과 역방향 맵 (불변)."""
+
+    def __init__(self, rows: list[dict]):
+        self.chats_by_user: dict[str, list[str]] = {}
+        self.user_by_chat: dict[str, str] = {}
+        # updated_at 오름차순으로 읽으므로 같은 채팅은 가장 최근 행의 사용자가 남는다
+        for row in rows:
+            chat_id = row.get("telegram_chat_id")
+            if not chat_id:
+                continue
+            chats = self.chats_by_user.setdefault(row["user_id"], [])
+            if str(chat_id) not in chats:
+                chats.append(str(chat_id))
+            self.user_by_chat[str(chat_id)] = row["user_id"]
+        for chats in self.chats_by_user.values():
+            chats.reverse()  # 최근 대상이 앞에 오도록
+
+
+_targets: _TargetMap | None = None
+_version: str | None = None
+_loaded_at = 0.0
+_checked_at = 0.0
+_lock = threading.Lock()
+_load_lock = threading.Lock()
+
+
+def _load_rows(client: Client) -> list[dict]:
+    rows: list[dict] = []
+    offset = 0
+    while True:
+        page = (
+            client.table(TARGETS_TABLE)
+            .select("user_id, telegram_chat_id")
+            .eq("is_active", True)
+            .order("updated_at")
+            .range(offset, offset + TARGETS_PAGE_SIZE - 1)
+            .execute()
+        ).data or []
+        rows.extend(page)
+        if len(page) < TARGETS_PAGE_SIZE:
+            return rows
+        offset += TARGETS_PAGE_SIZE
+
+
+def _fetch_version(client: Client) -> str | None:
+    try:
+        data = client.rpc("notification_targets_version", {}).execute().data
+    except Exception as e:
+        logger.debug("notification_targets_version unavailable: %s", e)
+        return None
+    return data if isinstance(data, str) else None
+
+
+def _get_targets(client: Client) -> _TargetMap:
+    """캐시된 대상 맵을 반환한다 (TTL 경과 또는 버전 변경 시 다시 적재)."""
+    global _targets, _version, _loaded_at, _checked_at
+    now = time.monotonic()
+    with _lock:
+        targets, version = _targets, _version
+        expired = targets is None or now - _loaded_at >= TARGETS_CACHE_TTL
+        check_due = not expired and now - _checked_at >= VERSION_CHECK_SECONDS
+    if not expired and not check_due:
+        return targets
+
+    with _load_lock:
+        latest = _fetch_version(client)
+        if not expired and (latest is None or latest == version):
+            with _lock:
+                _checked_at = now
+            return targets
+        try:
+            rows = _load_rows(client)
+        except Exception as e:
+            if targets is None:
+                raise
+            logger.warning("Failed to reload %s, using cached targets: %s", TARGETS_TABLE, e)
+            return targets
+        fresh = _TargetMap(rows)
+        with _lock:
+            _targets, _version = fresh, latest
+            _loaded_at = _checked_at = now
+        logger.info(
+            "Loaded %d notification targets for %d users",
+            len(fresh.user_by_chat),
+            len(fresh.chats_by_user),
+        )
+        return fresh
+
+
+def resolve(client: Client, user_ids: list[str]) -> dict[str, list[str]]:
+    """여러 사용자의 활성 telegram_chat_id 목록(최근 순)을 한 번에 찾는다 (대상이 없는 사용자는 제외)."""
+    chats_by_user = _get_targets(client).chats_by_user
+    return {uid: chats_by_user[uid] for uid in dict.fromkeys(user_ids) if uid in chats_by_user}
+
+
+def active_chat_ids(client: Client) -> list[str]:
+    """활성 대상 전체의 telegram_chat_id (사용자당 여러 채팅 포함, 중복 제거)."""
+    chats_by_user = _get_targets(client).chats_by_user
+    return list(dict.fromkeys(c for chats in chats_by_user.values() for c in chats))
+
+
+def user_for_chat(client: Client, chat_id: str) -> str | None:
+    """telegram_chat_id → user_id 역조회."""
+    return _get_targets(client).user_by_chat.get(str(chat_id))
+
+
+def invalidate() -> None:
+    """캐시를 비운다 (대상 변경 직후 또는 테스트용)."""
+    global _targets, _version, _loaded_at, _checked_at
+    with _lock:
+        _targets, _version = None, None
+        _loaded_at = _checked_at = 0.0
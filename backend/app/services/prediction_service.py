@@ -1,9 +1,9 @@
 """통합 스코어링 서비스 — 5개 시그널 가중 합산 + AI 리포트 생성."""
 
-import json
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 
-import httpx
 from supabase import Client
 
 from app.config import settings
@@ -16,18 +16,18 @@ from app.models.prediction import (
     PredictionScoresListResponse,
     SentimentSignal,
     SignalBreakdown,
+    SignalWeightConfig,
     TechnicalSignal,
 )
-from app.services import sentiment_service, stock_service
+from app.services import llm_client, sentiment_index, stock_service
 from app.services.supabase_client import get_latest
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
-# ─── 가중치 ───
+# ─── 가중치 (보정 결과가 없을 때의 기본값) ───
 
 WEIGHT_TECHNICAL = 0.30
 WEIGHT_MACRO = 0.25
@@ -35,6 +35,30 @@ WEIGHT_SENTIMENT = 0.20
 WEIGHT_CURRENCY = 0.15
 WEIGHT_GEOPOLITICAL = 0.10
 
+BUY_THRESHOLD = 25.0
+STRONG_THRESHOLD = 60.0
+
+DEFAULT_SIGNAL_WEIGHTS = SignalWeightConfig(
+    technical=WEIGHT_TECHNICAL,
+    macro=WEIGHT_MACRO,
+    sentiment=WEIGHT_SENTIMENT,
+    currency=WEIGHT_CURRENCY,
+    geopolitical=WEIGHT_GEOPOLITICAL,
+    buy_threshold=BUY_THRESHOLD,
+    strong_threshold=STRONG_THRESHOLD,
+)
+
+# 종목별 감성: 최근 N일, 최대 M건의 종목 태깅 헤드라인 / 블렌딩 사전 강도(유효 기사 수)
+TICKER_SENTIMENT_DAYS = 7
+TICKER_SENTIMENT_LIMIT = 50
+TICKER_SENTIMENT_PRIOR = 3.0
+
+WEIGHTS_TABLE = "signal_weight_configs"
+WEIGHTS_CACHE_TTL = 3600  # seconds
+
+_weights_cache: dict = {"config": None, "loaded_at": 0.0}
+_weights_lock = threading.Lock()
+
 
 # ═══════════════════════════════════════════════════════════
 # (a) 5개 시그널 계산
@@ -127,40 +151,58 @@ def _calc_macro_score(client: Client) -> MacroSignal:
     )
 
 
-def _calc_sentiment_score(client: Client) -> SentimentSignal:
-    """뉴스 감성 가중 평균 시그널을 계산한다."""
+def _ticker_sentiment(
+    client: Client, ticker: str, now: datetime
+) -> tuple[sentiment_index.IndexState, int] | None:
+    """종목이 태깅된 최근 헤드라인의 감쇠 가중 감성과 기사 수 (tickers GIN 인덱스 조회)."""
+    since = (now - timedelta(days=TICKER_SENTIMENT_DAYS)).isoformat()
     try:
-        results, _total = sentiment_service.get_results(
-            client, limit=50, offset=0
+        result = (
+            client.table("sentiment_results")
+            .select("direction, confidence, analyzed_at")
+            .contains("tickers", [ticker])
+            .gte("analyzed_at", since)
+            .order("analyzed_at", desc=True)
+            .limit(TICKER_SENTIMENT_LIMIT)
+            .execute()
         )
+        rows = result.data or []
     except Exception as e:
-        logger.warning("Sentiment results fetch failed: %s", e)
-        return SentimentSignal()
+        logger.warning("Ticker sentiment query failed (%s): %s", ticker, e)
+        return None
+    if not rows:
+        return None
+    return sentiment_index.summarize(rows, ticker, now), len(rows)
 
-    if not results:
-        return SentimentSignal()
 
-    # direction 가중 평균: BULLISH→+100, BEARISH→-100, NEUTRAL→0, × confidence
-    total_weight = 0.0
-    weighted_sum = 0.0
-    for r in results:
-        direction_val = 0.0
-        if r.direction == "BULLISH":
-            direction_val = 100.0
-        elif r.direction == "BEARISH":
-            direction_val = -100.0
+def _calc_sentiment_score(client: Client, ticker: str | None = None) -> SentimentSignal:
+    """뉴스 감성 시그널 — 시간 감쇠 감성 지수(전체)에 종목별 감성을 블렌딩한다.
 
-        confidence = r.confidence if r.confidence is not None else 0.5
-        weighted_sum += direction_val * confidence
-        total_weight += confidence
+    지수 값은 direction(BULLISH→+100, BEARISH→-100, NEUTRAL→0) × confidence의 감쇠 가중 평균.
+    종목 언급 기사가 있으면 유효 기사 수 n에 따라 n / (n + TICKER_SENTIMENT_PRIOR) 비중으로 섞는다.
+    """
+    state = sentiment_index.get_state(client)
+    overall = state.value if state is not None and state.count_sum > 0 else None
+    ticker_result = (
+        _ticker_sentiment(client, ticker, datetime.now(timezone.utc)) if ticker else None
+    )
+    if overall is None and ticker_result is None:
+        return SentimentSignal()
+    ticker_state, ticker_count = ticker_result if ticker_result else (None, 0)
 
-    avg_score = weighted_sum / total_weight if total_weight > 0 else 0.0
-    composite = max(-100.0, min(100.0, round(avg_score, 2)))
+    avg_score = overall if overall is not None else 0.0
+    composite = avg_score
+    if ticker_state is not None:
+        n = ticker_state.count_sum
+        w = n / (n + TICKER_SENTIMENT_PRIOR) if overall is not None else 1.0
+        composite = w * ticker_state.value + (1 - w) * avg_score
 
     return SentimentSignal(
         avg_weighted_score=round(avg_score, 2),
-        article_count=len(results),
-        composite=composite,
+        article_count=round(state.count_sum) if state is not None else 0,
+        ticker_score=round(ticker_state.value, 2) if ticker_state is not None else None,
+        ticker_article_count=ticker_count,
+        composite=max(-100.0, min(100.0, round(composite, 2))),
     )
 
 
@@ -240,15 +282,19 @@ def _calc_geopolitical_score(client: Client) -> GeopoliticalSignal:
 # ═══════════════════════════════════════════════════════════
 
 
-def _determine_direction(score: float) -> str:
+def _determine_direction(
+    score: float,
+    buy_threshold: float = BUY_THRESHOLD,
+    strong_threshold: float = STRONG_THRESHOLD,
+) -> str:
     """종합 점수 기반 투자 의견 5단계 판정."""
-    if score >= 60:
+    if score >= strong_threshold:
         return "STRONG_BUY"
-    if score >= 25:
+    if score >= buy_threshold:
         return "BUY"
-    if score <= -60:
+    if score <= -strong_threshold:
         return "STRONG_SELL"
-    if score <= -25:
+    if score <= -buy_threshold:
         return "SELL"
     return "HOLD"
 
@@ -266,29 +312,71 @@ def _determine_risk_level(
 
 
 # ═══════════════════════════════════════════════════════════
-# (c) AI 리포트 생성
+# (b-2) 보정된 가중치 조회 (캐시)
 # ═══════════════════════════════════════════════════════════
 
 
-def _get_model_from_db(client: Client) -> str:
-    """model_configs 테이블에서 DEEP_REPORT 모델을 조회한다."""
+def _load_signal_weights(client: Client) -> SignalWeightConfig:
+    """signal_weight_configs에서 활성 보정 결과 1건을 조회한다."""
     try:
         result = (
-            client.table("model_configs")
-            .select("primary_model")
-            .eq("config_key", "DEEP_REPORT")
+            client.table(WEIGHTS_TABLE)
+            .select("*")
             .eq("is_active", True)
+            .order("calibrated_at", desc=True)
             .limit(1)
             .execute()
         )
         if result.data:
-            return result.data[0]["primary_model"]
+            row = result.data[0]
+            return SignalWeightConfig(
+                technical=float(row["weight_technical"]),
+                macro=float(row["weight_macro"]),
+                sentiment=float(row["weight_sentiment"]),
+                currency=float(row["weight_currency"]),
+                geopolitical=float(row["weight_geopolitical"]),
+                buy_threshold=float(row["buy_threshold"]),
+                strong_threshold=float(row["strong_threshold"]),
+                calibrated_at=row.get("calibrated_at"),
+            )
     except Exception as e:
         logger.warning(
-            "Failed to query model_configs: %s — using default", e
+            "Failed to query %s: %s — using default weights", WEIGHTS_TABLE, e
         )
 
-    return DEFAULT_MODEL
+    return DEFAULT_SIGNAL_WEIGHTS
+
+
+def get_signal_weights(client: Client) -> SignalWeightConfig:
+    """가중치/임계값을 반환한다 (WEIGHTS_CACHE_TTL 동안 메모리 캐시)."""
+    now = time.monotonic()
+    with _weights_lock:
+        cached = _weights_cache["config"]
+        if cached is not None and now - _weights_cache["loaded_at"] < WEIGHTS_CACHE_TTL:
+            return cached
+
+    config = _load_signal_weights(client)
+    with _weights_lock:
+        _weights_cache["config"] = config
+        _weights_cache["loaded_at"] = now
+    return config
+
+
+def invalidate_signal_weights_cache() -> None:
+    """보정 작업이 새 가중치를 저장한 뒤 캐시를 비운다."""
+    with _weights_lock:
+        _weights_cache["config"] = None
+        _weights_cache["loaded_at"] = 0.0
+
+
+# ═══════════════════════════════════════════════════════════
+# (c) AI 리포트 생성
+# ═══════════════════════════════════════════════════════════
+
+
+def _get_model_chain(client: Client) -> llm_client.ModelChain:
+    """model_configs 테이블에서 DEEP_REPORT 모델 체인을 조회한다."""
+    return llm_client.get_model_chain(client, "DEEP_REPORT", DEFAULT_MODEL)
 
 
 def _generate_ai_report(
@@ -299,20 +387,22 @@ def _generate_ai_report(
     total_score: float,
     direction: str,
     risk_level: str,
+    weights: SignalWeightConfig | None = None,
 ) -> dict:
     """OpenRouter API로 AI 투자 리포트를 생성한다."""
     if not settings.openrouter_api_key:
         logger.warning("OPENROUTER_API_KEY not set — using fallback report")
         return _make_fallback_report(ticker, total_score, direction)
 
-    model = _get_model_from_db(client)
-    logger.info("Generating AI report for %s with model: %s", ticker, model)
+    chain = _get_model_chain(client)
+    logger.info("Generating AI report for %s with models: %s", ticker, chain.models)
 
     t = breakdown.technical
     m = breakdown.macro
     s = breakdown.sentiment
     c = breakdown.currency
     g = breakdown.geopolitical
+    w = weights or DEFAULT_SIGNAL_WEIGHTS
 
     prompt = f"""당신은 전문 투자 분석가입니다. 다음 데이터를 기반으로 한국어 투자 리포트를 작성하세요.
 
@@ -321,19 +411,19 @@ def _generate_ai_report(
 
 ## 5가지 시그널 분석 결과 (-100 ~ +100)
 
-1. 기술적 분석 (가중치 30%): {t.composite}점
+1. 기술적 분석 (가중치 {w.technical:.0%}): {t.composite}점
    - RSI: {t.rsi_score}, MACD: {t.macd_score}, BB: {t.bb_score}
 
-2. 거시경제 (가중치 25%): {m.composite}점
+2. 거시경제 (가중치 {w.macro:.0%}): {m.composite}점
    - VIX: {m.vix_score}, 금리: {m.yield_score}, 지수: {m.index_score}
 
-3. 뉴스 감성 (가중치 20%): {s.composite}점
+3. 뉴스 감성 (가중치 {w.sentiment:.0%}): {s.composite}점
    - 기사 {s.article_count}건 가중평균: {s.avg_weighted_score}
 
-4. 환율 (가중치 15%): {c.composite}점
+4. 환율 (가중치 {w.currency:.0%}): {c.composite}점
    - USD/KRW: {c.usd_krw}, 방향: {c.usd_krw_direction}
 
-5. 지정학 (가중치 10%): {g.composite}점
+5. 지정학 (가중치 {w.geopolitical:.0%}): {g.composite}점
    - 고위험 이벤트: {g.high_urgency_count}건
 
 ## 종합
@@ -368,31 +458,13 @@ def _generate_ai_report(
 JSON만 반환하세요. 다른 텍스트는 포함하지 마세요."""
 
     try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3,
-            },
+        return llm_client.chat_json_hedged(
+            chain,
+            llm_client.user_prompt(prompt),
+            feature="prediction",
+            temperature=0.3,
             timeout=90.0,
         )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-
-        # JSON 파싱 — 코드 블록 제거
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1] if "\n" in content else content
-            if content.endswith("```"):
-                content = content[: -len("```")]
-            content = content.strip()
-
-        return json.loads(content)
 
     except Exception as e:
         logger.error("AI report generation failed: %s", e)
@@ -469,7 +541,7 @@ def analyze_ticker(
     logger.info("Calculating signals for %s (%s)", ticker, company_name)
     tech = _calc_technical_score(ticker)
     macro = _calc_macro_score(client)
-    sentiment = _calc_sentiment_score(client)
+    sentiment = _calc_sentiment_score(client, ticker)
     currency = _calc_currency_score(client)
     geo = _calc_geopolitical_score(client)
 
@@ -481,18 +553,21 @@ def analyze_ticker(
         geopolitical=geo,
     )
 
-    # 3. 가중 합산: T×0.30 + M×0.25 + S×0.20 + C×0.15 + G×0.10
+    # 3. 가중 합산: 보정된 가중치 (없으면 기본 T×0.30 + M×0.25 + S×0.20 + C×0.15 + G×0.10)
+    weights = get_signal_weights(client)
     total_score = round(
-        tech.composite * WEIGHT_TECHNICAL
-        + macro.composite * WEIGHT_MACRO
-        + sentiment.composite * WEIGHT_SENTIMENT
-        + currency.composite * WEIGHT_CURRENCY
-        + geo.composite * WEIGHT_GEOPOLITICAL,
+        tech.composite * weights.technical
+        + macro.composite * weights.macro
+        + sentiment.composite * weights.sentiment
+        + currency.composite * weights.currency
+        + geo.composite * weights.geopolitical,
         2,
     )
 
     # 4. 방향/리스크 결정
-    direction = _determine_direction(total_score)
+    direction = _determine_direction(
+        total_score, weights.buy_threshold, weights.strong_threshold
+    )
     snapshot = get_latest(client)
     vix = snapshot.vix if snapshot else None
     risk_level = _determine_risk_level(vix, geo.composite)
@@ -512,6 +587,7 @@ def analyze_ticker(
         total_score,
         direction,
         risk_level,
+        weights,
     )
 
     # 6. prediction_scores INSERT
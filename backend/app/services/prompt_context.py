@@ -0,0 +1,170 @@
+"""프롬프트 컨텍스트 빌더 — 기능별 토큰 예산 안에서 컨텍스트를 압축/절단한다.
+
+- 섹션은 중요도 순서로 전달받아 앞에서부터 채운다. 예산을 넘는 리스트 섹션은
+  앞쪽(관련도/최신순으로 정렬된) 항목만 남기고, 넘는 스칼라/dict 섹션은 제외한다.
+- 압축 직렬화: 공백 없는 JSON, 실수 반올림, None/빈 값 제거, 긴 문자열 절단.
+- 토큰 수는 외부 토크나이저 없이 추정한다 (ASCII 4자 ≈ 1토큰, 한글 등 비ASCII 1자 ≈ 1토큰).
+"""
+
+import json
+import math
+from typing import Any
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 기능별 컨텍스트 토큰 예산 (프롬프트 지시문 제외, 컨텍스트 데이터만)
+CONTEXT_TOKEN_BUDGETS: dict[str, int] = {
+    "ask": 800,
+    "guide": 1500,
+    "guide_ticker": 600,
+    "weekly_report": 3000,
+    "simulator": 600,
+}
+DEFAULT_TOKEN_BUDGET = 1000
+
+FLOAT_DIGITS = 2
+MAX_STR_CHARS = 280
+
+
+# ─── 토큰 추정 ───
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 추정한다."""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars))
+
+
+def estimate_messages_tokens(messages: list[dict]) -> int:
+    """chat messages 전체의 토큰 수를 추정한다 (문자열 content만)."""
+    total = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            total += estimate_tokens(content) + 4  # role/구분자 오버헤드
+    return total
+
+
+# ─── 압축 직렬화 ───
+
+
+def compact(value: Any, max_str_chars: int = MAX_STR_CHARS) -> Any:
+    """실수 반올림, None/빈 값 제거, 긴 문자열 절단을 재귀 적용한다."""
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return None
+        rounded = round(value, FLOAT_DIGITS if abs(value) < 1000 else 0)
+        return int(rounded) if rounded == int(rounded) else rounded
+    if isinstance(value, str):
+        value = value.strip()
+        if len(value) > max_str_chars:
+            return value[: max_str_chars - 1] + "…"
+        return value
+    if isinstance(value, dict):
+        result = {}
+        for k, v in value.items():
+            v = compact(v, max_str_chars)
+            if v is None or v == "" or v == [] or v == {}:
+                continue
+            result[k] = v
+        return result
+    if isinstance(value, (list, tuple)):
+        return [
+            item
+            for item in (compact(v, max_str_chars) for v in value)
+            if item is not None and item != "" and item != {}
+        ]
+    return value
+
+
+def dumps(value: Any) -> str:
+    """공백 없는 JSON 직렬화."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+# ─── 예산 기반 빌드 ───
+
+
+def _fit_list(key: str, items: list, remaining: int) -> tuple[list, int]:
+    """예산 안에 들어가는 가장 긴 앞부분을 이진 탐색으로 찾는다."""
+    lo, hi = 0, len(items)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(dumps({key: items[:mid]})) <= remaining:
+            lo = mid
+        else:
+            hi = mid - 1
+    return items[:lo], estimate_tokens(dumps({key: items[:lo]})) if lo else 0
+
+
+def build_context(
+    feature: str,
+    sections: list[tuple[str, Any]],
+    budget: int | None = None,
+) -> str:
+    """(키, 값) 섹션을 중요도 순으로 예산 안에 채워 압축 JSON 문자열로 반환한다."""
+    budget = budget if budget is not None else CONTEXT_TOKEN_BUDGETS.get(feature, DEFAULT_TOKEN_BUDGET)
+    remaining = budget
+    selected: dict[str, Any] = {}
+    trimmed: list[str] = []
+    dropped: list[str] = []
+
+    for key, value in sections:
+        value = compact(value)
+        if value is None or value == [] or value == {} or value == "":
+            continue
+
+        cost = estimate_tokens(dumps({key: value}))
+        if cost <= remaining:
+            selected[key] = value
+            remaining -= cost
+            continue
+
+        if isinstance(value, list):
+            kept, kept_cost = _fit_list(key, value, remaining)
+            if kept:
+                selected[key] = kept
+                remaining -= kept_cost
+                trimmed.append(f"{key}:{len(kept)}/{len(value)}")
+                continue
+        dropped.append(key)
+
+    text = dumps(selected)
+    logger.info(
+        "Prompt context feature=%s tokens≈%d/%d trimmed=%s dropped=%s",
+        feature,
+        estimate_tokens(text),
+        budget,
+        trimmed or "-",
+        dropped or "-",
+    )
+    return text
+
+
+def fit_lines(feature: str, lines: list[str], budget: int | None = None) -> str:
+    """줄 단위 텍스트를 예산 안에서 앞부분부터 채우고, 생략된 줄 수를 덧붙인다."""
+    budget = budget if budget is not None else CONTEXT_TOKEN_BUDGETS.get(feature, DEFAULT_TOKEN_BUDGET)
+    kept: list[str] = []
+    used = 0
+    for line in lines:
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+
+    if len(kept) < len(lines):
+        kept.append(f"- 외 {len(lines) - len(kept)}건 생략")
+        logger.info(
+            "Prompt lines feature=%s kept %d/%d (tokens≈%d/%d)",
+            feature,
+            len(kept) - 1,
+            len(lines),
+            used,
+            budget,
+        )
+    return "\n".join(kept)
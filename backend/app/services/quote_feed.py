@@ -0,0 +1,75 @@
+"""시세 피드 — 시세 소스(알림 폴러, 시세 API 조회, 향후 스트리밍)와 소비자(알림 엔진)를 잇는 발행/구독 버스.
+
+발행은 호출 스레드에서 구독자를 순서대로 호출한다. 구독자는 가볍게 큐에 넣고 바로 반환해야 하며,
+구독자 예외는 로그만 남기고 다른 구독자와 발행자에게 전파하지 않는다.
+"""
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Quote:
+    ticker: str
+    price: float
+    previous_close: float | None = None
+    at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    source: str = "poll"
+
+    @property
+    def change_pct(self) -> float | None:
+        """전일 종가 대비 변동률 (%)."""
+        if not self.previous_close or self.previous_close <= 0:
+            return None
+        return (self.price - self.previous_close) / self.previous_close * 100
+
+
+Subscriber = Callable[[Quote], None]
+
+_subscribers: list[Subscriber] = []
+_lock = threading.Lock()
+
+
+def subscribe(handler: Subscriber) -> Callable[[], None]:
+    """구독을 등록하고 해지 함수를 반환한다."""
+    with _lock:
+        _subscribers.append(handler)
+
+    def unsubscribe() -> None:
+        with _lock:
+            if handler in _subscribers:
+                _subscribers.remove(handler)
+
+    return unsubscribe
+
+
+def publish(quote: Quote) -> None:
+    with _lock:
+        handlers = list(_subscribers)
+    for handler in handlers:
+        try:
+            handler(quote)
+        except Exception as e:
+            logger.warning("Quote subscriber failed for %s: %s", quote.ticker, e)
+
+
+def from_stock_quote(stock_quote, source: str = "poll") -> Quote | None:
+    """StockQuote → Quote (가격이 없으면 None). 전일 종가는 price - change로 복원한다."""
+    if stock_quote.price is None:
+        return None
+    previous_close = (
+        stock_quote.price - stock_quote.change if stock_quote.change is not None else None
+    )
+    return Quote(
+        ticker=stock_quote.ticker,
+        price=float(stock_quote.price),
+        previous_close=previous_close,
+        at=stock_quote.fetched_at,
+        source=source,
+    )
@@ -1,10 +1,8 @@
 """추천 엔진 서비스 — 기술적 스크리닝 + AI 추천 근거 생성."""
 
-import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 
-import httpx
 import yfinance as yf
 from supabase import Client
 
@@ -14,12 +12,11 @@ from app.models.recommendation import (
     ScreeningDetail,
     ScreenResponse,
 )
-from app.services import stock_service
+from app.services import llm_client, stock_service
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 DEFAULT_SCREENING_MODEL = "deepseek/deepseek-chat-v3-0324"
 MAX_WORKERS = 8
 
@@ -209,31 +206,13 @@ def _generate_recommendation_reason(
 JSON만 반환하세요."""
 
     try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3,
-            },
+        return llm_client.chat_json(
+            model,
+            llm_client.user_prompt(prompt),
+            feature="recommendation",
+            temperature=0.3,
             timeout=60.0,
         )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-
-        # JSON 파싱 — 코드 블록 제거
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1] if "\n" in content else content
-            if content.endswith("```"):
-                content = content[: -len("```")]
-            content = content.strip()
-
-        return json.loads(content)
 
     except Exception as e:
         logger.error("AI recommendation reason failed for %s: %s", ticker, e)
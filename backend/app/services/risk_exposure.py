@@ -0,0 +1,260 @@
+"""포트폴리오 노출 기반 리스크 평가 — 전체 사용자의 보유 종목을 한 번에 읽어 배열 연산으로 노출 사용자를 찾는다.
+
+보유 종목(portfolio, is_deleted = FALSE)마다 노출 속성을 붙인다.
+- 통화/국가: portfolio.market(없으면 티커 접미사 → 거래소)로 판정 (KRX → KRW/KR, US → USD/US ...)
+- 섹터: portfolio.sector (SECTOR_ALIASES로 한글/영문 표기를 정규화)
+
+리스크 조건별 노출 규칙:
+- VIX 공포 구간: 주식 보유자 전체 (글로벌 위험회피 — 암호화폐 제외)
+- USD/KRW 급변: USD 표시 자산 보유자
+- 지정학 HIGH 이벤트: 이벤트의 tickers / affected_sectors / affected_countries 중 하나라도 겹치는 보유자.
+  대상 정보가 전혀 없거나, 섹터/국가가 알려진 별칭(SECTOR_ALIASES/COUNTRY_ALIASES)으로 하나도
+  정규화되지 않는 이벤트는 대상을 알 수 없으므로 전체 보유자에게 해당한다.
+  알려진 섹터/국가를 지정한 이벤트는 해당 보유자가 없으면 아무에게도 보내지 않는다.
+
+사용자별 쿼리 없이 보유 종목 배열(H)과 이벤트 행렬(H×E)을 만들어 사용자 단위로 OR 집계한다.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+from supabase import Client
+
+from app.services import market_calendar
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+HOLDINGS_PAGE_SIZE = 1000  # PostgREST 기본 max-rows
+FX_EXPOSED_CURRENCY = "USD"  # USD/KRW 변동에 노출되는 통화
+
+# portfolio.market → 거래소 (market이 없으면 티커 접미사로 판정)
+MARKET_EXCHANGE = {"KOSPI": "KRX", "KOSDAQ": "KRX", "NYSE": "US", "NASDAQ": "US"}
+
+# 거래소 → (통화, 국가 코드)
+EXCHANGE_EXPOSURE: dict[str, tuple[str, str]] = {
+    "KRX": ("KRW", "KR"),
+    "US": ("USD", "US"),
+    "TSE": ("JPY", "JP"),
+    "HKEX": ("HKD", "HK"),
+    "LSE": ("GBP", "GB"),
+}
+
+# 감성 분석 affected_countries(한글/영문 혼용) → 국가 코드
+COUNTRY_ALIASES = {
+    "한국": "KR",
+    "대한민국": "KR",
+    "korea": "KR",
+    "south korea": "KR",
+    "kr": "KR",
+    "미국": "US",
+    "us": "US",
+    "usa": "US",
+    "united states": "US",
+    "일본": "JP",
+    "japan": "JP",
+    "jp": "JP",
+    "홍콩": "HK",
+    "hong kong": "HK",
+    "hk": "HK",
+    "영국": "GB",
+    "uk": "GB",
+    "united kingdom": "GB",
+    "gb": "GB",
+    "중국": "CN",
+    "china": "CN",
+    "cn": "CN",
+    "대만": "TW",
+    "taiwan": "TW",
+    "tw": "TW",
+    "독일": "DE",
+    "germany": "DE",
+    "프랑스": "FR",
+    "france": "FR",
+    "인도": "IN",
+    "india": "IN",
+    "러시아": "RU",
+    "russia": "RU",
+    "이스라엘": "IL",
+    "israel": "IL",
+    "이란": "IR",
+    "iran": "IR",
+}
+
+# 섹터 표기(감성 분석은 한글, portfolio.sector는 한글/yfinance 영문 혼용) → 정규화 키
+_SECTOR_NAMES: dict[str, list[str]] = {
+    "semiconductor": ["반도체", "칩", "semiconductor", "semiconductors", "chip", "chips"],
+    "technology": ["테크", "기술", "기술주", "it", "정보기술", "소프트웨어", "tech", "technology", "software"],
+    "communication": [
+        "인터넷", "통신", "미디어", "플랫폼", "internet", "telecom",
+        "communication services", "media",
+    ],
+    "energy": ["에너지", "정유", "석유", "원유", "가스", "energy", "oil", "oil & gas"],
+    "finance": [
+        "금융", "은행", "증권", "보험", "finance", "financial", "financials",
+        "financial services", "banks",
+    ],
+    "healthcare": [
+        "헬스케어", "바이오", "제약", "의료", "healthcare", "health care",
+        "biotech", "biotechnology", "pharmaceuticals",
+    ],
+    "auto": ["자동차", "자동차부품", "auto", "autos", "automotive", "auto manufacturers"],
+    "battery": ["2차전지", "이차전지", "배터리", "battery", "batteries"],
+    "defense": ["방산", "방위산업", "defense", "aerospace & defense"],
+    "shipbuilding": ["조선", "shipbuilding"],
+    "airline": ["항공", "airline", "airlines"],
+    "materials": ["소재", "화학", "철강", "materials", "basic materials", "chemicals", "steel"],
+    "industrials": ["산업재", "기계", "건설", "industrials", "machinery", "construction"],
+    "consumer": [
+        "소비재", "유통", "필수소비재", "경기소비재", "consumer", "retail",
+        "consumer cyclical", "consumer defensive",
+    ],
+    "real_estate": ["부동산", "리츠", "real estate", "reits"],
+    "utilities": ["유틸리티", "전력", "utilities"],
+    "crypto": ["암호화폐", "가상자산", "코인", "crypto", "cryptocurrency"],
+}
+SECTOR_ALIASES = {name: key for key, names in _SECTOR_NAMES.items() for name in names}
+_KNOWN_SECTORS = frozenset(_SECTOR_NAMES)
+_KNOWN_COUNTRIES = frozenset(COUNTRY_ALIASES.values())
+
+
+@dataclass
+class RiskSignals:
+    """전역 리스크 조건 — check_risk_conditions가 거시/감성 데이터로 채운다."""
+
+    vix_alert: bool = False
+    currency_alert: bool = False
+    geo_events: list[dict] = field(default_factory=list)  # tickers, affected_sectors, affected_countries
+
+    @property
+    def any(self) -> bool:
+        return self.vix_alert or self.currency_alert or bool(self.geo_events)
+
+
+@dataclass
+class UserExposure:
+    """리스크 조건에 노출된 사용자 1명."""
+
+    user_id: str
+    vix: bool = False
+    currency: bool = False
+    geo_events: int = 0
+    tickers: list[str] = field(default_factory=list)  # 노출된 보유 종목
+
+
+def _norm(value: str | None) -> str:
+    return (value or "").strip().casefold()
+
+
+def _country_code(value: str | None) -> str:
+    key = _norm(value)
+    return COUNTRY_ALIASES.get(key, key.upper())
+
+
+def _sector_key(value: str | None) -> str:
+    key = _norm(value)
+    return SECTOR_ALIASES.get(key, key)
+
+
+def _ticker_exposure(ticker: str, market: str | None) -> tuple[str, str, bool]:
+    """(통화, 국가 코드, 주식 여부)."""
+    exchange = MARKET_EXCHANGE.get(market or "") or market_calendar.exchange_for(ticker).code
+    currency, country = EXCHANGE_EXPOSURE.get(exchange, ("", ""))
+    return currency, country, exchange != market_calendar.CRYPTO.code
+
+
+def load_holdings(client: Client) -> list[dict]:
+    """전체 사용자의 활성 보유 종목을 페이지 단위로 읽는다."""
+    rows: list[dict] = []
+    offset = 0
+    while True:
+        page = (
+            client.table("portfolio")
+            .select("user_id, ticker, market, sector")
+            .eq("is_deleted", False)
+            .order("id")
+            .range(offset, offset + HOLDINGS_PAGE_SIZE - 1)
+            .execute()
+        ).data or []
+        rows.extend(page)
+        if len(page) < HOLDINGS_PAGE_SIZE:
+            return rows
+        offset += HOLDINGS_PAGE_SIZE
+
+
+def _event_matrix(
+    h_ticker: np.ndarray, h_sector: np.ndarray, h_country: np.ndarray, events: list[dict]
+) -> np.ndarray:
+    """보유 종목 × 지정학 이벤트 노출 행렬 (H×E bool)."""
+    matrix = np.zeros((len(h_ticker), len(events)), dtype=bool)
+    for e, event in enumerate(events):
+        tickers = [t.upper() for t in event.get("tickers") or [] if t]
+        sectors = [_sector_key(s) for s in event.get("affected_sectors") or [] if s]
+        countries = [_country_code(c) for c in event.get("affected_countries") or [] if c]
+        by_ticker = np.isin(h_ticker, tickers)
+        by_region = (np.isin(h_sector, sectors) & (h_sector != "")) | (
+            np.isin(h_country, countries) & (h_country != "")
+        )
+        matrix[:, e] = by_ticker | by_region
+        # 티커나 알려진 섹터/국가가 하나라도 있으면 대상이 정해진 이벤트 (보유자가 없으면 아무도 아님).
+        # 모든 값이 정규화되지 않는 이벤트는 대상을 알 수 없으므로 전체에 해당한다.
+        known = (
+            tickers
+            or _KNOWN_SECTORS.intersection(sectors)
+            or _KNOWN_COUNTRIES.intersection(countries)
+        )
+        if not known and not matrix[:, e].any():
+            matrix[:, e] = True
+    return matrix
+
+
+def evaluate(holdings: list[dict], signals: RiskSignals) -> list[UserExposure]:
+    """리스크 조건에 노출된 보유 종목을 가진 사용자만 반환한다."""
+    holdings = [h for h in holdings if h.get("user_id") and h.get("ticker")]
+    if not holdings or not signals.any:
+        return []
+
+    users, u_idx = np.unique([h["user_id"] for h in holdings], return_inverse=True)
+    h_ticker = np.array([h["ticker"].upper() for h in holdings])
+    tickers, first_row, t_idx = np.unique(h_ticker, return_index=True, return_inverse=True)
+    # 통화/국가는 종목 단위로 1회만 판정한 뒤 보유 행으로 펼친다
+    exposure = [
+        _ticker_exposure(str(t), holdings[i].get("market")) for t, i in zip(tickers, first_row)
+    ]
+    t_currency = np.array([c for c, _, _ in exposure])
+    t_country = np.array([c for _, c, _ in exposure])
+    t_equity = np.array([eq for _, _, eq in exposure], dtype=bool)
+    h_sector = np.array([_sector_key(h.get("sector")) for h in holdings])
+    n_users, n_rows = len(users), len(holdings)
+
+    vix_rows = t_equity[t_idx] if signals.vix_alert else np.zeros(n_rows, dtype=bool)
+    fx_rows = (
+        t_currency[t_idx] == FX_EXPOSED_CURRENCY
+        if signals.currency_alert
+        else np.zeros(n_rows, dtype=bool)
+    )
+    geo_rows = _event_matrix(h_ticker, h_sector, t_country[t_idx], signals.geo_events)
+
+    user_vix = np.bincount(u_idx, weights=vix_rows, minlength=n_users) > 0
+    user_fx = np.bincount(u_idx, weights=fx_rows, minlength=n_users) > 0
+    user_geo = np.zeros((n_users, geo_rows.shape[1]), dtype=bool)
+    np.logical_or.at(user_geo, u_idx, geo_rows)
+    geo_counts = user_geo.sum(axis=1)
+
+    exposed_rows = vix_rows | fx_rows | geo_rows.any(axis=1)
+    exposed_tickers: dict[int, list[str]] = {}
+    for row in np.flatnonzero(exposed_rows):
+        names = exposed_tickers.setdefault(int(u_idx[row]), [])
+        if h_ticker[row] not in names:
+            names.append(str(h_ticker[row]))
+
+    return [
+        UserExposure(
+            user_id=str(users[u]),
+            vix=bool(user_vix[u]),
+            currency=bool(user_fx[u]),
+            geo_events=int(geo_counts[u]),
+            tickers=exposed_tickers.get(int(u), []),
+        )
+        for u in np.flatnonzero(user_vix | user_fx | (geo_counts > 0))
+    ]
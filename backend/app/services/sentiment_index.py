@@ -0,0 +1,281 @@
+"""시간 감쇠 감성 지수 — 배치 저장 시 증분 갱신되는 지수 감쇠 누적 상태.
+
+각 누적합은 반감기 HALF_LIFE_HOURS로 감쇠한 뒤 새 배치를 더한다.
+  score_sum  ← score_sum·d + Σ 방향값(BULLISH +100 / BEARISH -100 / NEUTRAL 0) × confidence
+  weight_sum ← weight_sum·d + Σ confidence
+  value = score_sum / weight_sum  (-100 ~ 100, 감쇠 비율이 분자/분모에 공통이라 시간에 불변)
+
+scope는 'ALL'(전체)과 news_category별로 유지하며, 상태는 sentiment_index_state에 1행씩,
+갱신 시점 스냅샷은 sentiment_index_history에 쌓는다. 소비자(예측/공포탐욕/가이드)는
+get_state()로 상태 1행만 읽는다. 상태가 아직 없으면 최근 결과로 1회 부트스트랩한다
+(조회 시점이든 첫 배치 갱신 시점이든 — 0에서 시작해 직전 결과를 잃지 않도록).
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from supabase import Client
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+STATE_TABLE = "sentiment_index_state"
+HISTORY_TABLE = "sentiment_index_history"
+SCOPE_ALL = "ALL"
+
+HALF_LIFE_HOURS = 12.0
+DEFAULT_CONFIDENCE = 0.5
+HISTORY_RETENTION_DAYS = 90
+BOOTSTRAP_ROWS = 200
+
+DIRECTION_VALUES: dict[str, float] = {"BULLISH": 100.0, "BEARISH": -100.0}
+
+_update_lock = threading.Lock()
+
+
+@dataclass
+class IndexState:
+    scope: str
+    score_sum: float = 0.0
+    weight_sum: float = 0.0
+    bullish_sum: float = 0.0
+    bearish_sum: float = 0.0
+    count_sum: float = 0.0
+    updated_at: datetime | None = None
+
+    @property
+    def value(self) -> float:
+        """감쇠 가중 평균 감성 (-100 ~ 100)."""
+        return self.score_sum / self.weight_sum if self.weight_sum > 0 else 0.0
+
+    @property
+    def bullish_pct(self) -> float:
+        return self.bullish_sum / self.count_sum * 100 if self.count_sum > 0 else 0.0
+
+    @property
+    def bearish_pct(self) -> float:
+        return self.bearish_sum / self.count_sum * 100 if self.count_sum > 0 else 0.0
+
+    def decayed(self, at: datetime) -> "IndexState":
+        """at 시점까지 감쇠한 상태 (value/비율은 그대로, 유효 기사 수만 줄어든다)."""
+        if self.updated_at is None or at <= self.updated_at:
+            return IndexState(**{**self.__dict__, "updated_at": self.updated_at or at})
+        hours = (at - self.updated_at).total_seconds() / 3600
+        d = 0.5 ** (hours / HALF_LIFE_HOURS)
+        return IndexState(
+            scope=self.scope,
+            score_sum=self.score_sum * d,
+            weight_sum=self.weight_sum * d,
+            bullish_sum=self.bullish_sum * d,
+            bearish_sum=self.bearish_sum * d,
+            count_sum=self.count_sum * d,
+            updated_at=at,
+        )
+
+    def add(self, direction: str, confidence: float | None, factor: float = 1.0) -> None:
+        conf = (float(confidence) if confidence is not None else DEFAULT_CONFIDENCE) * factor
+        self.score_sum += DIRECTION_VALUES.get(direction, 0.0) * conf
+        self.weight_sum += conf
+        self.count_sum += factor
+        if direction == "BULLISH":
+            self.bullish_sum += factor
+        elif direction == "BEARISH":
+            self.bearish_sum += factor
+
+    def to_row(self) -> dict:
+        return {
+            "scope": self.scope,
+            "score_sum": self.score_sum,
+            "weight_sum": self.weight_sum,
+            "bullish_sum": self.bullish_sum,
+            "bearish_sum": self.bearish_sum,
+            "count_sum": self.count_sum,
+            "value": round(self.value, 4),
+            "updated_at": (self.updated_at or datetime.now(timezone.utc)).isoformat(),
+        }
+
+
+def _parse_time(value) -> datetime | None:
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def _from_row(row: dict) -> IndexState:
+    return IndexState(
+        scope=row["scope"],
+        score_sum=float(row.get("score_sum") or 0.0),
+        weight_sum=float(row.get("weight_sum") or 0.0),
+        bullish_sum=float(row.get("bullish_sum") or 0.0),
+        bearish_sum=float(row.get("bearish_sum") or 0.0),
+        count_sum=float(row.get("count_sum") or 0.0),
+        updated_at=_parse_time(row.get("updated_at")),
+    )
+
+
+# ─── 증분 갱신 ───
+
+
+def _load_states(client: Client) -> dict[str, IndexState]:
+    result = client.table(STATE_TABLE).select("*").execute()
+    return {row["scope"]: _from_row(row) for row in result.data or []}
+
+
+def _apply(
+    states: dict[str, IndexState],
+    analyses: list[dict],
+    at: datetime,
+) -> list[IndexState]:
+    """analyses를 at 시점 기준으로 누적하고, 갱신된 scope 상태 목록을 반환한다."""
+    touched: dict[str, IndexState] = {}
+
+    def scope_state(scope: str) -> IndexState:
+        if scope not in touched:
+            current = states.get(scope)
+            touched[scope] = current.decayed(at) if current else IndexState(scope=scope, updated_at=at)
+        return touched[scope]
+
+    for analysis in analyses:
+        direction = analysis.get("direction", "NEUTRAL")
+        confidence = analysis.get("confidence")
+        scope_state(SCOPE_ALL).add(direction, confidence)
+        category = analysis.get("news_category")
+        if category:
+            scope_state(category).add(direction, confidence)
+
+    states.update(touched)
+    return list(touched.values())
+
+
+def _persist(client: Client, updated: list[IndexState], at: datetime) -> None:
+    client.table(STATE_TABLE).upsert(
+        [s.to_row() for s in updated], on_conflict="scope"
+    ).execute()
+    client.table(HISTORY_TABLE).insert(
+        [
+            {
+                "scope": s.scope,
+                "value": round(s.value, 4),
+                "bullish_pct": round(s.bullish_pct, 2),
+                "bearish_pct": round(s.bearish_pct, 2),
+                "effective_count": round(s.count_sum, 3),
+                "recorded_at": at.isoformat(),
+            }
+            for s in updated
+        ]
+    ).execute()
+
+
+def update(client: Client, analyses: list[dict], at: datetime) -> None:
+    """저장된 감성 분석 배치를 지수 상태에 누적한다.
+
+    폴백 결과와 로컬 사전 분류(LOCAL, 시장 관련성 낮음) 결과는 지수를 0 쪽으로 희석하므로 제외한다.
+    """
+    analyses = [
+        a for a in analyses if not a.get("is_fallback") and a.get("analysis_source") != "LOCAL"
+    ]
+    if not analyses:
+        return
+    with _update_lock:
+        try:
+            # 상태가 없으면 이 배치 이전 결과로 먼저 부트스트랩한다 (이 배치는 이미 저장돼 있어 제외)
+            states = _load_states(client) or _bootstrap(client, before=at)
+            updated = _apply(states, analyses, at)
+            _persist(client, updated, at)
+            overall = states[SCOPE_ALL]
+            logger.info(
+                "Sentiment index updated — value=%.1f effective=%.1f scopes=%d",
+                overall.value,
+                overall.count_sum,
+                len(updated),
+            )
+        except Exception as e:
+            logger.warning("Sentiment index update failed: %s", e)
+            return
+    _prune_history(client, at)
+
+
+def _prune_history(client: Client, at: datetime) -> None:
+    cutoff = (at - timedelta(days=HISTORY_RETENTION_DAYS)).isoformat()
+    try:
+        client.table(HISTORY_TABLE).delete().lt("recorded_at", cutoff).execute()
+    except Exception as e:
+        logger.warning("Sentiment index history prune failed: %s", e)
+
+
+def summarize(rows: list[dict], scope: str, at: datetime) -> IndexState:
+    """결과 행 목록을 at 시점 기준 감쇠 가중으로 바로 집계한다 (종목별 감성 등 임시 scope용)."""
+    state = IndexState(scope=scope, updated_at=at)
+    for row in rows:
+        row_at = _parse_time(row.get("analyzed_at")) or at
+        hours = max(0.0, (at - row_at).total_seconds() / 3600)
+        state.add(
+            row.get("direction", "NEUTRAL"),
+            row.get("confidence"),
+            factor=0.5 ** (hours / HALF_LIFE_HOURS),
+        )
+    return state
+
+
+# ─── 조회 ───
+
+
+def _bootstrap(client: Client, before: datetime | None = None) -> dict[str, IndexState]:
+    """상태가 비어 있으면 최근 결과를 시간순으로 재생해 초기 상태를 만든다 (before 이전 결과만)."""
+    result = (
+        client.table("sentiment_results")
+        .select("direction, confidence, news_category, analyzed_at")
+        .order("analyzed_at", desc=True)
+        .limit(BOOTSTRAP_ROWS)
+        .execute()
+    )
+    rows = [
+        r
+        for r in result.data or []
+        if _parse_time(r.get("analyzed_at"))
+        and (before is None or _parse_time(r["analyzed_at"]) < before)
+    ]
+    if not rows:
+        return {}
+
+    states: dict[str, IndexState] = {}
+    rows.sort(key=lambda r: _parse_time(r["analyzed_at"]))
+    at = None
+    batch: list[dict] = []
+    for row in rows:
+        row_at = _parse_time(row["analyzed_at"])
+        if at is not None and row_at != at:
+            _apply(states, batch, at)
+            batch = []
+        at = row_at
+        batch.append(row)
+    _apply(states, batch, at)
+
+    client.table(STATE_TABLE).upsert(
+        [s.to_row() for s in states.values()], on_conflict="scope"
+    ).execute()
+    logger.info("Sentiment index bootstrapped from %d results", len(rows))
+    return states
+
+
+def get_states(client: Client) -> dict[str, IndexState]:
+    """모든 scope의 현재 시점 감쇠 상태."""
+    now = datetime.now(timezone.utc)
+    try:
+        states = _load_states(client)
+        if not states:
+            with _update_lock:
+                states = _load_states(client) or _bootstrap(client)
+    except Exception as e:
+        logger.warning("Sentiment index read failed: %s", e)
+        return {}
+    return {scope: s.decayed(now) for scope, s in states.items()}
+
+
+def get_state(client: Client, scope: str = SCOPE_ALL) -> IndexState | None:
+    """scope의 현재 시점 감쇠 상태 (없으면 None)."""
+    return get_states(client).get(scope)
@@ -5,11 +5,9 @@
 - 국내 정치, 국제 정치 & 외교, 속보 & 재난, 경제 정책 & 규제, 생활 & 자산
 """
 
-import json
-from datetime import datetime, timezone
-
-import feedparser
-import httpx
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
 from app.config import settings
 from app.models.sentiment import (
@@ -18,13 +16,35 @@ from app.models.sentiment import (
     SentimentCollectResponse,
     SentimentResult,
 )
+from app.services import (
+    article_dedup,
+    feed_fetcher,
+    headline_cluster,
+    headline_triage,
+    llm_client,
+    prompt_context,
+    sentiment_index,
+    ticker_alias,
+)
+from app.services.keyword_matcher import KeywordMatcher
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 MAX_ARTICLES_PER_SOURCE = 10
 DEFAULT_MODEL = "google/gemini-2.0-flash-001"
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# 배치 크기: 헤드라인 추정 토큰 + 기사당 예상 출력 토큰 합이 예산 이내
+BATCH_TOKEN_BUDGET = 2400
+OUTPUT_TOKENS_PER_ARTICLE = 90
+MAX_BATCH_SIZE = 25
+
+# 카테고리 요약 조회 윈도우 (sentiment_category_hourly 롤업 합산 범위)
+SUMMARY_WINDOWS: dict[str, timedelta] = {
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+}
 
 # ─── 9개 카테고리 정의 (DB news_categories 테이블과 동기화) ───
 
@@ -142,46 +162,71 @@ for _cat_data in NEWS_CATEGORIES.values():
     for _name, _url in _cat_data["feeds"].items():
         _ALL_FEEDS[_name] = _url
 
+# 키워드 → 카테고리 매처 (news_categories 조회 시 키워드가 바뀌었으면 재컴파일).
+# 3자 이하 영문 약어(AI, Fed, GDP ...)는 단어 전체가 일치해야 한다 ("AI" ≠ "aid", "airline")
+SHORT_KEYWORD_CHARS = 3
+_category_matcher = KeywordMatcher(
+    {k: d["keywords"] for k, d in NEWS_CATEGORIES.items()}, short_word_chars=SHORT_KEYWORD_CHARS
+)
+_category_fingerprint: tuple = tuple(
+    (k, tuple(d["keywords"])) for k, d in NEWS_CATEGORIES.items()
+)
+_category_lock = threading.Lock()
+
 
 # ─── 뉴스 수집 ───
 
 
 def collect_news() -> list[NewsArticle]:
-    """확장된 RSS 피드에서 뉴스 기사를 수집한다."""
+    """확장된 RSS 피드에서 뉴스 기사를 수집한다 (feed_fetcher 공용 레이어 경유)."""
     articles: list[NewsArticle] = []
 
-    for source, url in _ALL_FEEDS.items():
-        try:
-            feed = feedparser.parse(url)
-            entries = feed.entries[:MAX_ARTICLES_PER_SOURCE]
-
-            for entry in entries:
-                published = entry.get("published", entry.get("updated", ""))
-                articles.append(
-                    NewsArticle(
-                        title=entry.get("title", "").strip(),
-                        link=entry.get("link", ""),
-                        source=source,
-                        published=published,
-                    )
+    for source, entries in feed_fetcher.fetch_feeds(_ALL_FEEDS).items():
+        entries = entries[:MAX_ARTICLES_PER_SOURCE]
+        for entry in entries:
+            published = entry.get("published", entry.get("updated", ""))
+            articles.append(
+                NewsArticle(
+                    title=entry.get("title", "").strip(),
+                    link=entry.get("link", ""),
+                    source=source,
+                    published=published,
                 )
-
-            logger.info("Collected %d articles from %s", len(entries), source)
-        except Exception as e:
-            logger.warning("Failed to collect from %s: %s", source, e)
+            )
+        logger.info("Collected %d articles from %s", len(entries), source)
 
     logger.info("Total articles collected: %d", len(articles))
     return articles
 
 
+def _sync_category_matcher(categories: list[NewsCategoryConfig]) -> None:
+    """활성 카테고리 키워드가 바뀌었으면 매처를 다시 컴파일한다."""
+    global _category_matcher, _category_fingerprint
+
+    fingerprint = tuple(
+        (c.category_key, tuple(c.keywords)) for c in categories if c.is_active
+    )
+    if not fingerprint:
+        return
+    with _category_lock:
+        if fingerprint == _category_fingerprint:
+            return
+        _category_matcher = KeywordMatcher(dict(fingerprint), short_word_chars=SHORT_KEYWORD_CHARS)
+        _category_fingerprint = fingerprint
+    logger.info("Category keyword matcher rebuilt (%d categories)", len(fingerprint))
+
+
+def match_categories(title: str) -> dict[str, int]:
+    """제목에 매칭된 모든 카테고리와 키워드 적중 횟수 (적중 많은 순)."""
+    return _category_matcher.match(title)
+
+
 def _classify_category(title: str) -> str | None:
-    """키워드 매칭으로 뉴스 카테고리를 1차 분류한다 (AI 분류 전 사전 힌트)."""
-    title_lower = title.lower()
-    for cat_key, cat_data in NEWS_CATEGORIES.items():
-        for kw in cat_data["keywords"]:
-            if kw.lower() in title_lower:
-                return cat_key
-    return None
+    """키워드 매칭으로 뉴스 카테고리를 1차 분류한다 (AI 분류 전 사전 힌트).
+
+    적중 횟수가 가장 많은 카테고리, 동률이면 카테고리 정의 순서가 앞선 것.
+    """
+    return _category_matcher.best(title)
 
 
 # ─── AI 감성 분석 ───
@@ -220,6 +265,7 @@ def _make_neutral_fallback(reason: str) -> dict:
         "affected_countries": [],
         "short_term_impact": None,
         "medium_term_impact": None,
+        "is_fallback": True,  # DB 저장 대상 아님 — 재분석 대상 표시용
     }
 
 
@@ -232,23 +278,46 @@ def _build_category_prompt_section() -> str:
     return "\n".join(lines)
 
 
-def _analyze_batch(
-    articles: list[NewsArticle],
-    model: str,
-) -> list[dict]:
-    """OpenRouter API로 뉴스 배치 감성 분석 + 카테고리 분류를 수행한다."""
-    if not settings.openrouter_api_key:
-        logger.warning("OPENROUTER_API_KEY not set — returning neutral scores")
-        # API 키 없으면 키워드 매칭 기반 카테고리만 설정
-        results = []
-        for a in articles:
-            fallback = _make_neutral_fallback("API 키 미설정")
-            fallback["news_category"] = _classify_category(a.title)
-            results.append(fallback)
-        return results
-
-    titles = [f"{i + 1}. [{a.source}] {a.title}" for i, a in enumerate(articles)]
-    titles_text = "\n".join(titles)
+def _fallback_results(articles: list[NewsArticle], reason: str) -> list[dict]:
+    """기사별 중립 기본값 (카테고리는 키워드 매칭)."""
+    results = []
+    for a in articles:
+        fallback = _make_neutral_fallback(reason)
+        fallback["news_category"] = _classify_category(a.title)
+        results.append(fallback)
+    return results
+
+
+def _headline_line(index: int, article: NewsArticle) -> str:
+    return f"{index}. [{article.source}] {article.title}"
+
+
+def _plan_batches(articles: list[NewsArticle]) -> list[list[NewsArticle]]:
+    """헤드라인 길이 기반 토큰 추정으로 배치를 나눈다 (입력+예상 출력이 예산 이내)."""
+    batches: list[list[NewsArticle]] = []
+    current: list[NewsArticle] = []
+    used = 0
+    for article in articles:
+        cost = (
+            prompt_context.estimate_tokens(_headline_line(len(current) + 1, article))
+            + OUTPUT_TOKENS_PER_ARTICLE
+        )
+        if current and (used + cost > BATCH_TOKEN_BUDGET or len(current) >= MAX_BATCH_SIZE):
+            batches.append(current)
+            current, used = [], 0
+        current.append(article)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _request_scores(articles: list[NewsArticle], model: str) -> list[dict]:
+    """배치 1회 AI 호출. 응답 파싱/검증 실패 시 예외를 던진다.
+
+    AI가 기사 수보다 적게 응답하면 받은 만큼만 반환한다 (나머지는 호출자가 재요청).
+    """
+    titles_text = "\n".join(_headline_line(i + 1, a) for i, a in enumerate(articles))
     categories_text = _build_category_prompt_section()
 
     prompt = f"""다음 뉴스 헤드라인들의 시장 감성을 분석하고 카테고리를 분류하세요.
@@ -273,77 +342,188 @@ def _analyze_batch(
 
 JSON 배열만 응답하세요. 다른 텍스트는 포함하지 마세요."""
 
-    try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.1,
-            },
-            timeout=60.0,
+    scores = llm_client.chat_json(
+        model,
+        llm_client.user_prompt(prompt),
+        feature="sentiment",
+        temperature=0.1,
+        timeout=60.0,
+    )
+    if not isinstance(scores, list):
+        raise ValueError(f"expected JSON array, got {type(scores).__name__}")
+
+    results: list[dict] = []
+    for article, s in zip(articles, scores):
+        # AI가 반환한 카테고리 검증, 유효하지 않으면 키워드 매칭 폴백
+        ai_category = s.get("news_category")
+        if ai_category not in NEWS_CATEGORIES:
+            ai_category = _classify_category(article.title)
+
+        results.append(
+            {
+                "direction": s.get("direction", "NEUTRAL"),
+                "score": float(s.get("score", 0.0)),
+                "confidence": s.get("confidence"),
+                "event_type": s.get("event_type"),
+                "urgency": s.get("urgency", "LOW"),
+                "news_category": ai_category,
+                "reasoning": s.get("reasoning"),
+                "affected_sectors": s.get("affected_sectors", []),
+                "affected_countries": s.get("affected_countries", []),
+                "short_term_impact": s.get("short_term_impact"),
+                "medium_term_impact": s.get("medium_term_impact"),
+            }
         )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-
-        # JSON 파싱 — 코드 블록 제거
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1] if "\n" in content else content
-            if content.endswith("```"):
-                content = content[: -len("```")]
-            content = content.strip()
-
-        scores = json.loads(content)
-
-        results: list[dict] = []
-        for i, article in enumerate(articles):
-            if i < len(scores):
-                s = scores[i]
-                # AI가 반환한 카테고리 검증, 유효하지 않으면 키워드 매칭 폴백
-                ai_category = s.get("news_category")
-                if ai_category not in NEWS_CATEGORIES:
-                    ai_category = _classify_category(article.title)
-
-                results.append(
-                    {
-                        "direction": s.get("direction", "NEUTRAL"),
-                        "score": float(s.get("score", 0.0)),
-                        "confidence": s.get("confidence"),
-                        "event_type": s.get("event_type"),
-                        "urgency": s.get("urgency", "LOW"),
-                        "news_category": ai_category,
-                        "reasoning": s.get("reasoning"),
-                        "affected_sectors": s.get("affected_sectors", []),
-                        "affected_countries": s.get("affected_countries", []),
-                        "short_term_impact": s.get("short_term_impact"),
-                        "medium_term_impact": s.get("medium_term_impact"),
-                    }
-                )
-            else:
-                fallback = _make_neutral_fallback("분석 누락")
-                fallback["news_category"] = _classify_category(article.title)
-                results.append(fallback)
+    return results
+
+
+# 배치를 나눠 재요청할 실패 — 응답 JSON 파싱/검증 오류 (작은 배치면 성공할 수 있음).
+# 429/5xx/연결 오류는 llm_client가 이미 재시도했으므로 나눠 봐야 호출만 늘어난다.
+_SPLITTABLE_ERRORS = (ValueError, TypeError, AttributeError)
+
+
+def _analyze_batch(
+    articles: list[NewsArticle],
+    model: str,
+) -> list[dict]:
+    """OpenRouter API로 뉴스 배치 감성 분석 + 카테고리 분류를 수행한다.
 
-        return results
+    응답 파싱/검증이 실패하면 절반씩 나눠 재요청하고, 단건까지 실패한 기사만 중립 처리한다.
+    전송/HTTP 오류(장애)는 나누지 않고 배치 전체를 바로 중립 처리한다 (다음 주기에 재분석).
+    응답이 일부 누락되면 누락된 뒷부분만 다시 요청한다.
+    """
+    if not settings.openrouter_api_key:
+        logger.warning("OPENROUTER_API_KEY not set — returning neutral scores")
+        # API 키 없으면 키워드 매칭 기반 카테고리만 설정
+        return _fallback_results(articles, "API 키 미설정")
 
+    try:
+        results = _request_scores(articles, model)
+    except _SPLITTABLE_ERRORS as e:
+        if len(articles) == 1:
+            logger.error("OpenRouter sentiment analysis failed: %s", e)
+            return _fallback_results(articles, "분석 실패")
+        mid = len(articles) // 2
+        logger.warning(
+            "Sentiment batch of %d failed (%s) — retrying as %d + %d",
+            len(articles),
+            e,
+            mid,
+            len(articles) - mid,
+        )
+        return _analyze_batch(articles[:mid], model) + _analyze_batch(articles[mid:], model)
     except Exception as e:
-        logger.error("OpenRouter sentiment analysis failed: %s", e)
-        results = []
-        for a in articles:
-            fallback = _make_neutral_fallback("분석 실패")
-            fallback["news_category"] = _classify_category(a.title)
-            results.append(fallback)
-        return results
+        logger.error("OpenRouter sentiment batch of %d failed: %s", len(articles), e)
+        return _fallback_results(articles, "분석 실패")
+
+    if not results:
+        return _fallback_results(articles, "분석 누락")
+    if len(results) < len(articles):
+        logger.warning(
+            "Sentiment batch returned %d/%d — re-requesting the rest",
+            len(results),
+            len(articles),
+        )
+        results += _analyze_batch(articles[len(results) :], model)
+    return results
+
+
+def _analyze_parallel(articles: list[NewsArticle], model: str) -> list[dict]:
+    """토큰 예산 기반 배치를 공용 LLM 동시성 한도 내에서 병렬 분석한다 (카테고리 분류 포함)."""
+    if not articles:
+        return []
+    batches = _plan_batches(articles)
+    logger.info("Sentiment: %d articles in %d batches", len(articles), len(batches))
+    results: list[dict] = []
+    with ThreadPoolExecutor(max_workers=min(len(batches), settings.llm_max_concurrency)) as pool:
+        for analyses in pool.map(lambda batch: _analyze_batch(batch, model), batches):
+            results.extend(analyses)
+    return results
+
+
+def _analyze_clustered(articles: list[NewsArticle], model: str) -> list[dict]:
+    """근접 중복 헤드라인을 클러스터로 묶어 대표만 분석한다.
+
+    대표가 최근 실행 이력의 기사와 근접 중복이면 그 결과를 재사용한다.
+    모든 기사에 대표의 결과와 cluster_size(같은 사건을 보도한 기사 수)를 부여한다.
+    """
+    clusters = headline_cluster.cluster([a.title for a in articles])
+    representatives = [articles[c[0]] for c in clusters]
+
+    rep_results: list[dict | None] = [
+        headline_cluster.recall("sentiment", a.title) for a in representatives
+    ]
+    pending = [i for i, r in enumerate(rep_results) if r is None]
+    fresh = _analyze_parallel([representatives[i] for i in pending], model)
+    for i, result in zip(pending, fresh):
+        rep_results[i] = result
+        if not result.get("is_fallback"):
+            headline_cluster.remember("sentiment", representatives[i].title, result)
+
+    logger.info(
+        "Sentiment clustering: %d articles → %d clusters (%d reused from history, %d analyzed)",
+        len(articles),
+        len(clusters),
+        len(clusters) - len(pending),
+        len(pending),
+    )
+
+    analyses: list[dict] = [{} for _ in articles]
+    for members, result in zip(clusters, rep_results):
+        for idx in members:
+            analyses[idx] = {**result, "cluster_size": len(members)}
+    return analyses
 
 
 # ─── DB 저장/조회 ───
 
 
+def _local_analysis(title: str, result: headline_triage.TriageResult) -> dict:
+    """사전 분류에서 관련성이 낮은 헤드라인의 로컬 결과 (LLM 미호출).
+
+    시장 관련성이 낮다고 판정한 헤드라인이므로 방향 용어가 있어도 NEUTRAL/0으로 기록한다
+    (잠정 방향은 근거 문구에만 남긴다).
+    """
+    return {
+        "direction": "NEUTRAL",
+        "score": 0.0,
+        "confidence": headline_triage.LOCAL_CONFIDENCE,
+        "event_type": None,
+        "urgency": "LOW",
+        "news_category": _classify_category(title),
+        "reasoning": f"로컬 분류 (시장 관련성 {result.relevance:.2f}, 잠정 {result.direction})",
+        "affected_sectors": [],
+        "affected_countries": [],
+        "short_term_impact": None,
+        "medium_term_impact": None,
+        "analysis_source": "LOCAL",
+    }
+
+
+def _triage_articles(
+    articles: list[NewsArticle],
+) -> tuple[list[int], dict[int, dict]]:
+    """LLM으로 보낼 기사 인덱스와, 로컬 결과로 확정한 {인덱스: 분석}을 나눈다."""
+    threshold = settings.sentiment_triage_threshold
+    escalate: list[int] = []
+    local: dict[int, dict] = {}
+    for i, article in enumerate(articles):
+        result = headline_triage.triage(article.title, match_categories(article.title))
+        if headline_triage.should_escalate(result, threshold):
+            escalate.append(i)
+        else:
+            local[i] = _local_analysis(article.title, result)
+
+    if local:
+        logger.info(
+            "Headline triage: %d → LLM, %d resolved locally (threshold=%.2f)",
+            len(escalate),
+            len(local),
+            threshold,
+        )
+    return escalate, local
+
+
 def _save_results(
     supabase_client,
     articles: list[NewsArticle],
@@ -368,6 +548,9 @@ def _save_results(
                 "affected_countries": analysis.get("affected_countries"),
                 "short_term_impact": analysis.get("short_term_impact"),
                 "medium_term_impact": analysis.get("medium_term_impact"),
+                "cluster_size": analysis.get("cluster_size", 1),
+                "analysis_source": analysis.get("analysis_source", "LLM"),
+                "tickers": ticker_alias.tag(article.title),
                 "analyzed_at": analyzed_at.isoformat(),
             }
         )
@@ -425,7 +608,7 @@ def get_categories(supabase_client) -> list[NewsCategoryConfig]:
             .order("sort_order")
             .execute()
         )
-        return [
+        categories = [
             NewsCategoryConfig(
                 category_key=row["category_key"],
                 display_name=row["display_name"],
@@ -436,6 +619,8 @@ def get_categories(supabase_client) -> list[NewsCategoryConfig]:
             )
             for row in result.data
         ]
+        _sync_category_matcher(categories)
+        return categories
     except Exception as e:
         logger.warning("Failed to fetch news_categories: %s — using defaults", e)
         # DB 실패 시 하드코딩된 카테고리에서 반환
@@ -452,57 +637,28 @@ def get_categories(supabase_client) -> list[NewsCategoryConfig]:
 
 def get_category_summary(
     supabase_client,
+    window: str = "24h",
 ) -> list[dict]:
-    """카테고리별 최근 분석 요약 통계를 반환한다."""
+    """카테고리별 감성 요약 통계를 반환한다 (시간 단위 롤업 합산, window: 24h/7d/30d)."""
+    since = datetime.now(timezone.utc) - SUMMARY_WINDOWS[window]
     try:
-        # 최근 24시간 기준 카테고리별 집계
-        result = (
-            supabase_client.table("sentiment_results")
-            .select("news_category, direction, score")
-            .not_.is_("news_category", "null")
-            .order("analyzed_at", desc=True)
-            .limit(500)
-            .execute()
-        )
+        result = supabase_client.rpc(
+            "sentiment_category_summary", {"p_since": since.isoformat()}
+        ).execute()
 
-        # 카테고리별 집계
-        cat_stats: dict[str, dict] = {}
-        for row in result.data:
-            cat = row["news_category"]
-            if cat not in cat_stats:
-                cat_stats[cat] = {
-                    "category_key": cat,
-                    "total": 0,
-                    "bullish": 0,
-                    "bearish": 0,
-                    "neutral": 0,
-                    "avg_score": 0.0,
-                    "scores": [],
-                }
-            stats = cat_stats[cat]
-            stats["total"] += 1
-            direction = row.get("direction", "NEUTRAL")
-            if direction == "BULLISH":
-                stats["bullish"] += 1
-            elif direction == "BEARISH":
-                stats["bearish"] += 1
-            else:
-                stats["neutral"] += 1
-            stats["scores"].append(float(row.get("score", 0.0)))
-
-        # 평균 점수 계산 + display_name 매핑
+        # display_name 매핑
         summaries = []
-        for cat_key, stats in cat_stats.items():
+        for row in result.data or []:
+            cat_key = row["category_key"]
             cat_info = NEWS_CATEGORIES.get(cat_key, {})
-            avg = sum(stats["scores"]) / len(stats["scores"]) if stats["scores"] else 0.0
             summaries.append({
                 "category_key": cat_key,
                 "display_name": cat_info.get("display_name", cat_key),
-                "total": stats["total"],
-                "bullish": stats["bullish"],
-                "bearish": stats["bearish"],
-                "neutral": stats["neutral"],
-                "avg_score": round(avg, 3),
+                "total": int(row.get("total") or 0),
+                "bullish": int(row.get("bullish") or 0),
+                "bearish": int(row.get("bearish") or 0),
+                "neutral": int(row.get("neutral") or 0),
+                "avg_score": round(float(row.get("avg_score") or 0.0), 3),
             })
 
         # sort_order 기준 정렬
@@ -532,6 +688,9 @@ def _row_to_result(row: dict) -> SentimentResult:
         affected_countries=row.get("affected_countries"),
         short_term_impact=row.get("short_term_impact"),
         medium_term_impact=row.get("medium_term_impact"),
+        cluster_size=row.get("cluster_size") or 1,
+        analysis_source=row.get("analysis_source") or "LLM",
+        tickers=row.get("tickers") or [],
         analyzed_at=row.get("analyzed_at"),
         created_at=row.get("created_at"),
     )
@@ -543,10 +702,12 @@ def _row_to_result(row: dict) -> SentimentResult:
 def collect_and_analyze(supabase_client) -> SentimentCollectResponse:
     """뉴스 수집 → AI 감성 분석 + 카테고리 분류 → DB 저장까지 수행한다."""
     analyzed_at = datetime.now(timezone.utc)
+    get_categories(supabase_client)  # 키워드 변경 시 카테고리 매처 갱신
+    ticker_alias.refresh(supabase_client)  # 헤드라인 종목 태깅용 별칭 인덱스
 
     # 1. 뉴스 수집 (확장된 9개 카테고리 RSS 피드)
-    articles = collect_news()
-    if not articles:
+    collected = collect_news()
+    if not collected:
         return SentimentCollectResponse(
             success=False,
             articles_collected=0,
@@ -554,24 +715,56 @@ def collect_and_analyze(supabase_client) -> SentimentCollectResponse:
             collected_at=analyzed_at,
         )
 
-    # 2. 모델 선택
+    # 2. 이전 주기에 분석한 기사 제외 (URL 해시 + 제목 지문)
+    articles, duplicates = article_dedup.filter_new(supabase_client, collected)
+    if not articles:
+        return SentimentCollectResponse(
+            success=True,
+            articles_collected=len(collected),
+            articles_analyzed=0,
+            articles_new=0,
+            articles_duplicate=duplicates,
+            collected_at=analyzed_at,
+        )
+
+    # 3. 모델 선택
     model = _get_model_from_db(supabase_client)
     logger.info("Using model: %s", model)
 
-    # 3. 배치 분석 (10건씩 나눠서 — 카테고리 분류 포함)
-    batch_size = 10
-    all_analyses: list[dict] = []
-    for i in range(0, len(articles), batch_size):
-        batch = articles[i : i + batch_size]
-        analyses = _analyze_batch(batch, model)
-        all_analyses.extend(analyses)
-
-    # 4. DB 저장
-    saved = _save_results(supabase_client, articles, all_analyses, analyzed_at)
+    # 4. 로컬 사전 분류 — 시장 관련성이 낮은 헤드라인은 LLM 없이 확정
+    escalate, local = _triage_articles(articles)
+
+    # 5. 근접 중복 클러스터 대표만 분석하고 결과를 클러스터 전체에 전파
+    llm_analyses = _analyze_clustered([articles[i] for i in escalate], model) if escalate else []
+    by_index = dict(zip(escalate, llm_analyses))
+    by_index.update(local)
+    all_analyses = [by_index[i] for i in range(len(articles))]
+
+    # 6. 분석 성공 기사만 DB 저장·지수 반영·인덱스 등록
+    #    (폴백 결과는 저장하지 않고 seen으로도 등록하지 않아 다음 주기에 재분석한다)
+    analyzed = [(a, r) for a, r in zip(articles, all_analyses) if not r.get("is_fallback")]
+    if len(analyzed) < len(articles):
+        logger.warning(
+            "Sentiment analysis fell back for %d/%d articles — retrying next run",
+            len(articles) - len(analyzed),
+            len(articles),
+        )
+    saved = 0
+    if analyzed:
+        ok_articles = [a for a, _ in analyzed]
+        ok_analyses = [r for _, r in analyzed]
+        saved = _save_results(supabase_client, ok_articles, ok_analyses, analyzed_at)
+        if saved:
+            sentiment_index.update(supabase_client, ok_analyses, analyzed_at)
+            article_dedup.mark_seen(supabase_client, ok_articles)
+            article_dedup.prune(supabase_client)
 
     return SentimentCollectResponse(
         success=True,
-        articles_collected=len(articles),
+        articles_collected=len(collected),
         articles_analyzed=saved,
+        articles_new=len(articles),
+        articles_duplicate=duplicates,
+        articles_local=len(local),
         collected_at=analyzed_at,
     )
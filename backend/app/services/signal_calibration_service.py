@@ -0,0 +1,472 @@
+"""통합 스코어링 가중치 보정 서비스 — 과거 시그널 + 실현 수익률 기반 격자 탐색.
+
+prediction_scores에 저장된 5개 시그널 점수를 분석 시점 이후 HORIZON_DAYS 거래일
+실현 수익률과 매칭한 뒤, 가중치 심플렉스 격자 × 방향 임계값 조합을 numpy 행렬
+연산으로 일괄 평가한다. 격자는 청크 단위로 나눠 프로세스 풀에서 코어 병렬 평가하고,
+최적 조합은 signal_weight_configs에 저장되어 analyze_ticker가 캐시로 읽는다.
+
+목적 함수: 방향 판정을 포지션(BUY ±0.5, STRONG ±1.0, HOLD 0)으로 보고
+포지션 × 실현 수익률(%)의 표본 평균을 최대화한다.
+
+과적합 방지(워크포워드): 표본을 분석 시각순으로 나눠 앞쪽(학습)에서 격자 탐색하고,
+뒤쪽(검증, HOLDOUT_FRACTION)에서 기본 가중치와 비교한다. 검증 구간에서 표본당
+MIN_OOS_IMPROVEMENT 이상, 대응 표본 t-통계량 MIN_OOS_T_STAT 이상 개선된 경우에만 활성화한다.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from itertools import combinations
+
+import numpy as np
+import yfinance as yf
+from supabase import Client
+
+from app.services import prediction_service
+from app.services.stock_service import _retry_yf_call
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LOOKBACK_DAYS = 180
+HORIZON_DAYS = 5  # 실현 수익률 측정 구간 (거래일)
+MIN_SAMPLES = 100
+PAGE_SIZE = 1000
+
+WEIGHT_STEP = 0.05
+MIN_WEIGHT = 0.05
+BUY_THRESHOLD_GRID = (10.0, 15.0, 20.0, 25.0, 30.0, 35.0, 40.0)
+STRONG_THRESHOLD_GRID = (40.0, 50.0, 60.0, 70.0, 80.0)
+GRID_CHUNK_SIZE = 256
+HOLDOUT_FRACTION = 0.3  # 최근 표본 중 검증 구간 비율
+MIN_OOS_IMPROVEMENT = 0.05  # 검증 구간 목적 함수 최소 개선 (표본당 수익률 %p)
+MIN_OOS_T_STAT = 2.0  # 검증 구간 개선의 대응 표본 t-통계량 하한
+MAX_FETCH_WORKERS = 8
+
+SIGNAL_COLUMNS = (
+    "technical_score",
+    "macro_score",
+    "sentiment_score",
+    "currency_score",
+    "geopolitical_score",
+)
+
+
+# ─── (A) 후보 격자 ───
+
+
+def build_weight_grid(
+    step: float = WEIGHT_STEP,
+    min_weight: float = MIN_WEIGHT,
+    n_signals: int = len(SIGNAL_COLUMNS),
+) -> np.ndarray:
+    """합이 1인 가중치 조합 격자를 (K, n_signals) 배열로 반환한다.
+
+    step 단위의 정수 분할(stars and bars)로 생성하며, 각 가중치는 min_weight 이상이다.
+    """
+    units = int(round(1 / step))
+    floor = int(round(min_weight / step))
+    free = units - floor * n_signals
+    if free < 0:
+        raise ValueError("min_weight × n_signals must not exceed 1.0")
+
+    slots = free + n_signals - 1
+    bars = np.array(
+        list(combinations(range(slots), n_signals - 1)), dtype=np.int64
+    ).reshape(-1, n_signals - 1)
+    edges = np.hstack(
+        [
+            np.full((len(bars), 1), -1, dtype=np.int64),
+            bars,
+            np.full((len(bars), 1), slots, dtype=np.int64),
+        ]
+    )
+    parts = np.diff(edges, axis=1) - 1 + floor
+    return parts.astype(np.float64) * step
+
+
+def build_threshold_pairs(
+    buy_grid: tuple[float, ...] = BUY_THRESHOLD_GRID,
+    strong_grid: tuple[float, ...] = STRONG_THRESHOLD_GRID,
+) -> np.ndarray:
+    """strong > buy 를 만족하는 (buy, strong) 임계값 쌍을 (P, 2) 배열로 반환한다."""
+    pairs = [(b, s) for b in buy_grid for s in strong_grid if s > b]
+    return np.array(pairs, dtype=np.float64).reshape(-1, 2)
+
+
+# ─── (B) 벡터화 평가 ───
+
+
+def evaluate_candidates(
+    signals: np.ndarray,
+    returns: np.ndarray,
+    weights: np.ndarray,
+    threshold_pairs: np.ndarray,
+) -> np.ndarray:
+    """가중치 × 임계값 후보의 목적 함수 값을 (K, P) 배열로 반환한다.
+
+    Args:
+        signals: (N, 5) 시그널 점수 (-100 ~ +100)
+        returns: (N,) 실현 수익률 (%)
+        weights: (K, 5) 가중치 후보
+        threshold_pairs: (P, 2) (buy, strong) 임계값 후보
+    """
+    scores = signals @ weights.T  # (N, K)
+    abs_scores = np.abs(scores)
+    signs = np.sign(scores)
+    returns_col = returns[:, None]
+
+    result = np.empty((weights.shape[0], threshold_pairs.shape[0]))
+    for j, (buy, strong) in enumerate(threshold_pairs):
+        position = signs * (
+            0.5 * (abs_scores >= buy) + 0.5 * (abs_scores >= strong)
+        )
+        result[:, j] = (position * returns_col).mean(axis=0)
+    return result
+
+
+_worker_state: dict = {}
+
+
+def _init_worker(
+    signals: np.ndarray, returns: np.ndarray, threshold_pairs: np.ndarray
+) -> None:
+    """프로세스 풀 워커 초기화 — 표본 데이터를 워커당 1회만 전달한다."""
+    _worker_state["signals"] = signals
+    _worker_state["returns"] = returns
+    _worker_state["threshold_pairs"] = threshold_pairs
+
+
+def _evaluate_chunk(chunk_start: int, weights: np.ndarray) -> tuple[int, np.ndarray]:
+    """워커에서 가중치 청크 하나를 평가한다."""
+    return chunk_start, evaluate_candidates(
+        _worker_state["signals"],
+        _worker_state["returns"],
+        weights,
+        _worker_state["threshold_pairs"],
+    )
+
+
+def search_best(
+    signals: np.ndarray,
+    returns: np.ndarray,
+    weights: np.ndarray,
+    threshold_pairs: np.ndarray,
+    max_workers: int | None = None,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """전체 격자를 평가하여 (최적 가중치, 최적 임계값 쌍, 목적 함수 값)을 반환한다.
+
+    max_workers가 1이면 현재 프로세스에서, 그 외에는 코어 수만큼 병렬 평가한다.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    objective = np.empty((weights.shape[0], threshold_pairs.shape[0]))
+
+    if workers == 1:
+        objective[:] = evaluate_candidates(signals, returns, weights, threshold_pairs)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(signals, returns, threshold_pairs),
+        ) as executor:
+            futures = [
+                executor.submit(_evaluate_chunk, start, weights[start : start + GRID_CHUNK_SIZE])
+                for start in range(0, weights.shape[0], GRID_CHUNK_SIZE)
+            ]
+            for future in as_completed(futures):
+                start, chunk_result = future.result()
+                objective[start : start + chunk_result.shape[0]] = chunk_result
+
+    k, p = np.unravel_index(int(np.argmax(objective)), objective.shape)
+    return weights[k], threshold_pairs[p], float(objective[k, p])
+
+
+def sample_pnl(
+    signals: np.ndarray,
+    returns: np.ndarray,
+    weights: np.ndarray,
+    thresholds: np.ndarray,
+) -> np.ndarray:
+    """가중치 1개 × 임계값 1쌍의 표본별 포지션 × 실현 수익률 (N,)."""
+    scores = signals @ weights
+    abs_scores = np.abs(scores)
+    position = np.sign(scores) * (
+        0.5 * (abs_scores >= thresholds[0]) + 0.5 * (abs_scores >= thresholds[1])
+    )
+    return position * returns
+
+
+def chronological_split(
+    signals: np.ndarray,
+    returns: np.ndarray,
+    holdout_fraction: float = HOLDOUT_FRACTION,
+) -> tuple[tuple[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]:
+    """시각순 표본을 ((학습 signals, returns), (검증 signals, returns))로 나눈다 (검증 = 최근 구간)."""
+    cut = len(returns) - max(1, int(round(len(returns) * holdout_fraction)))
+    return (signals[:cut], returns[:cut]), (signals[cut:], returns[cut:])
+
+
+def fit_and_validate(
+    signals: np.ndarray,
+    returns: np.ndarray,
+    default_weights: np.ndarray,
+    default_thresholds: np.ndarray,
+    weight_grid: np.ndarray,
+    threshold_pairs: np.ndarray,
+    max_workers: int | None = None,
+) -> dict:
+    """학습 구간에서 최적 조합을 찾고 검증 구간에서 기본값 대비 개선 여부를 판정한다."""
+    (train_s, train_r), (test_s, test_r) = chronological_split(signals, returns)
+    best_weights, best_thresholds, train_objective = search_best(
+        train_s, train_r, weight_grid, threshold_pairs, max_workers=max_workers
+    )
+    best_pnl = sample_pnl(test_s, test_r, best_weights, best_thresholds)
+    default_pnl = sample_pnl(test_s, test_r, default_weights, default_thresholds)
+    diff = best_pnl - default_pnl
+    improvement = float(diff.mean())
+    spread = float(diff.std(ddof=1)) if len(diff) > 1 else 0.0
+    t_stat = improvement / (spread / np.sqrt(len(diff))) if spread > 0 else 0.0
+    return {
+        "weights": best_weights,
+        "thresholds": best_thresholds,
+        "train_objective": train_objective,
+        "objective": float(best_pnl.mean()),
+        "baseline_objective": float(default_pnl.mean()),
+        "t_stat": t_stat,
+        "updated": improvement >= MIN_OOS_IMPROVEMENT and t_stat >= MIN_OOS_T_STAT,
+    }
+
+
+# ─── (C) 표본 구성 ───
+
+
+def _load_history(client: Client, now: datetime) -> list[dict]:
+    """보정 구간의 prediction_scores 시그널 이력을 조회한다."""
+    since = (now - timedelta(days=LOOKBACK_DAYS)).isoformat()
+    # 수익률 측정 구간이 아직 끝나지 않은 최근 분석은 제외 (거래일 → 달력일 여유)
+    until = (now - timedelta(days=HORIZON_DAYS * 7 // 5 + 2)).isoformat()
+
+    rows: list[dict] = []
+    offset = 0
+    while True:
+        result = (
+            client.table("prediction_scores")
+            .select("ticker, analyzed_at, " + ", ".join(SIGNAL_COLUMNS))
+            .gte("analyzed_at", since)
+            .lte("analyzed_at", until)
+            .order("analyzed_at")
+            .range(offset, offset + PAGE_SIZE - 1)
+            .execute()
+        )
+        page = result.data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            break
+        offset += PAGE_SIZE
+
+    # 여러 사용자가 같은 날 같은 종목을 분석한 경우 1건만 표본으로 사용
+    unique: dict[tuple[str, str], dict] = {}
+    for row in rows:
+        unique[(row["ticker"], str(row["analyzed_at"])[:10])] = row
+    # 워크포워드 검증을 위해 분석 시각순으로 반환
+    return sorted(unique.values(), key=lambda r: str(r["analyzed_at"]))
+
+
+def _fetch_close_series(
+    ticker: str, start: datetime
+) -> tuple[str, np.ndarray | None, np.ndarray | None]:
+    """종가 시계열을 (ticker, 거래일 배열[datetime64[D]], 종가 배열)로 반환한다."""
+    try:
+        hist = _retry_yf_call(
+            yf.Ticker(ticker).history, start=start.strftime("%Y-%m-%d")
+        )
+        if hist is None or hist.empty:
+            return ticker, None, None
+        closes = hist["Close"]
+        closes = closes[closes.notna()]
+        dates = np.array(
+            [idx.strftime("%Y-%m-%d") for idx in closes.index], dtype="datetime64[D]"
+        )
+        return ticker, dates, closes.values.astype(np.float64)
+    except Exception as e:
+        logger.warning("Price history fetch failed for %s: %s", ticker, e)
+        return ticker, None, None
+
+
+def build_dataset(
+    rows: list[dict],
+    prices: dict[str, tuple[np.ndarray, np.ndarray]],
+    horizon_days: int = HORIZON_DAYS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """시그널 이력과 종가 시계열로 (signals (N, 5), returns (N,)) 표본을 만든다.
+
+    진입가는 분석일 당일 또는 직후 첫 거래일 종가, 청산가는 그로부터
+    horizon_days 거래일 뒤 종가다. 구간이 끝나지 않은 표본은 제외한다.
+    """
+    signal_rows: list[list[float]] = []
+    realized: list[float] = []
+
+    for row in rows:
+        series = prices.get(row["ticker"])
+        if series is None:
+            continue
+        dates, closes = series
+
+        analyzed_day = np.datetime64(str(row["analyzed_at"])[:10], "D")
+        entry = int(np.searchsorted(dates, analyzed_day, side="left"))
+        exit_ = entry + horizon_days
+        if exit_ >= len(closes) or closes[entry] <= 0:
+            continue
+
+        signal_rows.append([float(row.get(col) or 0.0) for col in SIGNAL_COLUMNS])
+        realized.append((closes[exit_] / closes[entry] - 1) * 100)
+
+    return (
+        np.array(signal_rows, dtype=np.float64).reshape(-1, len(SIGNAL_COLUMNS)),
+        np.array(realized, dtype=np.float64),
+    )
+
+
+# ─── (D) 보정 실행 + 저장 ───
+
+
+def _save_calibration(
+    client: Client,
+    weights: np.ndarray,
+    thresholds: np.ndarray,
+    sample_count: int,
+    objective: float,
+    baseline_objective: float,
+    calibrated_at: datetime,
+) -> None:
+    """새 보정 결과를 활성으로 저장한 뒤 이전 활성 설정을 비활성화한다.
+
+    저장이 실패하면 기존 활성 설정이 그대로 남는다. 두 단계 사이에는 활성 행이 2건일 수 있지만
+    소비자는 calibrated_at 최신 1건만 읽는다.
+    """
+    client.table("signal_weight_configs").insert(
+        {
+            "weight_technical": round(float(weights[0]), 4),
+            "weight_macro": round(float(weights[1]), 4),
+            "weight_sentiment": round(float(weights[2]), 4),
+            "weight_currency": round(float(weights[3]), 4),
+            "weight_geopolitical": round(float(weights[4]), 4),
+            "buy_threshold": float(thresholds[0]),
+            "strong_threshold": float(thresholds[1]),
+            "horizon_days": HORIZON_DAYS,
+            "sample_count": sample_count,
+            "objective": round(objective, 6),
+            "baseline_objective": round(baseline_objective, 6),
+            "is_active": True,
+            "calibrated_at": calibrated_at.isoformat(),
+        }
+    ).execute()
+    client.table("signal_weight_configs").update({"is_active": False}).eq(
+        "is_active", True
+    ).lt("calibrated_at", calibrated_at.isoformat()).execute()
+
+
+def calibrate_signal_weights(
+    client: Client,
+    max_workers: int | None = None,
+) -> dict:
+    """과거 시그널 이력으로 가중치/임계값을 보정하고 개선 시 저장한다."""
+    now = datetime.now(timezone.utc)
+
+    # 1. 시그널 이력
+    rows = _load_history(client, now)
+    if len(rows) < MIN_SAMPLES:
+        logger.info(
+            "Signal calibration skipped — %d samples (< %d)", len(rows), MIN_SAMPLES
+        )
+        return {"success": False, "sample_count": len(rows), "updated": False}
+
+    # 2. 종목별 종가 시계열 (병렬 수집)
+    start = now - timedelta(days=LOOKBACK_DAYS + 7)
+    tickers = sorted({row["ticker"] for row in rows})
+    prices: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        futures = [executor.submit(_fetch_close_series, t, start) for t in tickers]
+        for future in as_completed(futures):
+            ticker, dates, closes = future.result()
+            if dates is not None and closes is not None:
+                prices[ticker] = (dates, closes)
+
+    # 3. 표본 구성
+    signals, returns = build_dataset(rows, prices)
+    sample_count = len(returns)
+    if sample_count < MIN_SAMPLES:
+        logger.info(
+            "Signal calibration skipped — %d priced samples (< %d)",
+            sample_count,
+            MIN_SAMPLES,
+        )
+        return {"success": False, "sample_count": sample_count, "updated": False}
+
+    # 4. 격자 탐색(학습 구간) + 기본 가중치 대비 검증(최근 구간)
+    weight_grid = build_weight_grid()
+    threshold_pairs = build_threshold_pairs()
+    logger.info(
+        "Signal calibration — %d samples × %d weights × %d thresholds",
+        sample_count,
+        len(weight_grid),
+        len(threshold_pairs),
+    )
+    default = prediction_service.DEFAULT_SIGNAL_WEIGHTS
+    default_weights = np.array(
+        [
+            default.technical,
+            default.macro,
+            default.sentiment,
+            default.currency,
+            default.geopolitical,
+        ]
+    )
+    default_thresholds = np.array([default.buy_threshold, default.strong_threshold])
+    fit = fit_and_validate(
+        signals,
+        returns,
+        default_weights,
+        default_thresholds,
+        weight_grid,
+        threshold_pairs,
+        max_workers=max_workers,
+    )
+    best_weights, best_thresholds = fit["weights"], fit["thresholds"]
+    best_objective, baseline_objective = fit["objective"], fit["baseline_objective"]
+
+    # 5. 검증 구간에서 충분히 개선된 경우에만 저장 (objective/baseline은 검증 구간 값)
+    updated = fit["updated"]
+    if updated:
+        _save_calibration(
+            client,
+            best_weights,
+            best_thresholds,
+            sample_count,
+            best_objective,
+            baseline_objective,
+            now,
+        )
+        prediction_service.invalidate_signal_weights_cache()
+
+    logger.info(
+        "Signal calibration done — out-of-sample objective %.4f (baseline %.4f, t=%.2f, "
+        "train %.4f), updated=%s",
+        best_objective,
+        baseline_objective,
+        fit["t_stat"],
+        fit["train_objective"],
+        updated,
+    )
+    return {
+        "success": True,
+        "sample_count": sample_count,
+        "updated": updated,
+        "weights": [round(float(w), 4) for w in best_weights],
+        "buy_threshold": float(best_thresholds[0]),
+        "strong_threshold": float(best_thresholds[1]),
+        "objective": best_objective,
+        "baseline_objective": baseline_objective,
+        "train_objective": fit["train_objective"],
+        "t_stat": fit["t_stat"],
+    }
@@ -4,17 +4,16 @@ import json
 from datetime import datetime, timezone
 from typing import Any
 
-import httpx
 from supabase import Client
 
 from app.config import settings
+from app.services import llm_client, prompt_context
 from app.services.image_service import _extract_holdings_from_image, _get_vision_model
 from app.services.supabase_client import get_latest
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 DEFAULT_MODEL = "google/gemini-2.0-flash-001"
 
 # 4가지 시나리오 프롬프트 템플릿
@@ -68,6 +67,15 @@ def _build_scenario_prompt(scenario_type: str, params: dict[str, Any]) -> str:
     return f"시나리오 타입: {scenario_type}\n파라미터: {json.dumps(params, ensure_ascii=False)}"
 
 
+def _position_value(holding: dict) -> float:
+    """보유 종목 평가금액 (수량 × 현재가, 없으면 평단). 계산 불가 시 0."""
+    try:
+        price = holding.get("current_price") or holding.get("avg_price") or 0
+        return float(holding.get("quantity") or 0) * float(price)
+    except (TypeError, ValueError):
+        return 0.0
+
+
 def _gather_macro_context(client: Client) -> str:
     """현재 거시경제 상황을 텍스트로 요약한다."""
     snapshot = get_latest(client)
@@ -155,31 +163,13 @@ def run_simulation(
 JSON만 응답하세요."""
 
     try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.4,
-            },
+        result = llm_client.chat_json(
+            model,
+            llm_client.user_prompt(prompt),
+            feature="simulator",
+            temperature=0.4,
             timeout=90.0,
         )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-
-        # JSON 파싱
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1] if "\n" in content else content
-            if content.endswith("```"):
-                content = content[: -len("```")]
-            content = content.strip()
-
-        result = json.loads(content)
 
     except Exception as e:
         logger.error("Simulation failed for %s: %s", scenario_type, e)
@@ -235,8 +225,9 @@ def run_portfolio_simulation(
     scenario_prompt = _build_scenario_prompt(scenario_type, params)
     macro_context = _gather_macro_context(client)
 
+    # 평가금액 큰 종목부터 (토큰 예산 초과 시 소액 종목이 생략되도록)
     holdings_lines = []
-    for h in extracted:
+    for h in sorted(extracted, key=_position_value, reverse=True):
         name = h.get("name", "")
         ticker = h.get("ticker", "")
         qty = h.get("quantity", "?")
@@ -246,7 +237,7 @@ def run_portfolio_simulation(
         holdings_lines.append(
             f"- {name} ({ticker}): 보유 {qty}주, 평단 {avg}, 현재가 {cur}, 수익률 {pnl}%"
         )
-    holdings_text = "\n".join(holdings_lines)
+    holdings_text = prompt_context.fit_lines("simulator", holdings_lines)
 
     if not settings.openrouter_api_key:
         result = _make_fallback_result(scenario_type)
@@ -318,30 +309,13 @@ def run_portfolio_simulation(
 JSON만 응답하세요."""
 
     try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.4,
-            },
+        result = llm_client.chat_json(
+            model,
+            llm_client.user_prompt(prompt),
+            feature="simulator",
+            temperature=0.4,
             timeout=120.0,
         )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1] if "\n" in content else content
-            if content.endswith("```"):
-                content = content[: -len("```")]
-            content = content.strip()
-
-        result = json.loads(content)
 
     except Exception as e:
         logger.error("Portfolio simulation failed for %s: %s", scenario_type, e)
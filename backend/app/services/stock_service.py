@@ -19,6 +19,7 @@ from app.models.stock import (
     StockQuote,
     TechnicalIndicators,
 )
+from app.services import quote_feed
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -323,9 +324,19 @@ def _fetch_single_quote(ticker: str) -> StockQuote:
     )
 
 
-def fetch_quote(ticker: str) -> StockQuote:
-    """단일 종목 현재가 조회."""
-    return _fetch_single_quote(ticker)
+def _publish(stock_quote: StockQuote) -> None:
+    """조회한 시세를 시세 피드에 발행한다 (알림 엔진이 구독)."""
+    quote = quote_feed.from_stock_quote(stock_quote, source="api")
+    if quote is not None:
+        quote_feed.publish(quote)
+
+
+def fetch_quote(ticker: str, publish: bool = True) -> StockQuote:
+    """단일 종목 현재가 조회. publish=False면 시세 피드에 발행하지 않는다 (직접 평가하는 호출자용)."""
+    quote = _fetch_single_quote(ticker)
+    if publish:
+        _publish(quote)
+    return quote
 
 
 def fetch_multiple_quotes(tickers: list[str]) -> QuoteResponse:
@@ -339,7 +350,9 @@ def fetch_multiple_quotes(tickers: list[str]) -> QuoteResponse:
         for future in as_completed(future_map):
             ticker = future_map[future]
             try:
-                quotes.append(future.result())
+                quote = future.result()
+                _publish(quote)
+                quotes.append(quote)
             except Exception as e:
                 logger.error("Quote fetch failed for %s: %s", ticker, e)
                 quotes.append(
@@ -0,0 +1,330 @@
+"""텔레그램 발송기 — 장기 Bot 세션 1개 + 비동기 발송 큐 + 속도 제한 + 재시도 + 메트릭.
+
+모든 텔레그램 알림 발송(가격 알림, 리스크 브로드캐스트, 이미지 분석 결과)은 이 모듈을 통한다.
+
+- 전용 백그라운드 이벤트 루프 1개가 Bot(keep-alive HTTP 커넥션 풀)과 발송 큐를 소유한다.
+  메시지마다 Bot을 만들고 세션을 여닫지 않는다.
+- 워커 SENDER_CONCURRENCY개가 큐를 병렬로 소비해 브로드캐스트를 동시에 발송한다.
+- 발송 전 전역(초당 GLOBAL_RATE건)·채팅별(개인 1초, 그룹 3초 간격) 슬롯을 예약해
+  텔레그램 속도 제한을 넘지 않는다.
+- RetryAfter(flood wait)는 지정 시간만큼 해당 채팅과 전역 슬롯을 미루고 재시도,
+  네트워크 오류는 지수 백오프로 재시도한다. BadRequest/Forbidden은 재시도하지 않는다.
+- 큐 깊이, 발송/실패/재시도/flood wait 횟수, 큐 대기·전체 지연시간 p50·p95를 get_metrics()로 노출한다.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from telegram import Bot
+from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter
+from telegram.request import HTTPXRequest
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SENDER_CONCURRENCY = 8
+QUEUE_MAX = 5000
+GLOBAL_RATE = 25  # msg/s — Bot API 한도 30 msg/s에 여유를 둔다
+PRIVATE_CHAT_INTERVAL = 1.0  # seconds — 채팅당 1 msg/s
+GROUP_CHAT_INTERVAL = 3.0  # seconds — 그룹은 20 msg/min
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_MAX = 30.0  # seconds
+SEND_TIMEOUT = 60.0  # seconds — 동기 호출자가 결과를 기다리는 최대 시간
+LATENCY_WINDOW = 500
+
+
+@dataclass
+class _Outbound:
+    chat_id: str
+    text: str
+    parse_mode: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+# ─── 메트릭 ───
+
+_metrics = {"enqueued": 0, "sent": 0, "failed": 0, "retries": 0, "flood_waits": 0}
+_queue_waits: deque[float] = deque(maxlen=LATENCY_WINDOW)
+_latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+_metrics_lock = threading.Lock()
+
+
+def _count(key: str, n: int = 1) -> None:
+    with _metrics_lock:
+        _metrics[key] += n
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def get_metrics() -> dict:
+    """큐 깊이와 누적 발송 통계, 최근 큐 대기/전체 지연시간 p50·p95 (ms)."""
+    with _metrics_lock:
+        counts = dict(_metrics)
+        waits = list(_queue_waits)
+        latencies = list(_latencies)
+    return {
+        **counts,
+        "queue_depth": _queue.qsize() if _queue is not None else 0,
+        "p50_queue_wait_ms": round(_percentile(waits, 50), 1),
+        "p95_queue_wait_ms": round(_percentile(waits, 95), 1),
+        "p50_latency_ms": round(_percentile(latencies, 50), 1),
+        "p95_latency_ms": round(_percentile(latencies, 95), 1),
+    }
+
+
+# ─── 속도 제한 ───
+
+
+class _RateLimiter:
+    """전역·채팅별 다음 발송 가능 시각을 예약 방식으로 관리한다 (이벤트 루프 단일 스레드에서만 사용)."""
+
+    def __init__(self, global_rate: float):
+        self._global_interval = 1.0 / global_rate
+        self._global_next = 0.0
+        self._chat_next: dict[str, float] = {}
+
+    @staticmethod
+    def _chat_interval(chat_id: str) -> float:
+        # 그룹/채널 chat_id는 음수
+        return GROUP_CHAT_INTERVAL if str(chat_id).startswith("-") else PRIVATE_CHAT_INTERVAL
+
+    def reserve(self, chat_id: str, now: float) -> float:
+        """이번 발송 슬롯을 예약하고 그때까지 기다릴 시간(초)을 반환한다."""
+        chat_slot = max(now, self._chat_next.get(chat_id, 0.0))
+        slot = max(chat_slot, self._global_next)
+        self._chat_next[chat_id] = slot + self._chat_interval(chat_id)
+        self._global_next = slot + self._global_interval
+        return slot - now
+
+    def penalize(self, chat_id: str, now: float, seconds: float) -> None:
+        """flood wait 응답 — 해당 채팅과 전역 슬롯을 seconds 뒤로 민다."""
+        until = now + seconds
+        self._chat_next[chat_id] = max(self._chat_next.get(chat_id, 0.0), until)
+        self._global_next = max(self._global_next, until)
+
+
+# ─── 백그라운드 루프 + 장기 Bot 세션 ───
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_bot: Bot | None = None
+_queue: asyncio.Queue | None = None
+_limiter: _RateLimiter | None = None
+_workers: list[asyncio.Task] = []
+_init_lock = threading.Lock()
+
+
+async def _setup() -> None:
+    global _bot, _queue, _limiter, _workers
+    _bot = Bot(
+        token=settings.telegram_bot_token,
+        request=HTTPXRequest(connection_pool_size=SENDER_CONCURRENCY),
+    )
+    await _bot.initialize()
+    _queue = asyncio.Queue(maxsize=QUEUE_MAX)
+    _limiter = _RateLimiter(GLOBAL_RATE)
+    _workers = [asyncio.create_task(_worker(i)) for i in range(SENDER_CONCURRENCY)]
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """발송 전용 이벤트 루프를 (최초 1회) 기동하고 반환한다."""
+    global _loop, _loop_thread
+    with _init_lock:
+        if _loop is not None and _loop.is_running():
+            return _loop
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever, name="telegram-sender-loop", daemon=True
+        )
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(_setup(), loop).result(timeout=30)
+        except Exception:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+            raise
+        _loop, _loop_thread = loop, thread
+        logger.info(
+            "Telegram sender started (concurrency=%d, global_rate=%d/s)",
+            SENDER_CONCURRENCY,
+            GLOBAL_RATE,
+        )
+        return loop
+
+
+def _backoff_delay(attempt: int) -> float:
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2**attempt)))
+
+
+async def _deliver(item: _Outbound) -> bool:
+    """속도 제한 슬롯을 기다려 발송하고, flood wait/네트워크 오류는 재시도한다."""
+    assert _bot is not None and _limiter is not None
+    for attempt in range(MAX_RETRIES + 1):
+        wait = _limiter.reserve(item.chat_id, time.monotonic())
+        if wait > 0:
+            await asyncio.sleep(wait)
+        if attempt == 0:
+            with _metrics_lock:
+                _queue_waits.append((time.monotonic() - item.enqueued_at) * 1000)
+        try:
+            await _bot.send_message(
+                chat_id=item.chat_id, text=item.text, parse_mode=item.parse_mode
+            )
+            return True
+        except RetryAfter as e:
+            _count("flood_waits")
+            _limiter.penalize(item.chat_id, time.monotonic(), float(e.retry_after))
+            logger.warning("Telegram flood wait %ss for %s", e.retry_after, item.chat_id)
+        except (BadRequest, Forbidden) as e:
+            logger.error("Telegram send rejected for %s: %s", item.chat_id, e)
+            return False
+        except NetworkError as e:
+            if attempt >= MAX_RETRIES:
+                logger.error("Telegram send failed to %s: %s", item.chat_id, e)
+                return False
+            logger.warning("Telegram network error for %s, retrying: %s", item.chat_id, e)
+            await asyncio.sleep(_backoff_delay(attempt))
+        except Exception as e:
+            logger.error("Telegram send failed to %s: %s", item.chat_id, e)
+            return False
+        if attempt < MAX_RETRIES:
+            _count("retries")
+    logger.error("Telegram send gave up for %s after %d attempts", item.chat_id, MAX_RETRIES + 1)
+    return False
+
+
+async def _worker(worker_id: int) -> None:
+    assert _queue is not None
+    while True:
+        item: _Outbound = await _queue.get()
+        try:
+            ok = await _deliver(item)
+        except Exception as e:  # pragma: no cover — _deliver가 삼키지 못한 오류 방어
+            logger.error("Telegram sender worker %d failed: %s", worker_id, e)
+            ok = False
+        finally:
+            _queue.task_done()
+        with _metrics_lock:
+            _metrics["sent" if ok else "failed"] += 1
+            _latencies.append((time.monotonic() - item.enqueued_at) * 1000)
+        if not item.future.done():
+            item.future.set_result(ok)
+
+
+async def _enqueue_many(messages: list[tuple[str, str]], parse_mode: str) -> list[bool]:
+    """발송 루프 안에서 실행 — 모든 메시지를 큐에 넣고 결과를 함께 기다린다."""
+    assert _queue is not None
+    loop = asyncio.get_running_loop()
+    items = [
+        _Outbound(chat_id, text, parse_mode, loop.create_future()) for chat_id, text in messages
+    ]
+    for item in items:
+        await _queue.put(item)
+    _count("enqueued", len(items))
+    return list(await asyncio.gather(*(item.future for item in items)))
+
+
+# ─── 공개 API ───
+
+
+def _dedupe(chat_ids: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(str(c) for c in chat_ids if c))
+
+
+def send_batch(messages: list[tuple[str, str]], parse_mode: str = "HTML") -> list[bool]:
+    """(chat_id, text) 목록을 동시 발송하고 메시지별 성공 여부를 같은 순서로 반환한다 (동기 호출자용)."""
+    if not messages:
+        return []
+    if not settings.telegram_bot_token:
+        logger.warning("Telegram bot token not configured, skipping send")
+        return [False] * len(messages)
+    try:
+        loop = _get_loop()
+        future = asyncio.run_coroutine_threadsafe(_enqueue_many(messages, parse_mode), loop)
+        return future.result(timeout=SEND_TIMEOUT + len(messages) / GLOBAL_RATE)
+    except Exception as e:
+        logger.error("Telegram batch send failed (%d messages): %s", len(messages), e)
+        return [False] * len(messages)
+
+
+def broadcast(chat_ids: Iterable[str], text: str, parse_mode: str = "HTML") -> int:
+    """여러 채팅에 같은 메시지를 동시 발송하고 성공 건수를 반환한다 (동기 호출자용)."""
+    return sum(send_batch([(chat_id, text) for chat_id in _dedupe(chat_ids)], parse_mode))
+
+
+async def abroadcast(chat_ids: Iterable[str], text: str, parse_mode: str = "HTML") -> int:
+    """broadcast의 비동기 버전 — 호출자 이벤트 루프를 막지 않는다."""
+    targets = _dedupe(chat_ids)
+    if not targets:
+        return 0
+    if not settings.telegram_bot_token:
+        logger.warning("Telegram bot token not configured, skipping send")
+        return 0
+    try:
+        loop = await asyncio.to_thread(_get_loop)
+        coro = _enqueue_many([(chat_id, text) for chat_id in targets], parse_mode)
+        if asyncio.get_running_loop() is loop:
+            return sum(await coro)
+        return sum(await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop)))
+    except Exception as e:
+        logger.error("Telegram broadcast failed (%d targets): %s", len(targets), e)
+        return 0
+
+
+def send(chat_id: str, text: str, parse_mode: str = "HTML") -> bool:
+    """단일 채팅 발송 (동기)."""
+    return broadcast([chat_id], text, parse_mode) == 1
+
+
+async def asend(chat_id: str, text: str, parse_mode: str = "HTML") -> bool:
+    """단일 채팅 발송 (비동기)."""
+    return await abroadcast([chat_id], text, parse_mode) == 1
+
+
+def shutdown() -> None:
+    """큐에 남은 메시지를 잠시 기다린 뒤 Bot 세션을 닫고 발송 루프를 정지한다."""
+    global _loop, _loop_thread, _bot, _queue, _limiter, _workers
+    with _init_lock:
+        if _loop is None:
+            return
+        loop = _loop
+
+        async def _close() -> None:
+            if _queue is not None:
+                try:
+                    await asyncio.wait_for(_queue.join(), timeout=10)
+                except asyncio.TimeoutError:
+                    logger.warning("Telegram sender stopped with %d queued messages", _queue.qsize())
+            for task in _workers:
+                task.cancel()
+            await asyncio.gather(*_workers, return_exceptions=True)
+            if _bot is not None:
+                await _bot.shutdown()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_close(), loop).result(timeout=20)
+        except Exception as e:
+            logger.warning("Telegram sender close failed: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        if _loop_thread is not None:
+            _loop_thread.join(timeout=5)
+        loop.close()
+        _loop, _loop_thread, _bot, _queue, _limiter, _workers = None, None, None, None, None, []
+        logger.info("Telegram sender stopped")
@@ -3,18 +3,21 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+from supabase import Client
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 
 from app.config import settings
 from app.dependencies import get_supabase
+from app.services import notification_targets, telegram_sender
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+RISK_TICKERS_SHOWN = 10  # 리스크 알림에 표시할 노출 종목 수
+
 # ─── 모듈 수준 상태 ───
 
 _bot_app: Application | None = None
@@ -30,39 +33,18 @@ async def _send_message_async(
     text: str,
     parse_mode: str = "HTML",
 ) -> bool:
-    """비동기 텔레그램 메시지 발송."""
-    if not settings.telegram_bot_token:
-        logger.warning("Telegram bot token not configured, skipping send")
-        return False
-    try:
-        from telegram import Bot
-
-        bot = Bot(token=settings.telegram_bot_token)
-        async with bot:
-            await bot.send_message(
-                chat_id=chat_id,
-                text=text,
-                parse_mode=parse_mode,
-            )
-        return True
-    except Exception as e:
-        logger.error("Telegram send failed to %s: %s", chat_id, e)
-        return False
+    """비동기 텔레그램 메시지 발송 (telegram_sender 발송 큐 경유)."""
+    return await telegram_sender.asend(chat_id, text, parse_mode)
 
 
 def send_message(chat_id: str, text: str) -> bool:
     """동기 래퍼 — 스케줄러 잡에서 호출한다."""
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
+    return telegram_sender.send(chat_id, text)
 
-    if loop and loop.is_running():
-        with ThreadPoolExecutor(max_workers=1) as pool:
-            future = pool.submit(asyncio.run, _send_message_async(chat_id, text))
-            return future.result(timeout=30)
-    else:
-        return asyncio.run(_send_message_async(chat_id, text))
+
+def broadcast(chat_ids: list[str], text: str) -> int:
+    """여러 채팅에 동시 발송하고 성공 건수를 반환한다 (속도 제한은 발송 큐가 지킨다)."""
+    return telegram_sender.broadcast(chat_ids, text)
 
 
 def send_to_default(text: str) -> bool:
@@ -73,43 +55,69 @@ def send_to_default(text: str) -> bool:
     return send_message(settings.telegram_chat_id, text)
 
 
+def _resolve_user_chats(user_id: str) -> list[str]:
+    """사용자의 활성 telegram_chat_id 전체 (대상 캐시 조회, 없으면 기본 chat_id)."""
+    chat_ids = notification_targets.resolve(get_supabase(), [user_id]).get(user_id)
+    # fallback: 기본 chat_id로 발송
+    if chat_ids:
+        return chat_ids
+    return [settings.telegram_chat_id] if settings.telegram_chat_id else []
+
+
+def send_to_users(
+    client: Client,
+    messages: list[tuple[str, str]],
+    fallback_default: bool = True,
+) -> list[bool]:
+    """(user_id, text) 묶음을 수신 대상 1회 조회로 해석해 동시 발송한다 (메시지별 성공 여부).
+
+    사용자의 활성 채팅이 여럿이면 모두에게 보내고, 하나라도 성공하면 성공으로 센다.
+
+    fallback_default=False면 수신 대상이 없는 사용자는 기본 chat_id로 보내지 않고 건너뛴다.
+    """
+    if not messages:
+        return []
+    try:
+        chats = notification_targets.resolve(client, [uid for uid, _ in messages])
+    except Exception as e:
+        logger.error("Notification target lookup failed: %s", e)
+        chats = {}
+    outbound: list[tuple[str, str]] = []
+    positions: list[int] = []
+    default = [settings.telegram_chat_id] if fallback_default and settings.telegram_chat_id else []
+    for i, (user_id, text) in enumerate(messages):
+        for chat_id in chats.get(user_id) or default:
+            outbound.append((chat_id, text))
+            positions.append(i)
+    results = [False] * len(messages)
+    for i, ok in zip(positions, telegram_sender.send_batch(outbound)):
+        results[i] = results[i] or ok
+    return results
+
+
 async def send_to_user_async(user_id: str, text: str) -> bool:
-    """notification_targets에서 사용자 telegram_chat_id를 조회 후 발송한다."""
+    """notification_targets에서 사용자의 활성 telegram_chat_id 전체를 조회 후 발송한다."""
     try:
-        client = get_supabase()
-        result = (
-            client.table("notification_targets")
-            .select("telegram_chat_id")
-            .eq("user_id", user_id)
-            .eq("is_active", True)
-            .limit(1)
-            .execute()
-        )
-        if result.data and result.data[0].get("telegram_chat_id"):
-            chat_id = result.data[0]["telegram_chat_id"]
-            return await _send_message_async(chat_id, text)
-        # fallback: 기본 chat_id로 발송
-        if settings.telegram_chat_id:
-            return await _send_message_async(settings.telegram_chat_id, text)
-        return False
+        chat_ids = await asyncio.to_thread(_resolve_user_chats, user_id)
+        if not chat_ids:
+            return False
+        results = await asyncio.gather(*(_send_message_async(c, text) for c in chat_ids))
+        return any(results)
     except Exception as e:
         logger.error("send_to_user_async failed for %s: %s", user_id, e)
         return False
 
 
 def send_to_user_sync(user_id: str, text: str) -> bool:
-    """send_to_user_async의 동기 래퍼 — sync 컨텍스트에서 호출한다."""
+    """send_to_user_async의 동기 버전 — sync 컨텍스트에서 호출한다."""
     try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-
-    if loop and loop.is_running():
-        with ThreadPoolExecutor(max_workers=1) as pool:
-            future = pool.submit(asyncio.run, send_to_user_async(user_id, text))
-            return future.result(timeout=30)
-    else:
-        return asyncio.run(send_to_user_async(user_id, text))
+        chat_ids = _resolve_user_chats(user_id)
+        if not chat_ids:
+            return False
+        return broadcast(chat_ids, text) > 0
+    except Exception as e:
+        logger.error("send_to_user_sync failed for %s: %s", user_id, e)
+        return False
 
 
 def format_auto_registration_summary(
@@ -143,8 +151,9 @@ def format_price_alert(
     alert_type: str,
     trigger_price: float,
     current_price: float | None,
+    change_pct: float | None = None,
 ) -> str:
-    """가격 알림 텔레그램 메시지를 HTML로 포맷한다."""
+    """가격 알림 텔레그램 메시지를 HTML로 포맷한다. DAILY_CHANGE의 trigger_price는 변동률(%)."""
     type_label = {
         "TARGET_PRICE": "목표가 도달",
         "STOP_LOSS": "손절가 도달",
@@ -153,7 +162,9 @@ def format_price_alert(
 
     name = company_name or ticker
     price_str = f"{current_price:,.2f}" if current_price else "N/A"
-    trigger_str = f"{trigger_price:,.2f}"
+    if change_pct is not None:
+        price_str += f" ({change_pct:+.2f}%)"
+    trigger_str = f"±{trigger_price:.2f}%" if alert_type == "DAILY_CHANGE" else f"{trigger_price:,.2f}"
 
     return (
         f"<b>🔔 가격 알림 발동</b>\n\n"
@@ -169,8 +180,9 @@ def format_risk_alert(
     vix: float | None,
     high_urgency_count: int,
     usd_krw_change_pct: float | None,
+    exposed_tickers: list[str] | None = None,
 ) -> str:
-    """리스크 알림 텔레그램 메시지를 HTML로 포맷한다."""
+    """리스크 알림 텔레그램 메시지를 HTML로 포맷한다. exposed_tickers는 노출된 보유 종목."""
     lines = ["<b>⚠️ 리스크 알림</b>\n"]
 
     if vix is not None and vix >= 30:
@@ -185,6 +197,11 @@ def format_risk_alert(
             f"<b>환율:</b> USD/KRW {usd_krw_change_pct:+.1f}% ({direction})"
         )
 
+    if exposed_tickers:
+        shown = ", ".join(exposed_tickers[:RISK_TICKERS_SHOWN])
+        more = len(exposed_tickers) - RISK_TICKERS_SHOWN
+        lines.append(f"<b>노출 종목:</b> {shown}" + (f" 외 {more}개" if more > 0 else ""))
+
     lines.append(
         f"\n<b>시간:</b> {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}"
     )
@@ -199,18 +216,7 @@ def format_risk_alert(
 def _get_user_id_by_chat(chat_id: int) -> str | None:
     """telegram_chat_id → user_id 역조회."""
     try:
-        client = get_supabase()
-        result = (
-            client.table("notification_targets")
-            .select("user_id")
-            .eq("telegram_chat_id", str(chat_id))
-            .eq("is_active", True)
-            .limit(1)
-            .execute()
-        )
-        if result.data:
-            return result.data[0]["user_id"]
-        return None
+        return notification_targets.user_for_chat(get_supabase(), str(chat_id))
     except Exception as e:
         logger.error("User lookup by chat_id %s failed: %s", chat_id, e)
         return None
@@ -0,0 +1,128 @@
+"""종목 별칭 인덱스 — 회사명/한글명/티커 → 티커 매핑과 헤드라인 종목 태깅.
+
+별칭 출처 (합집합):
+- DEFAULT_ALIASES: 주요 종목 기본값
+- ticker_aliases 테이블: 관리자 추가분
+- watchlist/portfolio의 (ticker, company_name): 사용자가 실제 보는 종목
+
+별칭은 KeywordMatcher로 컴파일해 헤드라인 1회 스캔으로 모든 언급 티커를 찾는다.
+인덱스는 ALIAS_CACHE_TTL 동안 메모리에 유지한다.
+"""
+
+import threading
+import time
+
+from supabase import Client
+
+from app.services.keyword_matcher import KeywordMatcher
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ALIAS_TABLE = "ticker_aliases"
+ALIAS_CACHE_TTL = 3600  # seconds
+MIN_ALIAS_CHARS = 2  # 한 글자 별칭은 오탐이 많아 제외
+NAME_SOURCE_LIMIT = 2000
+
+# 주요 종목 기본 별칭 (티커 → 별칭). 티커 코드 자체도 별칭으로 포함한다.
+DEFAULT_ALIASES: dict[str, list[str]] = {
+    "005930.KS": ["삼성전자", "Samsung Electronics", "005930"],
+    "000660.KS": ["SK하이닉스", "하이닉스", "SK Hynix", "000660"],
+    "373220.KS": ["LG에너지솔루션", "LG Energy Solution", "373220"],
+    "005380.KS": ["현대차", "현대자동차", "Hyundai Motor", "005380"],
+    "035420.KS": ["네이버", "NAVER", "035420"],
+    "035720.KS": ["카카오", "Kakao", "035720"],
+    "NVDA": ["NVIDIA", "엔비디아", "NVDA"],
+    "AAPL": ["Apple", "애플", "AAPL"],
+    "MSFT": ["Microsoft", "마이크로소프트", "MSFT"],
+    "TSLA": ["Tesla", "테슬라", "TSLA"],
+    "GOOGL": ["Alphabet", "Google", "구글", "GOOGL"],
+    "AMZN": ["Amazon", "아마존", "AMZN"],
+    "META": ["Meta Platforms", "Facebook"],
+    "TSM": ["TSMC", "Taiwan Semiconductor"],
+    "AMD": ["AMD", "Advanced Micro Devices"],
+    "INTC": ["Intel", "인텔", "INTC"],
+}
+
+_matcher: KeywordMatcher | None = None
+_loaded_at = 0.0
+_lock = threading.Lock()
+
+
+def _load_aliases(client: Client | None) -> dict[str, set[str]]:
+    aliases: dict[str, set[str]] = {t: set(a) for t, a in DEFAULT_ALIASES.items()}
+    if client is None:
+        return aliases
+
+    try:
+        result = client.table(ALIAS_TABLE).select("alias, ticker").execute()
+        for row in result.data or []:
+            aliases.setdefault(row["ticker"], set()).add(row["alias"])
+    except Exception as e:
+        logger.warning("Failed to load %s: %s", ALIAS_TABLE, e)
+
+    for table in ("watchlist", "portfolio"):
+        try:
+            result = (
+                client.table(table)
+                .select("ticker, company_name")
+                .limit(NAME_SOURCE_LIMIT)
+                .execute()
+            )
+            for row in result.data or []:
+                if row.get("ticker") and row.get("company_name"):
+                    aliases.setdefault(row["ticker"], set()).add(row["company_name"])
+        except Exception as e:
+            logger.warning("Failed to load company names from %s: %s", table, e)
+
+    return aliases
+
+
+def _build(aliases: dict[str, set[str]]) -> KeywordMatcher:
+    return KeywordMatcher(
+        {
+            ticker: sorted(a for a in names if len(a.strip()) >= MIN_ALIAS_CHARS)
+            for ticker, names in aliases.items()
+        },
+        # 별칭은 고유명사 — 영문은 단어 전체 일치 ("Intel" ≠ "intelligence"), 한글은 조사 허용
+        whole_word=True,
+    )
+
+
+def refresh(client: Client | None, force: bool = False) -> None:
+    """TTL이 지났거나 force면 별칭 인덱스를 다시 만든다."""
+    global _matcher, _loaded_at
+    now = time.monotonic()
+    with _lock:
+        if not force and _matcher is not None and now - _loaded_at < ALIAS_CACHE_TTL:
+            return
+
+    aliases = _load_aliases(client)
+    matcher = _build(aliases)
+    with _lock:
+        _matcher = matcher
+        # DB 없이 만든 기본 인덱스는 다음 refresh(client) 때 바로 교체되도록 로드 시각을 남기지 않는다
+        _loaded_at = now if client is not None else 0.0
+    logger.info(
+        "Ticker alias index built: %d tickers, %d aliases",
+        len(aliases),
+        sum(len(a) for a in aliases.values()),
+    )
+
+
+def tag(text: str) -> list[str]:
+    """텍스트에 언급된 티커 목록 (언급 많은 순)."""
+    with _lock:
+        matcher = _matcher
+    if matcher is None:
+        refresh(None)
+        with _lock:
+            matcher = _matcher
+    return list(matcher.match(text))
+
+
+def reset() -> None:
+    global _matcher, _loaded_at
+    with _lock:
+        _matcher = None
+        _loaded_at = 0.0
@@ -4,48 +4,22 @@
 AI가 주간 종합 리포트(macro_summary, geo_summary, next_week_outlook, strategy_guide)를 생성한다.
 """
 
-import json
 from datetime import date, timedelta
 
-import httpx
 from supabase import Client
 
 from app.config import settings
+from app.services import llm_client, prompt_context
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 DEFAULT_MODEL = "anthropic/claude-sonnet-4-20250514"
 
 
-def _get_model_from_db(client: Client) -> str:
-    """model_configs에서 주간 리포트 생성용 모델을 조회한다."""
-    try:
-        result = (
-            client.table("model_configs")
-            .select("model_id")
-            .eq("feature", "weekly_report")
-            .eq("is_active", True)
-            .limit(1)
-            .execute()
-        )
-        if result.data:
-            return result.data[0]["model_id"]
-    except Exception as e:
-        logger.warning("model_configs query failed (weekly_report): %s — using default", e)
-    return DEFAULT_MODEL
-
-
-def _parse_ai_json(content: str) -> dict:
-    """AI 응답에서 JSON을 추출한다."""
-    content = content.strip()
-    if content.startswith("```"):
-        content = content.split("\n", 1)[1] if "\n" in content else content
-        if content.endswith("```"):
-            content = content[: -len("```")]
-        content = content.strip()
-    return json.loads(content)
+def _get_model_chain(client: Client) -> llm_client.ModelChain:
+    """model_configs에서 주간 리포트 생성용 모델 체인(WEEKLY_REPORT)을 조회한다."""
+    return llm_client.get_model_chain(client, "WEEKLY_REPORT", DEFAULT_MODEL)
 
 
 # ─── 주간 컨텍스트 수집 ───
@@ -169,6 +143,14 @@ def _gather_weekly_context(client: Client, week_start: date) -> dict:
     return context
 
 
+def _daily_last_snapshots(snapshots: list[dict]) -> list[dict]:
+    """시간순 스냅샷에서 날짜별 마지막 1건만 남긴다 (프롬프트 축약용)."""
+    by_day: dict[str, dict] = {}
+    for row in snapshots:
+        by_day[str(row.get("collected_at", ""))[:10]] = row
+    return list(by_day.values())
+
+
 # ─── 주간 리포트 생성 ───
 
 
@@ -193,13 +175,23 @@ def generate_weekly_report(client: Client, target_date: date | None = None) -> d
     logger.info("Generating weekly report for %s ~ %s", week_start_str, week_end.isoformat())
 
     context = _gather_weekly_context(client, target_date)
-    model = _get_model_from_db(client)
+    chain = _get_model_chain(client)
 
     if not settings.openrouter_api_key:
         logger.warning("OPENROUTER_API_KEY not set — generating fallback weekly report")
         return _save_fallback_report(client, week_start_str, context)
 
-    context_json = json.dumps(context, ensure_ascii=False, default=str)
+    context_json = prompt_context.build_context(
+        "weekly_report",
+        [
+            ("sentiment_summary", context.get("sentiment_summary")),
+            ("fear_greed", context.get("fear_greed")),
+            ("macro_snapshots", _daily_last_snapshots(context.get("macro_snapshots") or [])),
+            ("geo_risks", context.get("geo_risks")),
+            ("geo_events", context.get("geo_events")),
+            ("daily_briefings", context.get("daily_briefings")),
+        ],
+    )
 
     prompt = f"""당신은 시니어 투자 전략가입니다. 아래 한 주간의 시장 데이터를 기반으로 **주간 종합 리포트**를 작성하세요.
 
@@ -227,22 +219,13 @@ def generate_weekly_report(client: Client, target_date: date | None = None) -> d
 JSON만 응답하세요. 다른 텍스트 포함 금지."""
 
     try:
-        response = httpx.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3,
-            },
+        report = llm_client.chat_json_hedged(
+            chain,
+            llm_client.user_prompt(prompt),
+            feature="weekly_report",
+            temperature=0.3,
             timeout=120.0,
         )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-        report = _parse_ai_json(content)
 
     except Exception as e:
         logger.error("Weekly report generation failed: %s", e)
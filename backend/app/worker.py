@@ -0,0 +1,82 @@
+"""백그라운드 워커 프로세스 — 스케줄러(크론잡 + 즉시 실행 큐)와 텔레그램 봇을 API와 분리해 실행한다.
+
+    python -m app.worker
+
+API 파드는 SCHEDULER_ENABLED=false, TELEGRAM_BOT_ENABLED=false로 띄우고 워커를 별도 서비스로 둔다.
+무거운 작업(ETF 동기화/감성 분석/스코어링)이 API 요청 처리와 GIL·스레드풀을 다투지 않게 하기 위함이다.
+워커를 여러 개 띄워도 리더 선출(app.scheduler.leader)로 작업은 1곳에서만 실행된다.
+텔레그램 봇(getUpdates 폴링)도 같은 리더에서만 돌린다 — 한 토큰을 여러 프로세스가 폴링하면
+텔레그램이 409 Conflict로 거절하므로, BOT_LEADER_CHECK_SECONDS마다 리더 여부를 보고 봇을 켜고 끈다.
+SIGTERM/SIGINT를 받으면 임대를 반납하고 종료한다.
+"""
+
+import asyncio
+import signal
+
+from app.config import settings
+from app.scheduler.jobs import is_scheduler_leader, start_scheduler, stop_scheduler
+from app.services import llm_client, telegram_sender, telegram_service
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+BOT_LEADER_CHECK_SECONDS = 5
+
+
+async def _run_bot_while_leader(stop: asyncio.Event) -> None:
+    """리더인 동안만 봇 폴링을 유지한다 (리더 인계 시 새 리더가 이어받음)."""
+    polling = False
+    while not stop.is_set():
+        leader = is_scheduler_leader()
+        if leader and not polling:
+            if telegram_service.build_bot_application():
+                await telegram_service.start_bot()
+                polling = True
+        elif not leader and polling:
+            await telegram_service.stop_bot()
+            polling = False
+            logger.info("Telegram bot stopped (not leader)")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=BOT_LEADER_CHECK_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # pragma: no cover — Windows
+            pass
+
+    logger.info("Starting background worker")
+    start_scheduler()
+
+    if settings.telegram_bot_token and settings.telegram_bot_enabled:
+        waiter = _run_bot_while_leader(stop)
+    else:
+        logger.info(
+            "Telegram bot disabled (token=%s, enabled=%s)",
+            bool(settings.telegram_bot_token),
+            settings.telegram_bot_enabled,
+        )
+        waiter = stop.wait()
+
+    try:
+        await waiter
+    finally:
+        await telegram_service.stop_bot()
+        stop_scheduler()
+        telegram_sender.shutdown()
+        llm_client.shutdown()
+        logger.info("Background worker stopped")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
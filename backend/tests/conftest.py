@@ -53,6 +53,17 @@ MOCK_ADMIN = CurrentUser(
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _isolated_llm_cache(tmp_path, monkeypatch):
+    """LLM 응답 캐시를 테스트별 임시 SQLite 파일로 격리한다."""
+    from app.services import llm_cache
+
+    llm_cache.close()
+    monkeypatch.setattr("app.config.settings.llm_cache_path", str(tmp_path / "llm_cache.sqlite3"))
+    yield
+    llm_cache.close()
+
+
 @pytest.fixture()
 def mock_supabase():
     """Mock Supabase 클라이언트를 반환한다."""
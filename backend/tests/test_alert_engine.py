@@ -0,0 +1,159 @@
+"""가격 알림 엔진(증분 평가/일괄 발동/중복 방지) 테스트."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.services import alert_engine, quote_feed
+from app.services.quote_feed import Quote
+
+
+@pytest.fixture(autouse=True)
+def _fresh_engine():
+    alert_engine.reset()
+    yield
+    alert_engine.reset()
+
+
+def _alert(alert_id, alert_type, trigger, ticker="NVDA", triggered_at=None):
+    return {
+        "id": alert_id, "user_id": "u1", "ticker": ticker, "alert_type": alert_type,
+        "trigger_price": trigger, "triggered_at": triggered_at,
+    }
+
+
+# 2026-10-20(화) 11:00 ET — 미국 정규장 개장 중
+OPEN_NOW = datetime(2026, 10, 20, 15, 0, tzinfo=timezone.utc)
+
+
+def _process(mock_supabase, alerts, quotes, fired_ids, now=OPEN_NOW):
+    mock_supabase.table.return_value.execute.return_value.data = alerts
+    mock_supabase.rpc.return_value.execute.return_value.data = fired_ids
+    with patch.object(
+        alert_engine, "_notify_all", side_effect=lambda client, events: len(events)
+    ) as notify:
+        result = alert_engine.get_engine().process(mock_supabase, quotes, now=now)
+    return result, notify
+
+
+def test_one_shot_alerts_flipped_in_one_bulk_call(mock_supabase):
+    """도달한 알림은 RPC 1회로 발동 처리하고, DB가 실제로 전환한 알림에만 발송한다."""
+    alerts = [
+        _alert("a1", "TARGET_PRICE", 100),
+        _alert("a2", "TARGET_PRICE", 150),
+        _alert("a3", "STOP_LOSS", 90),
+        _alert("a4", "TARGET_PRICE", 105),
+    ]
+
+    result, notify = _process(mock_supabase, alerts, [Quote("NVDA", 110.0, 100.0)], ["a1"])
+
+    assert mock_supabase.rpc.call_count == 1
+    name, params = mock_supabase.rpc.call_args.args
+    assert name == "trigger_price_alerts"
+    assert sorted(params["p_ids"]) == ["a1", "a4"]  # a4는 다른 프로세스가 먼저 발동
+    assert result.triggered == 1
+    assert [a["id"] for a, _ in notify.call_args.args[1]] == ["a1"]
+    mock_supabase.table.return_value.update.assert_not_called()
+
+
+def test_daily_change_uses_previous_close_once_per_session(mock_supabase):
+    """DAILY_CHANGE는 전일 종가 대비 변동률로 발동하고, 같은 거래 세션에는 다시 발동하지 않는다."""
+    alerts = [_alert("d1", "DAILY_CHANGE", 5)]
+
+    quiet, _ = _process(mock_supabase, alerts, [Quote("NVDA", 104.0, 100.0)], ["d1"])
+    fired, _ = _process(mock_supabase, alerts, [Quote("NVDA", 94.0, 100.0)], ["d1"])
+    again, notify = _process(mock_supabase, alerts, [Quote("NVDA", 93.0, 100.0)], ["d1"])
+
+    assert quiet.triggered == 0
+    assert fired.triggered == 1
+    name, params = mock_supabase.rpc.call_args.args
+    assert name == "trigger_daily_change_alerts"
+    # 현지(뉴욕) 거래일 시작 시각으로 DB에서도 세션당 1회를 보장한다
+    assert params["p_session_starts"] == ["2026-10-20T00:00:00-04:00"]
+    assert again.triggered == 0
+    notify.assert_not_called()
+
+
+def test_daily_change_fires_again_next_session_not_while_closed(mock_supabase):
+    """휴장 중에는 평가하지 않고, 다음 세션에는 다시 발동한다 (12시간 고정 쿨다운 아님)."""
+    alerts = [_alert("d1", "DAILY_CHANGE", 5)]
+    after_close = datetime(2026, 10, 20, 23, 0, tzinfo=timezone.utc)  # 19:00 ET
+    next_open = datetime(2026, 10, 21, 14, 0, tzinfo=timezone.utc)  # 다음 날 10:00 ET
+
+    first, _ = _process(mock_supabase, alerts, [Quote("NVDA", 94.0, 100.0)], ["d1"])
+    closed, _ = _process(mock_supabase, alerts, [Quote("NVDA", 93.0, 100.0)], ["d1"], after_close)
+    next_day, _ = _process(
+        mock_supabase, alerts, [Quote("NVDA", 90.0, 100.0)], ["d1"], next_open
+    )
+
+    assert first.triggered == 1
+    assert closed.triggered == 0
+    assert next_day.triggered == 1
+    assert mock_supabase.rpc.call_count == 2
+
+
+def test_daily_change_session_restored_from_db(mock_supabase):
+    """재적재 시 최근 발동 시각(triggered_at)의 거래일을 복원해 같은 세션에는 발동하지 않는다."""
+    recent = (OPEN_NOW - timedelta(hours=1)).isoformat()
+    alerts = [_alert("d1", "DAILY_CHANGE", 5, triggered_at=recent)]
+
+    result, _ = _process(mock_supabase, alerts, [Quote("NVDA", 90.0, 100.0)], ["d1"])
+
+    assert result.triggered == 0
+    mock_supabase.rpc.assert_not_called()
+
+
+def test_duplicate_quotes_are_ignored(mock_supabase):
+    """같은 시세가 반복되면 다시 평가하지 않는다."""
+    alerts = [_alert("a1", "TARGET_PRICE", 100)]
+    quote = Quote("NVDA", 101.0, 100.0)
+
+    first, _ = _process(mock_supabase, alerts, [quote], [])  # 다른 프로세스가 이미 발동
+    second, _ = _process(mock_supabase, alerts, [quote], ["a1"])
+
+    assert first.triggered == second.triggered == 0
+    assert mock_supabase.rpc.call_count == 1
+
+
+def test_new_alert_fires_on_unchanged_quote_after_reload(mock_supabase):
+    """재적재로 새 알림이 생긴 티커는 같은 시세가 다시 와도 평가한다."""
+    quote = Quote("NVDA", 101.0, 100.0)
+    engine = alert_engine.get_engine()
+
+    first, _ = _process(mock_supabase, [_alert("a1", "TARGET_PRICE", 150)], [quote], [])
+    mock_supabase.table.return_value.execute.return_value.data = [
+        _alert("a1", "TARGET_PRICE", 150),
+        _alert("a2", "TARGET_PRICE", 100),  # 이미 충족된 새 알림
+    ]
+    engine.refresh(mock_supabase, force=True)
+    second, _ = _process(
+        mock_supabase,
+        [_alert("a1", "TARGET_PRICE", 150), _alert("a2", "TARGET_PRICE", 100)],
+        [quote],
+        ["a2"],
+    )
+
+    assert first.triggered == 0
+    assert second.triggered == 1
+
+
+def test_feed_quotes_are_processed_by_subscriber_thread(mock_supabase):
+    """시세 피드에 발행된 시세는 엔진 구독 스레드가 수 초 내 처리한다."""
+    mock_supabase.table.return_value.execute.return_value.data = [_alert("a1", "STOP_LOSS", 95)]
+    mock_supabase.rpc.return_value.execute.return_value.data = ["a1"]
+    engine = alert_engine.get_engine()
+
+    with patch.object(
+        alert_engine, "_notify_all", side_effect=lambda client, events: len(events)
+    ) as notify:
+        engine.start(lambda: mock_supabase)
+        quote_feed.publish(Quote("NVDA", 94.0, 100.0, source="api"))
+        for _ in range(50):
+            if notify.called:
+                break
+            time.sleep(0.05)
+        engine.stop()
+
+    assert notify.call_count == 1
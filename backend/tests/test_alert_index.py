@@ -0,0 +1,55 @@
+"""가격 알림 인덱스 테스트."""
+
+import random
+
+from app.services.alert_index import AlertIndex
+
+
+def _alert(alert_id, ticker, alert_type, trigger):
+    return {"id": alert_id, "user_id": "u1", "ticker": ticker, "alert_type": alert_type, "trigger_price": trigger}
+
+
+def test_crossed_matches_linear_scan():
+    """이분 탐색 결과는 전체 선형 판정과 같다."""
+    rng = random.Random(7)
+    alerts = [
+        _alert(str(i), rng.choice(["A", "B"]), rng.choice(["TARGET_PRICE", "STOP_LOSS"]), rng.uniform(50, 150))
+        for i in range(2000)
+    ]
+    index = AlertIndex(alerts)
+
+    for ticker in ("A", "B"):
+        for price in (49.0, 80.0, 100.0, 151.0):
+            expected = {
+                a["id"]
+                for a in alerts
+                if a["ticker"] == ticker
+                and (
+                    (a["alert_type"] == "TARGET_PRICE" and price >= a["trigger_price"])
+                    or (a["alert_type"] == "STOP_LOSS" and price <= a["trigger_price"])
+                )
+            }
+            assert {a["id"] for a in index.crossed(ticker, price)} == expected
+
+
+def test_boundaries_and_distance():
+    """트리거 가격과 같으면 발동하고, 거리는 미도달 트리거 중 가장 가까운 값이다.
+
+    DAILY_CHANGE는 전일 대비 변동률 절대값이 임계값(%) 이상이면 발동한다.
+    """
+    index = AlertIndex([
+        _alert("t1", "X", "TARGET_PRICE", 110),
+        _alert("t2", "X", "TARGET_PRICE", 120),
+        _alert("s1", "X", "STOP_LOSS", 90),
+        _alert("d1", "X", "DAILY_CHANGE", 5),
+    ])
+
+    assert [a["id"] for a in index.crossed("X", 110)] == ["t1"]
+    assert [a["id"] for a in index.crossed("X", 90)] == ["s1"]
+    assert index.crossed("Y", 100) == []
+    assert [a["id"] for a in index.crossed("X", 100, change_pct=-5.2)] == ["d1"]
+    assert index.crossed("X", 100, change_pct=4.9) == []
+    assert index.count("X") == 4
+    assert abs(index.distance_pct("X", 100, change_pct=4.5) - 0.5) < 1e-9
+    assert index.distance_pct("X", 100) == 10.0
+    assert abs(index.distance_pct("X", 115) - 5 / 115 * 100) < 1e-9
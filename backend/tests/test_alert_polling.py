@@ -0,0 +1,117 @@
+"""거래소 캘린더 + 적응형 가격 알림 폴링 테스트."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.models.stock import StockQuote
+from app.services import alert_engine, alert_service, market_calendar
+from app.services.market_calendar import exchange_for, is_active, is_open
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+@pytest.fixture(autouse=True)
+def _reset_poll_state():
+    alert_service.reset_poll_state()
+    alert_engine.reset()
+    yield
+    alert_service.reset_poll_state()
+    alert_engine.reset()
+
+
+def test_exchange_by_suffix():
+    """접미사로 거래소를 판별한다."""
+    assert exchange_for("005930.KS") is market_calendar.KRX
+    assert exchange_for("247540.KQ") is market_calendar.KRX
+    assert exchange_for("NVDA") is market_calendar.US
+    assert exchange_for("BTC-USD") is market_calendar.CRYPTO
+    assert exchange_for("7203.T") is market_calendar.TSE
+
+
+def test_krx_and_us_sessions():
+    """KRX는 KST 정규장, 미국은 ET 정규장(서머타임 반영)과 휴장일을 따른다."""
+    krx, us = market_calendar.KRX, market_calendar.US
+    assert is_open(krx, datetime(2026, 10, 19, 10, 0, tzinfo=KST))
+    assert not is_open(krx, datetime(2026, 10, 19, 16, 0, tzinfo=KST))
+    assert not is_open(krx, datetime(2026, 10, 9, 10, 0, tzinfo=KST))  # 한글날
+    assert not is_open(krx, datetime(2026, 10, 18, 10, 0, tzinfo=KST))  # 일요일
+    # 2026-10-19 09:30 EDT = 22:30 KST
+    assert is_open(us, datetime(2026, 10, 19, 22, 30, tzinfo=KST))
+    assert not is_open(us, datetime(2026, 10, 19, 22, 29, tzinfo=KST))
+    assert not is_open(us, datetime(2026, 11, 26, 15, 0, tzinfo=timezone.utc))  # 추수감사절
+    # 조기 폐장 13:00 ET 이후 닫힘
+    assert not is_open(us, datetime(2026, 11, 27, 13, 30, tzinfo=ZoneInfo("America/New_York")))
+
+
+def test_post_close_grace():
+    """폐장 직후 grace 동안은 활성으로 본다."""
+    krx = market_calendar.KRX
+    grace = timedelta(minutes=20)
+    assert is_active(krx, datetime(2026, 10, 19, 15, 40, tzinfo=KST), grace)
+    assert not is_active(krx, datetime(2026, 10, 19, 15, 51, tzinfo=KST), grace)
+
+
+def _alert(ticker, trigger, alert_type="TARGET_PRICE"):
+    return {
+        "id": f"{ticker}-{trigger}", "user_id": "u1", "ticker": ticker,
+        "alert_type": alert_type, "trigger_price": trigger,
+    }
+
+
+def _run(mock_supabase, alerts, now, prices, force=False):
+    mock_supabase.table.return_value.execute.return_value.data = alerts
+    fetched: list[str] = []
+
+    def fetch(ticker, publish=True):
+        fetched.append(ticker)
+        return StockQuote(ticker=ticker, price=prices[ticker], fetched_at=now)
+
+    with (
+        patch.object(alert_service, "datetime", wraps=datetime) as dt,
+        patch.object(alert_service.stock_service, "fetch_quote", side_effect=fetch),
+    ):
+        dt.now.return_value = now
+        result = alert_service.check_price_alerts(mock_supabase, force=force)
+    return result, sorted(fetched)
+
+
+def test_only_open_markets_are_polled(mock_supabase):
+    """KRX 장중(KST 10시)에는 미국 티커를 조회하지 않는다."""
+    now = datetime(2026, 10, 19, 1, 0, tzinfo=timezone.utc)  # 10:00 KST
+    alerts = [_alert("005930.KS", 90000), _alert("NVDA", 300)]
+
+    result, fetched = _run(mock_supabase, alerts, now, {"005930.KS": 70000, "NVDA": 200})
+
+    assert fetched == ["005930.KS"]
+    assert result.checked_count == 1
+    assert result.skipped_count == 1
+
+
+def test_interval_tightens_near_trigger(mock_supabase):
+    """트리거에 가까운 티커(0.5% 이내)는 30초 뒤, 먼 티커는 15분 뒤에 다시 조회한다."""
+    now = datetime(2026, 10, 19, 1, 0, tzinfo=timezone.utc)
+    alerts = [_alert("005930.KS", 70300), _alert("000660.KS", 300000)]
+    prices = {"005930.KS": 70000, "000660.KS": 200000}
+
+    _, first = _run(mock_supabase, alerts, now, prices)
+    _, second = _run(mock_supabase, alerts, now + timedelta(seconds=30), prices)
+    _, later = _run(mock_supabase, alerts, now + timedelta(minutes=16), prices)
+
+    assert first == ["000660.KS", "005930.KS"]
+    assert second == ["005930.KS"]
+    assert later == ["000660.KS", "005930.KS"]
+
+
+def test_force_polls_closed_markets(mock_supabase):
+    """관리자 수동 체크는 장 시간과 무관하게 모두 조회한다."""
+    now = datetime(2026, 10, 18, 1, 0, tzinfo=timezone.utc)  # 일요일
+    alerts = [_alert("005930.KS", 60000, "STOP_LOSS")]
+
+    _, skipped = _run(mock_supabase, alerts, now, {"005930.KS": 70000})
+    _, forced = _run(mock_supabase, alerts, now, {"005930.KS": 70000}, force=True)
+
+    assert skipped == []
+    assert forced == ["005930.KS"]
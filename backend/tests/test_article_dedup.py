@@ -0,0 +1,76 @@
+"""수집 기사 중복 제거 테스트."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.sentiment import NewsArticle
+from app.services import article_dedup
+
+
+@pytest.fixture(autouse=True)
+def _reset_index():
+    article_dedup.reset_cache()
+    yield
+    article_dedup.reset_cache()
+
+
+def _article(title: str, link: str, source: str = "Test") -> NewsArticle:
+    return NewsArticle(title=title, link=link, source=source)
+
+
+def test_normalize_url_strips_tracking_and_case():
+    """추적 파라미터/www/fragment/끝 슬래시/쿼리 순서 차이는 같은 URL로 본다."""
+    a = article_dedup.normalize_url("http://www.Reuters.com/world/x/?utm_source=rss&b=2&a=1#top")
+    b = article_dedup.normalize_url("https://reuters.com/world/x?a=1&b=2")
+    assert a == b
+
+
+def test_normalize_title_ignores_source_suffix_and_punctuation():
+    """매체명 접미사와 구두점 차이는 같은 제목 지문으로 본다."""
+    assert article_dedup.title_hash("Fed holds rates steady - Reuters") == article_dedup.title_hash(
+        "Fed holds rates, steady!"
+    )
+
+
+def test_filter_new_skips_seen_and_in_run_duplicates(mock_supabase):
+    """DB 인덱스에 있는 기사와 같은 주기 내 중복 기사를 제외한다."""
+    seen = _article("Oil prices jump on OPEC cut", "https://a.com/oil")
+    table = mock_supabase.table.return_value
+    table.gte.return_value = table
+    table.execute.return_value = MagicMock(
+        data=[
+            {
+                "url_hash": article_dedup.url_hash(seen.link),
+                "title_hash": article_dedup.title_hash(seen.title),
+            }
+        ]
+    )
+    articles = [
+        _article("Oil prices jump on OPEC cut", "https://b.com/other-url"),  # 제목 중복
+        _article("Chip stocks rally after earnings", "https://a.com/chips?utm_medium=rss"),
+        _article("Chip stocks rally after earnings - BBC", "https://bbc.com/chips"),  # 주기 내 중복
+        _article("속보", "https://c.com/1"),
+        _article("속보", "https://c.com/2"),  # 짧은 제목은 URL로만 비교
+    ]
+
+    fresh, duplicates = article_dedup.filter_new(mock_supabase, articles)
+
+    assert [a.link for a in fresh] == [
+        "https://a.com/chips?utm_medium=rss",
+        "https://c.com/1",
+        "https://c.com/2",
+    ]
+    assert duplicates == 2
+
+
+def test_mark_seen_updates_memory_index(mock_supabase):
+    """mark_seen 이후 같은 기사는 DB 재조회 없이 중복 처리된다."""
+    article = _article("Won weakens past 1,400 per dollar", "https://k.com/fx")
+    article_dedup.filter_new(mock_supabase, [])
+    article_dedup.mark_seen(mock_supabase, [article])
+
+    fresh, duplicates = article_dedup.filter_new(mock_supabase, [article])
+    assert fresh == []
+    assert duplicates == 1
+    mock_supabase.table.return_value.upsert.assert_called_once()
@@ -0,0 +1,59 @@
+"""AI Q&A 스트리밍 엔드포인트 테스트."""
+
+import json
+
+from app.config import settings
+from app.services import llm_client
+
+
+def _parse_sse(text: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_ask_stream_emits_tokens_then_done(client, mock_supabase, monkeypatch):
+    """토큰 이벤트를 먼저 보내고, 완료 후 딥링크 포함 done 이벤트와 대화 저장."""
+
+    async def fake_stream(model, messages, **kwargs):
+        for delta in ["VIX는 ", "현재 ", "낮습니다."]:
+            yield delta
+
+    monkeypatch.setattr(settings, "openrouter_api_key", "test-key")
+    monkeypatch.setattr(llm_client, "astream_completion", fake_stream)
+
+    res = client.post("/api/ask/stream", json={"question": "지금 VIX가 높은가요?"})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_sse(res.text)
+    assert [e for e, _ in events] == ["token", "token", "token", "done"]
+    done = events[-1][1]
+    assert done["answer"] == "VIX는 현재 낮습니다."
+    assert {"label": "공포/탐욕 지수", "url": "/fear-greed"} in done["deeplinks"]
+
+    inserted = [
+        call.args[0]
+        for call in mock_supabase.table.return_value.insert.call_args_list
+        if isinstance(call.args[0], dict) and "question" in call.args[0]
+    ]
+    assert inserted and inserted[-1]["answer"] == "VIX는 현재 낮습니다."
+
+
+def test_ask_stream_appends_fallback_on_error(client, monkeypatch):
+    """스트림 도중 오류가 나면 부분 답변 뒤에 안내 문구를 붙여 완료한다."""
+
+    async def broken_stream(model, messages, **kwargs):
+        yield "부분 답변"
+        raise RuntimeError("upstream closed")
+
+    monkeypatch.setattr(settings, "openrouter_api_key", "test-key")
+    monkeypatch.setattr(llm_client, "astream_completion", broken_stream)
+
+    res = client.post("/api/ask/stream", json={"question": "코스피 전망은?"})
+    events = _parse_sse(res.text)
+    done = events[-1][1]
+    assert done["answer"].startswith("부분 답변")
+    assert "일시적으로" in done["answer"]
@@ -0,0 +1,88 @@
+"""RSS 공용 수집 레이어(feed_fetcher) 테스트."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services import feed_fetcher
+
+RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>{title}</title><link>https://example.com/{slug}</link></item>
+</channel></rss>"""
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    feed_fetcher.clear_cache()
+    yield
+    feed_fetcher.clear_cache()
+
+
+def _use_transport(monkeypatch, handler):
+    """feed_fetcher가 만드는 AsyncClient에 MockTransport를 주입한다."""
+    original = httpx.AsyncClient
+
+    def factory(**kwargs):
+        return original(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(feed_fetcher.httpx, "AsyncClient", factory)
+
+
+def test_conditional_get_reuses_entries_on_304(monkeypatch):
+    """캐시 만료 후 ETag로 재요청하고, 304면 이전 파싱 결과를 돌려준다."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=RSS.format(title="Fed holds rates", slug="a"), headers={"ETag": '"v1"'})
+
+    _use_transport(monkeypatch, handler)
+    feeds = {"A": "https://feeds.example.com/a.xml"}
+
+    first = feed_fetcher.fetch_feeds(feeds)
+    assert [e["title"] for e in first["A"]] == ["Fed holds rates"]
+
+    # TTL 안에서는 네트워크 요청 없이 캐시를 읽는다
+    feed_fetcher.fetch_feeds(feeds)
+    assert len(requests) == 1
+
+    monkeypatch.setattr(feed_fetcher, "FEED_CACHE_TTL", 0)
+    again = feed_fetcher.fetch_feeds(feeds)
+    assert len(requests) == 2
+    assert requests[1].headers["if-none-match"] == '"v1"'
+    assert [e["title"] for e in again["A"]] == ["Fed holds rates"]
+
+
+def test_slow_or_failing_feed_does_not_block_others(monkeypatch):
+    """느린 피드는 타임아웃으로 빈 목록이 되고, 나머지 피드는 동시에 수집된다."""
+    monkeypatch.setattr(feed_fetcher, "FEED_TIMEOUT", 0.2)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/slow.xml":
+            await asyncio.sleep(5)
+        if request.url.path == "/broken.xml":
+            return httpx.Response(500)
+        slug = request.url.path.strip("/").removesuffix(".xml")
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, text=RSS.format(title=f"Title {slug}", slug=slug))
+
+    _use_transport(monkeypatch, handler)
+    feeds = {
+        "Slow": "https://feeds.example.com/slow.xml",
+        "Broken": "https://feeds.example.com/broken.xml",
+        **{f"F{i}": f"https://feeds.example.com/f{i}.xml" for i in range(5)},
+    }
+
+    started = time.perf_counter()
+    result = feed_fetcher.fetch_feeds(feeds)
+    elapsed = time.perf_counter() - started
+
+    assert result["Slow"] == []
+    assert result["Broken"] == []
+    assert all(len(result[f"F{i}"]) == 1 for i in range(5))
+    assert elapsed < 1.5
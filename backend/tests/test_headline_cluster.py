@@ -0,0 +1,81 @@
+"""헤드라인 근접 중복 클러스터링 테스트."""
+
+import pytest
+
+from app.config import settings
+from app.models.sentiment import NewsArticle
+from app.services import headline_cluster, sentiment_service
+
+
+@pytest.fixture(autouse=True)
+def _reset_history():
+    headline_cluster.reset_history()
+    yield
+    headline_cluster.reset_history()
+
+
+TITLES = [
+    "Israel strikes Gaza hospital, killing 20 - Reuters",
+    "Oil prices jump on OPEC cut",
+    "Israel strikes Gaza hospital, killing 20 people",
+    "Fed holds interest rates steady, signals cuts later this year",
+    "Fed holds interest rates steady and signals cuts later this year - BBC",
+    "삼성전자, 2분기 영업이익 10조 돌파",
+]
+
+
+def test_cluster_groups_near_duplicates():
+    """다른 매체의 유사 제목은 묶고, 무관한 제목은 분리한다. 대표는 가장 앞 인덱스."""
+    clusters = headline_cluster.cluster(TITLES)
+    assert clusters == [[0, 2], [1], [3, 4], [5]]
+
+
+OPPOSITE_PAIRS = [
+    ("Samsung shares rise 3% on chip demand", "Samsung shares fall 3% on chip demand"),
+    ("Fed raises interest rates by 25bp", "Fed cuts interest rates by 25bp"),
+    ("삼성전자 주가 3% 상승 마감", "삼성전자 주가 3% 하락 마감"),
+    ("Oil output cut by 500,000 barrels", "Oil output cut by 1,000,000 barrels"),
+]
+
+
+@pytest.mark.parametrize("a, b", OPPOSITE_PAIRS)
+def test_opposite_headlines_never_merge(a, b):
+    """방향어나 숫자가 다른 제목은 묶지 않고, 이력 결과도 재사용하지 않는다."""
+    assert headline_cluster.cluster([a, b]) == [[0], [1]]
+    headline_cluster.remember("sentiment", a, {"direction": "BULLISH"})
+    assert headline_cluster.recall("sentiment", b) is None
+
+
+def test_recall_matches_recent_history():
+    """최근 이력의 근접 중복 제목은 저장된 결과를 돌려준다."""
+    headline_cluster.remember("ns", TITLES[3], {"direction": "BULLISH"})
+    assert headline_cluster.recall("ns", TITLES[4]) == {"direction": "BULLISH"}
+    assert headline_cluster.recall("ns", TITLES[1]) is None
+    assert headline_cluster.recall("other", TITLES[4]) is None
+
+
+def test_sentiment_analyzes_only_representatives(monkeypatch):
+    """대표 기사만 LLM 분석하고 결과/클러스터 크기를 나머지에 전파한다."""
+    sent: list[str] = []
+
+    def fake_request(articles, model):
+        sent.extend(a.title for a in articles)
+        return [{"direction": "BEARISH", "score": -0.4} for _ in articles]
+
+    monkeypatch.setattr(settings, "openrouter_api_key", "test-key")
+    monkeypatch.setattr(sentiment_service, "_request_scores", fake_request)
+    articles = [
+        NewsArticle(title=t, link=f"https://x/{i}", source="Test") for i, t in enumerate(TITLES)
+    ]
+
+    analyses = sentiment_service._analyze_clustered(articles, "m")
+
+    assert sent == [TITLES[0], TITLES[1], TITLES[3], TITLES[5]]
+    assert [a["cluster_size"] for a in analyses] == [2, 1, 2, 2, 2, 1]
+    assert all(a["direction"] == "BEARISH" for a in analyses)
+
+    # 다음 실행: 이력과 근접 중복인 대표는 재분석하지 않는다
+    sent.clear()
+    again = [NewsArticle(title=TITLES[2], link="https://y/1", source="Test")]
+    assert sentiment_service._analyze_clustered(again, "m")[0]["direction"] == "BEARISH"
+    assert sent == []
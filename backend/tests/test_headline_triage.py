@@ -0,0 +1,76 @@
+"""헤드라인 로컬 사전 분류 테스트."""
+
+from unittest.mock import patch
+
+from app.config import settings
+from app.models.sentiment import NewsArticle
+from app.services import headline_triage, sentiment_service
+
+
+def test_triage_scores_relevance_and_direction():
+    """시장 용어/카테고리 키워드가 있으면 관련성이 높고, 방향 용어로 잠정 방향을 정한다."""
+    market = headline_triage.triage("Samsung shares surge on record profit", {"TECH_INDUSTRY": 1})
+    assert market.relevance >= 0.8
+    assert market.direction == "BULLISH"
+    assert 0 < market.score <= headline_triage.LOCAL_SCORE_SCALE
+
+    trivia = headline_triage.triage("Local bakery wins pie contest", {})
+    assert trivia.relevance == 0.0
+    assert trivia.direction == "NEUTRAL"
+
+    korean = headline_triage.triage("코스피 급락, 외국인 매도 우려", {"MACRO_FINANCE": 1})
+    assert korean.direction == "BEARISH"
+
+
+def test_collect_sends_only_relevant_headlines_to_llm(mock_supabase, monkeypatch):
+    """관련성 임계값 미만 기사는 LOCAL로 저장되고 LLM 호출 대상에서 빠진다."""
+    articles = [
+        NewsArticle(title="Fed signals rate cut as inflation cools", link="https://x/1", source="T"),
+        NewsArticle(title="Celebrity chef opens new restaurant", link="https://x/2", source="T"),
+    ]
+    sent: list[str] = []
+
+    def fake_clustered(batch, model):
+        sent.extend(a.title for a in batch)
+        return [{"direction": "BULLISH", "score": 0.6} for _ in batch]
+
+    monkeypatch.setattr(settings, "sentiment_triage_threshold", 0.3)
+    monkeypatch.setattr(sentiment_service, "collect_news", lambda: articles)
+    monkeypatch.setattr(sentiment_service, "_analyze_clustered", fake_clustered)
+    with (
+        patch.object(sentiment_service.article_dedup, "filter_new", return_value=(articles, 0)),
+        patch.object(sentiment_service.article_dedup, "mark_seen"),
+        patch.object(sentiment_service.article_dedup, "prune"),
+    ):
+        mock_supabase.table.return_value.execute.return_value.data = [{}, {}]
+        result = sentiment_service.collect_and_analyze(mock_supabase)
+
+    assert sent == ["Fed signals rate cut as inflation cools"]
+    assert result.articles_local == 1
+
+    rows = mock_supabase.table.return_value.insert.call_args.args[0]
+    assert [r["analysis_source"] for r in rows] == ["LLM", "LOCAL"]
+    assert rows[1]["confidence"] == headline_triage.LOCAL_CONFIDENCE
+
+
+def test_local_results_are_neutral_and_kept_out_of_index(mock_supabase, monkeypatch):
+    """관련성 미달 헤드라인은 방향 용어가 있어도 NEUTRAL/0으로 저장하고 감성 지수에 넣지 않는다."""
+    title = "Local bakery sales surge after festival"
+    result = headline_triage.triage(title, sentiment_service.match_categories(title))
+    assert result.direction == "BULLISH"  # 잠정 방향은 계산되지만
+
+    articles = [NewsArticle(title=title, link="https://x/3", source="T")]
+    monkeypatch.setattr(settings, "sentiment_triage_threshold", 0.5)
+    monkeypatch.setattr(sentiment_service, "collect_news", lambda: articles)
+    with (
+        patch.object(sentiment_service.article_dedup, "filter_new", return_value=(articles, 0)),
+        patch.object(sentiment_service.article_dedup, "mark_seen"),
+        patch.object(sentiment_service.article_dedup, "prune"),
+        patch.object(sentiment_service.sentiment_index, "_load_states") as load_states,
+    ):
+        mock_supabase.table.return_value.execute.return_value.data = [{}]
+        sentiment_service.collect_and_analyze(mock_supabase)
+
+    row = mock_supabase.table.return_value.insert.call_args.args[0][0]
+    assert (row["analysis_source"], row["direction"], row["score"]) == ("LOCAL", "NEUTRAL", 0.0)
+    load_states.assert_not_called()  # LOCAL만 있는 배치는 지수를 갱신하지 않는다
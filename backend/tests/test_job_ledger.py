@@ -0,0 +1,89 @@
+"""스케줄 작업 실행 원장 테스트."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import job_ledger
+
+
+def test_run_tracked_records_counts_and_details():
+    """성공 실행은 items/failed를 건수 컬럼에, 나머지 키를 details에 기록한다."""
+    client = MagicMock()
+
+    output = job_ledger.run_tracked(lambda: client, "etf_sync", lambda: {"items": 12, "failed": 1, "updated": True})
+
+    assert output == {"items": 12, "failed": 1, "updated": True}
+    client.table.assert_called_with("job_runs")
+    row = client.table.return_value.insert.call_args.args[0]
+    assert row["job_id"] == "etf_sync"
+    assert row["status"] == "success"
+    assert row["items_processed"] == 12
+    assert row["items_failed"] == 1
+    assert row["details"] == {"updated": True}
+    assert row["duration_ms"] >= 0
+    assert row["finished_at"] >= row["started_at"]
+
+
+def test_run_tracked_records_failure_and_reraises():
+    """실패 실행은 오류와 함께 기록하고 예외를 다시 던진다."""
+    client = MagicMock()
+
+    def boom():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        job_ledger.run_tracked(lambda: client, "weekly_report", boom)
+
+    row = client.table.return_value.insert.call_args.args[0]
+    assert row["status"] == "failed"
+    assert row["error"] == "upstream down"
+    assert row["items_processed"] is None
+
+
+def test_ledger_write_failure_does_not_break_job():
+    """원장 기록이 실패해도 작업 결과는 그대로 반환된다."""
+    client = MagicMock()
+    client.table.return_value.insert.return_value.execute.side_effect = RuntimeError("db down")
+
+    assert job_ledger.run_tracked(lambda: client, "etf_sync", lambda: 7) == 7
+
+
+def test_job_stats_endpoint_reports_p95(admin_client, mock_supabase):
+    """관리자 통계 API는 작업별 실행 수/실패 수/p95 소요 시간을 반환한다."""
+    table = mock_supabase.table.return_value
+    table.gte.return_value = table
+    rows = [
+        {"job_id": "market_refresh", "status": "success", "duration_ms": d * 1000,
+         "started_at": f"2026-10-{19 - i:02d}T07:00:00+00:00", "items_processed": 5}
+        for i, d in enumerate([10, 20, 30, 40, 50, 60, 70, 80, 90, 100])
+    ]
+    rows.append({"job_id": "price_alert_check", "status": "failed", "duration_ms": 500,
+                 "started_at": "2026-10-19T08:00:00+00:00", "items_processed": None})
+    table.execute.return_value.data = rows
+
+    res = admin_client.get("/api/admin/jobs/stats?days=7")
+
+    assert res.status_code == 200
+    jobs = res.json()["jobs"]
+    refresh = jobs["market_refresh"]
+    assert refresh["runs"] == 10
+    assert refresh["p50_duration_ms"] == 50000.0
+    assert refresh["p95_duration_ms"] == 100000.0
+    assert refresh["items_processed"] == 50
+    assert refresh["last_started_at"] == "2026-10-19T07:00:00+00:00"
+    assert jobs["price_alert_check"]["failures"] == 1
+    assert jobs["price_alert_check"]["last_status"] == "failed"
+
+
+@pytest.mark.parametrize(("platform", "maxrss", "expected"), [("linux", 204800, 200.0), ("darwin", 209715200, 200.0)])
+def test_peak_rss_unit_follows_platform(monkeypatch, platform, maxrss, expected):
+    """ru_maxrss는 Linux에서 KB, macOS에서 byte — 값 크기가 아니라 플랫폼으로 단위를 정한다."""
+    if job_ledger.resource is None:
+        pytest.skip("resource module unavailable")
+    monkeypatch.setattr(job_ledger.sys, "platform", platform)
+    monkeypatch.setattr(
+        job_ledger.resource, "getrusage", lambda who: MagicMock(ru_maxrss=maxrss)
+    )
+
+    assert job_ledger.peak_rss_mb() == expected
@@ -0,0 +1,68 @@
+"""작업 즉시 실행 요청 큐 테스트."""
+
+from datetime import timezone
+from unittest.mock import MagicMock, patch
+
+from app.scheduler import jobs
+
+
+def test_run_job_enqueues_request(admin_client, mock_supabase):
+    """관리자 즉시 실행 요청은 job_requests에 pending으로 들어간다."""
+    mock_supabase.table.return_value.execute.return_value.data = [
+        {"id": 7, "job_id": "etf_sync", "requested_by": "admin-1",
+         "requested_at": "2026-10-19T07:00:00+00:00", "status": "pending"}
+    ]
+
+    res = admin_client.post("/api/admin/jobs/etf_sync/run")
+
+    assert res.status_code == 202
+    assert res.json()["id"] == 7
+    inserted = [c.args[0] for c in mock_supabase.table.return_value.insert.call_args_list]
+    request = next(row for row in inserted if row.get("job_id") == "etf_sync")
+    assert request["status"] == "pending"
+
+
+def test_run_job_rejects_unknown_job(admin_client):
+    """등록되지 않은 작업은 404."""
+    assert admin_client.post("/api/admin/jobs/rm_rf/run").status_code == 404
+
+
+def test_dispatch_triggers_scheduled_job_now():
+    """워커는 요청을 꺼내 해당 작업의 다음 실행 시각을 지금으로 당기고, 모르는 작업은 거절한다."""
+    client = MagicMock()
+    fake_scheduler = MagicMock(timezone=timezone.utc)
+    fake_scheduler.get_job.side_effect = lambda job_id: object() if job_id == "market_refresh" else None
+    claimed = [{"id": 1, "job_id": "market_refresh"}, {"id": 2, "job_id": "unknown"}]
+
+    with (
+        patch.object(jobs, "get_supabase", return_value=client),
+        patch.object(jobs, "scheduler", fake_scheduler),
+        patch.object(jobs.job_queue, "claim", return_value=claimed),
+        patch.object(jobs.job_queue, "mark") as mark,
+    ):
+        jobs._dispatch_job_requests()
+
+    assert fake_scheduler.modify_job.call_args.args == ("market_refresh",)
+    assert "next_run_time" in fake_scheduler.modify_job.call_args.kwargs
+    assert [c.args[1:3] for c in mark.call_args_list] == [(1, "dispatched"), (2, "rejected")]
+
+
+def test_dispatch_rejects_request_for_running_job():
+    """이미 실행 중인 작업은 스케줄러가 건너뛰므로 dispatched가 아니라 rejected로 기록한다."""
+    fake_scheduler = MagicMock(timezone=timezone.utc)
+    fake_scheduler.get_job.return_value = object()
+    jobs._running_jobs.add("market_refresh")
+
+    try:
+        with (
+            patch.object(jobs, "get_supabase", return_value=MagicMock()),
+            patch.object(jobs, "scheduler", fake_scheduler),
+            patch.object(jobs.job_queue, "claim", return_value=[{"id": 3, "job_id": "market_refresh"}]),
+            patch.object(jobs.job_queue, "mark") as mark,
+        ):
+            jobs._dispatch_job_requests()
+    finally:
+        jobs._running_jobs.discard("market_refresh")
+
+    fake_scheduler.modify_job.assert_not_called()
+    assert mark.call_args.args[1:] == (3, "rejected", "already running")
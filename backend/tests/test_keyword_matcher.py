@@ -0,0 +1,59 @@
+"""다중 키워드 매처(Aho–Corasick) 및 카테고리 분류 테스트."""
+
+from app.models.sentiment import NewsCategoryConfig
+from app.services import ask_service, sentiment_service
+from app.services.keyword_matcher import KeywordMatcher
+
+
+def test_match_counts_every_label_in_one_pass():
+    """겹치는 키워드(he/she/hers)까지 모든 라벨과 적중 횟수를 반환한다."""
+    matcher = KeywordMatcher({"a": ["he", "hers"], "b": ["she"], "c": ["xyz"]})
+    assert matcher.match("ushers") == {}  # 모두 단어 중간이라 제외
+    assert matcher.match("she hers he") == {"a": 3, "b": 1}
+    assert matcher.best("nothing to see") is None
+
+
+def test_ascii_keywords_require_word_start_korean_do_not():
+    """영문 키워드는 단어 시작에서만(접미 허용), 한글은 조사가 붙어도 매칭한다."""
+    matcher = KeywordMatcher({"tech": ["AI"], "trade": ["tariff", "관세"]})
+    assert matcher.match("He said nothing") == {}
+    assert matcher.match("New AI tariffs") == {"trade": 1, "tech": 1}
+    assert matcher.match("미국의 관세를 인상") == {"trade": 1}
+
+
+def test_whole_word_option_also_checks_word_end():
+    """whole_word=True면 영문 키워드는 단어 끝에서도 끊겨야 하고, 한글은 그대로 부분 매칭한다."""
+    matcher = KeywordMatcher({"INTC": ["Intel", "인텔"]}, whole_word=True)
+    assert matcher.match("intelligence report") == {}
+    assert matcher.match("Intel's results, 인텔은 반등") == {"INTC": 2}
+
+
+def test_short_ascii_keywords_need_word_end():
+    """짧은 영문 약어는 단어 끝에서도 끊겨야 한다 ("AI" ≠ "aid"/"airline"), 복수형 s만 허용."""
+    matcher = KeywordMatcher({"tech": ["AI", "ETF"], "trade": ["tariff"]}, short_word_chars=3)
+    assert matcher.match("Foreign aid for airline workers") == {}
+    assert matcher.match("AI chips and new ETFs, tariffs") == {"tech": 2, "trade": 1}
+    assert sentiment_service.match_categories("Foreign aid package approved for airline workers") == {}
+
+
+def test_classify_category_prefers_most_hits_and_refreshes():
+    """적중 횟수가 많은 카테고리를 고르고, news_categories 키워드 변경 시 재컴파일한다."""
+    title = "Trump meets Putin at summit as oil prices swing"
+    assert sentiment_service.match_categories(title)["INTL_POLITICS"] == 3
+    assert sentiment_service._classify_category(title) == "INTL_POLITICS"
+
+    original = sentiment_service._category_matcher
+    try:
+        sentiment_service._sync_category_matcher(
+            [NewsCategoryConfig(category_key="CUSTOM", display_name="c", keywords=["summit"])]
+        )
+        assert sentiment_service._classify_category(title) == "CUSTOM"
+    finally:
+        sentiment_service._category_matcher = original
+        sentiment_service._category_fingerprint = None
+
+
+def test_ask_deeplinks_dedupe_by_url_in_definition_order():
+    """딥링크는 URL별 1회, DEEPLINK_KEYWORDS 정의 순서로 반환한다."""
+    links = ask_service._extract_deeplinks("전쟁과 금리, 공포 지수", "무역 분쟁도 VIX에 영향")
+    assert [link["url"] for link in links] == ["/macro", "/fear-greed", "/geo"]
@@ -0,0 +1,53 @@
+"""LLM 응답 영속 캐시 단위 테스트."""
+
+from app.config import settings
+from app.services import llm_cache
+
+
+def test_make_key_is_order_independent_and_sensitive_to_temperature():
+    """키는 dict 순서와 무관하고 temperature가 다르면 달라진다."""
+    a = llm_cache.make_key("m", [{"role": "user", "content": "hi"}], 0.1)
+    b = llm_cache.make_key("m", [{"content": "hi", "role": "user"}], 0.1)
+    c = llm_cache.make_key("m", [{"role": "user", "content": "hi"}], 0.3)
+    assert a == b
+    assert a != c
+
+
+def test_put_get_respects_ttl(monkeypatch):
+    """TTL이 지난 항목과 TTL 0 기능은 조회되지 않는다."""
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+
+    llm_cache.put("k1", "geo", "m", "hello")
+    llm_cache.put("k2", "ask", "m", "never stored")
+    assert llm_cache.get("k1") == "hello"
+    assert llm_cache.get("k2") is None
+
+    now[0] += llm_cache.ttl_for("geo") + 1
+    assert llm_cache.get("k1") is None
+
+
+def test_evict_removes_least_recently_used(monkeypatch):
+    """용량 상한을 넘으면 최근에 사용되지 않은 항목부터 삭제한다."""
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+    monkeypatch.setattr(settings, "llm_cache_max_mb", 1)
+    blob = "x" * (400 * 1024)
+
+    for key in ("a", "b", "c"):
+        llm_cache.put(key, "sentiment", "m", blob)
+        now[0] += 1
+    llm_cache.get("a")  # a를 최근 사용으로 갱신
+
+    llm_cache.evict()
+    assert llm_cache.get("b") is None
+    assert llm_cache.get("a") == blob
+    assert llm_cache.get("c") == blob
+
+
+def test_admin_llm_metrics_includes_cache(admin_client):
+    """관리자 메트릭 응답에 캐시 통계가 포함된다."""
+    llm_cache.put("k", "geo", "m", "cached")
+    res = admin_client.get("/api/admin/llm/metrics")
+    assert res.status_code == 200
+    assert res.json()["cache"]["entries"] == 1
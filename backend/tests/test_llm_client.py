@@ -0,0 +1,237 @@
+"""공용 LLM 클라이언트 단위 테스트."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from app.services import llm_client
+
+
+@pytest.fixture()
+def mock_openrouter(monkeypatch):
+    """MockTransport 기반 OpenRouter 응답 큐를 주입한다."""
+    responses: list[httpx.Response] = []
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    monkeypatch.setattr(llm_client, "BACKOFF_BASE", 0.0)
+    loop = llm_client._get_loop()
+
+    async def _swap():
+        await llm_client._http.aclose()
+        llm_client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    asyncio.run_coroutine_threadsafe(_swap(), loop).result()
+    yield responses, requests
+    llm_client.shutdown()
+
+
+def _ok(content: str, **usage) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "model": "test/model",
+            "choices": [{"message": {"content": content}}],
+            "usage": usage,
+        },
+    )
+
+
+def test_parse_json_content_strips_code_fence():
+    """```json 코드 블록으로 감싼 응답도 파싱한다."""
+    assert llm_client.parse_json_content('```json\n{"a": 1}\n```') == {"a": 1}
+    assert llm_client.parse_json_content(' [1, 2] ') == [1, 2]
+
+
+def test_chat_json_retries_on_429(mock_openrouter):
+    """429/5xx는 재시도 후 성공 응답을 반환하고 메트릭을 기록한다."""
+    responses, requests = mock_openrouter
+    responses += [
+        httpx.Response(429),
+        httpx.Response(503),
+        _ok('{"ok": true}', prompt_tokens=10, completion_tokens=5, cost=0.001),
+    ]
+
+    result = llm_client.chat_json(
+        "test/model", llm_client.user_prompt("hi"), feature="test_retry"
+    )
+
+    assert result == {"ok": True}
+    assert len(requests) == 3
+    metrics = llm_client.get_metrics()["test_retry"]
+    assert metrics["calls"] == 1
+    assert metrics["retries"] == 2
+    assert metrics["prompt_tokens"] == 10
+    assert metrics["completion_tokens"] == 5
+
+
+def test_chat_completion_does_not_retry_client_error(mock_openrouter):
+    """4xx(429 제외)는 재시도하지 않고 즉시 예외를 던진다."""
+    responses, requests = mock_openrouter
+    responses.append(httpx.Response(400))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        llm_client.chat_completion(
+            "test/model", llm_client.user_prompt("hi"), feature="test_400"
+        )
+    assert len(requests) == 1
+    assert llm_client.get_metrics()["test_400"]["errors"] == 1
+
+
+def test_achat_completion_from_other_loop(mock_openrouter):
+    """다른 이벤트 루프에서 호출해도 공용 루프/풀을 사용한다."""
+    responses, _ = mock_openrouter
+    responses.append(_ok("안녕하세요"))
+
+    result = asyncio.run(
+        llm_client.achat_completion(
+            "test/model", llm_client.user_prompt("hi"), feature="test_async"
+        )
+    )
+    assert result.content == "안녕하세요"
+    assert result.attempts == 1
+
+
+def test_chat_json_served_from_cache(mock_openrouter):
+    """동일 요청은 두 번째부터 캐시로 응답하고, cache=False면 우회한다."""
+    responses, requests = mock_openrouter
+    responses += [_ok('{"v": 1}'), _ok('{"v": 2}')]
+    messages = llm_client.user_prompt("same prompt")
+
+    first = llm_client.chat_json("test/model", messages, feature="sentiment")
+    second = llm_client.chat_json("test/model", messages, feature="sentiment")
+    bypass = llm_client.chat_json("test/model", messages, feature="sentiment", cache=False)
+
+    assert first == second == {"v": 1}
+    assert bypass == {"v": 2}
+    assert len(requests) == 2
+    metrics = llm_client.get_metrics()["sentiment"]
+    assert metrics["cache_hits"] >= 1
+
+
+def test_invalid_json_is_not_cached(mock_openrouter):
+    """파싱 실패한 응답은 캐시하지 않아 재시도 시 다시 호출한다."""
+    responses, requests = mock_openrouter
+    responses += [_ok("not json"), _ok('{"ok": true}')]
+    messages = llm_client.user_prompt("flaky")
+
+    try:
+        llm_client.chat_json("test/model", messages, feature="guide")
+    except ValueError:
+        pass
+    assert llm_client.chat_json("test/model", messages, feature="guide") == {"ok": True}
+    assert len(requests) == 2
+
+
+def test_astream_completion_yields_deltas(mock_openrouter):
+    """SSE 스트림의 delta를 순서대로 전달하고 사용량을 기록한다."""
+    responses, requests = mock_openrouter
+    body = (
+        ": OPENROUTER PROCESSING\n\n"
+        'data: {"choices": [{"delta": {"content": "안녕"}}]}\n\n'
+        'data: {"choices": [{"delta": {"content": "하세요"}}]}\n\n'
+        'data: {"choices": [], "usage": {"prompt_tokens": 3, "completion_tokens": 2}}\n\n'
+        "data: [DONE]\n\n"
+    )
+    responses += [
+        httpx.Response(503),
+        httpx.Response(200, text=body, headers={"content-type": "text/event-stream"}),
+    ]
+
+    async def collect():
+        return [
+            delta
+            async for delta in llm_client.astream_completion(
+                "test/model", llm_client.user_prompt("hi"), feature="test_stream"
+            )
+        ]
+
+    assert asyncio.run(collect()) == ["안녕", "하세요"]
+    assert len(requests) == 2
+    assert b'"stream":true' in requests[-1].content.replace(b" ", b"")
+    metrics = llm_client.get_metrics()["test_stream"]
+    assert metrics["retries"] == 1
+    assert metrics["completion_tokens"] == 2
+
+
+@pytest.fixture()
+def model_router(monkeypatch):
+    """모델별 지연/응답을 지정할 수 있는 비동기 MockTransport를 주입한다."""
+    behaviors: dict[str, tuple[float, str]] = {}
+    called: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        called.append(model)
+        delay, content = behaviors[model]
+        await asyncio.sleep(delay)
+        return _ok(content)
+
+    loop = llm_client._get_loop()
+
+    async def _swap():
+        await llm_client._http.aclose()
+        llm_client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    asyncio.run_coroutine_threadsafe(_swap(), loop).result()
+    yield behaviors, called
+    llm_client.shutdown()
+
+
+def test_chat_json_hedged_slow_primary_loses(model_router):
+    """1순위가 지연 예산을 넘기면 다음 모델에 헤지하고 먼저 온 응답을 채택한다."""
+    behaviors, called = model_router
+    behaviors["slow/model"] = (1.0, '{"from": "slow"}')
+    behaviors["fast/model"] = (0.0, '{"from": "fast"}')
+    chain = llm_client.ModelChain(models=["slow/model", "fast/model"], hedge_after_ms=50)
+
+    result = llm_client.chat_json_hedged(
+        chain, llm_client.user_prompt("hedge"), feature="test_hedge"
+    )
+
+    assert result == {"from": "fast"}
+    assert called == ["slow/model", "fast/model"]
+    metrics = llm_client.get_metrics()["test_hedge"]
+    assert metrics["hedges"] == 1
+    assert metrics["fallback_wins"] == 1
+    assert llm_client.get_model_metrics()["fast/model"]["calls"] >= 1
+
+
+def test_chat_json_hedged_invalid_json_falls_through(model_router):
+    """1순위 응답이 유효 JSON이 아니면 예산을 기다리지 않고 다음 모델을 호출한다."""
+    behaviors, called = model_router
+    behaviors["broken/model"] = (0.0, "sorry, no json")
+    behaviors["good/model"] = (0.0, '[1, 2]')
+    chain = llm_client.ModelChain(models=["broken/model", "good/model"], hedge_after_ms=60_000)
+
+    result = llm_client.chat_json_hedged(
+        chain, llm_client.user_prompt("fallthrough"), feature="test_fallthrough"
+    )
+    assert result == [1, 2]
+    assert called == ["broken/model", "good/model"]
+
+
+def test_get_model_chain_orders_and_dedupes(mock_supabase):
+    """primary → fallback_model → fallback_models 순서로 중복 없이 체인을 만든다."""
+    llm_client.invalidate_model_chains()
+    mock_supabase.table.return_value.execute.return_value = MagicMock(
+        data=[
+            {
+                "primary_model": "a/model",
+                "fallback_model": "b/model",
+                "fallback_models": ["b/model", "c/model"],
+                "hedge_after_ms": 1500,
+            }
+        ]
+    )
+
+    chain = llm_client.get_model_chain(mock_supabase, "TEST_KEY", "default/model")
+    assert chain.models == ["a/model", "b/model", "c/model"]
+    assert chain.hedge_after_ms == 1500
+    llm_client.invalidate_model_chains()
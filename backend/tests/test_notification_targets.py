@@ -0,0 +1,87 @@
+"""알림 수신 대상 캐시 테스트."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services import notification_targets, telegram_service
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    notification_targets.invalidate()
+    yield
+    notification_targets.invalidate()
+
+
+def _targets(mock_supabase, rows, version="2:2026-10-19"):
+    mock_supabase.table.return_value.execute.return_value.data = rows
+    mock_supabase.rpc.return_value.execute.return_value.data = version
+
+
+ROWS = [
+    {"user_id": "u1", "telegram_chat_id": "100"},
+    {"user_id": "u2", "telegram_chat_id": "200"},
+    {"user_id": "u3", "telegram_chat_id": None},
+]
+
+
+def test_batch_resolved_with_one_bulk_load(mock_supabase):
+    """여러 사용자·여러 번 조회해도 테이블은 한 번만 읽는다."""
+    _targets(mock_supabase, ROWS)
+
+    first = notification_targets.resolve(mock_supabase, ["u1", "u2", "u3", "u1"])
+    second = notification_targets.resolve(mock_supabase, ["u2"])
+
+    assert first == {"u1": ["100"], "u2": ["200"]}
+    assert second == {"u2": ["200"]}
+    assert notification_targets.active_chat_ids(mock_supabase) == ["100", "200"]
+    assert notification_targets.user_for_chat(mock_supabase, "200") == "u2"
+    assert mock_supabase.table.call_count == 1
+
+
+def test_reloads_when_version_changes(mock_supabase, monkeypatch):
+    """버전 확인 주기마다 버전이 바뀌었으면 다시 적재하고, 같으면 캐시를 쓴다."""
+    monkeypatch.setattr(notification_targets, "VERSION_CHECK_SECONDS", 0)
+    _targets(mock_supabase, ROWS)
+    notification_targets.resolve(mock_supabase, ["u1"])
+
+    notification_targets.resolve(mock_supabase, ["u1"])
+    assert mock_supabase.table.call_count == 1
+
+    _targets(mock_supabase, [{"user_id": "u1", "telegram_chat_id": "101"}], version="1:2026-10-20")
+    assert notification_targets.resolve(mock_supabase, ["u1", "u2"]) == {"u1": ["101"]}
+    assert mock_supabase.table.call_count == 2
+
+
+def test_user_with_several_active_chats_gets_all(mock_supabase):
+    """user_id는 유니크가 아니다 — 활성 행 3개(사용자 2명)면 채팅 3개 모두에 보낸다."""
+    _targets(mock_supabase, [
+        {"user_id": "u1", "telegram_chat_id": "100"},
+        {"user_id": "u2", "telegram_chat_id": "200"},
+        {"user_id": "u1", "telegram_chat_id": "-300"},  # u1의 그룹 채팅 (가장 최근)
+    ])
+
+    assert notification_targets.active_chat_ids(mock_supabase) == ["-300", "100", "200"]
+    assert notification_targets.resolve(mock_supabase, ["u1"]) == {"u1": ["-300", "100"]}
+    with patch.object(
+        telegram_service.telegram_sender, "send_batch", side_effect=lambda m: [False, True, True]
+    ) as send_batch:
+        results = telegram_service.send_to_users(mock_supabase, [("u1", "a"), ("u2", "b")])
+
+    assert send_batch.call_args.args[0] == [("-300", "a"), ("100", "a"), ("200", "b")]
+    assert results == [True, True]  # 한 채팅이라도 성공하면 성공
+
+
+def test_send_to_users_falls_back_to_default_chat(mock_supabase, monkeypatch):
+    """대상이 없는 사용자는 기본 chat_id로 보내고, 결과는 입력 순서를 따른다."""
+    monkeypatch.setattr("app.config.settings.telegram_chat_id", "999")
+    _targets(mock_supabase, ROWS)
+
+    with patch.object(
+        telegram_service.telegram_sender, "send_batch", side_effect=lambda m: [True] * len(m)
+    ) as send_batch:
+        results = telegram_service.send_to_users(mock_supabase, [("u1", "a"), ("u3", "b")])
+
+    assert results == [True, True]
+    assert send_batch.call_args.args[0] == [("100", "a"), ("999", "b")]
@@ -0,0 +1,107 @@
+"""의존성 기반 파이프라인 실행기 테스트."""
+
+import threading
+import time
+
+import pytest
+
+from app.scheduler import jobs
+from app.scheduler.pipeline import Step, run_pipeline, validate
+
+
+def _recorder(log: list, name: str, delay: float = 0.0, fail: bool = False):
+    def run():
+        log.append(("start", name, time.perf_counter()))
+        time.sleep(delay)
+        log.append(("end", name, time.perf_counter()))
+        if fail:
+            raise RuntimeError(f"{name} boom")
+    return run
+
+
+def test_independent_steps_run_in_parallel_and_respect_dependencies():
+    """독립 단계는 동시에, 하위 단계는 상위 완료 직후 시작한다."""
+    log: list = []
+    steps = [
+        Step("a", _recorder(log, "a", 0.2)),
+        Step("b", _recorder(log, "b", 0.2)),
+        Step("c", _recorder(log, "c"), depends_on=("a", "b")),
+    ]
+
+    started = time.perf_counter()
+    result = run_pipeline("test", steps)
+    elapsed = time.perf_counter() - started
+
+    assert result.success
+    assert elapsed < 0.35  # a, b 병렬
+    t = {(kind, name): ts for kind, name, ts in log}
+    assert t[("start", "c")] >= max(t[("end", "a")], t[("end", "b")])
+    assert all(r.duration_s >= 0 for r in result.steps.values())
+
+
+def test_failed_step_is_recorded_and_downstream_still_runs():
+    """상위 실패는 기록되고, 하위 단계는 upstream_failed로 표시된 채 실행된다."""
+    log: list = []
+    result = run_pipeline(
+        "test",
+        [
+            Step("a", _recorder(log, "a", fail=True)),
+            Step("b", _recorder(log, "b"), depends_on=("a",)),
+        ],
+    )
+    assert result.failed_steps == ["a"]
+    assert "a boom" in result.steps["a"].error
+    assert result.steps["b"].status == "success"
+    assert result.steps["b"].upstream_failed
+
+
+def test_validate_rejects_cycles_and_unknown_dependencies():
+    noop = lambda: None  # noqa: E731
+    with pytest.raises(ValueError, match="cycle"):
+        validate([Step("a", noop, ("b",)), Step("b", noop, ("a",))])
+    with pytest.raises(ValueError, match="unknown"):
+        validate([Step("a", noop, ("missing",))])
+
+
+def test_market_refresh_dag_order(monkeypatch):
+    """시장 데이터 갱신 DAG가 선언된 선후관계대로 모든 단계를 실행한다."""
+    order: list[str] = []
+    lock = threading.Lock()
+    steps = []
+    for step in jobs.MARKET_REFRESH_STEPS:
+        def run(name=step.name):
+            with lock:
+                order.append(name)
+        steps.append(Step(step.name, run, step.depends_on))
+
+    result = run_pipeline("market_refresh", steps)
+
+    assert result.success
+    pos = {name: i for i, name in enumerate(order)}
+    assert pos["sentiment"] > pos["geo"]
+    assert pos["fear_greed"] > max(pos["macro"], pos["sentiment"])
+    assert pos["prediction"] > pos["fear_greed"]
+    assert min(pos["risk_alert"], pos["guide"]) > pos["prediction"]
+
+
+def test_pipeline_stops_launching_steps_when_told():
+    """should_continue가 False가 되면 실행 중인 단계는 끝나고 남은 단계는 skipped로 남는다."""
+    log: list[str] = []
+    leader = {"value": True}
+
+    def first():
+        log.append("a")
+        leader["value"] = False  # 단계 실행 중 리더를 잃음
+
+    steps = [
+        Step("a", first),
+        Step("b", _recorder(log, "b"), ("a",)),
+        Step("c", _recorder(log, "c"), ("b",)),
+    ]
+
+    result = run_pipeline("demo", steps, should_continue=lambda: leader["value"])
+
+    assert log == ["a"]
+    assert result.steps["a"].status == "success"
+    assert result.skipped_steps == ["b", "c"]
+    assert not result.success
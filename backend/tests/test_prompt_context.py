@@ -0,0 +1,55 @@
+"""프롬프트 컨텍스트 빌더 테스트."""
+
+import json
+
+from app.services import prompt_context
+
+
+def test_compact_rounds_and_drops_empty():
+    """실수 반올림, None/빈 값 제거, 긴 문자열 절단."""
+    value = {
+        "vix": 18.23456,
+        "usd_krw": 1385.678,
+        "gold": None,
+        "tags": [],
+        "note": "x" * 500,
+        "rows": [{"a": None}, {"b": 1.0}],
+    }
+    result = prompt_context.compact(value)
+    assert result["vix"] == 18.23
+    assert result["usd_krw"] == 1386
+    assert "gold" not in result and "tags" not in result
+    assert len(result["note"]) == prompt_context.MAX_STR_CHARS
+    assert result["rows"] == [{"b": 1}]
+
+
+def test_estimate_tokens_counts_hangul_heavier():
+    """한글은 ASCII보다 글자당 토큰을 많이 추정한다."""
+    assert prompt_context.estimate_tokens("abcd" * 10) == 10
+    assert prompt_context.estimate_tokens("가나다라") == 4
+
+
+def test_build_context_respects_budget_and_priority():
+    """앞선 섹션을 우선 채우고, 넘치는 리스트는 앞부분만 남기며 예산을 지킨다."""
+    sections = [
+        ("macro", {"vix": 20.1234}),
+        ("geo_risks", [{"title": f"리스크 {i}", "level": "HIGH"} for i in range(50)]),
+        ("big", {"text": "가" * 250}),
+    ]
+
+    text = prompt_context.build_context("test", sections, budget=120)
+    data = json.loads(text)
+
+    assert prompt_context.estimate_tokens(text) <= 120
+    assert data["macro"] == {"vix": 20.12}
+    assert 0 < len(data["geo_risks"]) < 50
+    assert data["geo_risks"][0]["title"] == "리스크 0"
+    assert "big" not in data
+
+
+def test_fit_lines_appends_omitted_count():
+    """예산을 넘는 줄은 생략하고 생략 건수를 표시한다."""
+    lines = [f"- 종목{i}: 보유 10주" for i in range(100)]
+    text = prompt_context.fit_lines("test", lines, budget=50)
+    assert text.splitlines()[0] == lines[0]
+    assert text.endswith("건 생략")
@@ -0,0 +1,128 @@
+"""포트폴리오 노출 기반 리스크 평가 테스트."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app.services import alert_service, risk_exposure
+from app.services.risk_exposure import RiskSignals
+
+HOLDINGS = [
+    {"user_id": "u1", "ticker": "005930.KS", "market": "KOSPI", "sector": "반도체"},
+    {"user_id": "u2", "ticker": "NVDA", "market": "NASDAQ", "sector": "Semiconductors"},
+    {"user_id": "u3", "ticker": "AAPL", "market": "NASDAQ", "sector": None},
+    {"user_id": "u3", "ticker": "035720.KS", "market": "KOSDAQ", "sector": "인터넷"},
+    {"user_id": "u4", "ticker": "035720.KS", "market": "KOSDAQ", "sector": "인터넷"},
+]
+
+
+def _exposed(signals):
+    return {e.user_id: e for e in risk_exposure.evaluate(HOLDINGS, signals)}
+
+
+def test_currency_alert_reaches_only_usd_holders():
+    """USD/KRW 급변은 USD 표시 종목 보유자에게만 해당한다."""
+    exposed = _exposed(RiskSignals(currency_alert=True))
+
+    assert set(exposed) == {"u2", "u3"}
+    assert exposed["u3"].tickers == ["AAPL"]
+    assert not exposed["u2"].vix
+
+
+def test_geo_events_match_country_sector_and_ticker():
+    """지정학 이벤트는 국가/섹터/티커 중 하나라도 겹치는 보유자에게 해당하고 이벤트 수를 센다."""
+    events = [
+        {"affected_countries": ["한국"], "affected_sectors": [], "tickers": []},
+        {"affected_countries": [], "affected_sectors": ["반도체"], "tickers": ["nvda"]},
+    ]
+
+    exposed = _exposed(RiskSignals(geo_events=events))
+
+    assert set(exposed) == {"u1", "u2", "u3", "u4"}
+    assert exposed["u1"].geo_events == 2
+    assert exposed["u2"].geo_events == 1
+    assert exposed["u3"].tickers == ["035720.KS"]
+
+
+def test_untargeted_event_and_no_signal():
+    """대상 정보가 없는 이벤트는 전체 보유자에게 해당하고, 조건이 없으면 아무도 해당하지 않는다."""
+    assert len(_exposed(RiskSignals(geo_events=[{"affected_countries": []}]))) == 4
+    assert risk_exposure.evaluate(HOLDINGS, RiskSignals()) == []
+
+
+def test_llm_sector_and_country_values_are_normalized():
+    """감성 분석의 한글 섹터는 영문 보유 섹터와 같은 키로 비교한다."""
+    event = {"affected_sectors": ["반도체"], "affected_countries": ["대만"], "tickers": []}
+    holdings = [
+        {"user_id": "u1", "ticker": "NVDA", "market": "NASDAQ", "sector": "Semiconductors"},
+        {"user_id": "u2", "ticker": "AAPL", "market": "NASDAQ", "sector": "Technology"},
+        {"user_id": "u3", "ticker": "035720.KS", "market": "KOSDAQ", "sector": "인터넷"},
+    ]
+
+    exposed = risk_exposure.evaluate(holdings, RiskSignals(geo_events=[event]))
+
+    assert [e.user_id for e in exposed] == ["u1"]
+
+
+def test_known_sector_without_holders_reaches_nobody():
+    """알려진 섹터/국가를 지정한 이벤트는 해당 보유자가 없으면 아무에게도 보내지 않는다."""
+    holdings = [
+        {"user_id": "u1", "ticker": "AAPL", "market": "NASDAQ", "sector": "Technology"},
+        {"user_id": "u2", "ticker": "005380.KS", "market": "KOSPI", "sector": "자동차"},
+    ]
+    semis = {"affected_sectors": ["반도체"], "affected_countries": ["중국", "대만"], "tickers": []}
+
+    assert risk_exposure.evaluate(holdings, RiskSignals(geo_events=[semis])) == []
+    # 티커만 지정된 이벤트도 보유자가 없으면 아무에게도 해당하지 않는다
+    assert risk_exposure.evaluate(holdings, RiskSignals(geo_events=[{"tickers": ["TSLA"]}])) == []
+
+
+def test_unrecognized_event_terms_reach_everyone():
+    """섹터/국가가 하나도 알려진 별칭으로 정규화되지 않으면 대상을 알 수 없으므로 전체에 보낸다."""
+    holdings = [
+        {"user_id": "u1", "ticker": "AAPL", "market": "NASDAQ", "sector": "Technology"},
+        {"user_id": "u2", "ticker": "005380.KS", "market": "KOSPI", "sector": "자동차"},
+    ]
+    event = {"affected_sectors": ["희토류"], "affected_countries": ["중동"], "tickers": []}
+
+    exposed = risk_exposure.evaluate(holdings, RiskSignals(geo_events=[event]))
+
+    assert {e.user_id for e in exposed} == {"u1", "u2"}
+
+
+def _table(rows):
+    table = MagicMock()
+    for method in ("select", "eq", "gte", "order", "limit", "range"):
+        getattr(table, method).return_value = table
+    table.execute.return_value = MagicMock(data=rows)
+    return table
+
+
+def test_risk_check_sends_only_to_exposed_users():
+    """지정학 경보가 뜨면 노출된 사용자에게만 개인화된 메시지를 보낸다."""
+    tables = {
+        "sentiment_results": _table([{"id": "s1", "tickers": ["NVDA"], "affected_sectors": [], "affected_countries": []}]),
+        "portfolio": _table(HOLDINGS),
+    }
+    client = MagicMock()
+    client.table.side_effect = lambda name: tables[name]
+
+    with (
+        patch.object(alert_service, "get_latest", return_value=SimpleNamespace(vix=18.0, usd_krw=None)),
+        patch.object(
+            alert_service.telegram_service,
+            "send_to_users",
+            side_effect=lambda c, messages, fallback_default: [True] * len(messages),
+        ) as send_to_users,
+        patch.object(alert_service.telegram_service, "send_to_default") as send_to_default,
+    ):
+        result = alert_service.check_risk_conditions(client)
+
+    messages = send_to_users.call_args.args[1]
+    assert [user_id for user_id, _ in messages] == ["u2"]
+    # 이전 회차 이벤트로 다시 경보하지 않도록 최근 분석 결과만 조회한다
+    assert tables["sentiment_results"].gte.call_args.args[0] == "analyzed_at"
+    assert "NVDA" in messages[0][1]
+    assert send_to_users.call_args.kwargs["fallback_default"] is False
+    assert result.geopolitical_alert and result.exposed_user_count == 1
+    assert result.notifications_sent == 1
+    send_to_default.assert_not_called()
@@ -0,0 +1,92 @@
+"""스케줄러 리더 선출 테스트."""
+
+from unittest.mock import MagicMock
+
+from app.scheduler import leader
+from app.scheduler.leader import DatabaseLease, FileLease, LeaderElection
+
+
+class FakeLease:
+    def __init__(self, results):
+        self.results = list(results)
+        self.released = False
+
+    def acquire(self):
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def release(self):
+        self.released = True
+
+
+def _election(lease, ttl=90):
+    events = []
+    election = LeaderElection(
+        lease, lambda: events.append("elected"), lambda: events.append("demoted"), ttl=ttl
+    )
+    return election, events
+
+
+def test_takeover_and_demotion_fire_callbacks_once():
+    """임대 획득 시 1회 elected, 유지 중엔 콜백 없음, 잃으면 demoted."""
+    election, events = _election(FakeLease([False, True, True, False]))
+
+    assert [election.tick() for _ in range(4)] == [False, True, True, False]
+    assert events == ["elected", "demoted"]
+
+
+def test_transient_renewal_error_keeps_leadership_until_expiry(monkeypatch):
+    """DB 오류가 나도 마지막 갱신 임대가 유효한 동안은 리더를 유지한다."""
+    clock = [1000.0]
+    monkeypatch.setattr(leader.time, "monotonic", lambda: clock[0])
+    election, events = _election(FakeLease([True, RuntimeError("db"), RuntimeError("db")]), ttl=90)
+
+    election.tick()
+    clock[0] += 30
+    assert election.tick() is True
+    clock[0] += 60  # 마지막 갱신 후 90초 — 만료 여유 구간 진입
+    assert election.tick() is False
+    assert events == ["elected", "demoted"]
+
+
+def test_stop_releases_lease_when_leader():
+    """종료 시 리더였다면 임대를 반납한다."""
+    lease = FakeLease([True])
+    election, events = _election(lease)
+    election.tick()
+
+    election.stop()
+
+    assert lease.released
+    assert events == ["elected", "demoted"]
+    assert not election.is_leader
+
+
+def test_file_lease_is_exclusive(tmp_path):
+    """파일 락은 한 번에 하나만 잡히고, 반납하면 다른 인스턴스가 잡는다."""
+    path = str(tmp_path / "scheduler.lock")
+    first, second = FileLease(path), FileLease(path)
+
+    assert first.acquire()
+    assert first.acquire()  # 재진입(갱신)
+    assert not second.acquire()
+    first.release()
+    assert second.acquire()
+    second.release()
+
+
+def test_database_lease_calls_rpc():
+    """DB 임대는 holder/ttl로 acquire RPC를 호출하고 결과를 bool로 돌려준다."""
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value.data = True
+    lease = DatabaseLease(lambda: client, "host:1:abc", ttl=60)
+
+    assert lease.acquire() is True
+    client.rpc.assert_called_with(
+        "acquire_scheduler_lease",
+        {"p_name": "scheduler", "p_holder": "host:1:abc", "p_ttl_seconds": 60},
+    )
+    client.rpc.return_value.execute.return_value.data = False
+    assert lease.acquire() is False
@@ -0,0 +1,115 @@
+"""감성 분석 적응형 배치 테스트."""
+
+from unittest.mock import patch
+
+import httpx
+
+from app.config import settings
+from app.models.sentiment import NewsArticle
+from app.services import article_dedup, headline_cluster, sentiment_service
+
+
+def _articles(n: int, title: str = "Fed holds rates steady") -> list[NewsArticle]:
+    return [
+        NewsArticle(title=f"{title} {i}", link=f"https://x/{i}", source="Test")
+        for i in range(n)
+    ]
+
+
+def _score() -> dict:
+    return {"direction": "BULLISH", "score": 0.5, "news_category": "MACRO_FINANCE"}
+
+
+def test_plan_batches_respects_token_budget():
+    """긴 헤드라인일수록 배치가 작아지고, 모든 기사가 순서대로 배치된다."""
+    short = sentiment_service._plan_batches(_articles(60))
+    long = sentiment_service._plan_batches(_articles(60, title="가" * 200))
+
+    assert all(len(b) <= sentiment_service.MAX_BATCH_SIZE for b in short)
+    assert len(long) > len(short)
+    assert [a.link for b in long for a in b] == [a.link for a in _articles(60)]
+
+
+def test_failed_batch_retried_by_halves(monkeypatch):
+    """배치 실패 시 절반씩 재요청하고, 단건 실패만 중립 처리한다."""
+    calls: list[int] = []
+
+    def fake_request(articles, model):
+        calls.append(len(articles))
+        if len(articles) > 2 or any(a.link.endswith("/3") for a in articles):
+            raise ValueError("bad json")
+        return [_score() for _ in articles]
+
+    monkeypatch.setattr(settings, "openrouter_api_key", "test-key")
+    monkeypatch.setattr(sentiment_service, "_request_scores", fake_request)
+
+    results = sentiment_service._analyze_batch(_articles(8), "m")
+
+    assert len(results) == 8
+    assert calls[0] == 8
+    assert [r["direction"] for r in results].count("NEUTRAL") == 1
+    assert results[3]["reasoning"] == "분석 실패"
+
+
+def test_transport_error_does_not_split_batch(monkeypatch):
+    """전송/HTTP 오류(장애)는 배치를 나눠 재요청하지 않고 한 번에 중립 처리한다."""
+    calls: list[int] = []
+
+    def fake_request(articles, model):
+        calls.append(len(articles))
+        raise httpx.ConnectError("openrouter down")
+
+    monkeypatch.setattr(settings, "openrouter_api_key", "test-key")
+    monkeypatch.setattr(sentiment_service, "_request_scores", fake_request)
+
+    results = sentiment_service._analyze_batch(_articles(25), "m")
+
+    assert calls == [25]
+    assert len(results) == 25
+    assert all(r["is_fallback"] for r in results)
+
+
+def test_partial_response_re_requests_remainder(monkeypatch):
+    """응답이 일부만 오면 누락된 뒷부분만 다시 요청한다."""
+    calls: list[int] = []
+
+    def fake_request(articles, model):
+        calls.append(len(articles))
+        return [_score() for _ in articles[:3]]
+
+    monkeypatch.setattr(settings, "openrouter_api_key", "test-key")
+    monkeypatch.setattr(sentiment_service, "_request_scores", fake_request)
+
+    results = sentiment_service._analyze_batch(_articles(5), "m")
+    assert len(results) == 5
+    assert all(r["direction"] == "BULLISH" for r in results)
+    assert calls == [5, 2]
+
+
+def test_fallback_results_are_not_saved_and_retried_next_run(mock_supabase, monkeypatch):
+    """LLM이 실패한 기사는 저장·지수 반영·seen 등록 없이 다음 주기에 재분석한다 (중립 행 반복 저장 없음)."""
+    articles = [NewsArticle(title="Fed signals rate cut as inflation cools", link="https://x/1", source="T")]
+    requested: list[str] = []
+
+    def failing_request(batch, model):
+        requested.extend(a.title for a in batch)
+        raise ValueError("bad json")
+
+    monkeypatch.setattr(settings, "openrouter_api_key", "test-key")
+    monkeypatch.setattr(settings, "sentiment_triage_threshold", 0.0)
+    monkeypatch.setattr(sentiment_service, "collect_news", lambda: articles)
+    monkeypatch.setattr(sentiment_service, "_request_scores", failing_request)
+    article_dedup.reset_cache()
+    headline_cluster.reset_history()
+    try:
+        with patch.object(sentiment_service.sentiment_index, "update") as index_update:
+            first = sentiment_service.collect_and_analyze(mock_supabase)
+            second = sentiment_service.collect_and_analyze(mock_supabase)
+    finally:
+        article_dedup.reset_cache()
+        headline_cluster.reset_history()
+
+    assert requested == [articles[0].title] * 2  # seen으로 등록되지 않아 다음 주기에 재시도
+    assert first.articles_analyzed == second.articles_analyzed == 0
+    mock_supabase.table.return_value.insert.assert_not_called()
+    index_update.assert_not_called()
@@ -0,0 +1,117 @@
+"""시간 감쇠 감성 지수 테스트."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import fear_greed_service, prediction_service, sentiment_index
+
+T0 = datetime(2026, 3, 2, 0, 0, tzinfo=timezone.utc)
+HALF_LIFE = sentiment_index.HALF_LIFE_HOURS
+
+
+def test_decay_halves_effective_count_but_keeps_value():
+    """반감기가 지나면 유효 기사 수는 절반, 가중 평균 값은 그대로."""
+    states: dict = {}
+    sentiment_index._apply(
+        states,
+        [
+            {"direction": "BULLISH", "confidence": 1.0, "news_category": "MACRO_FINANCE"},
+            {"direction": "BEARISH", "confidence": 0.5},
+        ],
+        T0,
+    )
+    overall = states["ALL"]
+    assert overall.value == pytest.approx((100 - 50) / 1.5)
+    assert states["MACRO_FINANCE"].value == pytest.approx(100)
+
+    later = overall.decayed(T0 + timedelta(hours=sentiment_index.HALF_LIFE_HOURS))
+    assert later.count_sum == pytest.approx(1.0)
+    assert later.value == pytest.approx(overall.value)
+
+
+def test_newer_batch_outweighs_older_one():
+    """오래된 배치는 감쇠되어 새 배치가 지수를 주도한다."""
+    states: dict = {}
+    sentiment_index._apply(states, [{"direction": "BEARISH", "confidence": 1.0}] * 4, T0)
+    sentiment_index._apply(
+        states, [{"direction": "BULLISH", "confidence": 1.0}] * 2, T0 + timedelta(hours=36)
+    )
+    # 36h = 반감기 3회 → 4 × 1/8 = 0.5 vs 2
+    assert states["ALL"].value == pytest.approx((200 - 50) / 2.5)
+    assert states["ALL"].bullish_pct == pytest.approx(80)
+
+
+def test_update_upserts_state_and_appends_history(mock_supabase):
+    """배치 저장 시 기존 상태에 누적해 상태 upsert + 시계열 insert (폴백 제외)."""
+    table = mock_supabase.table.return_value
+    table.execute.return_value.data = [
+        {"scope": "ALL", "score_sum": 100.0, "weight_sum": 1.0, "bullish_sum": 1.0,
+         "bearish_sum": 0.0, "count_sum": 1.0, "updated_at": T0.isoformat()},
+    ]
+    sentiment_index.update(
+        mock_supabase,
+        [
+            {"direction": "BEARISH", "confidence": 1.0, "news_category": "ENERGY"},
+            {"direction": "NEUTRAL", "score": 0.0, "is_fallback": True},
+        ],
+        T0,
+    )
+
+    rows = {r["scope"]: r for r in table.upsert.call_args.args[0]}
+    assert rows["ALL"]["count_sum"] == 2.0
+    assert rows["ALL"]["value"] == 0.0
+    assert rows["ENERGY"]["value"] == -100.0
+    assert {r["scope"] for r in table.insert.call_args.args[0]} == {"ALL", "ENERGY"}
+
+
+def _table(rows):
+    table = MagicMock()
+    for method in ("select", "order", "limit", "upsert", "insert", "delete", "lt"):
+        getattr(table, method).return_value = table
+    table.execute.return_value = MagicMock(data=rows)
+    return table
+
+
+def test_first_update_bootstraps_from_earlier_results():
+    """상태가 비어 있으면 0에서 시작하지 않고 이 배치 이전 결과로 부트스트랩한 뒤 누적한다."""
+    earlier = (T0 - timedelta(hours=HALF_LIFE)).isoformat()
+    tables = {
+        "sentiment_index_state": _table([]),
+        "sentiment_index_history": _table([]),
+        "sentiment_results": _table([
+            {"direction": "BULLISH", "confidence": 1.0, "news_category": None, "analyzed_at": earlier},
+            {"direction": "BULLISH", "confidence": 1.0, "news_category": None, "analyzed_at": earlier},
+            # 이번 배치 — 이미 저장돼 있지만 부트스트랩에서 제외해 두 번 세지 않는다
+            {"direction": "BEARISH", "confidence": 1.0, "news_category": None, "analyzed_at": T0.isoformat()},
+        ]),
+    }
+    client = MagicMock()
+    client.table.side_effect = lambda name: tables[name]
+
+    sentiment_index.update(client, [{"direction": "BEARISH", "confidence": 1.0}], T0)
+
+    state = tables["sentiment_index_state"]
+    final = {r["scope"]: r for r in state.upsert.call_args.args[0]}["ALL"]
+    assert state.upsert.call_count == 2  # 부트스트랩 + 이번 배치
+    # 이전 결과 2건은 반감기 1회 감쇠(1.0) + 이번 배치 1건
+    assert final["count_sum"] == pytest.approx(2.0)
+    assert final["value"] == pytest.approx(0.0)
+
+
+def test_consumers_read_index_state(monkeypatch):
+    """예측 시그널과 공포/탐욕 감성 컴포넌트가 지수 상태 1건으로 계산된다."""
+    state = sentiment_index.IndexState(
+        scope="ALL", score_sum=60.0, weight_sum=1.5, bullish_sum=3.0,
+        bearish_sum=1.0, count_sum=5.0, updated_at=T0,
+    )
+    monkeypatch.setattr(sentiment_index, "get_state", lambda client, scope="ALL": state)
+
+    signal = prediction_service._calc_sentiment_score(None)
+    assert signal.composite == 40.0
+    assert signal.article_count == 5
+
+    component = fear_greed_service._calc_sentiment_component(None)
+    assert component["raw"] == {"bullish_pct": 60.0, "bearish_pct": 20.0}
+    assert component["value"] == 75
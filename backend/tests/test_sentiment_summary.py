@@ -0,0 +1,31 @@
+"""카테고리별 감성 요약(시간 단위 롤업) 테스트."""
+
+from datetime import datetime, timedelta, timezone
+
+
+def test_summary_reads_rollup_rpc_for_window(client, mock_supabase):
+    """요약 API는 윈도우 시작 시각으로 롤업 RPC를 호출하고 카테고리 순서로 정렬한다."""
+    mock_supabase.rpc.return_value.execute.return_value.data = [
+        {"category_key": "ENERGY", "total": 4, "bullish": 1, "bearish": 2, "neutral": 1, "avg_score": -0.12345},
+        {"category_key": "MACRO_FINANCE", "total": 10, "bullish": 6, "bearish": 1, "neutral": 3, "avg_score": 0.3},
+    ]
+
+    res = client.get("/api/sentiment/categories/summary?window=7d")
+
+    assert res.status_code == 200
+    body = res.json()
+    assert body["window"] == "7d"
+    assert [s["category_key"] for s in body["summaries"]] == ["MACRO_FINANCE", "ENERGY"]
+    assert body["summaries"][1]["avg_score"] == -0.123
+    assert body["summaries"][0]["display_name"] == "거시경제 & 금융"
+
+    name, params = mock_supabase.rpc.call_args.args
+    assert name == "sentiment_category_summary"
+    since = datetime.fromisoformat(params["p_since"])
+    expected = datetime.now(timezone.utc) - timedelta(days=7)
+    assert abs((since - expected).total_seconds()) < 60
+
+
+def test_summary_rejects_unknown_window(client):
+    """지원하지 않는 윈도우는 422."""
+    assert client.get("/api/sentiment/categories/summary?window=90d").status_code == 422
@@ -0,0 +1,150 @@
+"""통합 스코어링 가중치 보정 서비스 단위 테스트."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from app.services import signal_calibration_service
+from app.services.prediction_service import DEFAULT_SIGNAL_WEIGHTS, _determine_direction
+from app.services.signal_calibration_service import (
+    build_dataset,
+    build_threshold_pairs,
+    build_weight_grid,
+    evaluate_candidates,
+    fit_and_validate,
+    search_best,
+)
+
+DEFAULT_WEIGHTS = np.array([
+    DEFAULT_SIGNAL_WEIGHTS.technical,
+    DEFAULT_SIGNAL_WEIGHTS.macro,
+    DEFAULT_SIGNAL_WEIGHTS.sentiment,
+    DEFAULT_SIGNAL_WEIGHTS.currency,
+    DEFAULT_SIGNAL_WEIGHTS.geopolitical,
+])
+DEFAULT_THRESHOLDS = np.array([DEFAULT_SIGNAL_WEIGHTS.buy_threshold, DEFAULT_SIGNAL_WEIGHTS.strong_threshold])
+
+
+def test_weight_grid_sums_to_one():
+    """모든 가중치 조합의 합이 1이고 최소 가중치 이상이다."""
+    grid = build_weight_grid(step=0.05, min_weight=0.05)
+    assert grid.shape[1] == 5
+    assert np.allclose(grid.sum(axis=1), 1.0)
+    assert grid.min() >= 0.05 - 1e-9
+    # 20단위를 5칸에 1단위 이상씩 분할: C(19, 4)
+    assert len(grid) == 3876
+
+
+def test_threshold_pairs_strong_above_buy():
+    """strong 임계값은 항상 buy 임계값보다 크다."""
+    pairs = build_threshold_pairs((10.0, 50.0), (40.0, 60.0))
+    assert pairs.tolist() == [[10.0, 40.0], [10.0, 60.0], [50.0, 60.0]]
+
+
+def test_search_best_prefers_predictive_signal():
+    """실현 수익률과 같은 방향인 시그널에 가장 큰 가중치가 부여된다."""
+    rng = np.random.default_rng(0)
+    signals = rng.uniform(-100, 100, size=(400, 5))
+    returns = signals[:, 1] / 20  # 거시 시그널만 수익률을 설명
+
+    grid = build_weight_grid(step=0.1, min_weight=0.1)
+    pairs = build_threshold_pairs()
+    weights, thresholds, objective = search_best(
+        signals, returns, grid, pairs, max_workers=1
+    )
+
+    assert int(np.argmax(weights)) == 1
+    assert thresholds[1] > thresholds[0]
+    assert objective > 0
+
+
+def test_evaluate_candidates_hold_is_zero():
+    """임계값 미만 점수(HOLD)는 목적 함수에 기여하지 않는다."""
+    signals = np.full((3, 5), 5.0)
+    returns = np.array([1.0, -2.0, 3.0])
+    result = evaluate_candidates(
+        signals, returns, np.array([[0.2] * 5]), np.array([[25.0, 60.0]])
+    )
+    assert result.shape == (1, 1)
+    assert result[0, 0] == 0.0
+
+
+def test_build_dataset_forward_return():
+    """분석일 이후 첫 거래일 종가 대비 horizon 거래일 뒤 수익률을 계산한다."""
+    dates = np.array(
+        ["2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07"],
+        dtype="datetime64[D]",
+    )
+    closes = np.array([100.0, 100.0, 105.0, 110.0])
+    rows = [
+        {
+            "ticker": "AAPL",
+            "analyzed_at": "2026-01-03T00:00:00+00:00",  # 주말 → 01-05 진입
+            "technical_score": 10,
+            "macro_score": None,
+            "sentiment_score": 0,
+            "currency_score": 0,
+            "geopolitical_score": 0,
+        },
+        {"ticker": "AAPL", "analyzed_at": "2026-01-07T00:00:00+00:00"},  # 구간 미완료
+        {"ticker": "MSFT", "analyzed_at": "2026-01-02T00:00:00+00:00"},  # 시세 없음
+    ]
+
+    signals, returns = build_dataset(rows, {"AAPL": (dates, closes)}, horizon_days=2)
+
+    assert signals.shape == (1, 5)
+    assert signals[0].tolist() == [10.0, 0.0, 0.0, 0.0, 0.0]
+    assert np.isclose(returns[0], 10.0)
+
+
+def test_determine_direction_custom_thresholds():
+    """보정된 임계값으로 방향을 판정한다."""
+    assert _determine_direction(30) == "BUY"
+    assert _determine_direction(30, buy_threshold=35, strong_threshold=50) == "HOLD"
+    assert _determine_direction(-55, buy_threshold=20, strong_threshold=50) == "STRONG_SELL"
+
+
+def _fit(returns_fn, seed=0):
+    rng = np.random.default_rng(seed)
+    signals = rng.uniform(-100, 100, size=(300, 5))
+    returns = returns_fn(signals, rng)
+    return fit_and_validate(
+        signals, returns, DEFAULT_WEIGHTS, DEFAULT_THRESHOLDS,
+        build_weight_grid(step=0.1, min_weight=0.1), build_threshold_pairs(), max_workers=1,
+    )
+
+
+def test_noise_fit_is_not_activated():
+    """수익률이 잡음뿐이면 학습 구간 최적값이 있어도 검증 구간에서 개선이 없어 활성화하지 않는다."""
+    for seed in range(3):
+        fit = _fit(lambda s, rng: rng.normal(0, 3, len(s)), seed)
+        assert fit["train_objective"] > 0
+        assert not fit["updated"]
+
+
+def test_predictive_fit_is_activated_on_holdout():
+    """실제로 예측력이 있는 시그널이면 검증 구간에서도 기본 가중치보다 나아 활성화한다."""
+    fit = _fit(lambda s, rng: s[:, 1] / 20 + rng.normal(0, 1, len(s)))
+
+    assert fit["updated"]
+    assert int(np.argmax(fit["weights"])) == 1
+    assert fit["objective"] > fit["baseline_objective"]
+
+
+def test_save_inserts_before_deactivating_previous():
+    """새 설정을 먼저 저장하고 이전 활성 설정을 끈다 — 저장 실패 시 기존 설정이 남는다."""
+    client = MagicMock()
+    table = client.table.return_value
+    calls: list[str] = []
+    table.insert.side_effect = lambda row: calls.append("insert") or table
+    table.update.side_effect = lambda row: calls.append("update") or table
+    table.eq.return_value = table
+    at = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+    signal_calibration_service._save_calibration(
+        client, DEFAULT_WEIGHTS, DEFAULT_THRESHOLDS, 120, 0.4, 0.1, at
+    )
+
+    assert calls == ["insert", "update"]
+    table.lt.assert_called_once_with("calibrated_at", at.isoformat())
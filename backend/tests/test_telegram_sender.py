@@ -0,0 +1,92 @@
+"""텔레그램 발송 큐(장기 Bot 세션/속도 제한/재시도/메트릭) 테스트."""
+
+import pytest
+from telegram.error import BadRequest, RetryAfter
+
+from app.services import telegram_sender
+
+
+class _FakeBot:
+    """send_message 호출을 기록하고, 채팅별로 지정한 오류를 순서대로 발생시킨다."""
+
+    instances = 0
+
+    def __init__(self, token, request=None):
+        _FakeBot.instances += 1
+        self.sent: list[str] = []
+        self.errors: dict[str, list[Exception]] = {}
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def send_message(self, chat_id, text, parse_mode):
+        pending = self.errors.get(chat_id)
+        if pending:
+            raise pending.pop(0)
+        self.sent.append(chat_id)
+
+
+@pytest.fixture()
+def fake_bot(monkeypatch):
+    monkeypatch.setattr(telegram_sender, "Bot", _FakeBot)
+    monkeypatch.setattr(telegram_sender, "PRIVATE_CHAT_INTERVAL", 0.0)
+    monkeypatch.setattr(telegram_sender, "GLOBAL_RATE", 10_000)
+    monkeypatch.setattr("app.config.settings.telegram_bot_token", "test-token")
+    _FakeBot.instances = 0
+    for key in telegram_sender._metrics:
+        telegram_sender._metrics[key] = 0
+    telegram_sender._get_loop()
+    yield telegram_sender._bot
+    telegram_sender.shutdown()
+
+
+def test_broadcast_reuses_one_bot_session(fake_bot):
+    """브로드캐스트는 중복 채팅을 제외하고 하나의 Bot 세션으로 발송한다."""
+    sent = telegram_sender.broadcast(["1", "2", "2", "3", ""], "hi")
+    assert telegram_sender.send("4", "hi") is True
+
+    assert sent == 3
+    assert sorted(fake_bot.sent) == ["1", "2", "3", "4"]
+    assert _FakeBot.instances == 1
+    metrics = telegram_sender.get_metrics()
+    assert metrics["sent"] == 4
+    assert metrics["queue_depth"] == 0
+
+
+def test_flood_wait_is_retried(fake_bot):
+    """RetryAfter는 대기 후 재시도하고, BadRequest는 재시도하지 않는다."""
+    fake_bot.errors = {"1": [RetryAfter(0)], "2": [BadRequest("chat not found")]}
+
+    sent = telegram_sender.broadcast(["1", "2"], "hi")
+
+    assert sent == 1
+    assert fake_bot.sent == ["1"]
+    metrics = telegram_sender.get_metrics()
+    assert metrics["flood_waits"] == 1
+    assert metrics["retries"] == 1
+    assert metrics["failed"] == 1
+
+
+def test_rate_limiter_spaces_per_chat_and_global():
+    """같은 채팅은 채팅별 간격, 서로 다른 채팅은 전역 간격으로 슬롯을 예약한다."""
+    limiter = telegram_sender._RateLimiter(global_rate=10)
+
+    assert limiter.reserve("1", 100.0) == 0.0
+    assert limiter.reserve("2", 100.0) == pytest.approx(0.1)
+    assert limiter.reserve("1", 100.0) == pytest.approx(telegram_sender.PRIVATE_CHAT_INTERVAL)
+    limiter.reserve("-100", 200.0)
+    assert limiter.reserve("-100", 200.0) == pytest.approx(telegram_sender.GROUP_CHAT_INTERVAL)
+
+    limiter.penalize("3", 300.0, 5.0)
+    assert limiter.reserve("4", 300.0) == pytest.approx(5.0)
+
+
+def test_missing_token_skips_send(monkeypatch):
+    """봇 토큰이 없으면 발송 루프를 띄우지 않고 0건을 반환한다."""
+    monkeypatch.setattr("app.config.settings.telegram_bot_token", "")
+
+    assert telegram_sender.broadcast(["1"], "hi") == 0
+    assert telegram_sender._loop is None
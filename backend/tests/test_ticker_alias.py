@@ -0,0 +1,61 @@
+"""종목 별칭 인덱스 및 종목별 감성 블렌딩 테스트."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services import prediction_service, sentiment_index, ticker_alias
+
+
+@pytest.fixture(autouse=True)
+def _reset_aliases():
+    ticker_alias.reset()
+    yield
+    ticker_alias.reset()
+
+
+def test_tag_maps_names_and_codes_to_tickers():
+    """한글명/영문명/종목코드 모두 티커로 태깅된다."""
+    assert ticker_alias.tag("삼성전자, 엔비디아에 HBM 공급") == ["005930.KS", "NVDA"]
+    assert ticker_alias.tag("Nvidia shares hit record") == ["NVDA"]
+    assert ticker_alias.tag("005930 외국인 순매수") == ["005930.KS"]
+    assert ticker_alias.tag("Oil prices climb") == []
+
+
+def test_ascii_aliases_match_whole_words_only():
+    """영문 별칭은 더 긴 단어 안에서 매칭되지 않는다 (Intel ≠ intelligence, Amazon ≠ Amazonian)."""
+    assert ticker_alias.tag("US intelligence warns of Iran threat") == []
+    assert ticker_alias.tag("Artificial intelligence boom lifts chip stocks") == []
+    assert ticker_alias.tag("Amazonian deforestation hits record") == []
+    assert ticker_alias.tag("Intel's foundry wins Amazon order") == ["AMZN", "INTC"]
+    assert ticker_alias.tag("테슬라가 급등") == ["TSLA"]
+
+
+def test_refresh_adds_watchlist_company_names(mock_supabase):
+    """관심종목/포트폴리오의 종목명이 별칭으로 추가된다."""
+    mock_supabase.table.return_value.execute.return_value.data = [
+        {"ticker": "042700.KQ", "company_name": "한미반도체", "alias": "한미반도체"},
+    ]
+    ticker_alias.refresh(mock_supabase)
+    assert ticker_alias.tag("한미반도체, TC본더 수주") == ["042700.KQ"]
+
+
+def test_ticker_sentiment_blends_with_global_index(mock_supabase, monkeypatch):
+    """종목 언급 기사가 있으면 유효 기사 수 비중만큼 전체 지수와 섞는다."""
+    now = datetime.now(timezone.utc).isoformat()
+    table = mock_supabase.table.return_value
+    table.contains.return_value = table
+    table.gte.return_value = table
+    table.execute.return_value.data = [
+        {"direction": "BEARISH", "confidence": 1.0, "analyzed_at": now},
+    ] * 3
+    overall = sentiment_index.IndexState(scope="ALL", score_sum=50.0, weight_sum=1.0, count_sum=10.0)
+    monkeypatch.setattr(sentiment_index, "get_state", lambda client, scope="ALL": overall)
+
+    signal = prediction_service._calc_sentiment_score(mock_supabase, "005930.KS")
+
+    table.contains.assert_called_with("tickers", ["005930.KS"])
+    assert signal.ticker_score == -100.0
+    assert signal.ticker_article_count == 3
+    # n≈3, prior=3 → 절반씩: 0.5 × -100 + 0.5 × 50
+    assert signal.composite == pytest.approx(-25.0, abs=0.1)
@@ -136,7 +136,7 @@ function formatResult(
   switch (key) {
     case "price-alert": {
       const r = data as AlertCheckResult;
-      return `체크 ${r.checked_count}건, 발동 ${r.triggered_count}건, 알림 ${r.notified_count}건${r.failed_tickers.length > 0 ? ` (실패: ${r.failed_tickers.join(", ")})` : ""}`;
+      return `체크 ${r.checked_count}건${r.skipped_count > 0 ? ` (건너뜀 ${r.skipped_count}건)` : ""}, 발동 ${r.triggered_count}건, 알림 ${r.notified_count}건${r.failed_tickers.length > 0 ? ` (실패: ${r.failed_tickers.join(", ")})` : ""}`;
     }
     case "risk-alert": {
       const r = data as RiskAlertResult;
@@ -147,7 +147,7 @@ function formatResult(
       if (r.currency_alert)
         alerts.push(`환율 ${r.usd_krw_change_pct?.toFixed(2)}%`);
       return alerts.length > 0
-        ? `경고: ${alerts.join(", ")} / 알림 ${r.notifications_sent}건`
+        ? `경고: ${alerts.join(", ")} / 노출 사용자 ${r.exposed_user_count}명, 알림 ${r.notifications_sent}건`
         : `이상 없음 / 알림 ${r.notifications_sent}건`;
     }
     case "etf-sync": {
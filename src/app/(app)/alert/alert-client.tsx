@@ -15,6 +15,7 @@ import {
   Target,
   ShieldAlert,
   AlertTriangle,
+  Activity,
 } from "lucide-react";
 
 import {
@@ -40,6 +41,11 @@ const ALERT_TYPE_CONFIG: Record<
     icon: <ShieldAlert className="size-3.5" />,
     color: "bg-red-100 text-red-800 dark:bg-red-900 dark:text-red-200",
   },
+  DAILY_CHANGE: {
+    label: "일일 변동",
+    icon: <Activity className="size-3.5" />,
+    color: "bg-amber-100 text-amber-800 dark:bg-amber-900 dark:text-amber-200",
+  },
 };
 
 // ─── 헬퍼 ───
@@ -210,6 +216,7 @@ function AlertCard({
 }) {
   const typeConfig =
     ALERT_TYPE_CONFIG[alert.alert_type] ?? ALERT_TYPE_CONFIG.TARGET_PRICE;
+  const isDailyChange = alert.alert_type === "DAILY_CHANGE";
 
   return (
     <div
@@ -232,9 +239,11 @@ function AlertCard({
         </div>
         <div className="flex flex-wrap items-center gap-3 text-sm">
           <span>
-            설정가:{" "}
+            {isDailyChange ? "변동률" : "설정가"}:{" "}
             <span className="font-medium">
-              {formatPrice(alert.trigger_price)}
+              {isDailyChange
+                ? `±${alert.trigger_price}%`
+                : formatPrice(alert.trigger_price)}
             </span>
           </span>
           {alert.current_price != null && (
@@ -242,7 +251,7 @@ function AlertCard({
               현재가: {formatPrice(alert.current_price)}
             </span>
           )}
-          {alert.is_triggered && alert.triggered_at && (
+          {(alert.is_triggered || isDailyChange) && alert.triggered_at && (
             <Badge variant="secondary" className="text-xs">
               {timeAgo(alert.triggered_at)} 발동
             </Badge>
@@ -347,11 +356,22 @@ function AddAlertForm({
               <ShieldAlert className="mr-1 size-3.5" />
               손절가
             </Button>
+            <Button
+              type="button"
+              variant={alertType === "DAILY_CHANGE" ? "default" : "outline"}
+              size="sm"
+              onClick={() => setAlertType("DAILY_CHANGE")}
+            >
+              <Activity className="mr-1 size-3.5" />
+              일일 변동
+            </Button>
           </div>
           <div className="grid grid-cols-2 gap-2">
             <Input
               type="number"
-              placeholder="알림 가격"
+              placeholder={
+                alertType === "DAILY_CHANGE" ? "전일 대비 변동률(%)" : "알림 가격"
+              }
               value={triggerPrice}
               onChange={(e) => setTriggerPrice(e.target.value)}
               min="0"
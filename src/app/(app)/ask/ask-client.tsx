@@ -6,7 +6,7 @@ import Link from "next/link";
 import { Card, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
-import { askQuestion } from "@/lib/api/ask";
+import { askQuestionStream } from "@/lib/api/ask";
 import { Loader2, Send, ExternalLink } from "lucide-react";
 
 interface Message {
@@ -33,27 +33,31 @@ export function AskContent() {
     if (!question || loading) return;
 
     setInput("");
-    setMessages((prev) => [...prev, { role: "user", content: question }]);
+    setMessages((prev) => [
+      ...prev,
+      { role: "user", content: question },
+      { role: "assistant", content: "" },
+    ]);
     setLoading(true);
 
+    // 스트리밍 중인 마지막 assistant 메시지를 갱신한다
+    const updateLast = (update: (msg: Message) => Message) =>
+      setMessages((prev) => [...prev.slice(0, -1), update(prev[prev.length - 1])]);
+
     try {
-      const res = await askQuestion(question);
-      setMessages((prev) => [
-        ...prev,
-        {
-          role: "assistant",
-          content: res.answer,
-          deeplinks: res.deeplinks,
-        },
-      ]);
+      const res = await askQuestionStream(question, (text) =>
+        updateLast((msg) => ({ ...msg, content: msg.content + text })),
+      );
+      updateLast(() => ({
+        role: "assistant",
+        content: res.answer,
+        deeplinks: res.deeplinks,
+      }));
     } catch {
-      setMessages((prev) => [
-        ...prev,
-        {
-          role: "assistant",
-          content: "죄송합니다. 일시적 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.",
-        },
-      ]);
+      updateLast(() => ({
+        role: "assistant",
+        content: "죄송합니다. 일시적 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.",
+      }));
     } finally {
       setLoading(false);
     }
@@ -89,7 +93,7 @@ export function AskContent() {
           </div>
         )}
 
-        {messages.map((msg, i) => (
+        {messages.filter((msg) => msg.content).map((msg, i) => (
           <div
             key={i}
             className={`flex ${msg.role === "user" ? "justify-end" : "justify-start"}`}
@@ -121,7 +125,7 @@ export function AskContent() {
           </div>
         ))}
 
-        {loading && (
+        {loading && !messages[messages.length - 1]?.content && (
           <div className="flex justify-start">
             <div className="bg-muted flex items-center gap-2 rounded-lg px-4 py-2">
               <Loader2 className="size-4 animate-spin" />
@@ -65,7 +65,7 @@ export function MacroContent({
       const result = await collectSentiment();
       if (result.success) {
         toast.success(
-          `뉴스 ${result.articles_collected}건 수집, ${result.articles_analyzed}건 분석 완료`,
+          `뉴스 ${result.articles_collected}건 수집 (신규 ${result.articles_new}건, 중복 ${result.articles_duplicate}건), ${result.articles_analyzed}건 분석 완료 (로컬 분류 ${result.articles_local}건)`,
         );
         router.refresh();
       }
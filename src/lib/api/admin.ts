@@ -86,6 +86,8 @@ export interface ModelConfig {
   display_name: string;
   primary_model: string;
   fallback_model: string | null;
+  fallback_models: string[];
+  hedge_after_ms: number | null;
   max_tokens: number;
   temperature: number;
   is_active: boolean;
@@ -165,6 +167,8 @@ export function updateModelConfig(
   params: {
     primary_model?: string;
     fallback_model?: string;
+    fallback_models?: string[];
+    hedge_after_ms?: number;
     max_tokens?: number;
     temperature?: number;
     is_active?: boolean;
@@ -11,8 +11,8 @@ export interface PriceAlert {
   user_id: string;
   ticker: string;
   company_name: string | null;
-  alert_type: string; // TARGET_PRICE | STOP_LOSS
-  trigger_price: number;
+  alert_type: string; // TARGET_PRICE | STOP_LOSS | DAILY_CHANGE
+  trigger_price: number; // DAILY_CHANGE는 전일 대비 변동률(%)
   current_price: number | null;
   is_triggered: boolean;
   triggered_at: string | null;
@@ -58,6 +58,7 @@ export async function deleteAlert(
 
 export interface AlertCheckResult {
   checked_count: number;
+  skipped_count: number;
   triggered_count: number;
   notified_count: number;
   failed_tickers: string[];
@@ -71,6 +72,7 @@ export interface RiskAlertResult {
   high_urgency_count: number;
   currency_alert: boolean;
   usd_krw_change_pct: number | null;
+  exposed_user_count: number; // 보유 종목이 노출된 사용자 수
   notifications_sent: number;
   checked_at: string;
 }
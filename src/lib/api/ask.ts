@@ -1,4 +1,4 @@
-import { apiFetch } from "./client";
+import { apiFetch, apiStream } from "./client";
 
 interface AskResponse {
   answer: string;
@@ -12,3 +12,46 @@ export async function askQuestion(question: string): Promise<AskResponse> {
     body: JSON.stringify({ question }),
   });
 }
+
+/**
+ * 스트리밍 Q&A. 토큰이 도착할 때마다 onToken을 호출하고,
+ * 완료 시 최종 답변/딥링크를 반환한다.
+ */
+export async function askQuestionStream(
+  question: string,
+  onToken: (text: string) => void,
+): Promise<AskResponse> {
+  const res = await apiStream("/ask/stream", {
+    method: "POST",
+    body: JSON.stringify({ question }),
+  });
+
+  const reader = res.body!.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += value;
+
+    let sep: number;
+    while ((sep = buffer.indexOf("\n\n")) !== -1) {
+      const block = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+
+      let event = "message";
+      let data = "";
+      for (const line of block.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      if (!data) continue;
+
+      const payload = JSON.parse(data);
+      if (event === "token") onToken(payload.text);
+      else if (event === "done") return payload as AskResponse;
+    }
+  }
+
+  throw new Error("스트림이 완료 이벤트 없이 종료되었습니다.");
+}
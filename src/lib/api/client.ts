@@ -46,6 +46,31 @@ export async function apiFetch<T>(
   return res.json();
 }
 
+/**
+ * 스트리밍(SSE) 응답용 API 호출. 본문을 읽지 않은 Response를 반환한다.
+ */
+export async function apiStream(
+  path: string,
+  options?: RequestInit,
+): Promise<Response> {
+  const headers = await getAuthHeaders();
+  const url = `${API_BASE}${path}`;
+
+  const res = await fetch(url, {
+    ...options,
+    headers: { ...headers, Accept: "text/event-stream", ...options?.headers },
+  });
+
+  if (!res.ok || !res.body) {
+    const body = await res.json().catch(() => ({}));
+    throw new Error(
+      body.detail ?? `API 요청 실패: ${res.status} ${res.statusText}`,
+    );
+  }
+
+  return res;
+}
+
 /**
  * 서버 사이드 전용 API 클라이언트.
  * Server Actions / 서버 컴포넌트에서 Backend API를 호출할 때 사용.
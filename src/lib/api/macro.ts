@@ -28,6 +28,9 @@ interface SentimentCollectResponse {
   success: boolean;
   articles_collected: number;
   articles_analyzed: number;
+  articles_new: number;
+  articles_duplicate: number;
+  articles_local: number;
   collected_at: string;
 }
 
@@ -67,10 +70,15 @@ export async function getNewsCategories(): Promise<NewsCategoriesResponse> {
   return apiFetch("/sentiment/categories");
 }
 
+export type SummaryWindow = "24h" | "7d" | "30d";
+
 interface CategorySummaryResponse {
+  window: SummaryWindow;
   summaries: NewsCategorySummary[];
 }
 
-export async function getCategorySummary(): Promise<CategorySummaryResponse> {
-  return apiFetch("/sentiment/categories/summary");
+export async function getCategorySummary(
+  window: SummaryWindow = "24h",
+): Promise<CategorySummaryResponse> {
+  return apiFetch(`/sentiment/categories/summary?window=${window}`);
 }
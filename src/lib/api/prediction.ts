@@ -23,6 +23,8 @@ export interface MacroSignal {
 export interface SentimentSignal {
   avg_weighted_score: number;
   article_count: number;
+  ticker_score?: number | null;
+  ticker_article_count?: number;
   composite: number;
 }
 
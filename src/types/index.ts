@@ -114,6 +114,9 @@ export interface SentimentResult {
   affected_countries: string[] | null;
   short_term_impact: string | null;
   medium_term_impact: string | null;
+  cluster_size?: number;
+  analysis_source?: "LLM" | "LOCAL";
+  tickers?: string[];
   analyzed_at: string;
   created_at: string;
 }
@@ -0,0 +1,37 @@
+-- ============================================================
+-- 013: 통합 스코어링 시그널 가중치 보정 결과 저장
+-- prediction_scores 이력 + 실현 수익률로 오프라인 보정한
+-- 5개 시그널 가중치와 방향 판정 임계값 (is_active=TRUE 1건만 사용)
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS signal_weight_configs (
+  id                    UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  weight_technical      NUMERIC(5, 4) NOT NULL,
+  weight_macro          NUMERIC(5, 4) NOT NULL,
+  weight_sentiment      NUMERIC(5, 4) NOT NULL,
+  weight_currency       NUMERIC(5, 4) NOT NULL,
+  weight_geopolitical   NUMERIC(5, 4) NOT NULL,
+  buy_threshold         NUMERIC(6, 2) NOT NULL DEFAULT 25,
+  strong_threshold      NUMERIC(6, 2) NOT NULL DEFAULT 60,
+  horizon_days          INT NOT NULL DEFAULT 5,
+  sample_count          INT NOT NULL DEFAULT 0,
+  objective             NUMERIC(12, 6),
+  baseline_objective    NUMERIC(12, 6),
+  is_active             BOOLEAN NOT NULL DEFAULT TRUE,
+  calibrated_at         TIMESTAMPTZ NOT NULL DEFAULT now(),
+  created_at            TIMESTAMPTZ NOT NULL DEFAULT now(),
+  CHECK (strong_threshold > buy_threshold)
+);
+
+COMMENT ON TABLE signal_weight_configs IS '통합 스코어링 가중치/임계값 보정 이력. is_active=TRUE 최신 1건을 analyze_ticker가 사용';
+
+CREATE INDEX IF NOT EXISTS idx_signal_weight_configs_active
+  ON signal_weight_configs(calibrated_at DESC)
+  WHERE is_active = TRUE;
+
+-- RLS: 서비스 키로만 쓰기, 관리자 읽기
+ALTER TABLE signal_weight_configs ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "signal_weight_configs_select_admin"
+  ON signal_weight_configs FOR SELECT
+  USING (is_admin_or_above());
@@ -0,0 +1,23 @@
+-- ============================================================
+-- 014: 기능별 LLM 모델 폴백 체인 + 헤지 지연 예산
+-- primary_model → fallback_model → fallback_models[] 순서로 체인을 구성하고,
+-- 앞 모델이 hedge_after_ms 안에 응답하지 않으면 다음 모델에 헤지 요청을 보낸다.
+-- ============================================================
+
+ALTER TABLE model_configs
+  ADD COLUMN IF NOT EXISTS fallback_models TEXT[] NOT NULL DEFAULT '{}',
+  ADD COLUMN IF NOT EXISTS hedge_after_ms  INTEGER CHECK (hedge_after_ms IS NULL OR hedge_after_ms > 0);
+
+COMMENT ON COLUMN model_configs.fallback_models IS 'fallback_model 이후 추가 폴백 모델 (순서대로 헤지)';
+COMMENT ON COLUMN model_configs.hedge_after_ms IS '다음 모델로 헤지 요청을 보내기까지의 지연 예산(ms). NULL이면 서버 기본값';
+
+-- 리포트 생성 기능: 느린 1순위 모델이 전체를 막지 않도록 체인 구성
+UPDATE model_configs
+   SET fallback_models = ARRAY['google/gemini-2.0-flash-001'],
+       hedge_after_ms  = 20000
+ WHERE config_key = 'DEEP_REPORT';
+
+INSERT INTO model_configs (config_key, display_name, primary_model, fallback_model, fallback_models, max_tokens, temperature, hedge_after_ms) VALUES
+  ('DAILY_GUIDE', '일간/종목 투자 가이드', 'anthropic/claude-sonnet-4-20250514', 'google/gemini-2.0-flash-001', '{}', 4096, 0.3, 20000),
+  ('WEEKLY_REPORT', '주간 리포트', 'anthropic/claude-sonnet-4-20250514', 'google/gemini-2.0-flash-001', '{}', 4096, 0.3, 30000)
+ON CONFLICT (config_key) DO NOTHING;
@@ -0,0 +1,23 @@
+-- ============================================================
+-- 015: 수집 기사 중복 제거 인덱스
+-- 정규화 URL 해시 + 제목 지문으로 이미 감성 분석한 기사를 식별해
+-- 다음 수집 주기에서 LLM 재분석/재저장을 건너뛴다.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS seen_articles (
+  url_hash       TEXT PRIMARY KEY,
+  title_hash     TEXT NOT NULL,
+  source         TEXT,
+  first_seen_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE seen_articles IS '감성 분석 완료 기사 인덱스 (url_hash=정규화 URL SHA-256, title_hash=정규화 제목 SHA-256)';
+
+CREATE INDEX IF NOT EXISTS idx_seen_articles_title_hash
+  ON seen_articles(title_hash);
+
+CREATE INDEX IF NOT EXISTS idx_seen_articles_first_seen
+  ON seen_articles(first_seen_at DESC);
+
+-- RLS: 서비스 키 전용 (정책 없음 = 일반 사용자 접근 불가)
+ALTER TABLE seen_articles ENABLE ROW LEVEL SECURITY;
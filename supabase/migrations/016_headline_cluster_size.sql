@@ -0,0 +1,14 @@
+-- ============================================================
+-- 016: 근접 중복 헤드라인 클러스터 크기
+-- 같은 사건을 여러 매체가 보도한 경우 대표 1건만 AI 분석하고
+-- 결과를 전파한다. cluster_size = 해당 실행에서 묶인 기사 수 (보도 강도 시그널)
+-- ============================================================
+
+ALTER TABLE sentiment_results
+  ADD COLUMN IF NOT EXISTS cluster_size INTEGER NOT NULL DEFAULT 1 CHECK (cluster_size >= 1);
+
+ALTER TABLE geopolitical_events
+  ADD COLUMN IF NOT EXISTS cluster_size INTEGER NOT NULL DEFAULT 1 CHECK (cluster_size >= 1);
+
+COMMENT ON COLUMN sentiment_results.cluster_size IS '같은 실행에서 근접 중복으로 묶인 기사 수';
+COMMENT ON COLUMN geopolitical_events.cluster_size IS '이벤트 대표 기사와 근접 중복으로 묶인 기사 수';
@@ -0,0 +1,11 @@
+-- ============================================================
+-- 017: 감성 분석 결과 출처 (LLM / 로컬 사전 분류)
+-- 시장 관련성이 낮은 헤드라인은 로컬 렉시콘 분류로 확정하고 LLM을 생략한다.
+-- LOCAL 결과는 약한 신호(|score| ≤ 0.3, confidence 0.3)로만 기록된다.
+-- ============================================================
+
+ALTER TABLE sentiment_results
+  ADD COLUMN IF NOT EXISTS analysis_source TEXT NOT NULL DEFAULT 'LLM'
+    CHECK (analysis_source IN ('LLM', 'LOCAL'));
+
+COMMENT ON COLUMN sentiment_results.analysis_source IS 'LLM: AI 분석 / LOCAL: 로컬 사전 분류 (LLM 생략)';
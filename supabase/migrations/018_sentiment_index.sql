@@ -0,0 +1,44 @@
+-- ============================================================
+-- 018: 시간 감쇠 감성 지수 (증분 상태 + 시계열)
+-- 감성 분석 배치 저장 시마다 지수 감쇠(반감기) 누적합을 갱신한다.
+-- 예측/공포탐욕/가이드는 sentiment_results를 스캔하지 않고 상태 행 1건을 읽는다.
+-- scope = 'ALL'(전체) 또는 news_category 키
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS sentiment_index_state (
+  scope         TEXT PRIMARY KEY,
+  score_sum     DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ 방향값(±100) × confidence × 감쇠
+  weight_sum    DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ confidence × 감쇠
+  bullish_sum   DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ BULLISH 기사 × 감쇠
+  bearish_sum   DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ BEARISH 기사 × 감쇠
+  count_sum     DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ 기사 × 감쇠 (유효 기사 수)
+  value         DOUBLE PRECISION NOT NULL DEFAULT 0,  -- score_sum / weight_sum (-100 ~ 100)
+  updated_at    TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE sentiment_index_state IS '시간 감쇠 감성 지수 누적 상태 (scope별 1행)';
+
+CREATE TABLE IF NOT EXISTS sentiment_index_history (
+  id            BIGSERIAL PRIMARY KEY,
+  scope         TEXT NOT NULL,
+  value         DOUBLE PRECISION NOT NULL,
+  bullish_pct   DOUBLE PRECISION NOT NULL,
+  bearish_pct   DOUBLE PRECISION NOT NULL,
+  effective_count DOUBLE PRECISION NOT NULL,
+  recorded_at   TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_sentiment_index_history_scope_time
+  ON sentiment_index_history(scope, recorded_at DESC);
+
+-- RLS: 조회는 인증 사용자, 쓰기는 서비스 키 전용
+ALTER TABLE sentiment_index_state ENABLE ROW LEVEL SECURITY;
+ALTER TABLE sentiment_index_history ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "sentiment_index_state_select_authenticated"
+  ON sentiment_index_state FOR SELECT
+  USING (auth.uid() IS NOT NULL);
+
+CREATE POLICY "sentiment_index_history_select_authenticated"
+  ON sentiment_index_history FOR SELECT
+  USING (auth.uid() IS NOT NULL);
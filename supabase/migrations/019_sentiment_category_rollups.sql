@@ -0,0 +1,107 @@
+-- ============================================================
+-- 019: 카테고리별 감성 시간 단위 롤업
+-- sentiment_results INSERT 시 트리거가 (카테고리, 시간 버킷) 집계를 누적한다.
+-- 요약 API는 원본 행을 스캔하지 않고 윈도우(24h/7d/30d) 내 버킷만 합산한다.
+-- ============================================================
+
+-- 1. 롤업 테이블
+CREATE TABLE IF NOT EXISTS sentiment_category_hourly (
+  news_category  TEXT NOT NULL,
+  bucket_start   TIMESTAMPTZ NOT NULL,
+  total          INTEGER NOT NULL DEFAULT 0,
+  bullish        INTEGER NOT NULL DEFAULT 0,
+  bearish        INTEGER NOT NULL DEFAULT 0,
+  neutral        INTEGER NOT NULL DEFAULT 0,
+  score_sum      DOUBLE PRECISION NOT NULL DEFAULT 0,
+  PRIMARY KEY (news_category, bucket_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_sentiment_category_hourly_bucket
+  ON sentiment_category_hourly(bucket_start DESC);
+
+COMMENT ON TABLE sentiment_category_hourly IS '카테고리 × 1시간 버킷 감성 집계 (sentiment_results INSERT 트리거로 유지)';
+
+ALTER TABLE sentiment_category_hourly ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "sentiment_category_hourly_select_authenticated"
+  ON sentiment_category_hourly FOR SELECT
+  USING (auth.uid() IS NOT NULL);
+
+-- 2. INSERT 트리거 (문장 단위 — 배치 insert 1회에 버킷별 upsert 1회)
+CREATE OR REPLACE FUNCTION rollup_sentiment_category_hourly()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  INSERT INTO sentiment_category_hourly AS h
+    (news_category, bucket_start, total, bullish, bearish, neutral, score_sum)
+  SELECT
+    news_category,
+    date_trunc('hour', analyzed_at),
+    COUNT(*),
+    COUNT(*) FILTER (WHERE direction = 'BULLISH'),
+    COUNT(*) FILTER (WHERE direction = 'BEARISH'),
+    COUNT(*) FILTER (WHERE direction NOT IN ('BULLISH', 'BEARISH')),
+    COALESCE(SUM(score), 0)
+  FROM new_rows
+  WHERE news_category IS NOT NULL
+  GROUP BY news_category, date_trunc('hour', analyzed_at)
+  ON CONFLICT (news_category, bucket_start) DO UPDATE SET
+    total     = h.total + EXCLUDED.total,
+    bullish   = h.bullish + EXCLUDED.bullish,
+    bearish   = h.bearish + EXCLUDED.bearish,
+    neutral   = h.neutral + EXCLUDED.neutral,
+    score_sum = h.score_sum + EXCLUDED.score_sum;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_sentiment_results_category_rollup ON sentiment_results;
+
+CREATE TRIGGER trg_sentiment_results_category_rollup
+  AFTER INSERT ON sentiment_results
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION rollup_sentiment_category_hourly();
+
+-- 3. 기존 데이터 백필
+INSERT INTO sentiment_category_hourly
+  (news_category, bucket_start, total, bullish, bearish, neutral, score_sum)
+SELECT
+  news_category,
+  date_trunc('hour', analyzed_at),
+  COUNT(*),
+  COUNT(*) FILTER (WHERE direction = 'BULLISH'),
+  COUNT(*) FILTER (WHERE direction = 'BEARISH'),
+  COUNT(*) FILTER (WHERE direction NOT IN ('BULLISH', 'BEARISH')),
+  COALESCE(SUM(score), 0)
+FROM sentiment_results
+WHERE news_category IS NOT NULL
+GROUP BY news_category, date_trunc('hour', analyzed_at)
+ON CONFLICT (news_category, bucket_start) DO NOTHING;
+
+-- 4. 윈도우 요약 RPC
+CREATE OR REPLACE FUNCTION sentiment_category_summary(p_since TIMESTAMPTZ)
+RETURNS TABLE (
+  category_key  TEXT,
+  total         BIGINT,
+  bullish       BIGINT,
+  bearish       BIGINT,
+  neutral       BIGINT,
+  avg_score     DOUBLE PRECISION
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    news_category,
+    SUM(total),
+    SUM(bullish),
+    SUM(bearish),
+    SUM(neutral),
+    SUM(score_sum) / NULLIF(SUM(total), 0)
+  FROM sentiment_category_hourly
+  WHERE bucket_start >= date_trunc('hour', p_since)
+  GROUP BY news_category;
+$$;
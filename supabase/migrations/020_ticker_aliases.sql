@@ -0,0 +1,37 @@
+-- ============================================================
+-- 020: 종목 별칭 인덱스 + 헤드라인 종목 태깅
+-- 회사명/한글명/티커(예: 삼성전자 → 005930.KS, NVIDIA → NVDA)를 티커로 매핑하고,
+-- 감성 분석 저장 시 헤드라인에 언급된 티커를 sentiment_results.tickers에 태깅한다.
+-- 예측 시 종목별 감성은 GIN 인덱스(tickers @> ARRAY[ticker])로 조회한다.
+-- ============================================================
+
+-- 1. 별칭 테이블 (관리자 추가분 — 코드 기본값/관심종목·포트폴리오 종목명과 합쳐 사용)
+CREATE TABLE IF NOT EXISTS ticker_aliases (
+  alias       TEXT NOT NULL,
+  ticker      TEXT NOT NULL,
+  created_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (alias, ticker)
+);
+
+CREATE INDEX IF NOT EXISTS idx_ticker_aliases_ticker
+  ON ticker_aliases(ticker);
+
+ALTER TABLE ticker_aliases ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "ticker_aliases_select_authenticated"
+  ON ticker_aliases FOR SELECT
+  USING (auth.uid() IS NOT NULL);
+
+CREATE POLICY "ticker_aliases_write_admin"
+  ON ticker_aliases FOR ALL
+  USING (is_admin_or_above())
+  WITH CHECK (is_admin_or_above());
+
+-- 2. 헤드라인 종목 태그
+ALTER TABLE sentiment_results
+  ADD COLUMN IF NOT EXISTS tickers TEXT[] NOT NULL DEFAULT '{}';
+
+CREATE INDEX IF NOT EXISTS idx_sentiment_results_tickers
+  ON sentiment_results USING GIN (tickers);
+
+COMMENT ON COLUMN sentiment_results.tickers IS '헤드라인에 언급된 종목 티커 (별칭 인덱스 매칭)';
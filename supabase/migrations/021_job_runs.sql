@@ -0,0 +1,32 @@
+-- ============================================================
+-- 021: 스케줄 작업 실행 원장
+-- 스케줄 작업 실행 1회당 1행 — 시작/종료, 소요 시간, 처리/실패 건수, 최대 RSS, 오류.
+-- 시장 갱신 파이프라인은 전체 실행(market_refresh)과 단계별(market_refresh.<step>)로 기록한다.
+-- 보존 기간(30일)이 지난 행은 스케줄러가 정리한다.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS job_runs (
+  id               BIGSERIAL PRIMARY KEY,
+  job_id           TEXT NOT NULL,
+  started_at       TIMESTAMPTZ NOT NULL,
+  finished_at      TIMESTAMPTZ,
+  duration_ms      INTEGER,
+  status           TEXT NOT NULL CHECK (status IN ('success', 'failed')),
+  items_processed  INTEGER,
+  items_failed     INTEGER,
+  peak_rss_mb      NUMERIC(10, 1),
+  error            TEXT,
+  details          JSONB
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_runs_job_started
+  ON job_runs(job_id, started_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_job_runs_started
+  ON job_runs(started_at DESC);
+
+ALTER TABLE job_runs ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "job_runs_select_admin"
+  ON job_runs FOR SELECT
+  USING (is_admin_or_above());
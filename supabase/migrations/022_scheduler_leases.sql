@@ -0,0 +1,66 @@
+-- ============================================================
+-- 022: 스케줄러 리더 임대
+-- uvicorn 다중 워커/레플리카 중 임대를 잡은 인스턴스 1개만 크론잡을 실행한다.
+-- 리더는 ttl/3 간격으로 임대를 갱신하고, 갱신이 끊겨 expires_at이 지나면
+-- 다른 인스턴스가 acquire_scheduler_lease로 인계받는다.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS scheduler_leases (
+  name         TEXT PRIMARY KEY,
+  holder       TEXT NOT NULL,
+  acquired_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+  renewed_at   TIMESTAMPTZ NOT NULL DEFAULT now(),
+  expires_at   TIMESTAMPTZ NOT NULL
+);
+
+ALTER TABLE scheduler_leases ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "scheduler_leases_select_admin"
+  ON scheduler_leases FOR SELECT
+  USING (is_admin_or_above());
+
+-- 임대 획득/갱신: 비어 있거나, 내가 보유 중이거나, 만료된 경우에만 성공 (행 잠금으로 원자적)
+CREATE OR REPLACE FUNCTION acquire_scheduler_lease(
+  p_name TEXT,
+  p_holder TEXT,
+  p_ttl_seconds INTEGER
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_holder TEXT;
+BEGIN
+  INSERT INTO scheduler_leases (name, holder, acquired_at, renewed_at, expires_at)
+  VALUES (p_name, p_holder, now(), now(), now() + make_interval(secs => p_ttl_seconds))
+  ON CONFLICT (name) DO UPDATE
+    SET holder      = EXCLUDED.holder,
+        acquired_at = CASE
+                        WHEN scheduler_leases.holder = EXCLUDED.holder THEN scheduler_leases.acquired_at
+                        ELSE now()
+                      END,
+        renewed_at  = now(),
+        expires_at  = EXCLUDED.expires_at
+    WHERE scheduler_leases.holder = EXCLUDED.holder
+       OR scheduler_leases.expires_at < now()
+  RETURNING holder INTO v_holder;
+
+  RETURN v_holder IS NOT NULL;
+END;
+$$;
+
+-- 임대 반납 (정상 종료 시 — 다른 인스턴스가 만료를 기다리지 않고 즉시 인계)
+CREATE OR REPLACE FUNCTION release_scheduler_lease(p_name TEXT, p_holder TEXT)
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  DELETE FROM scheduler_leases WHERE name = p_name AND holder = p_holder;
+$$;
+
+-- 백엔드(service_role)만 호출
+REVOKE EXECUTE ON FUNCTION acquire_scheduler_lease(TEXT, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION release_scheduler_lease(TEXT, TEXT) FROM PUBLIC, anon, authenticated;
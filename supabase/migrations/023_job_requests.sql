@@ -0,0 +1,48 @@
+-- ============================================================
+-- 023: 작업 실행 요청 큐
+-- API 파드(SCHEDULER_ENABLED=false)가 관리자 즉시 실행 요청을 넣고,
+-- 워커 프로세스의 스케줄러 리더가 claim_job_requests로 꺼내 해당 작업을 즉시 실행한다.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS job_requests (
+  id            BIGSERIAL PRIMARY KEY,
+  job_id        TEXT NOT NULL,
+  requested_by  UUID REFERENCES auth.users(id) ON DELETE SET NULL,
+  requested_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+  status        TEXT NOT NULL DEFAULT 'pending'
+                CHECK (status IN ('pending', 'claimed', 'dispatched', 'rejected')),
+  claimed_at    TIMESTAMPTZ,
+  handled_at    TIMESTAMPTZ,
+  note          TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_requests_pending
+  ON job_requests(requested_at)
+  WHERE status = 'pending';
+
+ALTER TABLE job_requests ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "job_requests_select_admin"
+  ON job_requests FOR SELECT
+  USING (is_admin_or_above());
+
+-- 대기 요청을 오래된 순으로 꺼낸다 (동시 호출 시 SKIP LOCKED로 중복 없음)
+CREATE OR REPLACE FUNCTION claim_job_requests(p_limit INTEGER)
+RETURNS SETOF job_requests
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  UPDATE job_requests
+     SET status = 'claimed', claimed_at = now()
+   WHERE id IN (
+     SELECT id FROM job_requests
+      WHERE status = 'pending'
+      ORDER BY requested_at
+      LIMIT p_limit
+      FOR UPDATE SKIP LOCKED
+   )
+  RETURNING *;
+$$;
+
+REVOKE EXECUTE ON FUNCTION claim_job_requests(INTEGER) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,32 @@
+-- ============================================================
+-- 024: 가격 알림 일괄 발동
+-- 알림 체크 1회에서 도달한 알림 전체를 한 번의 UPDATE로 발동 처리한다.
+-- 아직 미발동인 행만 갱신하고 갱신된 id를 돌려주므로, 체크가 겹쳐도 알림은 한 번만 발송된다.
+-- 미발동 알림 페이지 조회(id 순)를 위한 부분 인덱스를 추가한다.
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_price_alerts_untriggered_id
+  ON price_alerts(id)
+  WHERE is_triggered = FALSE;
+
+CREATE OR REPLACE FUNCTION trigger_price_alerts(
+  p_ids UUID[],
+  p_prices NUMERIC[],
+  p_triggered_at TIMESTAMPTZ
+)
+RETURNS SETOF UUID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  UPDATE price_alerts AS a
+     SET is_triggered  = TRUE,
+         triggered_at  = p_triggered_at,
+         current_price = t.price
+    FROM unnest(p_ids, p_prices) AS t(id, price)
+   WHERE a.id = t.id
+     AND a.is_triggered = FALSE
+  RETURNING a.id;
+$$;
+
+REVOKE EXECUTE ON FUNCTION trigger_price_alerts(UUID[], NUMERIC[], TIMESTAMPTZ) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,31 @@
+-- ============================================================
+-- 025: 일일 변동률(DAILY_CHANGE) 알림
+-- DAILY_CHANGE 알림의 trigger_price는 전일 종가 대비 변동률 임계값(%)이다.
+-- 1회성인 목표가/손절가와 달리 is_triggered를 켜지 않고 반복 발동하며,
+-- 마지막 발동(triggered_at) 후 쿨다운이 지난 행만 갱신·반환해 프로세스 간 중복 발송을 막는다.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION trigger_daily_change_alerts(
+  p_ids UUID[],
+  p_prices NUMERIC[],
+  p_triggered_at TIMESTAMPTZ,
+  p_cooldown_seconds INTEGER
+)
+RETURNS SETOF UUID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  UPDATE price_alerts AS a
+     SET triggered_at  = p_triggered_at,
+         current_price = t.price
+    FROM unnest(p_ids, p_prices) AS t(id, price)
+   WHERE a.id = t.id
+     AND a.alert_type = 'DAILY_CHANGE'
+     AND a.is_triggered = FALSE
+     AND (a.triggered_at IS NULL
+          OR a.triggered_at <= p_triggered_at - make_interval(secs => p_cooldown_seconds))
+  RETURNING a.id;
+$$;
+
+REVOKE EXECUTE ON FUNCTION trigger_daily_change_alerts(UUID[], NUMERIC[], TIMESTAMPTZ, INTEGER) FROM PUBLIC, anon, authenticated;
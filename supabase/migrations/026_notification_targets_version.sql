@@ -0,0 +1,19 @@
+-- ============================================================
+-- 026: 알림 수신 대상 버전
+-- 백엔드는 notification_targets를 user_id ↔ telegram_chat_id 맵으로 메모리에 캐시한다.
+-- 이 함수의 값(행 수 + 최신 updated_at)이 바뀌면 대상이 추가/수정/삭제된 것이므로 다시 적재한다.
+-- updated_at은 006의 trg_notification_targets_updated_at 트리거가 갱신한다.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION notification_targets_version()
+RETURNS TEXT
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT count(*)::TEXT || ':' || COALESCE(max(updated_at)::TEXT, '')
+    FROM notification_targets;
+$$;
+
+REVOKE EXECUTE ON FUNCTION notification_targets_version() FROM PUBLIC, anon, authenticated;
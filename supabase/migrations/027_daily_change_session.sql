@@ -0,0 +1,32 @@
+-- ============================================================
+-- 027: DAILY_CHANGE 알림 중복 방지를 거래소 세션 기준으로
+-- 고정 쿨다운(025) 대신 상장 거래소의 현지 거래일당 1회만 발동한다.
+-- p_session_starts[i]는 p_ids[i] 종목의 현지 거래일 시작 시각이며,
+-- 마지막 발동(triggered_at)이 그보다 이전인 행만 갱신·반환한다.
+-- ============================================================
+
+DROP FUNCTION IF EXISTS trigger_daily_change_alerts(UUID[], NUMERIC[], TIMESTAMPTZ, INTEGER);
+
+CREATE OR REPLACE FUNCTION trigger_daily_change_alerts(
+  p_ids UUID[],
+  p_prices NUMERIC[],
+  p_triggered_at TIMESTAMPTZ,
+  p_session_starts TIMESTAMPTZ[]
+)
+RETURNS SETOF UUID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  UPDATE price_alerts AS a
+     SET triggered_at  = p_triggered_at,
+         current_price = t.price
+    FROM unnest(p_ids, p_prices, p_session_starts) AS t(id, price, session_start)
+   WHERE a.id = t.id
+     AND a.alert_type = 'DAILY_CHANGE'
+     AND a.is_triggered = FALSE
+     AND (a.triggered_at IS NULL OR a.triggered_at < t.session_start)
+  RETURNING a.id;
+$$;
+
+REVOKE EXECUTE ON FUNCTION trigger_daily_change_alerts(UUID[], NUMERIC[], TIMESTAMPTZ, TIMESTAMPTZ[]) FROM PUBLIC, anon, authenticated;